@@ -0,0 +1,103 @@
+"""
+INVITE 라우팅 결정 벤치마크
+
+임시 call_control.db에 owner별 규칙·스케줄·발신자 필터를 만들고, sip_endpoint와 같은 순서
+(resolve_caller_filter → resolve_rule)로 초당 결정 수를 잰다. ROUTING_SNAPSHOT=0(매 호출 DB 조회)과
+기본 스냅샷 경로를 차례로 비교한다.
+
+실행 방법:
+  python scripts/bench_routing_decisions.py [--owners 50] [--rules 8] [--filters 20] [--seconds 3]
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import structlog
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.call_control import db as _db  # noqa: E402
+from src.call_control import routing_engine as _engine  # noqa: E402
+
+_DAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+
+def _seed(owners: int, rules: int, filters: int, rng: random.Random) -> list:
+    names = []
+    for o in range(owners):
+        owner = str(1000 + o)
+        names.append(owner)
+        for s in range(rules):
+            start = rng.randint(0, 20)
+            _db.create_schedule({
+                "id": f"{owner}-s{s}", "owner": owner, "name": f"s{s}",
+                "days": rng.sample(_DAYS, rng.randint(1, 5)),
+                "time_ranges": [{"start": f"{start:02d}:00", "end": f"{start + 3:02d}:30"}],
+                "include_holidays": rng.random() < 0.3, "holiday_country": "KR",
+            })
+            _db.create_rule({
+                "id": f"{owner}-r{s}", "owner": owner, "name": f"r{s}", "priority": s,
+                "action": "direct", "schedule_id": f"{owner}-s{s}",
+            })
+        _db.create_rule({"id": f"{owner}-fallback", "owner": owner, "name": "fallback",
+                         "priority": 999, "action": "ai_only"})
+        for f in range(filters):
+            digits = "".join(rng.choice("0123456789") for _ in range(rng.randint(2, 6)))
+            _db.create_caller_filter({
+                "id": f"{owner}-f{f}", "owner": owner, "name": f"f{f}",
+                "pattern": "010" + digits + ("*" if f % 2 else ""), "action": "reject", "priority": f,
+            })
+    return names
+
+
+def _run(owners: list, seconds: float, rng: random.Random) -> float:
+    base = datetime(2026, 3, 2, tzinfo=timezone.utc)
+    count = 0
+    deadline = time.perf_counter() + seconds
+    started = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            owner = rng.choice(owners)
+            caller = "010" + "".join(rng.choice("0123456789") for _ in range(8))
+            if _engine.resolve_caller_filter(owner, caller) is None:
+                _engine.resolve_rule(owner, now=base + timedelta(minutes=rng.randint(0, 60 * 24 * 7)))
+            count += 1
+    return count / (time.perf_counter() - started)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="INVITE 라우팅 결정 벤치마크")
+    parser.add_argument("--owners", type=int, default=50)
+    parser.add_argument("--rules", type=int, default=8)
+    parser.add_argument("--filters", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+    # 매칭 debug 로그 출력이 측정을 지배하지 않도록
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["CALL_CONTROL_DB_PATH"] = str(Path(tmp) / "call_control.db")
+        _db.init_db()
+        owners = _seed(args.owners, args.rules, args.filters, random.Random(1))
+
+        results = {}
+        for label, flag in (("db_per_call", "0"), ("snapshot", "1")):
+            os.environ["ROUTING_SNAPSHOT"] = flag
+            _engine.invalidate_routing_snapshots()
+            results[label] = _run(owners, args.seconds, random.Random(2))
+            print(f"{label:12s} {results[label]:>12,.0f} decisions/s")
+        print(f"speedup      {results['snapshot'] / results['db_per_call']:>12.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
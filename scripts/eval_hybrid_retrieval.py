@@ -0,0 +1,182 @@
+"""
+RAGEngine 하이브리드(BM25 + 벡터) 검색 오프라인 평가 하네스.
+
+서버·ChromaDB·Gemini 없이 `tests_new/fixtures/rag_hybrid_eval.json`의 지식/질의 세트로
+벡터 단독(hybrid_lexical_weight=0)과 하이브리드 검색의 recall@k·지연을 비교한다.
+
+- 기본 임베더는 문자 trigram 해싱 벡터(결정적·의존성 없음) — 절대 수치보다 상대 비교용
+- `--embedder st`면 운영과 같은 SentenceTransformer(paraphrase-multilingual-mpnet-base-v2) 사용
+- 벡터 저장소는 L2 거리 기반 인메모리 구현(Chroma 기본 l2 공간과 동일 점수식 1/(1+d))
+
+사용법:
+    python scripts/eval_hybrid_retrieval.py [--k 1 3 5] [--weight 0.3] [--embedder hash|st]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.ai_voicebot.ai_pipeline.lexical_index import (  # noqa: E402
+    LexicalIndexRegistry,
+    metadata_matches_where,
+)
+from src.ai_voicebot.ai_pipeline.rag_engine import RAGEngine  # noqa: E402
+
+_DEFAULT_FIXTURE = _PROJECT_ROOT / "tests_new" / "fixtures" / "rag_hybrid_eval.json"
+
+
+class _HashingEmbedder:
+    """문자 trigram → 고정 차원 해싱 벡터 (L2 정규화)."""
+
+    def __init__(self, dimension: int = 256):
+        self.dimension = dimension
+
+    def embed_text(self, text: str) -> List[float]:
+        vec = [0.0] * self.dimension
+        s = f"  {(text or '').lower()}  "
+        for i in range(len(s) - 2):
+            h = int(hashlib.md5(s[i : i + 3].encode("utf-8")).hexdigest(), 16)
+            vec[h % self.dimension] += 1.0
+        norm = math.sqrt(sum(v * v for v in vec)) or 1.0
+        return [v / norm for v in vec]
+
+
+class _SentenceTransformerEmbedder:
+    def __init__(self) -> None:
+        from sentence_transformers import SentenceTransformer
+
+        self._model = SentenceTransformer("paraphrase-multilingual-mpnet-base-v2")
+
+    def embed_text(self, text: str) -> List[float]:
+        return self._model.encode(text, normalize_embeddings=True).tolist()
+
+
+class _InMemoryVectorDb:
+    """RAGEngine이 쓰는 get/query 시그니처만 구현한 L2 벡터 저장소."""
+
+    def __init__(self) -> None:
+        self._rows: List[Dict[str, Any]] = []
+
+    def add(self, doc_id: str, embedding: List[float], text: str, metadata: Dict[str, Any]) -> None:
+        self._rows.append({"id": doc_id, "embedding": embedding, "text": text, "metadata": metadata})
+
+    def get(
+        self,
+        where: Optional[Dict[str, Any]] = None,
+        limit: int = 1000,
+        ids: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        rows = [
+            r
+            for r in self._rows
+            if metadata_matches_where(r["metadata"], where) and (ids is None or r["id"] in ids)
+        ][:limit]
+        return {
+            "ids": [r["id"] for r in rows],
+            "documents": [r["text"] for r in rows],
+            "metadatas": [r["metadata"] for r in rows],
+        }
+
+    def query(
+        self,
+        query_embeddings: List[List[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        q = query_embeddings[0]
+        scored = []
+        for r in self._rows:
+            if not metadata_matches_where(r["metadata"], where):
+                continue
+            dist = sum((a - b) ** 2 for a, b in zip(q, r["embedding"]))
+            scored.append((dist, r))
+        scored.sort(key=lambda x: x[0])
+        top = scored[:n_results]
+        return {
+            "ids": [[r["id"] for _, r in top]],
+            "documents": [[r["text"] for _, r in top]],
+            "metadatas": [[r["metadata"] for _, r in top]],
+            "distances": [[d for d, _ in top]],
+        }
+
+
+async def _evaluate(
+    fixture: Dict[str, Any], embedder: Any, weight: float, ks: List[int]
+) -> Dict[str, Any]:
+    owner = str(fixture.get("owner") or "1004")
+    vdb = _InMemoryVectorDb()
+    for doc in fixture["documents"]:
+        meta = {"owner": owner, "category": doc.get("category") or "question"}
+        vdb.add(doc["id"], embedder.embed_text(doc["text"]), doc["text"], meta)
+    engine = RAGEngine(
+        vector_db=vdb,
+        embedder=embedder,
+        top_k=max(ks),
+        similarity_threshold=0.0,
+        hybrid_lexical_weight=weight,
+        lexical_registry=LexicalIndexRegistry(),
+    )
+    hits = {k: 0 for k in ks}
+    latencies: List[float] = []
+    for case in fixture["queries"]:
+        t0 = time.perf_counter()
+        result = await engine.search(case["query"], owner_filter=owner, intent="question")
+        latencies.append((time.perf_counter() - t0) * 1000)
+        ranked = [d.id for d in result.documents]
+        relevant = set(case["relevant"])
+        for k in ks:
+            if relevant & set(ranked[:k]):
+                hits[k] += 1
+    n = len(fixture["queries"]) or 1
+    latencies.sort()
+    return {
+        "hybrid_lexical_weight": weight,
+        "recall": {f"@{k}": round(hits[k] / n, 3) for k in ks},
+        "latency_ms_p50": round(statistics.median(latencies), 2) if latencies else 0.0,
+        "latency_ms_p95": round(latencies[max(0, int(len(latencies) * 0.95) - 1)], 2) if latencies else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="RAG 하이브리드 검색 recall@k / 지연 평가")
+    parser.add_argument("--fixture", default=str(_DEFAULT_FIXTURE))
+    parser.add_argument("--k", type=int, nargs="+", default=[1, 3, 5])
+    parser.add_argument("--weight", type=float, default=0.3, help="하이브리드 BM25 가중치")
+    parser.add_argument("--embedder", choices=["hash", "st"], default="hash")
+    args = parser.parse_args()
+
+    fixture = json.loads(Path(args.fixture).read_text(encoding="utf-8"))
+    embedder = _SentenceTransformerEmbedder() if args.embedder == "st" else _HashingEmbedder()
+    ks = sorted(set(args.k))
+
+    async def _run() -> List[Dict[str, Any]]:
+        return [
+            await _evaluate(fixture, embedder, 0.0, ks),
+            await _evaluate(fixture, embedder, args.weight, ks),
+        ]
+
+    import logging
+
+    import structlog
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    for row in asyncio.run(_run()):
+        label = "vector_only" if row["hybrid_lexical_weight"] == 0 else "hybrid"
+        print(json.dumps({"mode": label, **row}, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+call_data_record 로그 색인 보충/재구축 스크립트
+
+logs/call_data_record_*.log 를 읽어 logs/call_data_record_index.db 의 call_id 색인을 채운다.
+색인 도입 전 로그 백필이나 색인 DB 손상 시 사용한다 (서버 실행 중에도 안전 — 기록 측은 INSERT OR IGNORE).
+
+실행 방법:
+  python scripts/rebuild_call_data_record_index.py [--rebuild] [--log-dir DIR]
+
+옵션:
+  --rebuild: 색인을 비우고 모든 로그에서 다시 만든다 (기본: 색인 안 된 꼬리만 보충)
+  --log-dir: 로그 디렉터리 (기본: 프로젝트 logs/)
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.common.call_data_record_index import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
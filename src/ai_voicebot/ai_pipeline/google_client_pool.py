@@ -0,0 +1,365 @@
+"""
+Google Cloud STT/TTS gRPC 클라이언트 풀 (프로세스 공용).
+
+TTSClient/STTClient 생성마다(RingbackPlayer 인사말 1회 포함) 새 TextToSpeechClient()/SpeechClient()를
+만들어 채널 생성·TLS 핸드셰이크·인증 토큰 발급을 통화마다 다시 치르던 것을, 종류(kind)·리전별로
+keepalive 채널 1개를 만들어 두고 공유한다.
+
+- kind: "tts"/"stt" (동기, TTSClient·STTClient), "tts_async"/"stt_v2_async" (grpc.aio, Pipecat 서비스)
+  동기 클라이언트는 스레드 안전하므로 프로세스 공용, aio 클라이언트는 이벤트 루프별로 공유
+- warm(): 기동 시 채널 연결(channel_ready)까지 미리 수행
+- 백그라운드 인증 갱신: 공유 자격증명이 만료 임박이면 요청 경로 밖에서 refresh
+- track(kind): 요청 동시성(in_flight/max_in_flight)·오류 집계 → get_stats()
+- 테스트: channel_factory로 로컬 가짜 gRPC 서버(insecure channel)에 연결
+
+환경변수 GOOGLE_CLIENT_POOL=0 이면 기존처럼 생성마다 새 클라이언트를 만든다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+
+# 유휴 구간에도 연결 유지 (NAT/LB 유휴 종료 방지) — 재연결 시 TLS 핸드셰이크 재발생 방지
+GRPC_KEEPALIVE_OPTIONS: List[Tuple[str, int]] = [
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+AUTH_REFRESH_INTERVAL_SEC = 60.0
+# 만료까지 이 시간보다 적게 남으면 백그라운드에서 갱신
+AUTH_REFRESH_MARGIN_SEC = 300.0
+
+ChannelFactory = Callable[[str, str, List[Tuple[str, int]]], Any]
+
+
+def google_client_pool_enabled() -> bool:
+    return os.environ.get("GOOGLE_CLIENT_POOL", "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+def _kind_spec(kind: str) -> Tuple[Any, Any, str, bool]:
+    """kind → (Client 클래스, Transport 클래스, 기본 host, aio 여부). google-cloud 패키지는 지연 import."""
+    if kind == "tts":
+        from google.cloud.texttospeech_v1 import TextToSpeechClient
+        from google.cloud.texttospeech_v1.services.text_to_speech.transports.grpc import (
+            TextToSpeechGrpcTransport,
+        )
+        return TextToSpeechClient, TextToSpeechGrpcTransport, "texttospeech.googleapis.com", False
+    if kind == "stt":
+        from google.cloud.speech_v1 import SpeechClient
+        from google.cloud.speech_v1.services.speech.transports.grpc import SpeechGrpcTransport
+        return SpeechClient, SpeechGrpcTransport, "speech.googleapis.com", False
+    if kind == "tts_async":
+        from google.cloud.texttospeech_v1 import TextToSpeechAsyncClient
+        from google.cloud.texttospeech_v1.services.text_to_speech.transports.grpc_asyncio import (
+            TextToSpeechGrpcAsyncIOTransport,
+        )
+        return TextToSpeechAsyncClient, TextToSpeechGrpcAsyncIOTransport, "texttospeech.googleapis.com", True
+    if kind == "stt_v2_async":
+        from google.cloud.speech_v2 import SpeechAsyncClient
+        from google.cloud.speech_v2.services.speech.transports.grpc_asyncio import SpeechGrpcAsyncIOTransport
+        return SpeechAsyncClient, SpeechGrpcAsyncIOTransport, "speech.googleapis.com", True
+    raise ValueError(f"unknown google client kind: {kind}")
+
+
+def regional_host(default_host: str, region: Optional[str]) -> str:
+    """리전 엔드포인트 (예: asia-northeast3-speech.googleapis.com). global/None이면 기본 host."""
+    if not region or region == "global":
+        return default_host
+    return f"{region}-{default_host}"
+
+
+@dataclass
+class _PooledClient:
+    kind: str
+    region: str
+    host: str
+    client: Any
+    channel: Any
+    created_at: float
+    requests: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    errors: int = 0
+    last_error: str = ""
+    last_ok_at: Optional[float] = None
+    warm_ms: Optional[float] = None
+    ready: Optional[bool] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "region": self.region,
+            "host": self.host,
+            "ready": self.ready,
+            "warm_ms": round(self.warm_ms, 1) if self.warm_ms is not None else None,
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "age_sec": round(time.time() - self.created_at, 1),
+        }
+
+
+class GoogleClientPool:
+    """종류·리전(·이벤트 루프)별 공유 gRPC 클라이언트."""
+
+    def __init__(
+        self,
+        *,
+        channel_factory: Optional[ChannelFactory] = None,
+        credentials: Any = None,
+        auth_refresh_interval_sec: float = AUTH_REFRESH_INTERVAL_SEC,
+    ):
+        self._channel_factory = channel_factory
+        self._credentials = credentials
+        self._auth_refresh_interval_sec = auth_refresh_interval_sec
+        self._entries: Dict[Tuple[str, str, int], _PooledClient] = {}
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.auth_refreshes = 0
+        self.auth_refresh_errors = 0
+
+    # ── 자격증명 ──
+
+    def _get_credentials(self) -> Any:
+        if self._credentials is None:
+            import google.auth
+
+            self._credentials, _project = google.auth.default(scopes=_SCOPES)
+        return self._credentials
+
+    def _make_channel(self, kind: str, transport_cls: Any, host: str) -> Any:
+        if self._channel_factory is not None:
+            return self._channel_factory(kind, host, list(GRPC_KEEPALIVE_OPTIONS))
+        return transport_cls.create_channel(
+            host,
+            credentials=self._get_credentials(),
+            scopes=_SCOPES,
+            options=list(GRPC_KEEPALIVE_OPTIONS),
+        )
+
+    # ── 조회 ──
+
+    def _key(self, kind: str, region: Optional[str], is_async: bool) -> Tuple[str, str, int]:
+        loop_id = 0
+        if is_async:
+            # grpc.aio 채널은 생성한 이벤트 루프에 묶인다
+            loop_id = id(asyncio.get_running_loop())
+        return kind, region or "global", loop_id
+
+    def _entry(self, kind: str, region: Optional[str] = None) -> _PooledClient:
+        client_cls, transport_cls, default_host, is_async = _kind_spec(kind)
+        key = self._key(kind, region, is_async)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry
+            host = regional_host(default_host, region)
+            channel = self._make_channel(kind, transport_cls, host)
+            transport = transport_cls(host=host, channel=channel)
+            entry = _PooledClient(
+                kind=kind,
+                region=key[1],
+                host=host,
+                client=client_cls(transport=transport),
+                channel=channel,
+                created_at=time.time(),
+            )
+            self._entries[key] = entry
+        logger.info("google_client_pool_channel_created", kind=kind, region=key[1], host=host)
+        return entry
+
+    def get(self, kind: str, region: Optional[str] = None) -> Any:
+        """공유 클라이언트 (aio kind는 실행 중인 이벤트 루프 안에서 호출)."""
+        return self._entry(kind, region).client
+
+    def tts_client(self, region: Optional[str] = None) -> Any:
+        return self.get("tts", region)
+
+    def stt_client(self, region: Optional[str] = None) -> Any:
+        return self.get("stt", region)
+
+    # ── 동시성·오류 집계 ──
+
+    @contextmanager
+    def track(self, kind: str, region: Optional[str] = None) -> Iterator[None]:
+        """요청 1건 구간 (동기·비동기 코드 모두 with 블록으로 사용)."""
+        entry = self._entry(kind, region)
+        with self._lock:
+            entry.in_flight += 1
+            entry.max_in_flight = max(entry.max_in_flight, entry.in_flight)
+        try:
+            yield
+        except Exception as e:
+            with self._lock:
+                entry.errors += 1
+                entry.last_error = f"{type(e).__name__}: {e}"[:200]
+            raise
+        else:
+            entry.last_ok_at = time.time()
+        finally:
+            with self._lock:
+                entry.in_flight -= 1
+                entry.requests += 1
+
+    # ── 예열·헬스 ──
+
+    def warm(
+        self,
+        kinds: Tuple[str, ...] = ("tts", "stt"),
+        region: Optional[str] = None,
+        timeout: float = 5.0,
+    ) -> Dict[str, bool]:
+        """동기 kind 채널을 미리 연결 (TLS·인증 포함). 반환: {kind: 연결 성공 여부}."""
+        import grpc
+
+        result: Dict[str, bool] = {}
+        for kind in kinds:
+            t0 = time.perf_counter()
+            try:
+                entry = self._entry(kind, region)
+                grpc.channel_ready_future(entry.channel).result(timeout=timeout)
+                entry.ready = True
+            except Exception as e:
+                logger.warning("google_client_pool_warm_failed", kind=kind, region=region, error=str(e))
+                entry = self._entries.get(self._key(kind, region, False))
+                if entry is not None:
+                    entry.ready = False
+                    entry.last_error = f"{type(e).__name__}: {e}"[:200]
+                result[kind] = False
+                continue
+            entry.warm_ms = (time.perf_counter() - t0) * 1000.0
+            result[kind] = True
+        logger.info("google_client_pool_warmed", result=result, region=region or "global")
+        return result
+
+    async def warm_async(
+        self,
+        kinds: Tuple[str, ...] = ("tts_async", "stt_v2_async"),
+        region: Optional[str] = None,
+        timeout: float = 5.0,
+    ) -> Dict[str, bool]:
+        """현재 이벤트 루프의 aio 채널을 미리 연결 (Pipecat 서비스가 채택할 채널)."""
+        result: Dict[str, bool] = {}
+        for kind in kinds:
+            t0 = time.perf_counter()
+            try:
+                entry = self._entry(kind, region)
+                await asyncio.wait_for(entry.channel.channel_ready(), timeout=timeout)
+                entry.ready = True
+                entry.warm_ms = (time.perf_counter() - t0) * 1000.0
+                result[kind] = True
+            except Exception as e:
+                logger.warning("google_client_pool_warm_failed", kind=kind, region=region, error=str(e))
+                result[kind] = False
+        logger.info("google_client_pool_warmed", result=result, region=region or "global")
+        return result
+
+    def refresh_credentials_if_needed(self) -> bool:
+        """공유 자격증명이 무효이거나 만료 임박이면 갱신. 반환: 갱신 여부."""
+        creds = self._credentials
+        if creds is None or not hasattr(creds, "refresh"):
+            return False
+        expiry = getattr(creds, "expiry", None)
+        expiring = expiry is not None and (
+            expiry.timestamp() if hasattr(expiry, "timestamp") else float(expiry)
+        ) - time.time() < AUTH_REFRESH_MARGIN_SEC
+        if getattr(creds, "valid", False) and not expiring:
+            return False
+        try:
+            from google.auth.transport.requests import Request
+
+            creds.refresh(Request())
+            self.auth_refreshes += 1
+            return True
+        except Exception as e:
+            self.auth_refresh_errors += 1
+            logger.warning("google_client_pool_auth_refresh_failed", error=str(e))
+            return False
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self._auth_refresh_interval_sec):
+            self.refresh_credentials_if_needed()
+
+    def start_background_refresh(self) -> None:
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._stop.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop, name="google-auth-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            channels = [e.snapshot() for e in self._entries.values()]
+        return {
+            "enabled": google_client_pool_enabled(),
+            "channels": channels,
+            "in_flight": sum(c["in_flight"] for c in channels),
+            "auth_refreshes": self.auth_refreshes,
+            "auth_refresh_errors": self.auth_refresh_errors,
+        }
+
+    def close(self) -> None:
+        self._stop.set()
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            close = getattr(entry.channel, "close", None)
+            if close is not None and not asyncio.iscoroutinefunction(close):
+                try:
+                    close()
+                except Exception:
+                    pass
+
+
+_google_client_pool: Optional[GoogleClientPool] = None
+_google_client_pool_lock = threading.Lock()
+
+
+def get_google_client_pool() -> GoogleClientPool:
+    global _google_client_pool
+    if _google_client_pool is None:
+        with _google_client_pool_lock:
+            if _google_client_pool is None:
+                _google_client_pool = GoogleClientPool()
+    return _google_client_pool
+
+
+def adopt_pooled_client(service: Any, kind: str, region: Optional[str] = None) -> bool:
+    """
+    Pipecat Google 서비스가 생성자에서 만든 전용 aio 클라이언트(_client)를 풀의 공유 클라이언트로 교체.
+
+    클래스가 같을 때만 교체하며(서비스 구현이 다른 API 버전을 쓰면 그대로 둠), 실패해도 기존 클라이언트로 동작한다.
+    """
+    if not google_client_pool_enabled():
+        return False
+    current = getattr(service, "_client", None)
+    if current is None:
+        return False
+    try:
+        pooled = get_google_client_pool().get(kind, region)
+    except Exception as e:
+        logger.warning("google_client_pool_adopt_failed", kind=kind, error=str(e))
+        return False
+    if type(pooled) is not type(current):
+        return False
+    service._client = pooled
+    return True
@@ -0,0 +1,355 @@
+"""
+Lexical (BM25) Index — owner별 문자 n-gram 역색인
+
+RAGEngine 하이브리드 검색의 어휘 축. 한국어는 형태소 분석 없이 공백 분할만 하면
+조사·어미("예약은", "예약을")가 서로 다른 토큰이 되어 매칭이 거의 일어나지 않으므로,
+어절 안에서 문자 bigram을 뽑아 색인한다("예약은" → "예약", "약은").
+
+- 지식 컬렉션 쓰기는 모두 `_VectorDbWrapper.write()`를 거치며 `get_lexical_index_registry()`에 통지 → 증분 갱신
+- owner 인덱스가 아직 없거나 TTL(LEXICAL_INDEX_TTL_SEC, 기본 60초)이 지나면 RAGEngine이 검색 때
+  vector_db.get(where=owner)로 다시 적재 — 다른 프로세스의 쓰기도 TTL 안에 반영된다
+- 적재(loader 호출)는 owner별 락 안에서 한 번만 실행하고 전역 락 밖에서 돌린다 — 다른 owner 검색·쓰기 통지를
+  막지 않으며, 결과만 전역 락 아래에서 교체한다
+- 적재 도중 쓰기 통지가 끼면 그 적재 결과는 곧바로 만료 처리 (다음 검색 때 재적재)
+- 메타데이터(category/doc_type 등)도 함께 보관해 Chroma where 절과 같은 필터를 메모리에서 적용
+"""
+
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from src.common.sip_owner import normalize_owner_username
+
+logger = structlog.get_logger(__name__)
+
+# 한글 음절 / 영숫자만 남기고 나머지는 어절 구분자로 취급
+_TOKEN_SPLIT_RE = re.compile(r"[^0-9a-zA-Z가-힣]+")
+
+# BM25 기본 파라미터 (짧은 FAQ 위주 → 길이 정규화 b는 표준값 유지)
+DEFAULT_BM25_K1 = 1.2
+DEFAULT_BM25_B = 0.75
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, str(default)))
+    except ValueError:
+        return default
+
+
+def tokenize_for_lexical(text: str, ngram: int = 2) -> List[str]:
+    """어절별 문자 n-gram 토큰 목록.
+
+    n보다 짧은 어절("길", "몇")은 어절 자체를 토큰으로 쓴다. 영문/숫자는 소문자로 정규화.
+    """
+    if not text:
+        return []
+    tokens: List[str] = []
+    for word in _TOKEN_SPLIT_RE.split(text.lower()):
+        if not word:
+            continue
+        if len(word) <= ngram:
+            tokens.append(word)
+            continue
+        tokens.extend(word[i : i + ngram] for i in range(len(word) - ngram + 1))
+    return tokens
+
+
+def metadata_matches_where(metadata: Optional[Dict[str, Any]], where: Optional[Dict[str, Any]]) -> bool:
+    """Chroma where 절(RAGEngine이 만드는 부분집합: $and/$or/$eq/$ne/$in/$nin, 단순 값)을 메모리에서 평가."""
+    if not where:
+        return True
+    meta = metadata if isinstance(metadata, dict) else {}
+    for key, cond in where.items():
+        if key == "$and":
+            if not all(metadata_matches_where(meta, c) for c in (cond or [])):
+                return False
+            continue
+        if key == "$or":
+            if not any(metadata_matches_where(meta, c) for c in (cond or [])):
+                return False
+            continue
+        value = meta.get(key)
+        if isinstance(cond, dict):
+            for op, expected in cond.items():
+                if op == "$eq" and value != expected:
+                    return False
+                if op == "$ne" and value == expected:
+                    return False
+                if op == "$in" and value not in (expected or []):
+                    return False
+                if op == "$nin" and value in (expected or []):
+                    return False
+        elif value != cond:
+            return False
+    return True
+
+
+class BM25Index:
+    """단일 owner용 증분 BM25 역색인 (thread-safe).
+
+    postings: term → {doc_id: tf}. 문서 삭제/갱신 시 해당 문서의 term만 갱신하므로
+    upsert 비용은 문서 길이에 비례하고 전체 재색인이 필요 없다.
+    """
+
+    def __init__(self, k1: float = DEFAULT_BM25_K1, b: float = DEFAULT_BM25_B, ngram: int = 2):
+        self.k1 = k1
+        self.b = b
+        self.ngram = ngram
+        self._postings: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._doc_len: Dict[str, int] = {}
+        self._doc_terms: Dict[str, Tuple[str, ...]] = {}
+        self._texts: Dict[str, str] = {}
+        self._metadatas: Dict[str, Dict[str, Any]] = {}
+        self._total_len = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._doc_len)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_len
+
+    def upsert(self, doc_id: str, text: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        if not doc_id:
+            return
+        tf = Counter(tokenize_for_lexical(text or "", self.ngram))
+        with self._lock:
+            self._remove_locked(doc_id)
+            for term, count in tf.items():
+                self._postings[term][doc_id] = count
+            length = sum(tf.values())
+            self._doc_len[doc_id] = length
+            self._doc_terms[doc_id] = tuple(tf.keys())
+            self._texts[doc_id] = text or ""
+            self._metadatas[doc_id] = dict(metadata) if isinstance(metadata, dict) else {}
+            self._total_len += length
+
+    def remove(self, doc_id: str) -> None:
+        with self._lock:
+            self._remove_locked(doc_id)
+
+    def _remove_locked(self, doc_id: str) -> None:
+        if doc_id not in self._doc_len:
+            return
+        for term in self._doc_terms.pop(doc_id, ()):
+            plist = self._postings.get(term)
+            if plist is None:
+                continue
+            plist.pop(doc_id, None)
+            if not plist:
+                del self._postings[term]
+        self._total_len -= self._doc_len.pop(doc_id, 0)
+        self._texts.pop(doc_id, None)
+        self._metadatas.pop(doc_id, None)
+
+    def get_document(self, doc_id: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            if doc_id not in self._doc_len:
+                return None
+            return self._texts.get(doc_id, ""), dict(self._metadatas.get(doc_id) or {})
+
+    def score(
+        self,
+        query: str,
+        top_n: int = 20,
+        where: Optional[Dict[str, Any]] = None,
+        restrict_ids: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """BM25 점수 상위 (doc_id, score) 목록. where는 metadata_matches_where로 필터."""
+        q_terms = set(tokenize_for_lexical(query or "", self.ngram))
+        if not q_terms:
+            return []
+        allowed = set(restrict_ids) if restrict_ids is not None else None
+        with self._lock:
+            n_docs = len(self._doc_len)
+            if n_docs == 0:
+                return []
+            avgdl = (self._total_len / n_docs) or 1.0
+            scores: Dict[str, float] = defaultdict(float)
+            for term in q_terms:
+                plist = self._postings.get(term)
+                if not plist:
+                    continue
+                df = len(plist)
+                idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+                for doc_id, tf in plist.items():
+                    if allowed is not None and doc_id not in allowed:
+                        continue
+                    dl = self._doc_len.get(doc_id, 0)
+                    denom = tf + self.k1 * (1.0 - self.b + self.b * dl / avgdl)
+                    scores[doc_id] += idf * (tf * (self.k1 + 1.0)) / denom
+            if where:
+                scores = {
+                    d: s for d, s in scores.items() if metadata_matches_where(self._metadatas.get(d), where)
+                }
+        ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+        return ranked[: max(0, int(top_n))]
+
+
+class LexicalIndexRegistry:
+    """owner → BM25Index. 지식 쓰기 경로(_VectorDbWrapper)와 RAGEngine 검색 경로가 공유."""
+
+    def __init__(self, ttl_sec: Optional[float] = None) -> None:
+        self.ttl_sec = ttl_sec if ttl_sec is not None else _env_float("LEXICAL_INDEX_TTL_SEC", 60.0)
+        self._indexes: Dict[str, BM25Index] = {}
+        self._loaded_at: Dict[str, float] = {}
+        self._writes = 0  # 쓰기 통지 횟수 (적재 중 쓰기 감지용)
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}  # owner별 적재 single-flight
+
+    @staticmethod
+    def _owner_key(owner: Optional[str]) -> str:
+        return normalize_owner_username(owner) or (owner or "").strip()
+
+    def _fresh(self, key: str) -> bool:
+        return time.monotonic() - self._loaded_at.get(key, float("-inf")) <= self.ttl_sec
+
+    def get(self, owner: Optional[str]) -> Optional[BM25Index]:
+        """TTL 안의 owner 인덱스 (없거나 만료면 None → ensure_loaded로 재적재)."""
+        key = self._owner_key(owner)
+        index = self._indexes.get(key)
+        if index is None or not self._fresh(key):
+            return None
+        return index
+
+    def ensure_loaded(
+        self,
+        owner: Optional[str],
+        loader: Callable[[str], Dict[str, Any]],
+    ) -> Optional[BM25Index]:
+        """owner 인덱스가 없거나 만료됐으면 loader(owner) → {ids, documents, metadatas}로 (재)적재."""
+        key = self._owner_key(owner)
+        if not key:
+            return None
+        existing = self.get(key)
+        if existing is not None:
+            return existing
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            # 같은 owner를 먼저 적재한 스레드가 있었으면 그 결과를 쓴다
+            with self._lock:
+                existing = self._indexes.get(key)
+                if existing is not None and self._fresh(key):
+                    return existing
+                writes = self._writes
+            try:
+                raw = loader(key) or {}
+            except Exception as e:
+                logger.warning("lexical_index_load_failed", owner=key, error=str(e))
+                return existing
+            index = BM25Index()
+            ids = list(raw.get("ids") or [])
+            docs = list(raw.get("documents") or [])
+            metas = list(raw.get("metadatas") or [])
+            for i, doc_id in enumerate(ids):
+                text = docs[i] if i < len(docs) and isinstance(docs[i], str) else ""
+                meta = metas[i] if i < len(metas) and isinstance(metas[i], dict) else {}
+                index.upsert(doc_id, text, meta)
+            with self._lock:
+                self._indexes[key] = index
+                # 적재 중 쓰기가 있었으면 그 쓰기가 빠졌을 수 있으므로 다음 검색 때 다시 적재
+                self._loaded_at[key] = time.monotonic() if writes == self._writes else float("-inf")
+        logger.info("lexical_index_loaded", owner=key, documents=len(index), reloaded=existing is not None)
+        return index
+
+    def on_upsert(
+        self,
+        ids: List[str],
+        documents: Optional[List[Optional[str]]],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """지식 쓰기 통지. 이미 적재된 owner 인덱스만 증분 갱신(미적재 owner는 첫 검색 때 전체 적재).
+
+        documents/metadatas가 None이면(메타데이터만·본문만 바꾸는 update) 인덱스의 기존 값을 유지한다.
+        """
+        self._note_write()
+        for i, doc_id in enumerate(ids or []):
+            current = self._find(doc_id)
+            meta: Optional[Dict[str, Any]] = None
+            if metadatas is not None:
+                meta = metadatas[i] if i < len(metadatas) and isinstance(metadatas[i], dict) else {}
+            text: Optional[str] = None
+            if documents is not None:
+                text = documents[i] if i < len(documents) and isinstance(documents[i], str) else ""
+            if current is not None:
+                stored = current.get_document(doc_id)
+                if stored is not None:
+                    text = stored[0] if text is None else text
+                    meta = stored[1] if meta is None else meta
+            index = self._indexes.get(self._owner_key((meta or {}).get("owner")))
+            if index is None or text is None:
+                # owner가 바뀐 문서가 다른 인덱스에 남지 않도록 제거. 본문을 모르면 owner 인덱스는 재적재
+                self._remove_everywhere(doc_id)
+                if index is not None:
+                    self.invalidate((meta or {}).get("owner"))
+                continue
+            for other in list(self._indexes.values()):
+                if other is not index and doc_id in other:
+                    other.remove(doc_id)
+            index.upsert(doc_id, text, meta)
+
+    def on_delete(self, ids: Optional[List[str]] = None, where: Optional[Dict[str, Any]] = None) -> None:
+        """지식 삭제 통지. where 삭제는 대상 id를 알 수 없으므로 해당 owner(또는 전체) 인덱스를 폐기."""
+        self._note_write()
+        for doc_id in ids or []:
+            self._remove_everywhere(doc_id)
+        if where and not ids:
+            owner = where.get("owner") if isinstance(where, dict) else None
+            if isinstance(owner, dict):
+                owner = owner.get("$eq")
+            if isinstance(owner, str) and owner:
+                self.invalidate(owner)
+            else:
+                self.invalidate()
+
+    def _note_write(self) -> None:
+        with self._lock:
+            self._writes += 1
+
+    def invalidate(self, owner: Optional[str] = None) -> None:
+        with self._lock:
+            if owner is None:
+                self._indexes.clear()
+                self._loaded_at.clear()
+            else:
+                key = self._owner_key(owner)
+                self._indexes.pop(key, None)
+                self._loaded_at.pop(key, None)
+
+    def _find(self, doc_id: str) -> Optional[BM25Index]:
+        for index in list(self._indexes.values()):
+            if doc_id in index:
+                return index
+        return None
+
+    def _remove_everywhere(self, doc_id: str) -> None:
+        for index in list(self._indexes.values()):
+            index.remove(doc_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "owners": len(self._indexes),
+            "documents": {k: len(v) for k, v in self._indexes.items()},
+        }
+
+
+_registry: Optional[LexicalIndexRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_lexical_index_registry() -> LexicalIndexRegistry:
+    """프로세스 공용 레지스트리 (API 스레드·AI 파이프라인이 같은 인덱스를 본다)."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = LexicalIndexRegistry()
+    return _registry
@@ -30,9 +30,12 @@ if _import_logger_available and _genai_import_start is not None:
 
 import asyncio
 import re
-from typing import List, Dict, Optional, Any
+import threading
+from typing import AsyncIterator, Awaitable, List, Dict, Optional, Any
 import json
 
+from .llm_response_cache import get_llm_response_cache
+
 logger = structlog.get_logger(__name__)
 
 
@@ -62,6 +65,67 @@ class _GenAIModelAdapter:
             config=generation_config,
         )
 
+    async def generate_content_stream_async(self, contents, generation_config=None):
+        """google-genai 비동기 클라이언트(client.aio) 스트리밍 — 청크 대기가 이벤트 루프를 막지 않는다."""
+        return await self._client.aio.models.generate_content_stream(
+            model=self.model_name,
+            contents=contents,
+            config=generation_config,
+        )
+
+
+# 스트리밍 대기 중 cancel_event가 set됐음을 알리는 표식
+_STREAM_CANCELLED = object()
+# 스트리밍 기본 타임아웃(초): 첫 텍스트 청크 / 이후 청크 간격
+DEFAULT_STREAM_FIRST_TOKEN_TIMEOUT_SEC = 10.0
+DEFAULT_STREAM_CHUNK_TIMEOUT_SEC = 8.0
+
+# generate_response 폴백 문구 (응답 캐시에 저장하지 않음)
+_RESPONSE_TIMEOUT_FALLBACK = "죄송합니다. 일시적으로 처리가 지연되고 있습니다. 잠시 후 다시 질문해 주시거나, 담당자 연결이 필요하시면 말씀해 주세요."
+_RESPONSE_ERROR_FALLBACK = "죄송합니다, 답변을 생성하는 중 오류가 발생했습니다."
+
+
+def _cacheable_response(text: Any) -> bool:
+    return bool(text) and text not in (_RESPONSE_TIMEOUT_FALLBACK, _RESPONSE_ERROR_FALLBACK)
+
+
+async def _await_stream_step(
+    aw: Awaitable[Any],
+    timeout: Optional[float],
+    cancel_event: Optional[asyncio.Event],
+) -> Any:
+    """
+    스트림 한 단계(열기/다음 청크) 대기.
+
+    Returns:
+        aw 결과, cancel_event가 먼저 set되면 _STREAM_CANCELLED
+    Raises:
+        asyncio.TimeoutError: timeout 초과 (대기 중인 단계는 취소)
+    """
+    step = asyncio.ensure_future(aw)
+    if cancel_event is None:
+        try:
+            return await asyncio.wait_for(step, timeout) if timeout is not None else await step
+        finally:
+            if not step.done():
+                step.cancel()
+    stop = asyncio.ensure_future(cancel_event.wait())
+    try:
+        done, _ = await asyncio.wait(
+            {step, stop}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        stop.cancel()
+        if not step.done():
+            step.cancel()
+    if step in done:
+        return step.result()
+    # 취소된 단계가 정리될 때까지 한 번 양보 (이후 스트림 aclose 충돌 방지)
+    await asyncio.gather(step, return_exceptions=True)
+    if stop in done:
+        return _STREAM_CANCELLED
+    raise asyncio.TimeoutError()
+
 
 def _finish_reason_name(response: Any) -> Optional[str]:
     """google-genai 응답에서 finish_reason을 문자열 이름(STOP/MAX_TOKENS/SAFETY/...)으로 정규화.
@@ -124,6 +188,17 @@ class LLMClient:
         }
         self.generation_config = genai.types.GenerateContentConfig(**_init_kw)
         
+        # 스트리밍 타임아웃 (첫 텍스트 청크 / 청크 간격)
+        self.stream_first_token_timeout = float(
+            config.get("stream_first_token_timeout_sec", DEFAULT_STREAM_FIRST_TOKEN_TIMEOUT_SEC)
+        )
+        self.stream_chunk_timeout = float(
+            config.get("stream_chunk_timeout_sec", DEFAULT_STREAM_CHUNK_TIMEOUT_SEC)
+        )
+        self.last_stream_first_token_ms: Optional[float] = None
+        self.stream_cancellations = 0
+        self.stream_timeouts = 0
+
         # 대화 히스토리
         self.conversation_history: List[Dict[str, str]] = []
         self.max_history_length = config.get("max_history_length", 20)
@@ -173,7 +248,31 @@ class LLMClient:
             kwargs["thinking_config"] = tc
         return genai.types.GenerateContentConfig(**kwargs)
     
-    async def generate_simple(self, prompt: str, max_tokens: Optional[int] = None, timeout_seconds: float = 10.0) -> str:
+    def _response_cache_key(
+        self,
+        prompt: str,
+        *,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        return get_llm_response_cache().make_key(
+            model=self.model_name,
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=self.config.get("temperature", 0.7) if temperature is None else temperature,
+            max_output_tokens=max_output_tokens,
+            extra=extra,
+        )
+
+    async def generate_simple(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        timeout_seconds: float = 10.0,
+        cache_site: Optional[str] = None,
+    ) -> str:
         """
         간단한 프롬프트로 LLM 응답 생성 (HITL 응답 다듬기 등).
         
@@ -181,10 +280,21 @@ class LLMClient:
             prompt: 프롬프트 텍스트
             max_tokens: 최대 토큰 수 (기본값은 설정값 사용)
             timeout_seconds: API 타임아웃 (기본 10초)
+            cache_site: 지정 시 같은 프롬프트·설정의 결과를 응답 캐시에서 재사용 (호출 지점 이름 = 통계 키)
             
         Returns:
             생성된 텍스트
         """
+        if cache_site:
+            key = self._response_cache_key(prompt, max_output_tokens=max_tokens)
+            return await get_llm_response_cache().get_or_compute(
+                cache_site, key, lambda: self._generate_simple_uncached(prompt, max_tokens, timeout_seconds)
+            )
+        return await self._generate_simple_uncached(prompt, max_tokens, timeout_seconds)
+
+    async def _generate_simple_uncached(
+        self, prompt: str, max_tokens: Optional[int], timeout_seconds: float
+    ) -> str:
         try:
             gen_config = self._effective_generation_config(max_tokens)
             
@@ -217,13 +327,32 @@ class LLMClient:
         *,
         max_tokens: int = 512,
         timeout_seconds: float = 22.0,
+        cache_site: Optional[str] = "help_items",
     ) -> tuple[str, bool]:
         """
         help 의도 전용: JSON만 출력하도록 유도 + 가능 시 response_mime_type=application/json.
 
+        같은 지식 집합(지식 버전)·같은 프롬프트면 응답 캐시 결과를 재사용한다 (cache_site=None이면 항상 호출).
+
         Returns:
             (raw_text, json_mode_applied) — json_mode_applied는 API에 JSON MIME을 붙였는지 여부.
         """
+        if cache_site:
+            key = self._response_cache_key(
+                prompt, temperature=0.05, max_output_tokens=max_tokens, extra={"json": True}
+            )
+            text, json_mode_applied = await get_llm_response_cache().get_or_compute(
+                cache_site,
+                key,
+                lambda: self._generate_help_items_json_uncached(prompt, max_tokens, timeout_seconds),
+                cacheable=lambda result: bool(result[0]),
+            )
+            return text, bool(json_mode_applied)
+        return await self._generate_help_items_json_uncached(prompt, max_tokens, timeout_seconds)
+
+    async def _generate_help_items_json_uncached(
+        self, prompt: str, max_tokens: int, timeout_seconds: float
+    ) -> tuple[str, bool]:
         json_mode_applied = False
         try:
             tc = self._thinking_off()
@@ -285,6 +414,7 @@ class LLMClient:
         timeout_seconds: float = 30.0,  # ✅ API 타임아웃 설정
         max_output_tokens: Optional[int] = None,
         update_history: bool = True,
+        cache_site: Optional[str] = None,
     ) -> str:
         """
         사용자 입력에 대한 답변 생성
@@ -302,10 +432,41 @@ class LLMClient:
                 JSON 등이 다음 호출의 "이전 대화" 컨텍스트로 섞여 들어가 실제 응답 생성 LLM이
                 이를 그대로 따라 하는(예: 분류 JSON을 응답으로 반환) 문제가 생긴다(2026-07-29
                 발견·수정, `tts_response_meta_json_blocked` 근본 원인).
+            cache_site: 지정하고 update_history=False인 내부 호출이면 같은 프롬프트(이전 대화 포함)·설정의
+                결과를 응답 캐시에서 재사용한다 (rewrite_query/classify_intent 등). 폴백 문구는 저장하지 않는다.
             
         Returns:
             생성된 답변 텍스트
         """
+        if cache_site and not update_history:
+            prompt = self._build_conversation_prompt(user_text, context_docs, system_prompt)
+            key = self._response_cache_key(
+                prompt, system_prompt=system_prompt, max_output_tokens=max_output_tokens
+            )
+            return await get_llm_response_cache().get_or_compute(
+                cache_site,
+                key,
+                lambda: self._generate_response_uncached(
+                    user_text, context_docs, system_prompt, call_id, timeout_seconds,
+                    max_output_tokens, update_history,
+                ),
+                cacheable=_cacheable_response,
+            )
+        return await self._generate_response_uncached(
+            user_text, context_docs, system_prompt, call_id, timeout_seconds,
+            max_output_tokens, update_history,
+        )
+
+    async def _generate_response_uncached(
+        self,
+        user_text: str,
+        context_docs: List[str],
+        system_prompt: Optional[str],
+        call_id: Optional[str],
+        timeout_seconds: float,
+        max_output_tokens: Optional[int],
+        update_history: bool,
+    ) -> str:
         import time
         start_time = time.time()
         
@@ -339,7 +500,7 @@ class LLMClient:
                            timeout_seconds=timeout_seconds,
                            note="Gemini API 타임아웃 → Fallback 응답 사용")
                 # Fallback 응답
-                return "죄송합니다. 일시적으로 처리가 지연되고 있습니다. 잠시 후 다시 질문해 주시거나, 담당자 연결이 필요하시면 말씀해 주세요."
+                return _RESPONSE_TIMEOUT_FALLBACK
             
             # 응답 텍스트 추출
             answer = (response.text or "").strip()
@@ -424,7 +585,132 @@ class LLMClient:
             
         except Exception as e:
             logger.error("LLM generation error", error=str(e), exc_info=True)
-            return "죄송합니다, 답변을 생성하는 중 오류가 발생했습니다."
+            return _RESPONSE_ERROR_FALLBACK
+
+    def _start_stream_reader(
+        self,
+        prompt: str,
+        gen_cfg: Any,
+        loop: asyncio.AbstractEventLoop,
+        queue: "asyncio.Queue",
+        stop: threading.Event,
+    ) -> threading.Thread:
+        """
+        동기 스트림(generate_content(stream=True))을 전용 스레드에서 읽어 queue로 전달.
+
+        queue 항목: ("chunk", chunk) | ("end", None) | ("error", Exception)
+        stop이 set되면 다음 청크 수신 시점에 읽기를 멈추고 응답을 닫는다.
+        """
+
+        def _put(item: tuple) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                pass  # 이벤트 루프 종료
+
+        def _run() -> None:
+            response = None
+            try:
+                response = self.model.generate_content(
+                    prompt, generation_config=gen_cfg, stream=True
+                )
+                for chunk in response:
+                    if stop.is_set():
+                        break
+                    _put(("chunk", chunk))
+                _put(("end", None))
+            except Exception as e:
+                _put(("error", e))
+            finally:
+                close = getattr(response, "close", None)
+                if callable(close):
+                    try:
+                        close()
+                    except Exception:
+                        pass
+
+        t = threading.Thread(target=_run, name="llm-stream-reader", daemon=True)
+        t.start()
+        return t
+
+    async def _stream_text_chunks(
+        self,
+        prompt: str,
+        gen_cfg: Any,
+        *,
+        first_token_timeout: float,
+        chunk_timeout: float,
+        deadline: float,
+        cancel_event: Optional[asyncio.Event] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Gemini 스트리밍 텍스트 조각을 이벤트 루프를 막지 않고 순서대로 yield.
+
+        - 기본: google-genai 비동기 클라이언트(client.aio) — 청크 대기가 루프의 await
+        - 폴백(모델 어댑터에 비동기 경로 없음): 리더 스레드가 동기 iterator를 읽어 asyncio.Queue로 전달
+        첫 텍스트 청크는 first_token_timeout, 이후 청크는 chunk_timeout, 전체는 deadline(monotonic) 안에 와야 한다.
+        cancel_event가 set되면(barge-in 등) 조용히 종료하고 스트림을 닫는다.
+        """
+        loop = asyncio.get_running_loop()
+        stop = threading.Event()
+        stream: Any = None
+        first = True
+        started = time.monotonic()
+        self.last_stream_first_token_ms = None
+
+        def _step_timeout() -> float:
+            base = first_token_timeout if first else chunk_timeout
+            return max(0.0, min(base, deadline - time.monotonic()))
+
+        try:
+            async_open = getattr(self.model, "generate_content_stream_async", None)
+            if callable(async_open):
+                opened = await _await_stream_step(
+                    async_open(prompt, generation_config=gen_cfg), _step_timeout(), cancel_event
+                )
+                if opened is _STREAM_CANCELLED:
+                    self.stream_cancellations += 1
+                    return
+                stream = opened.__aiter__()
+
+                def _next_chunk() -> Awaitable[Any]:
+                    return stream.__anext__()
+            else:
+                queue: asyncio.Queue = asyncio.Queue()
+                self._start_stream_reader(prompt, gen_cfg, loop, queue, stop)
+
+                async def _next_chunk() -> Any:
+                    kind, payload = await queue.get()
+                    if kind == "end":
+                        raise StopAsyncIteration
+                    if kind == "error":
+                        raise payload
+                    return payload
+
+            while True:
+                try:
+                    chunk = await _await_stream_step(_next_chunk(), _step_timeout(), cancel_event)
+                except StopAsyncIteration:
+                    return
+                if chunk is _STREAM_CANCELLED:
+                    self.stream_cancellations += 1
+                    logger.info("llm_streaming_cancelled", first_token_received=not first)
+                    return
+                text = getattr(chunk, "text", "") or ""
+                if not text:
+                    continue
+                if first:
+                    first = False
+                    self.last_stream_first_token_ms = round((time.monotonic() - started) * 1000, 1)
+                yield text
+        finally:
+            stop.set()
+            aclose = getattr(stream, "aclose", None)
+            if callable(aclose):
+                try:
+                    await aclose()
+                except Exception:
+                    pass
 
     async def generate_response_streaming(
         self,
@@ -433,10 +719,22 @@ class LLMClient:
         system_prompt: Optional[str] = None,
         timeout_seconds: float = 30.0,
         max_output_tokens: Optional[int] = None,
+        first_token_timeout: Optional[float] = None,
+        chunk_timeout: Optional[float] = None,
+        cancel_event: Optional[asyncio.Event] = None,
     ):
         """
         스트리밍 LLM 응답 생성. 문장 단위로 yield.
 
+        청크 수신은 google-genai 비동기 클라이언트(또는 리더 스레드 + asyncio.Queue)로 처리해
+        토큰 대기 동안 이벤트 루프(SIP/RTP·다른 통화 파이프라인)를 막지 않는다.
+
+        Args:
+            timeout_seconds: 전체 응답 상한
+            first_token_timeout: 첫 텍스트 청크 상한 (None이면 stream_first_token_timeout_sec, 기본 10초)
+            chunk_timeout: 청크 간격 상한 (None이면 stream_chunk_timeout_sec, 기본 8초)
+            cancel_event: set되면(barge-in 등) 남은 스트림을 닫고 추가 문장 없이 종료
+
         Yields:
             str: 완성된 문장 (마침표/물음표/느낌표로 끝나는 단위)
         """
@@ -446,24 +744,19 @@ class LLMClient:
         gen_cfg = self._effective_generation_config(max_output_tokens)
 
         buffer = ""
+        received = False
         try:
-            loop = asyncio.get_event_loop()
-            response = await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    lambda: self.model.generate_content(
-                        prompt,
-                        generation_config=gen_cfg,
-                        stream=True,
-                    )
+            async for text in self._stream_text_chunks(
+                prompt,
+                gen_cfg,
+                first_token_timeout=(
+                    self.stream_first_token_timeout if first_token_timeout is None else first_token_timeout
                 ),
-                timeout=timeout_seconds,
-            )
-
-            for chunk in response:
-                text = getattr(chunk, "text", "") or ""
-                if not text:
-                    continue
+                chunk_timeout=self.stream_chunk_timeout if chunk_timeout is None else chunk_timeout,
+                deadline=time.monotonic() + timeout_seconds,
+                cancel_event=cancel_event,
+            ):
+                received = True
                 buffer += text
                 while True:
                     match = _re.search(r"[.?!。]\s*", buffer)
@@ -475,12 +768,18 @@ class LLMClient:
                     if sentence:
                         yield sentence
 
-            if buffer.strip():
+            cancelled = bool(cancel_event is not None and cancel_event.is_set())
+            if buffer.strip() and not cancelled:
                 yield buffer.strip()
 
             self.total_requests += 1
         except asyncio.TimeoutError:
-            logger.error("llm_streaming_timeout", timeout_seconds=timeout_seconds)
+            self.stream_timeouts += 1
+            logger.error(
+                "llm_streaming_timeout",
+                timeout_seconds=timeout_seconds,
+                first_token_received=received,
+            )
             if buffer.strip():
                 yield buffer.strip()
             else:
@@ -1150,6 +1449,9 @@ JSON:"""
             "total_requests": self.total_requests,
             "total_tokens": self.total_tokens,
             "history_length": len(self.conversation_history),
+            "last_stream_first_token_ms": self.last_stream_first_token_ms,
+            "stream_cancellations": self.stream_cancellations,
+            "stream_timeouts": self.stream_timeouts,
             "avg_tokens_per_request": (
                 self.total_tokens / self.total_requests 
                 if self.total_requests > 0 else 0
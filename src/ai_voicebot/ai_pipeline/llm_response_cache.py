@@ -0,0 +1,393 @@
+"""
+LLM 호출 결과 캐시 (결정적 키: 모델·시스템 프롬프트·정규화된 입력·생성 설정·지식 버전).
+
+의미 기반 QA 캐시와 별개로, 통화 간에 글자 그대로 같은 보조 LLM 호출이 반복된다 —
+흔한 짧은 발화의 rewrite_query/classify_intent, 같은 지식 집합의 generate_help_items_json,
+같은 대본의 통화 요약 등. 이 캐시는 그런 호출의 Gemini 왕복을 턴 경로에서 빼낸다.
+
+- 키: model + system_prompt 해시 + 공백 정규화한 프롬프트 + temperature·max_output_tokens + 지식 버전
+- 메모리 LRU + TTL (LLM_CACHE_MAX_ENTRIES, LLM_CACHE_TTL_SEC)
+- 선택 SQLite 영속화: LLM_CACHE_DB_PATH 지정 시에만 (통화 요약 등 대본이 디스크에 남지 않도록 기본 꺼짐)
+- single-flight: 같은 키의 동시 요청은 첫 요청의 결과를 함께 기다림
+- 호출 지점(call_site)별 hit/miss/coalesced 통계 → get_stats()
+- 지식 버전: 지식 upsert/delete 알림(help_cache.notify_knowledge_changed)마다 bump_knowledge_version()
+  → 이전 지식으로 만든 결과는 키가 달라져 다시 쓰이지 않는다
+
+캐시하지 않는 값(타임아웃·오류 폴백 문구, 빈 응답)은 호출부의 cacheable 판정으로 걸러낸다.
+환경변수 LLM_RESPONSE_CACHE=0 이면 조회·저장 없이 항상 호출한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_TTL_SEC = 600.0
+
+_WS_RE = re.compile(r"\s+")
+
+# 계산하던 요청이 취소됐음을 기다리던 요청에 알리는 표식 (받은 쪽은 다시 조회·계산)
+_LEADER_CANCELLED = object()
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    call_site TEXT NOT NULL,
+    value_json TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS llm_cache_meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def llm_response_cache_enabled() -> bool:
+    return os.environ.get("LLM_RESPONSE_CACHE", "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+def normalize_prompt(text: str) -> str:
+    return _WS_RE.sub(" ", text or "").strip()
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+class _SiteStats:
+    __slots__ = ("hits", "misses", "coalesced", "stores", "uncacheable")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.stores = 0
+        self.uncacheable = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "stores": self.stores,
+            "uncacheable": self.uncacheable,
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 3) if lookups else 0.0,
+        }
+
+
+class LLMResponseCache:
+    """LLMClient 보조 호출 결과 캐시 (프로세스 공용)."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_sec: float = DEFAULT_TTL_SEC,
+        db_path: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            max_entries: 메모리 LRU 상한
+            ttl_sec: 항목 유효 시간 (0 이하면 만료 없음)
+            db_path: SQLite 영속화 경로 (None/빈 문자열이면 메모리만)
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_sec = float(ttl_sec)
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = {}
+        self._sites: Dict[str, _SiteStats] = {}
+        self.evictions = 0
+        self.expired = 0
+        self.disk_hits = 0
+        self._knowledge_version = 0
+        self._db_path = db_path or None
+        if self._db_path:
+            self._init_db()
+
+    # ── SQLite 계층 ──
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._db_path, timeout=5.0)
+
+    def _init_db(self) -> None:
+        try:
+            Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.executescript(_DDL)
+                row = conn.execute(
+                    "SELECT value FROM llm_cache_meta WHERE name = 'knowledge_version'"
+                ).fetchone()
+                if row:
+                    self._knowledge_version = int(row[0])
+                conn.execute("DELETE FROM llm_cache WHERE expires_at > 0 AND expires_at < ?", (self._clock(),))
+        except Exception as e:
+            logger.warning("llm_cache_db_init_failed", path=self._db_path, error=str(e))
+            self._db_path = None
+
+    def _db_get(self, key: str) -> Optional[Tuple[Any, float]]:
+        if not self._db_path:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value_json, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except Exception as e:
+            logger.debug("llm_cache_db_read_failed", error=str(e))
+            return None
+        if not row:
+            return None
+        return json.loads(row[0]), float(row[1])
+
+    def _db_put(self, key: str, call_site: str, value: Any, expires_at: float) -> None:
+        if not self._db_path:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, call_site, value_json, expires_at) VALUES (?, ?, ?, ?)",
+                    (key, call_site, json.dumps(value, ensure_ascii=False), expires_at),
+                )
+        except Exception as e:
+            logger.debug("llm_cache_db_write_failed", error=str(e))
+
+    # ── 키·지식 버전 ──
+
+    @property
+    def knowledge_version(self) -> int:
+        return self._knowledge_version
+
+    def bump_knowledge_version(self) -> int:
+        """지식 집합 변경 — 이후 키가 모두 달라진다 (메모리 항목은 LRU/TTL로 자연 소멸)."""
+        with self._lock:
+            self._knowledge_version += 1
+            version = self._knowledge_version
+        if self._db_path:
+            try:
+                with self._connect() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO llm_cache_meta (name, value) VALUES ('knowledge_version', ?)",
+                        (str(version),),
+                    )
+                    conn.execute("DELETE FROM llm_cache")
+            except Exception as e:
+                logger.debug("llm_cache_db_version_write_failed", error=str(e))
+        return version
+
+    def make_key(
+        self,
+        *,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        parts = [
+            model or "",
+            _hash(system_prompt or ""),
+            normalize_prompt(prompt),
+            "" if temperature is None else f"{float(temperature):.3f}",
+            "" if max_output_tokens is None else str(int(max_output_tokens)),
+            json.dumps(extra or {}, sort_keys=True, ensure_ascii=False),
+            str(self._knowledge_version),
+        ]
+        return _hash("\x1f".join(parts))
+
+    # ── 조회·저장 ──
+
+    def _site(self, call_site: str) -> _SiteStats:
+        stats = self._sites.get(call_site)
+        if stats is None:
+            stats = self._sites[call_site] = _SiteStats()
+        return stats
+
+    def _lookup(self, key: str) -> Tuple[bool, Any]:
+        now = self._clock()
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None:
+                value, expires_at = item
+                if expires_at <= 0 or expires_at > now:
+                    self._entries.move_to_end(key)
+                    return True, value
+                del self._entries[key]
+                self.expired += 1
+        disk = self._db_get(key)
+        if disk is not None:
+            value, expires_at = disk
+            if expires_at <= 0 or expires_at > now:
+                with self._lock:
+                    self.disk_hits += 1
+                    self._store_memory(key, value, expires_at)
+                return True, value
+        return False, None
+
+    def _store_memory(self, key: str, value: Any, expires_at: float) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: str, call_site: str = "default") -> Optional[Any]:
+        found, value = self._lookup(key)
+        with self._lock:
+            stats = self._site(call_site)
+            if found:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+        return value if found else None
+
+    def put(self, key: str, value: Any, call_site: str = "default", ttl_sec: Optional[float] = None) -> None:
+        ttl = self.ttl_sec if ttl_sec is None else float(ttl_sec)
+        expires_at = self._clock() + ttl if ttl > 0 else 0.0
+        with self._lock:
+            self._store_memory(key, value, expires_at)
+            self._site(call_site).stores += 1
+        self._db_put(key, call_site, value, expires_at)
+
+    async def get_or_compute(
+        self,
+        call_site: str,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool] = bool,
+    ) -> Any:
+        """
+        캐시 hit면 저장값, 같은 키를 계산 중인 요청이 있으면 그 결과를, 아니면 compute() 결과를 반환.
+
+        cacheable(result)가 False면(폴백 문구·빈 응답) 저장하지 않는다. 기다리던 요청에는 그대로 전달된다.
+        compute()의 예외(Exception)도 기다리던 요청에 전달되지만, 계산하던 요청이 취소되면 기다리던
+        요청들을 깨워 그중 하나가 다시 계산한다.
+        """
+        if not llm_response_cache_enabled():
+            return await compute()
+
+        loop = asyncio.get_running_loop()
+        flight_key = (key, id(loop))
+        while True:
+            found, value = self._lookup(key)
+            with self._lock:
+                stats = self._site(call_site)
+                if found:
+                    stats.hits += 1
+                    return value
+                waiting = self._inflight.get(flight_key)
+                if waiting is not None:
+                    stats.coalesced += 1
+                else:
+                    stats.misses += 1
+                    pending = loop.create_future()
+                    self._inflight[flight_key] = pending
+            if waiting is None:
+                break
+            result = await asyncio.shield(waiting)
+            if result is not _LEADER_CANCELLED:
+                return result
+            # 계산하던 요청이 취소됨(다른 통화의 barge-in 등) — 이 요청이 다시 조회·계산한다
+
+        try:
+            result = await compute()
+        except Exception as e:
+            with self._lock:
+                self._inflight.pop(flight_key, None)
+            if not pending.done():
+                pending.set_exception(e)
+                pending.exception()  # 기다리는 쪽이 없어도 "never retrieved" 경고 방지
+            raise
+        except BaseException:
+            # 취소는 계산한 요청만의 사정 — 기다리던 요청에 CancelledError를 넘기지 않고 깨워서 재계산시킨다
+            with self._lock:
+                self._inflight.pop(flight_key, None)
+            if not pending.done():
+                pending.set_result(_LEADER_CANCELLED)
+            raise
+        with self._lock:
+            self._inflight.pop(flight_key, None)
+        if cacheable(result):
+            self.put(key, result, call_site)
+        else:
+            with self._lock:
+                self._site(call_site).uncacheable += 1
+        if not pending.done():
+            pending.set_result(result)
+        return result
+
+    # ── 통계 ──
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sites = {name: s.snapshot() for name, s in self._sites.items()}
+            entries = len(self._entries)
+        hits = sum(s["hits"] + s["coalesced"] for s in sites.values())
+        lookups = hits + sum(s["misses"] for s in sites.values())
+        return {
+            "enabled": llm_response_cache_enabled(),
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_sec": self.ttl_sec,
+            "knowledge_version": self._knowledge_version,
+            "persistent": bool(self._db_path),
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expired": self.expired,
+            "disk_hits": self.disk_hits,
+            "call_sites": sites,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self._db_path:
+            try:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM llm_cache")
+            except Exception as e:
+                logger.debug("llm_cache_db_clear_failed", error=str(e))
+
+
+_llm_response_cache: Optional[LLMResponseCache] = None
+_llm_response_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    global _llm_response_cache
+    if _llm_response_cache is None:
+        with _llm_response_cache_lock:
+            if _llm_response_cache is None:
+                try:
+                    max_entries = int(os.environ.get("LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+                    ttl_sec = float(os.environ.get("LLM_CACHE_TTL_SEC", DEFAULT_TTL_SEC))
+                except ValueError:
+                    max_entries, ttl_sec = DEFAULT_MAX_ENTRIES, DEFAULT_TTL_SEC
+                _llm_response_cache = LLMResponseCache(
+                    max_entries=max_entries,
+                    ttl_sec=ttl_sec,
+                    db_path=os.environ.get("LLM_CACHE_DB_PATH", "").strip() or None,
+                )
+    return _llm_response_cache
+
+
+def bump_knowledge_version() -> int:
+    return get_llm_response_cache().bump_knowledge_version()
@@ -9,10 +9,19 @@ from dataclasses import dataclass, field
 from collections import Counter
 import asyncio
 import json
+import time
 import structlog
 
+from src.ai_voicebot.ai_pipeline.lexical_index import (
+    BM25Index,
+    LexicalIndexRegistry,
+    get_lexical_index_registry,
+    metadata_matches_where,
+    tokenize_for_lexical,
+)
 from src.ai_voicebot.ai_pipeline.query_hints import looks_like_visit_or_direction_info_query
 from src.ai_voicebot.knowledge.chromadb_client import KNOWLEDGE_COLLECTION
+from src.ai_voicebot.knowledge.vector_store_gateway import get_vector_store_gateway
 from src.common.sip_owner import normalize_owner_username
 
 logger = structlog.get_logger(__name__)
@@ -87,6 +96,9 @@ class RAGEngine:
         similarity_threshold: float = 0.42,
         reranking_enabled: bool = False,
         doc_type_allowlist: Optional[List[str]] = None,
+        hybrid_lexical_weight: float = 0.3,
+        lexical_registry: Optional[LexicalIndexRegistry] = None,
+        lexical_load_limit: int = 5000,
     ):
         """
         Args:
@@ -96,6 +108,9 @@ class RAGEngine:
             similarity_threshold: 유사도 임계값
             reranking_enabled: 재순위화 활성화
             doc_type_allowlist: 설정 시 Chroma where에 doc_type $in 추가 (None이면 미적용)
+            hybrid_lexical_weight: BM25 정규화 점수 가중치 (벡터 유사도에 가산). 0이면 하이브리드 비활성
+            lexical_registry: owner별 BM25 인덱스 레지스트리 (None이면 프로세스 공용)
+            lexical_load_limit: owner 인덱스 최초 적재 시 vector_db.get limit
         """
         self.vector_db = vector_db
         self.embedder = embedder
@@ -106,6 +121,9 @@ class RAGEngine:
         if doc_type_allowlist:
             cleaned = tuple(str(x).strip() for x in doc_type_allowlist if str(x).strip())
             self._doc_type_allowlist = cleaned or None
+        self.hybrid_lexical_weight = max(0.0, float(hybrid_lexical_weight or 0.0))
+        self._lexical_registry = lexical_registry
+        self.lexical_load_limit = lexical_load_limit
         
         # 통계
         self.total_searches = 0
@@ -115,6 +133,7 @@ class RAGEngine:
                    top_k=top_k,
                    threshold=similarity_threshold,
                    reranking=reranking_enabled,
+                   hybrid_lexical_weight=self.hybrid_lexical_weight,
                    doc_type_allowlist=list(self._doc_type_allowlist) if self._doc_type_allowlist else None)
     
     # intent → knowledge category 검색 조건 (CHROMADB_CATEGORY_DESIGN)
@@ -144,6 +163,7 @@ class RAGEngine:
         call_id: Optional[str] = None,  # DB 로깅용
         top_k_override: Optional[int] = None,
         intent: Optional[str] = None,  # intent별 category 필터 (설계 §4.1)
+        query_embedding: Optional[List[float]] = None,  # 미리 계산된 임베딩 (선행 조회 재사용)
     ) -> RAGSearchResult:
         """
         질문에 대한 관련 문서 검색
@@ -153,11 +173,11 @@ class RAGEngine:
             owner_filter: 사용자 ID 필터 (착신자 전용 지식)
             call_id: 통화 ID (DB 로깅용, 선택)
             intent: 의도 — 이에 따라 category 조건 추가 (greeting/farewell/question 등)
+            query_embedding: 주어지면 임베딩 단계를 건너뛴다
             
         Returns:
             RAGSearchResult(documents=..., trace=...) — trace는 rag_search_done.rag_search_trace 로 기록
         """
-        import time
         start_time = time.time()
         owner_for_query = normalize_owner_username(owner_filter) if owner_filter else None
         if owner_filter and owner_for_query != (owner_filter or "").strip():
@@ -181,13 +201,15 @@ class RAGEngine:
 
         try:
             # 1. 질문 임베딩 (TextEmbedder.embed_text sync — embed 메서드 없음)
-            if hasattr(self.embedder, "embed_text"):
-                query_embedding = self.embedder.embed_text(query)
-            elif hasattr(self.embedder, "embed"):
-                fn = self.embedder.embed
-                query_embedding = await fn(query) if asyncio.iscoroutinefunction(fn) else fn(query)
-            else:
-                raise RuntimeError("Embedder has no embed_text or embed method")
+            #    선행 조회(speculative_prefetch)가 넘긴 임베딩이 있으면 재사용
+            if query_embedding is None:
+                if hasattr(self.embedder, "embed_text"):
+                    query_embedding = self.embedder.embed_text(query)
+                elif hasattr(self.embedder, "embed"):
+                    fn = self.embedder.embed
+                    query_embedding = await fn(query) if asyncio.iscoroutinefunction(fn) else fn(query)
+                else:
+                    raise RuntimeError("Embedder has no embed_text or embed method")
             if not query_embedding:
                 tr = _base_trace()
                 tr["abort_reason"] = "empty_query_embedding"
@@ -234,14 +256,29 @@ class RAGEngine:
             soft_floor_used: Optional[float] = None
             after_strict_threshold_count = 0
             # Chroma 후보 풀을 넉넉히 가져온 뒤, 임계값·backfill로 top_k를 채움 (검색은 넓게, LLM이 선별)
-            chroma_n_results = max(effective_top_k * 5, 32)
+            # BM25 인덱스가 있으면 어휘 축이 벡터 풀 밖의 문서를 보충하므로 풀을 줄인다
+            lexical_index = await self._alexical_index_for(owner_for_query)
+            if lexical_index is not None:
+                chroma_n_results = max(effective_top_k * 3, 16)
+            else:
+                chroma_n_results = max(effective_top_k * 5, 32)
             if search_intent == "help":
                 chroma_n_results = max(80, effective_top_k * 4)
-            raw = self.vector_db.query(
-                query_embeddings=[query_embedding],
-                n_results=chroma_n_results,
-                where=filter_dict
-            )
+            # Chroma 동기 I/O는 이벤트 루프 밖(VectorStoreGateway 전용 풀)에서 실행 — 동시 질의는 1회로 묶임
+            if hasattr(self.vector_db, "aquery"):
+                raw = await self.vector_db.aquery(
+                    query_embeddings=[query_embedding],
+                    n_results=chroma_n_results,
+                    where=filter_dict
+                )
+            else:
+                raw = await get_vector_store_gateway().run(
+                    "query",
+                    self.vector_db.query,
+                    query_embeddings=[query_embedding],
+                    n_results=chroma_n_results,
+                    where=filter_dict,
+                )
             ids = raw.get("ids", [[]])[0] if raw.get("ids") else []
             docs_list = raw.get("documents", [[]])[0] if raw.get("documents") else []
             metadatas = raw.get("metadatas", [[]])[0] if raw.get("metadatas") else []
@@ -257,6 +294,14 @@ class RAGEngine:
                 dist = distances[i] if i < len(distances) else 1.0
                 score = 1.0 / (1.0 + float(dist)) if dist is not None else 0.0
                 documents.append(Document(id=doc_id or "", text=text if isinstance(text, str) else "", score=score, metadata=meta))
+
+            # 3-1. BM25 하이브리드 — 벡터 풀 밖 어휘 매칭 문서 보충 (가산점은 임계값 컷 뒤에 적용)
+            lexical_trace: Dict[str, Any] = {"lexical_fusion_applied": False}
+            lexical_boost: Dict[str, float] = {}
+            if lexical_index is not None:
+                documents, lexical_boost, lexical_trace = await self._afuse_lexical(
+                    query, documents, lexical_index, filter_dict, lexical_top_n=chroma_n_results
+                )
             
             # 4. 유사도 필터링
             before_filter = list(documents)
@@ -336,6 +381,9 @@ class RAGEngine:
                         note="strict 통과 문서 부족 시 soft_floor 이상 청크로 보충 — LLM이 관련성 판단",
                     )
                 after_threshold_count = len(documents)
+            # 4-1. BM25 가산 — 임계값·soft_fallback·backfill은 벡터 유사도 원점수로 판정한 뒤 순위만 조정
+            if lexical_boost:
+                documents = self._apply_lexical_boost(documents, lexical_boost)
             logger.info("rag_search_debug",
                         call=True,
                         call_id=call_id or "",
@@ -385,49 +433,7 @@ class RAGEngine:
             
             # DB 로깅 (신규)
             if call_id:
-                try:
-                    from ..logging.ai_logger import log_rag_search_sync
-                    
-                    # 검색 결과를 직렬화 가능한 형태로 변환
-                    search_results_dict = [
-                        {
-                            "id": doc.id,
-                            "text": doc.text,
-                            "score": doc.score
-                        }
-                        for doc in documents
-                    ]
-                    
-                    # RAG 컨텍스트 (실제 사용된 문서)
-                    rag_context = "\n\n".join([doc.text for doc in documents])
-                    
-                    # 최고 점수
-                    top_score = documents[0].score if documents else 0.0
-                    
-                    # 비동기 로깅
-                    log_rag_search_sync(
-                        call_id=call_id,
-                        user_question=query,
-                        search_results=search_results_dict,
-                        top_score=top_score,
-                        rag_context_used=rag_context,
-                        search_latency_ms=search_latency_ms
-                    )
-                    
-                    # 지식 매칭 로깅 (각 문서마다)
-                    from ..logging.ai_logger import log_knowledge_match_sync
-                    for doc in documents:
-                        log_knowledge_match_sync(
-                            call_id=call_id,
-                            matched_knowledge_id=doc.id,
-                            similarity_score=doc.score,
-                            knowledge_text=doc.text,
-                            category=doc.metadata.get("category", "unknown")
-                        )
-                except ImportError:
-                    logger.debug("AI logger not available, skipping DB logging")
-                except Exception as e:
-                    logger.error("rag_db_log_failed", call=True, category="rag", error=str(e))
+                self.log_search_to_db(call_id, query, documents, search_latency_ms)
 
             tr = _base_trace()
             tr["search_intent_used"] = search_intent
@@ -460,6 +466,7 @@ class RAGEngine:
             tr["recall_backfill_added"] = recall_backfill_n
             tr["first_raw_chroma_distance"] = round(first_distance, 6) if first_distance is not None else None
             tr["reranking_applied"] = reranking_applied_flag
+            tr.update(lexical_trace)
             tr["final_returned_count"] = len(documents)
             tr["hit_category_counts"] = _hit_category_counts(documents)
             tr["top_hits_trace"] = _top_hits_trace_rows(documents, max_items=12)
@@ -473,6 +480,179 @@ class RAGEngine:
             tr["error"] = str(e)
             return RAGSearchResult([], tr)
     
+    def log_search_to_db(
+        self,
+        call_id: str,
+        query: str,
+        documents: List[Document],
+        search_latency_ms: int,
+    ) -> None:
+        """검색 결과·매칭 지식을 AI 로그 DB에 기록 (search 내부 및 선행 조회 채택 시 사용)."""
+        try:
+            from ..logging.ai_logger import log_rag_search_sync
+            
+            # 검색 결과를 직렬화 가능한 형태로 변환
+            search_results_dict = [
+                {
+                    "id": doc.id,
+                    "text": doc.text,
+                    "score": doc.score
+                }
+                for doc in documents
+            ]
+            
+            # RAG 컨텍스트 (실제 사용된 문서)
+            rag_context = "\n\n".join([doc.text for doc in documents])
+            
+            # 최고 점수
+            top_score = documents[0].score if documents else 0.0
+            
+            # 비동기 로깅
+            log_rag_search_sync(
+                call_id=call_id,
+                user_question=query,
+                search_results=search_results_dict,
+                top_score=top_score,
+                rag_context_used=rag_context,
+                search_latency_ms=search_latency_ms
+            )
+            
+            # 지식 매칭 로깅 (각 문서마다)
+            from ..logging.ai_logger import log_knowledge_match_sync
+            for doc in documents:
+                log_knowledge_match_sync(
+                    call_id=call_id,
+                    matched_knowledge_id=doc.id,
+                    similarity_score=doc.score,
+                    knowledge_text=doc.text,
+                    category=doc.metadata.get("category", "unknown")
+                )
+        except ImportError:
+            logger.debug("AI logger not available, skipping DB logging")
+        except Exception as e:
+            logger.error("rag_db_log_failed", call=True, category="rag", error=str(e))
+
+    def _lexical_index_for(self, owner: Optional[str]) -> Optional[BM25Index]:
+        """owner BM25 인덱스 (없으면 vector_db.get으로 1회 적재). owner 미지정·비활성 시 None."""
+        if not owner or self.hybrid_lexical_weight <= 0 or not hasattr(self.vector_db, "get"):
+            return None
+        registry = self._lexical_registry or get_lexical_index_registry()
+        return registry.ensure_loaded(
+            owner,
+            lambda o: self.vector_db.get(where={"owner": o}, limit=self.lexical_load_limit),
+        )
+
+    async def _alexical_index_for(self, owner: Optional[str]) -> Optional[BM25Index]:
+        """_lexical_index_for의 비동기 버전 — 최초 적재(vector_db.get)만 게이트웨이 풀에서 실행."""
+        if not owner or self.hybrid_lexical_weight <= 0 or not hasattr(self.vector_db, "get"):
+            return None
+        registry = self._lexical_registry or get_lexical_index_registry()
+        loaded = registry.get(owner)
+        if loaded is not None:
+            return loaded
+        return await get_vector_store_gateway().run("get", self._lexical_index_for, owner)
+
+    async def _afuse_lexical(
+        self,
+        query: str,
+        documents: List[Document],
+        index: BM25Index,
+        where: Optional[Dict[str, Any]],
+        lexical_top_n: int,
+    ) -> Tuple[List[Document], Dict[str, float], Dict[str, Any]]:
+        """BM25 상위 문서 중 벡터 풀 밖 문서의 본문을 Chroma에서 다시 읽은 뒤 _fuse_lexical로 융합.
+
+        인덱스의 본문 사본은 다른 프로세스의 수정·삭제를 TTL 동안 모를 수 있으므로 프롬프트에 넣지 않는다.
+        Chroma에 없는 id(삭제됨)는 버리고, 조회 실패 시 어휘 전용 보충 없이 가산만 한다.
+        """
+        t0 = time.perf_counter()
+        hits = index.score(query, top_n=lexical_top_n, where=where)
+        pool_ids = {d.id for d in documents}
+        only_ids = [doc_id for doc_id, s in hits if s > 0 and doc_id not in pool_ids]
+        fetched: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        if only_ids:
+            try:
+                raw = await get_vector_store_gateway().run(
+                    "get", self.vector_db.get, ids=only_ids, limit=len(only_ids)
+                )
+            except Exception as e:
+                logger.warning("rag_lexical_fetch_failed", error=str(e) or type(e).__name__)
+                raw = {}
+            wanted = set(only_ids)
+            r_ids = list(raw.get("ids") or [])
+            r_docs = list(raw.get("documents") or [])
+            r_metas = list(raw.get("metadatas") or [])
+            for i, doc_id in enumerate(r_ids):
+                if doc_id not in wanted:
+                    continue
+                text = r_docs[i] if i < len(r_docs) and isinstance(r_docs[i], str) else ""
+                meta = r_metas[i] if i < len(r_metas) and isinstance(r_metas[i], dict) else {}
+                # 인덱스 적재 뒤 메타데이터가 바뀌어 필터에서 빠진 문서도 제외
+                if metadata_matches_where(meta, where):
+                    fetched[doc_id] = (text, meta)
+        documents, boost, trace = self._fuse_lexical(documents, hits, fetched, len(index))
+        trace["lexical_dropped_stale"] = len(only_ids) - len(fetched)
+        trace["lexical_latency_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+        return documents, boost, trace
+
+    def _fuse_lexical(
+        self,
+        documents: List[Document],
+        hits: List[Tuple[str, float]],
+        lexical_docs: Dict[str, Tuple[str, Dict[str, Any]]],
+        index_size: int,
+    ) -> Tuple[List[Document], Dict[str, float], Dict[str, Any]]:
+        """
+        벡터 후보에 BM25 상위 문서를 보충하고, 문서별 BM25 가산점(w * bm25 / max_bm25)을 계산
+
+        점수는 바꾸지 않는다 — similarity_threshold 컷이 벡터 유사도 원점수로 이뤄지도록
+        가산은 컷 뒤 _apply_lexical_boost에서 적용한다.
+        - BM25에만 있는 문서: 벡터 풀 최저 점수(풀 밖 문서 유사도의 상한)를 원점수로 추가.
+          본문·메타데이터는 lexical_docs(Chroma에서 방금 읽은 값)로 채우고, 없는 id는 버린다
+
+        Returns:
+            (보충된 후보, id → 가산점, trace)
+        """
+        w = self.hybrid_lexical_weight
+        trace: Dict[str, Any] = {
+            "lexical_fusion_applied": True,
+            "lexical_weight": w,
+            "lexical_hit_count": len(hits),
+            "lexical_index_size": index_size,
+        }
+        if not hits or hits[0][1] <= 0:
+            trace["lexical_boosted_count"] = 0
+            trace["lexical_only_added"] = 0
+            return documents, {}, trace
+        max_bm25 = hits[0][1]
+        boost = {doc_id: w * s / max_bm25 for doc_id, s in hits if s > 0}
+        floor = min((d.score for d in documents), default=0.0)
+        seen = {d.id for d in documents}
+        added = 0
+        for doc_id in boost:
+            if doc_id in seen:
+                continue
+            stored = lexical_docs.get(doc_id)
+            if stored is None:
+                continue
+            text, meta = stored
+            documents.append(Document(id=doc_id, text=text, score=floor, metadata=meta))
+            added += 1
+        documents.sort(key=lambda d: d.score, reverse=True)
+        trace["lexical_boosted_count"] = sum(1 for d in documents if d.id in boost)
+        trace["lexical_only_added"] = added
+        return documents, boost, trace
+
+    @staticmethod
+    def _apply_lexical_boost(documents: List[Document], boost: Dict[str, float]) -> List[Document]:
+        """임계값을 통과한 문서에 BM25 가산점을 더해 재정렬 (상한 1.0)"""
+        for d in documents:
+            bonus = boost.get(d.id)
+            if bonus:
+                d.score = min(1.0, d.score + bonus)
+        documents.sort(key=lambda d: d.score, reverse=True)
+        return documents
+
     async def _rerank(
         self, 
         query: str, 
@@ -482,7 +662,7 @@ class RAGEngine:
         검색 결과 재순위화
         
         단순 벡터 유사도가 아닌 실제 관련성 기반 재순위화
-        (키워드 매칭과 길이 기반)
+        (문자 bigram 커버리지와 길이 기반 — 조사가 붙은 한국어 어절도 매칭)
         
         Args:
             query: 검색 질문
@@ -492,16 +672,16 @@ class RAGEngine:
             재순위화된 문서 리스트
         """
         try:
-            # 질문의 주요 키워드 추출
-            query_words = set(query.lower().split())
+            # 질문의 문자 bigram 추출 (공백 분할은 "예약은"/"예약을"을 다른 단어로 취급)
+            query_terms = set(tokenize_for_lexical(query))
             
             # 각 문서의 재순위 점수 계산
             for doc in documents:
-                doc_words = set(doc.text.lower().split())
+                doc_terms = set(tokenize_for_lexical(doc.text))
                 
                 # 키워드 매칭 비율
-                overlap = len(query_words & doc_words)
-                keyword_score = overlap / len(query_words) if query_words else 0
+                overlap = len(query_terms & doc_terms)
+                keyword_score = overlap / len(query_terms) if query_terms else 0
                 
                 # 문서 길이 패널티 (너무 길면 감점)
                 length_score = 1.0 if len(doc.text) < 300 else 0.8
@@ -607,5 +787,6 @@ class RAGEngine:
             "top_k": self.top_k,
             "similarity_threshold": self.similarity_threshold,
             "reranking_enabled": self.reranking_enabled,
+            "hybrid_lexical_weight": self.hybrid_lexical_weight,
         }
 
@@ -15,6 +15,11 @@ import structlog
 
 from google.cloud import speech
 
+from src.ai_voicebot.ai_pipeline.google_client_pool import (
+    get_google_client_pool,
+    google_client_pool_enabled,
+)
+
 logger = structlog.get_logger(__name__)
 
 
@@ -37,7 +42,9 @@ class STTClient:
                 - enable_automatic_punctuation: True
         """
         self.config = config
-        self.client = speech.SpeechClient()
+        # 프로세스 공용 keepalive 채널 재사용 (통화마다 채널·TLS·인증 재수립 방지)
+        self._pool = get_google_client_pool() if google_client_pool_enabled() else None
+        self.client = self._pool.stt_client() if self._pool is not None else speech.SpeechClient()
 
         self.recognition_config = speech.RecognitionConfig(
             encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
@@ -164,53 +171,60 @@ class STTClient:
         결과는 asyncio.run_coroutine_threadsafe로 이벤트 루프에 전달.
         """
         try:
-            requests = self._request_generator()
-            responses = self.client.streaming_recognize(
-                self.streaming_config, requests
-            )
-
-            for response in responses:
-                if not self._running:
-                    break
-
-                if not response.results:
-                    continue
-
-                result = response.results[0]
-                if not result.alternatives:
-                    continue
-
-                transcript = result.alternatives[0].transcript
-                is_final = result.is_final
-                self.total_results += 1
-
-                logger.debug("STT result",
-                           text=transcript,
-                           is_final=is_final)
-
-                # 이벤트 루프로 콜백 전달 (스레드 안전)
-                if self.result_callback and self._loop and self._loop.is_running():
-                    try:
-                        if asyncio.iscoroutinefunction(self.result_callback):
-                            future = asyncio.run_coroutine_threadsafe(
-                                self.result_callback(transcript, is_final),
-                                self._loop,
-                            )
-                            # 콜백 완료를 최대 2초 대기 (이벤트 루프 지연 방지)
-                            future.result(timeout=2.0)
-                        else:
-                            self._loop.call_soon_threadsafe(
-                                self.result_callback, transcript, is_final
-                            )
-                    except Exception as cb_err:
-                        logger.error("STT callback error", error=str(cb_err))
-
+            if self._pool is not None:
+                with self._pool.track("stt"):
+                    self._consume_responses()
+            else:
+                self._consume_responses()
         except Exception as e:
             logger.error("STT streaming error", error=str(e), exc_info=True)
         finally:
             self._running = False
             logger.info("STT streaming ended")
 
+    def _consume_responses(self):
+        """streaming_recognize 응답을 읽어 콜백으로 전달 (스트림 1개 = 요청 1건)."""
+        requests = self._request_generator()
+        responses = self.client.streaming_recognize(
+            self.streaming_config, requests
+        )
+
+        for response in responses:
+            if not self._running:
+                break
+
+            if not response.results:
+                continue
+
+            result = response.results[0]
+            if not result.alternatives:
+                continue
+
+            transcript = result.alternatives[0].transcript
+            is_final = result.is_final
+            self.total_results += 1
+
+            logger.debug("STT result",
+                       text=transcript,
+                       is_final=is_final)
+
+            # 이벤트 루프로 콜백 전달 (스레드 안전)
+            if self.result_callback and self._loop and self._loop.is_running():
+                try:
+                    if asyncio.iscoroutinefunction(self.result_callback):
+                        future = asyncio.run_coroutine_threadsafe(
+                            self.result_callback(transcript, is_final),
+                            self._loop,
+                        )
+                        # 콜백 완료를 최대 2초 대기 (이벤트 루프 지연 방지)
+                        future.result(timeout=2.0)
+                    else:
+                        self._loop.call_soon_threadsafe(
+                            self.result_callback, transcript, is_final
+                        )
+                except Exception as cb_err:
+                    logger.error("STT callback error", error=str(cb_err))
+
     def get_stats(self) -> dict:
         """STT 통계 반환"""
         return {
@@ -9,9 +9,15 @@ Google Cloud Text-to-Speech gRPC Client
 from google.cloud import texttospeech
 import asyncio
 import re
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Optional, Tuple
 import structlog
 
+from src.ai_voicebot.ai_pipeline.google_client_pool import (
+    get_google_client_pool,
+    google_client_pool_enabled,
+)
+from src.ai_voicebot.ai_pipeline.tts_phrase_cache import get_tts_phrase_cache
+
 logger = structlog.get_logger(__name__)
 
 # 한국어 locale 정규형 (Google TTS/Chirp는 ko-kr만 허용)
@@ -44,6 +50,19 @@ def normalize_tts_language_code(language_code: Optional[str], voice_name: Option
     return raw
 
 
+def tts_cache_identity(config: dict) -> Tuple[str, str, float]:
+    """TTS 설정 → 문구 캐시 키 구성요소 (voice, language, speaking_rate).
+
+    TTSClient 생성(gRPC 클라이언트) 없이 캐시를 조회하는 경로(RingbackPlayer)와 공용.
+    """
+    voice_name = config.get("voice_name", "ko-KR-Chirp3-HD-Kore")
+    language_code = normalize_tts_language_code(
+        config.get("language_code") or "ko-KR",
+        voice_name=voice_name,
+    )
+    return voice_name, language_code, config.get("speaking_rate", 1.0)
+
+
 class TTSClient:
     """
     Google Cloud Text-to-Speech gRPC Client
@@ -62,7 +81,11 @@ class TTSClient:
                 - volume_gain_db: 0.0
         """
         self.config = config
-        self.client = texttospeech.TextToSpeechClient()
+        # 프로세스 공용 keepalive 채널 재사용 (TTSClient 생성마다 채널·TLS·인증 재수립 방지)
+        self._pool = get_google_client_pool() if google_client_pool_enabled() else None
+        self.client = (
+            self._pool.tts_client() if self._pool is not None else texttospeech.TextToSpeechClient()
+        )
         
         # 음성 설정 (language_code는 정규화 함수로 한 곳에서 통일)
         voice_name = config.get("voice_name", "ko-KR-Chirp3-HD-Kore")
@@ -97,6 +120,10 @@ class TTSClient:
             volume_gain_db=config.get("volume_gain_db", 0.0),
         )
         
+        # 고정 문구 캐시 키 (voice·language·speaking_rate가 같아야 같은 음원)
+        self._cache_voice, self._cache_language, self._cache_speaking_rate = tts_cache_identity(config)
+        self.phrase_cache_hits = 0
+
         # 상태
         self._is_generating = False
         self._stop_flag = False
@@ -110,6 +137,42 @@ class TTSClient:
                    language=language_code,
                    speaking_rate=config.get("speaking_rate", 1.0))
     
+    def _synthesize_speech(self, synthesis_input):
+        """synthesize_speech 1건 (executor 스레드에서 호출, 풀 사용 시 동시성 집계)."""
+        if self._pool is None:
+            return self.client.synthesize_speech(
+                input=synthesis_input, voice=self.voice, audio_config=self.audio_config
+            )
+        with self._pool.track("tts"):
+            return self.client.synthesize_speech(
+                input=synthesis_input, voice=self.voice, audio_config=self.audio_config
+            )
+
+    def _cached_phrase_pcm(self, text: str) -> Optional[bytes]:
+        """고정 문구 캐시 조회 (LINEAR16 16kHz). 없으면 None."""
+        pcm = get_tts_phrase_cache().get_pcm(
+            text,
+            voice=self._cache_voice,
+            language=self._cache_language,
+            speaking_rate=self._cache_speaking_rate,
+            sample_rate=16000,
+        )
+        if pcm:
+            self.phrase_cache_hits += 1
+            logger.info("TTS phrase cache hit", text_length=len(text), audio_bytes=len(pcm))
+        return pcm
+
+    def _store_phrase_pcm(self, text: str, pcm: bytes) -> None:
+        """등록된 고정 문구면 합성 결과를 캐시에 저장 (그 외 문장은 무시)."""
+        get_tts_phrase_cache().put_pcm(
+            text,
+            pcm,
+            16000,
+            voice=self._cache_voice,
+            language=self._cache_language,
+            speaking_rate=self._cache_speaking_rate,
+        )
+
     async def synthesize_stream(
         self, 
         text: str,
@@ -133,6 +196,16 @@ class TTSClient:
         self._stop_flag = False
         
         try:
+            cached = self._cached_phrase_pcm(text)
+            if cached:
+                for i in range(0, len(cached), chunk_size):
+                    if self._stop_flag:
+                        logger.info("TTS stopped (barge-in)")
+                        break
+                    yield cached[i:i + chunk_size]
+                    await asyncio.sleep(0.01)
+                return
+
             # TTS 요청 (동기 API를 executor에서 실행해 이벤트 루프 블로킹 방지)
             synthesis_input = texttospeech.SynthesisInput(text=text)
             
@@ -141,16 +214,14 @@ class TTSClient:
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
                 None,
-                lambda: self.client.synthesize_speech(
-                    input=synthesis_input,
-                    voice=self.voice,
-                    audio_config=self.audio_config
-                )
+                self._synthesize_speech,
+                synthesis_input,
             )
             _tts_api_ms = int((_time.monotonic() - _t0) * 1000)
             
             # 오디오 데이터를 청크로 분할하여 스트리밍
             audio_data = response.audio_content
+            self._store_phrase_pcm(text, audio_data)
             
             logger.info("TTS synthesis done, streaming chunks",
                        text_length=len(text),
@@ -199,16 +270,17 @@ class TTSClient:
             전체 오디오 데이터 (bytes)
         """
         try:
+            cached = self._cached_phrase_pcm(text)
+            if cached:
+                return cached
+
             synthesis_input = texttospeech.SynthesisInput(text=text)
             
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
                 None,
-                lambda: self.client.synthesize_speech(
-                    input=synthesis_input,
-                    voice=self.voice,
-                    audio_config=self.audio_config
-                )
+                self._synthesize_speech,
+                synthesis_input,
             )
             
             self.total_syntheses += 1
@@ -216,6 +288,7 @@ class TTSClient:
             
             logger.debug("TTS synthesis completed", text_length=len(text))
             
+            self._store_phrase_pcm(text, response.audio_content)
             return response.audio_content
             
         except Exception as e:
@@ -247,6 +320,7 @@ class TTSClient:
             "total_syntheses": self.total_syntheses,
             "total_chars": self.total_chars,
             "is_generating": self._is_generating,
+            "phrase_cache_hits": self.phrase_cache_hits,
             "avg_chars_per_synthesis": (
                 self.total_chars / self.total_syntheses 
                 if self.total_syntheses > 0 else 0
@@ -0,0 +1,398 @@
+"""
+고정 문구 TTS 캐시 (G.711 20ms 프레임, 내용 주소 지정).
+
+인사말(RingbackPlayer·greeting 기본값), 종료 멘트, HITL 대기/부재 멘트, 단축 응답, 오류 폴백처럼
+매 통화 같은 문장이 Google TTS로 다시 합성되고 통화마다 리샘플링·G.711 인코딩되던 것을
+한 번만 합성해 발송 직전 형태(8kHz G.711 20ms 프레임)로 보관한다.
+
+- 키: sha256(정규화 문구 | voice | language | speaking_rate | codec) — 내용 주소 지정
+- 저장: 메모리 LRU(바이트 상한) + 디스크(TTS_PHRASE_CACHE_DIR, 기본 data/tts_phrase_cache)
+- 조회: TTSClient.synthesize/synthesize_stream, Pipecat TTS 서비스(run_tts)가 API 호출 전에 확인
+- 저장 대상: register()/warm()으로 등록된 고정 문구만 (LLM 생성 응답은 저장하지 않음)
+- PCM 소비자(Pipecat·TTSClient)에는 get_pcm()으로 디코드해 주고,
+  RTP 직접 송신 경로(RingbackPlayer)는 프레임을 그대로 보낸다.
+"""
+
+from __future__ import annotations
+
+import audioop
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_DEFAULT_DIR = "data/tts_phrase_cache"
+TTS_PHRASE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# 이보다 긴 문장은 고정 문구로 보지 않음 (등록 시에도 제외)
+TTS_PHRASE_MAX_CHARS = 300
+
+# G.711: 8kHz, 1 sample = 1 byte → 20ms = 160 bytes
+G711_SAMPLE_RATE = 8000
+G711_FRAME_BYTES = 160
+CODECS = ("PCMU", "PCMA")
+# 마지막 프레임 패딩용 무음 코드
+_SILENCE_BYTE = {"PCMU": b"\xff", "PCMA": b"\xd5"}
+
+SynthesizeFn = Callable[[str], Awaitable[bytes]]
+
+
+def normalize_phrase(text: Optional[str]) -> str:
+    """캐시 키용 문구 정규화 (공백 정리). 발화 내용이 달라지는 변환은 하지 않는다."""
+    return " ".join((text or "").split())
+
+
+def phrase_key(
+    text: str,
+    *,
+    voice: str,
+    language: str,
+    speaking_rate: Optional[float],
+    codec: str,
+) -> str:
+    # 미지정 speaking_rate는 API 기본값 1.0과 같은 음원
+    rate = f"{float(speaking_rate if speaking_rate is not None else 1.0):.3f}"
+    raw = "\x1f".join((normalize_phrase(text), voice or "", (language or "").lower(), rate, codec.upper()))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def strip_wav_header(audio: bytes) -> bytes:
+    """Google TTS LINEAR16 응답의 RIFF/WAV 헤더를 제거 (헤더가 없으면 그대로)."""
+    if audio[:4] != b"RIFF" or audio[8:12] != b"WAVE":
+        return audio
+    idx = audio.find(b"data", 12)
+    return audio[idx + 8:] if idx >= 0 else audio
+
+
+def encode_g711_frames(pcm: bytes, sample_rate: int, codec: str) -> List[bytes]:
+    """16-bit mono PCM → 8kHz G.711 20ms 프레임 목록 (마지막 프레임은 무음 코드로 패딩)."""
+    pcm = strip_wav_header(pcm or b"")
+    pcm = pcm[: len(pcm) - (len(pcm) % 2)]
+    if not pcm:
+        return []
+    pcm_8k = pcm
+    if sample_rate != G711_SAMPLE_RATE:
+        pcm_8k, _ = audioop.ratecv(pcm, 2, 1, sample_rate, G711_SAMPLE_RATE, None)
+    encoded = audioop.lin2alaw(pcm_8k, 2) if codec == "PCMA" else audioop.lin2ulaw(pcm_8k, 2)
+    frames = [encoded[i:i + G711_FRAME_BYTES] for i in range(0, len(encoded), G711_FRAME_BYTES)]
+    if frames and len(frames[-1]) < G711_FRAME_BYTES:
+        frames[-1] = frames[-1] + _SILENCE_BYTE.get(codec, b"\xff") * (G711_FRAME_BYTES - len(frames[-1]))
+    return frames
+
+
+@dataclass
+class PhraseAudio:
+    """캐시된 문구 1건 (코덱 1종)."""
+
+    key: str
+    codec: str
+    frames: List[bytes]
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.frames) * G711_FRAME_BYTES
+
+    @property
+    def duration_ms(self) -> int:
+        return len(self.frames) * 20
+
+    def pcm(self, sample_rate: int = 16000) -> bytes:
+        """16-bit mono PCM으로 디코드 (Pipecat·TTSClient 등 PCM 소비자용)."""
+        data = b"".join(self.frames)
+        pcm_8k = audioop.alaw2lin(data, 2) if self.codec == "PCMA" else audioop.ulaw2lin(data, 2)
+        if sample_rate == G711_SAMPLE_RATE:
+            return pcm_8k
+        converted, _ = audioop.ratecv(pcm_8k, 2, 1, G711_SAMPLE_RATE, sample_rate, None)
+        return converted
+
+
+class TTSPhraseCache:
+    """프로세스 공용 고정 문구 TTS 캐시 (get_tts_phrase_cache())."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes if max_bytes is not None else int(
+            os.environ.get("TTS_PHRASE_CACHE_MAX_BYTES", TTS_PHRASE_CACHE_MAX_BYTES)
+        )
+        self._entries: "OrderedDict[str, PhraseAudio]" = OrderedDict()
+        self._bytes = 0
+        self._registered: set = set()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0, "warmed": 0}
+
+    # ── 경로 ──
+
+    def _get_dir(self) -> Path:
+        if self._cache_dir is None:
+            self._cache_dir = os.environ.get("TTS_PHRASE_CACHE_DIR", _DEFAULT_DIR)
+        return Path(self._cache_dir)
+
+    def _file_path(self, key: str, codec: str) -> Path:
+        ext = "alaw" if codec == "PCMA" else "ulaw"
+        return self._get_dir() / key[:2] / f"{key}.{ext}"
+
+    # ── 등록 ──
+
+    def register(self, texts: Iterable[str]) -> int:
+        """고정 문구로 등록 (이 문구들만 합성 결과가 저장된다). 반환: 새로 등록된 수."""
+        added = 0
+        with self._lock:
+            for t in texts:
+                norm = normalize_phrase(t)
+                if norm and len(norm) <= TTS_PHRASE_MAX_CHARS and norm not in self._registered:
+                    self._registered.add(norm)
+                    added += 1
+        return added
+
+    def is_registered(self, text: str) -> bool:
+        return normalize_phrase(text) in self._registered
+
+    # ── 조회 ──
+
+    def get(
+        self,
+        text: str,
+        *,
+        voice: str,
+        language: str,
+        speaking_rate: Optional[float] = None,
+        codec: str = "PCMU",
+    ) -> Optional[PhraseAudio]:
+        """캐시된 G.711 프레임. 메모리 → 디스크 순으로 찾고 없으면 None."""
+        if not normalize_phrase(text):
+            return None
+        codec = codec.upper()
+        key = phrase_key(text, voice=voice, language=language, speaking_rate=speaking_rate, codec=codec)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry
+        entry = self._load_from_disk(key, codec)
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            self._stats["disk_hits"] += 1
+            self._insert_locked(entry)
+        return entry
+
+    def get_pcm(
+        self,
+        text: str,
+        *,
+        voice: str,
+        language: str,
+        speaking_rate: Optional[float] = None,
+        sample_rate: int = 16000,
+    ) -> Optional[bytes]:
+        """PCM 소비자용 조회 (PCMU 프레임을 디코드)."""
+        entry = self.get(text, voice=voice, language=language, speaking_rate=speaking_rate, codec="PCMU")
+        return entry.pcm(sample_rate) if entry is not None else None
+
+    # ── 저장 ──
+
+    def put_pcm(
+        self,
+        text: str,
+        pcm: bytes,
+        sample_rate: int,
+        *,
+        voice: str,
+        language: str,
+        speaking_rate: Optional[float] = None,
+        codecs: Iterable[str] = CODECS,
+        force: bool = False,
+    ) -> bool:
+        """합성된 PCM을 코덱별 G.711 프레임으로 저장. 등록되지 않은 문구는 force 없이는 무시."""
+        if not pcm or not (force or self.is_registered(text)):
+            return False
+        for codec in codecs:
+            codec = codec.upper()
+            key = phrase_key(text, voice=voice, language=language, speaking_rate=speaking_rate, codec=codec)
+            entry = PhraseAudio(key=key, codec=codec, frames=encode_g711_frames(pcm, sample_rate, codec))
+            self._write_to_disk(entry)
+            with self._lock:
+                self._insert_locked(entry)
+                self._stats["stores"] += 1
+        return True
+
+    def _insert_locked(self, entry: PhraseAudio) -> None:
+        old = self._entries.pop(entry.key, None)
+        if old is not None:
+            self._bytes -= old.size_bytes
+        self._entries[entry.key] = entry
+        self._bytes += entry.size_bytes
+        while self._bytes > self._max_bytes and len(self._entries) > 1:
+            _k, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size_bytes
+            self._stats["evictions"] += 1
+
+    def _load_from_disk(self, key: str, codec: str) -> Optional[PhraseAudio]:
+        path = self._file_path(key, codec)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("tts_phrase_cache_read_failed", path=str(path), error=str(e))
+            return None
+        if not data or len(data) % G711_FRAME_BYTES:
+            return None
+        frames = [data[i:i + G711_FRAME_BYTES] for i in range(0, len(data), G711_FRAME_BYTES)]
+        return PhraseAudio(key=key, codec=codec, frames=frames)
+
+    def _write_to_disk(self, entry: PhraseAudio) -> None:
+        path = self._file_path(entry.key, entry.codec)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            tmp.write_bytes(b"".join(entry.frames))
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("tts_phrase_cache_write_failed", path=str(path), error=str(e))
+
+    # ── 기동 시 예열 ──
+
+    async def warm(
+        self,
+        phrases: Iterable[str],
+        synthesize: SynthesizeFn,
+        *,
+        voice: str,
+        language: str,
+        speaking_rate: Optional[float] = None,
+        sample_rate: int = 16000,
+    ) -> int:
+        """등록 후 캐시에 없는 문구만 합성해 채운다. 반환: 새로 합성한 수."""
+        phrases = [p for p in dict.fromkeys(normalize_phrase(p) for p in phrases) if p]
+        self.register(phrases)
+        synthesized = 0
+        for text in phrases:
+            if not self.is_registered(text):
+                continue
+            if self.get(text, voice=voice, language=language, speaking_rate=speaking_rate) is not None:
+                continue
+            try:
+                pcm = await synthesize(text)
+            except Exception as e:
+                logger.warning("tts_phrase_cache_warm_failed", text_preview=text[:40], error=str(e))
+                continue
+            if self.put_pcm(
+                text, pcm, sample_rate, voice=voice, language=language, speaking_rate=speaking_rate
+            ):
+                synthesized += 1
+        with self._lock:
+            self._stats["warmed"] += synthesized
+        logger.info(
+            "tts_phrase_cache_warmed",
+            phrases=len(phrases),
+            synthesized=synthesized,
+            voice=voice,
+            entries=len(self._entries),
+        )
+        return synthesized
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "registered": len(self._registered),
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        """메모리 캐시만 비운다 (디스크 파일은 유지)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+def default_fixed_phrases() -> List[str]:
+    """코드에 정의된 고정 멘트 (인사 기본값·단축 응답·종료·오류 폴백)."""
+    from src.ai_voicebot.greeting_defaults import DEFAULT_GREETING_PHASE1, DEFAULT_GREETING_PHASE2
+    from src.ai_voicebot.langgraph.nodes import response_shortcuts as rs
+    from src.ai_voicebot.langgraph.nodes.update_state import DEFAULT_CLOSING_MESSAGE
+
+    return [
+        DEFAULT_GREETING_PHASE1,
+        DEFAULT_GREETING_PHASE2,
+        DEFAULT_CLOSING_MESSAGE,
+        rs.DEFAULT_REPEAT_MESSAGE,
+        rs.DEFAULT_CLARIFICATION_MESSAGE,
+        rs.DEFAULT_HELP_MESSAGE,
+        rs.DEFAULT_FALLBACK_MESSAGE,
+        rs.HITL_FALLBACK_OFFER_MESSAGE,
+        "잠시만 확인 중이니 기다려 주세요. 곧 답변 드리겠습니다.",
+        "죄송합니다. 해당 부분은 잘 모르는 내용이라 확인 후 별도로 안내드리겠습니다.",
+        "죄송합니다. 일시적으로 처리가 지연되고 있습니다.",
+        "죄송합니다. 일시적으로 처리가 지연되고 있습니다. 잠시 후 다시 질문해 주시거나, 담당자 연결이 필요하시면 말씀해 주세요.",
+    ]
+
+
+def owner_ringback_greetings(owners: Iterable[str]) -> List[str]:
+    """owner별 링 구간 인사말(RingbackPlayer) 텍스트."""
+    from src.services.ringback_service import get_effective_ringback_settings_for_player
+
+    texts: List[str] = []
+    for owner in owners:
+        try:
+            settings = get_effective_ringback_settings_for_player(owner) or {}
+        except Exception as e:
+            logger.debug("tts_phrase_cache_ringback_settings_failed", owner=owner, error=str(e))
+            continue
+        if settings.get("enabled_greeting") and settings.get("greeting_text"):
+            texts.append(settings["greeting_text"])
+    return texts
+
+
+async def warm_tts_phrase_cache_on_startup(
+    tts_config: Dict[str, Any],
+    owners: Iterable[str] = (),
+    extra_phrases: Iterable[str] = (),
+) -> int:
+    """기동 시 고정 문구(코드 기본값 + 설정 멘트 + owner별 인사말)를 합성해 캐시를 채운다."""
+    from src.ai_voicebot.ai_pipeline.tts_client import TTSClient, tts_cache_identity
+    from src.common.sqlite_pool import to_thread as _db_to_thread
+
+    greetings = await _db_to_thread(owner_ringback_greetings, list(owners))
+    phrases = default_fixed_phrases() + list(extra_phrases) + greetings
+    voice, language, speaking_rate = tts_cache_identity(tts_config)
+    cache = get_tts_phrase_cache()
+    cache.register(phrases)
+    if all(
+        cache.get(p, voice=voice, language=language, speaking_rate=speaking_rate) is not None
+        for p in phrases
+        if cache.is_registered(p)
+    ):
+        # 디스크에 모두 있음 — TTS 클라이언트 생성 생략
+        logger.info("tts_phrase_cache_warm_skipped", phrases=len(phrases), reason="all_cached")
+        return 0
+    tts = TTSClient(tts_config)
+    return await cache.warm(
+        phrases, tts.synthesize, voice=voice, language=language, speaking_rate=speaking_rate
+    )
+
+
+_tts_phrase_cache: Optional[TTSPhraseCache] = None
+_tts_phrase_cache_lock = threading.Lock()
+
+
+def get_tts_phrase_cache() -> TTSPhraseCache:
+    global _tts_phrase_cache
+    if _tts_phrase_cache is None:
+        with _tts_phrase_cache_lock:
+            if _tts_phrase_cache is None:
+                _tts_phrase_cache = TTSPhraseCache()
+    return _tts_phrase_cache
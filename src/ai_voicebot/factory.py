@@ -16,7 +16,7 @@ from .vad_detector import VADDetector
 # from .ai_pipeline.tts_client import TTSClient
 # from .ai_pipeline.llm_client import LLMClient
 from .ai_pipeline.rag_engine import RAGEngine
-from .knowledge.embedder import TextEmbedder
+from .knowledge.embedder import get_text_embedder
 from .knowledge.chromadb_client import get_chromadb_client
 from .knowledge.knowledge_extractor import KnowledgeExtractor
 from .recording.recorder import CallRecorder
@@ -34,10 +34,31 @@ _global_llm_client = None
 _global_ai_orchestrator = None
 
 
-def _build_google_stt_service(config: Dict[str, Any] = None):
-    """GoogleSTTService 인스턴스 생성 (Singleton·파이프라인 전용 공통)."""
+def _uses_pooled_credentials(cfg: Dict[str, Any]) -> bool:
+    """서비스 설정의 자격증명이 클라이언트 풀(ADC/GOOGLE_APPLICATION_CREDENTIALS)과 같은지."""
+    if cfg.get("credentials") is not None:
+        return False
+    path = cfg.get("credentials_path")
+    return not path or path == os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
+
+
+def _adopt_pooled_google_client(svc, kind: str, cfg: Dict[str, Any], region: Optional[str] = None) -> None:
+    """Pipecat 서비스의 전용 gRPC 클라이언트를 공용 keepalive 채널 클라이언트로 교체 (첫 요청 TLS·인증 생략)."""
+    from .ai_pipeline.google_client_pool import adopt_pooled_client
+
+    if _uses_pooled_credentials(cfg) and adopt_pooled_client(svc, kind, region):
+        logger.debug("google_pooled_client_adopted", kind=kind, region=region or "global")
+
+
+def _build_google_stt_service(config: Dict[str, Any] = None, call_id: Optional[str] = None):
+    """GoogleSTTService 인스턴스 생성 (Singleton·파이프라인 전용 공통).
+
+    call_id가 있으면(파이프라인 전용) 스트림 사전 연결·회전 래퍼(PrewarmedGoogleSTTService)를 쓴다.
+    STT_STREAM_MANAGER=0이면 Pipecat 기본 서비스.
+    """
     from pipecat.services.google.stt import GoogleSTTService
     from pipecat.transcriptions.language import Language
+    from .pipecat.stt_stream_manager import stt_stream_manager_enabled
 
     # Pipecat 공식: ko-KR은 params.InputParams(languages=[Language.KO_KR])로 설정.
     _cfg = config or {}
@@ -57,10 +78,17 @@ def _build_google_stt_service(config: Dict[str, Any] = None):
         _kwargs["credentials"] = _cfg["credentials"]
     if _cfg.get("location"):
         _kwargs["location"] = _cfg["location"]
-    return GoogleSTTService(**_kwargs)
+    if call_id is not None and stt_stream_manager_enabled():
+        from .pipecat.services.prewarmed_google_stt import PrewarmedGoogleSTTService
+
+        svc = PrewarmedGoogleSTTService(call_id=call_id, **_kwargs)
+    else:
+        svc = GoogleSTTService(**_kwargs)
+    _adopt_pooled_google_client(svc, "stt_v2_async", _cfg, region=_cfg.get("location"))
+    return svc
 
 
-async def create_google_stt_service_per_pipeline(config: Dict[str, Any] = None):
+async def create_google_stt_service_per_pipeline(config: Dict[str, Any] = None, call_id: str = ""):
     """
     Pipecat 파이프라인(통화)마다 전용 Google STT.
 
@@ -70,9 +98,11 @@ async def create_google_stt_service_per_pipeline(config: Dict[str, Any] = None):
     인사·TTS가 전혀 나가지 않을 수 있음 (ai_enabled_calls > 1 재현).
     """
     try:
-        svc = _build_google_stt_service(config)
+        svc = _build_google_stt_service(config, call_id=call_id)
         logger.info(
             "google_stt_service_per_pipeline_created",
+            call_id=call_id,
+            stream_manager=type(svc).__name__ != "GoogleSTTService",
             languages="ko-KR (Language.KO_KR)",
             note="통화별 STT — 동시 Pipecat 호 Singleton 공유 방지",
         )
@@ -180,6 +210,8 @@ def _build_google_tts_service(config: Dict[str, Any] = None, call_id: str = ""):
             "model": effective_model,
             "voice_id": effective_voice,
             "sample_rate": _tts_config.get("sample_rate", 24000),
+            # 적응형 플레이아웃 pre-roll (ms, 미설정 시 TTS_PLAYOUT_PREROLL_MS 또는 250, 음수면 전체 수집)
+            "preroll_ms": _tts_config.get("playout_preroll_ms"),
         }
         if gemini_prompt:
             gemini_kwargs["params"] = GeminiTTSService.InputParams(
@@ -198,7 +230,9 @@ def _build_google_tts_service(config: Dict[str, Any] = None, call_id: str = ""):
             call_id=call_id or "",
             note="Gemini TTS 선택 — 24kHz 출력, RTPPacketBuilder에서 8kHz 리샘플링",
         )
-        return DebugGeminiTTSService(**gemini_kwargs)
+        svc = DebugGeminiTTSService(**gemini_kwargs)
+        _adopt_pooled_google_client(svc, "tts_async", _tts_config)
+        return svc
 
     # Chirp 3 HD (기본 경로)
     # DebugGoogleTTSService(GoogleTTSService) 생성자: voice_id, sample_rate, params(language, speaking_rate)
@@ -217,6 +251,7 @@ def _build_google_tts_service(config: Dict[str, Any] = None, call_id: str = ""):
             speaking_rate=float(speaking_rate) if speaking_rate is not None else None,
         ),
         "aggregate_sentences": False,
+        "preroll_ms": _tts_config.get("playout_preroll_ms"),
     }
 
     logger.info(
@@ -227,7 +262,9 @@ def _build_google_tts_service(config: Dict[str, Any] = None, call_id: str = ""):
         call_id=call_id or "",
         note="Chirp 3 HD TTS 선택 — 스트리밍 API, aggregate_sentences=False",
     )
-    return DebugGoogleTTSService(**chirp_kwargs)
+    svc = DebugGoogleTTSService(**chirp_kwargs)
+    _adopt_pooled_google_client(svc, "tts_async", _tts_config)
+    return svc
 
 
 async def create_google_tts_service_per_pipeline(config: Dict[str, Any] = None, call_id: str = ""):
@@ -410,12 +447,15 @@ async def create_ai_orchestrator(config: Dict[str, Any]) -> Optional[AIOrchestra
         
         # 7. Text Embedder
         embedding_config = config.get("embedding", {})
-        embedder = TextEmbedder(
+        # 프로세스 공유 임베더 (API·지식 추출과 같은 모델 인스턴스) — 최초 호출만 로드 비용 발생
+        embedder = get_text_embedder(
             model_name=embedding_config.get("model", "paraphrase-multilingual-mpnet-base-v2"),
+            backend=embedding_config.get("backend"),
+            consumer="ai_pipeline",
+            batch_size=embedding_config.get("batch_size", 32),
             dimension=embedding_config.get("dimension", 768),
-            batch_size=embedding_config.get("batch_size", 32)
         )
-        logger.info("Text Embedder initialized")
+        logger.info("Text Embedder initialized", **embedder.get_stats())
         
         # 8. Vector DB (ChromaDB)
         logger.info("🔄 [FACTORY] Step 8/12: Initializing Vector DB...")
@@ -454,6 +494,7 @@ async def create_ai_orchestrator(config: Dict[str, Any]) -> Optional[AIOrchestra
             similarity_threshold=rag_config.get("similarity_threshold", 0.35),
             reranking_enabled=rag_config.get("reranking_enabled", False),
             doc_type_allowlist=_dt_allow,
+            hybrid_lexical_weight=rag_config.get("hybrid_lexical_weight", 0.3),
         )
         logger.info("RAG Engine initialized")
         
@@ -558,14 +599,15 @@ async def ensure_knowledge_service_singleton_for_hitl(config: Dict[str, Any]) ->
         return False
     try:
         from ..services.knowledge_service import KnowledgeService, set_knowledge_service
-        from .knowledge.embedder import TextEmbedder
         from .knowledge.chromadb_client import get_chromadb_client, get_vector_db
 
         embedding_config = config.get("embedding", {})
-        embedder = TextEmbedder(
+        embedder = get_text_embedder(
             model_name=embedding_config.get("model", "paraphrase-multilingual-mpnet-base-v2"),
-            dimension=embedding_config.get("dimension", 768),
+            backend=embedding_config.get("backend"),
+            consumer="knowledge_service",
             batch_size=embedding_config.get("batch_size", 32),
+            dimension=embedding_config.get("dimension", 768),
         )
         vector_db_config = config.get("vector_db", {})
         if vector_db_config.get("provider", "chromadb") != "chromadb":
@@ -3,6 +3,7 @@ ChromaDB 클라이언트 — 지식 API 및 RAG와 동일한 벡터 DB 접근.
 
 - get_chromadb_client(): lazy 초기화용 클라이언트 (initialize() 지원)
 - get_vector_db(): .get(where=..., limit=...), .query(...) 인터페이스
+- 비동기 경로(aget/aquery/adelete/upsert/search 등)는 VectorStoreGateway 전용 스레드 풀에서 실행
 
 텔레메트리: PostHog 6.x와 Chroma 호환 문제로 "capture() takes 1 positional argument but 3 were given"
 오류가 발생할 수 있음. anonymized_telemetry=False 사용 + 로거 억제로 콘솔 오류를 막음.
@@ -16,6 +17,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from src.ai_voicebot.knowledge.vector_db import Document
+from src.ai_voicebot.knowledge.vector_store_gateway import get_vector_store_gateway
 
 # Chroma 텔레메트리 오류 로그 억제 (PostHog 6.x API 호환 이슈 시 "Failed to send telemetry event" 방지)
 for _name in ("chromadb.telemetry", "chromadb.telemetry.product.posthog"):
@@ -95,6 +97,34 @@ def _distance_to_score(distance: float, metric: str = "cosine") -> float:
     return max(0.0, 1.0 / (1.0 + float(distance)))
 
 
+def _notify_lexical_upsert(
+    ids: List[str], documents: Optional[List[str]], metadatas: Optional[List[Dict[str, Any]]]
+) -> None:
+    """knowledge 컬렉션 쓰기 → RAG 하이브리드 검색용 BM25 인덱스 증분 갱신 (실패해도 쓰기는 유지).
+    documents/metadatas가 None이면 인덱스의 기존 본문/메타데이터를 유지한다 (update)."""
+    try:
+        from src.ai_voicebot.ai_pipeline.lexical_index import get_lexical_index_registry
+
+        get_lexical_index_registry().on_upsert(
+            list(ids or []),
+            list(documents) if documents is not None else None,
+            list(metadatas) if metadatas is not None else None,
+        )
+    except Exception as e:
+        logger.debug("lexical index upsert hook failed: %s", e)
+
+
+def _notify_lexical_delete(
+    ids: Optional[List[str]] = None, where: Optional[Dict[str, Any]] = None
+) -> None:
+    try:
+        from src.ai_voicebot.ai_pipeline.lexical_index import get_lexical_index_registry
+
+        get_lexical_index_registry().on_delete(ids=list(ids or []), where=where)
+    except Exception as e:
+        logger.debug("lexical index delete hook failed: %s", e)
+
+
 class _VectorDbWrapper:
     """ChromaDB Collection을 RAG/API가 기대하는 get/query 시그니처로 감쌈.
     LangGraph semantic_cache용 search_collection / upsert_to_collection 지원."""
@@ -105,7 +135,7 @@ class _VectorDbWrapper:
 
     @property
     def collection(self) -> Any:
-        """KnowledgeService 등에서 vector_db.collection.get() 호출 호환용."""
+        """KnowledgeService 등에서 vector_db.collection.get() 호출 호환용 (쓰기는 write()로)."""
         return self._collection
 
     def get(
@@ -159,6 +189,51 @@ class _VectorDbWrapper:
             logger.warning("ChromaDB query failed: %s", e)
             return {"ids": [[]], "documents": [[]], "metadatas": [[]], "distances": [[]]}
 
+    async def aget(
+        self,
+        where: Optional[Dict[str, Any]] = None,
+        limit: int = 1000,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """get()의 비동기 버전 (게이트웨이 풀에서 실행, 타임아웃 시 빈 결과)."""
+        try:
+            return await get_vector_store_gateway().run("get", self.get, where=where, limit=limit, **kwargs)
+        except asyncio.TimeoutError:
+            return {"ids": [], "documents": [], "metadatas": []}
+
+    async def aquery(
+        self,
+        query_embeddings: List[List[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """query()의 비동기 버전. 동시 질의는 게이트웨이에서 query_embeddings 1회로 묶임."""
+        try:
+            res = await get_vector_store_gateway().query(
+                self._collection,
+                query_embeddings=query_embeddings,
+                n_results=n_results,
+                where=_normalize_where(where),
+                include=["documents", "metadatas", "distances"],
+                **kwargs,
+            )
+            return {
+                "ids": res.get("ids") or [[]],
+                "documents": res.get("documents") or [[]],
+                "metadatas": res.get("metadatas") or [[]],
+                "distances": res.get("distances") or [[]],
+            }
+        except Exception as e:
+            logger.warning("ChromaDB query failed: %s", e or type(e).__name__)
+            return {"ids": [[]], "documents": [[]], "metadatas": [[]], "distances": [[]]}
+
+    async def adelete(
+        self, ids: Optional[List[str]] = None, where: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> None:
+        """delete()의 비동기 버전 (게이트웨이 풀에서 실행)."""
+        await get_vector_store_gateway().run("delete", self.delete, ids=ids, where=where, **kwargs)
+
     async def upsert(
         self,
         doc_id: str,
@@ -168,32 +243,74 @@ class _VectorDbWrapper:
     ) -> None:
         """
         지식 컬렉션 단건 upsert. KnowledgeExtractor / ExtractionPipeline v2 호환.
-        (동기 Chroma I/O는 to_thread로 이벤트 루프 블로킹 완화)
+        (동기 Chroma I/O는 게이트웨이 전용 풀에서 실행)
         """
         if not doc_id or not embedding:
             raise ValueError("upsert requires doc_id and non-empty embedding")
 
         def _run() -> None:
             try:
-                self._collection.upsert(
-                    ids=[doc_id],
-                    embeddings=[embedding],
-                    documents=[text],
-                    metadatas=[metadata],
-                )
+                self.write("upsert", [doc_id], embeddings=[embedding], documents=[text], metadatas=[metadata])
             except Exception as first_err:
                 try:
-                    self._collection.add(
-                        ids=[doc_id],
-                        embeddings=[embedding],
-                        documents=[text],
-                        metadatas=[metadata],
-                    )
+                    self.write("add", [doc_id], embeddings=[embedding], documents=[text], metadatas=[metadata])
                 except Exception:
-                    logger.warning("ChromaDB upsert failed: %s", first_err)
                     raise first_err
 
-        await asyncio.to_thread(_run)
+        await get_vector_store_gateway().run("upsert", _run)
+
+    async def upsert_many(
+        self,
+        ids: List[str],
+        embeddings: List[List[float]],
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """
+        지식 컬렉션 일괄 upsert (Chroma upsert 1회·게이트웨이 풀 작업 1회).
+        ExtractionPipeline v2가 통화 1건의 검증 통과 항목을 한 번에 저장할 때 사용.
+        """
+        if not ids:
+            return
+        if not (len(ids) == len(embeddings) == len(texts) == len(metadatas)):
+            raise ValueError("upsert_many requires ids/embeddings/texts/metadatas of equal length")
+        if any(not i for i in ids) or any(not e for e in embeddings):
+            raise ValueError("upsert_many requires doc_id and non-empty embedding per item")
+
+        def _run() -> None:
+            self.write("upsert", list(ids), embeddings=list(embeddings), documents=list(texts), metadatas=list(metadatas))
+
+        await get_vector_store_gateway().run("upsert", _run)
+
+    @staticmethod
+    def _query_row_to_documents(res: Dict[str, Any], row: int) -> List[Document]:
+        """collection.query 결과의 row번째 질의 → Document 목록 (score = 1/(1+distance))."""
+
+        def _pick(key: str) -> List[Any]:
+            rows = res.get(key) or []
+            return list(rows[row] or []) if row < len(rows) else []
+
+        ids = _pick("ids")
+        docs_list = _pick("documents")
+        metas = _pick("metadatas")
+        dists = _pick("distances")
+        out: List[Document] = []
+        for i, did in enumerate(ids):
+            dist = float(dists[i]) if i < len(dists) else 1.0
+            score = 1.0 / (1.0 + dist)
+            doc_text = docs_list[i] if i < len(docs_list) else ""
+            meta = metas[i] if i < len(metas) else {}
+            if not isinstance(meta, dict):
+                meta = {}
+            out.append(
+                Document(
+                    id=did or "",
+                    text=doc_text if isinstance(doc_text, str) else "",
+                    score=score,
+                    metadata=meta,
+                )
+            )
+        return out
 
     async def search(
         self,
@@ -209,42 +326,40 @@ class _VectorDbWrapper:
         """
         if not vector:
             return []
+        return (await self.search_many([vector], top_k=top_k, filter=filter))[0]
 
-        def _run() -> List[Document]:
-            w = _normalize_where(filter) if filter else None
-            try:
-                res = self._collection.query(
-                    query_embeddings=[vector],
-                    n_results=top_k,
-                    where=w,
-                    include=["documents", "metadatas", "distances"],
-                )
-            except Exception as e:
-                logger.warning("ChromaDB search (wrapper) failed: %s", e)
-                return []
-            ids = (res.get("ids") or [[]])[0]
-            docs_list = (res.get("documents") or [[]])[0]
-            metas = (res.get("metadatas") or [[]])[0]
-            dists = (res.get("distances") or [[]])[0]
-            out: List[Document] = []
-            for i, did in enumerate(ids):
-                dist = float(dists[i]) if i < len(dists) else 1.0
-                score = 1.0 / (1.0 + dist)
-                doc_text = docs_list[i] if i < len(docs_list) else ""
-                meta = metas[i] if i < len(metas) else {}
-                if not isinstance(meta, dict):
-                    meta = {}
-                out.append(
-                    Document(
-                        id=did or "",
-                        text=doc_text if isinstance(doc_text, str) else "",
-                        score=score,
-                        metadata=meta,
-                    )
-                )
+    async def search_many(
+        self,
+        vectors: List[List[float]],
+        top_k: int = 5,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Document]]:
+        """
+        다중 벡터 유사 검색 — query_embeddings 여러 개를 Chroma query 1회로 처리.
+
+        Returns:
+            입력 순서와 같은 Document 목록의 목록. 빈 벡터 자리는 빈 목록.
+        """
+        valid = [i for i, v in enumerate(vectors) if v]
+        out: List[List[Document]] = [[] for _ in vectors]
+        if not valid:
             return out
 
-        return await asyncio.to_thread(_run)
+        w = _normalize_where(filter) if filter else None
+        try:
+            res = await get_vector_store_gateway().query(
+                self._collection,
+                query_embeddings=[vectors[i] for i in valid],
+                n_results=top_k,
+                where=w,
+                include=["documents", "metadatas", "distances"],
+            )
+        except Exception as e:
+            logger.warning("ChromaDB search (wrapper) failed: %s", e or type(e).__name__)
+            return out
+        for row, i in enumerate(valid):
+            out[i] = self._query_row_to_documents(res, row)
+        return out
 
     def add(
         self,
@@ -258,31 +373,59 @@ class _VectorDbWrapper:
         if metadatas is None or len(metadatas) != len(ids):
             metadatas = (metadatas or [])[: len(ids)]
             metadatas = metadatas + [{}] * (len(ids) - len(metadatas))
-        try:
-            self._collection.add(
-                ids=ids,
-                embeddings=embeddings,
-                documents=documents,
-                metadatas=metadatas,
-                **kwargs,
-            )
-        except Exception as e:
-            logger.warning("ChromaDB add failed: %s", e)
-            raise
+        self.write("add", ids, embeddings=embeddings, documents=documents, metadatas=metadatas, **kwargs)
 
     def delete(self, ids: Optional[List[str]] = None, where: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
         """지식 컬렉션에서 문서 삭제. ids 또는 where 중 하나 지정."""
-        if not ids and not where:
+        self.write("delete", ids, where=where, **kwargs)
+
+    def write(
+        self,
+        op: str,
+        ids: Optional[List[str]],
+        embeddings: Optional[List[List[float]]] = None,
+        documents: Optional[List[str]] = None,
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """지식 컬렉션 쓰기 단일 경로 (op: add/upsert/update/delete) — BM25 인덱스 통지 포함.
+
+        collection.update()/upsert()/delete()를 직접 부르면 BM25 인덱스에 옛 본문·삭제된 문서가 남으므로
+        지식 컬렉션 쓰기는 모두 여기를 거친다. update에서 documents/metadatas를 생략하면 생략한 쪽은
+        인덱스의 기존 값을 유지한다. delete는 ids 또는 where.
+        """
+        if op not in ("add", "upsert", "update", "delete"):
+            raise ValueError(f"unsupported knowledge collection op: {op}")
+        ids = list(ids or [])
+        if op == "delete":
+            if not ids and not where:
+                return
+            try:
+                if ids:
+                    self._collection.delete(ids=ids, **kwargs)
+                else:
+                    self._collection.delete(where=_normalize_where(where), **kwargs)
+            except Exception as e:
+                logger.warning("ChromaDB delete failed: %s", e)
+                raise
+            _notify_lexical_delete(ids=ids, where=where)
+            return
+        if not ids:
             return
+        payload: Dict[str, Any] = {"ids": ids}
+        if embeddings is not None:
+            payload["embeddings"] = embeddings
+        if documents is not None:
+            payload["documents"] = documents
+        if metadatas is not None:
+            payload["metadatas"] = metadatas
         try:
-            if ids:
-                self._collection.delete(ids=ids, **kwargs)
-            else:
-                w = _normalize_where(where)
-                self._collection.delete(where=w, **kwargs)
+            getattr(self._collection, op)(**payload, **kwargs)
         except Exception as e:
-            logger.warning("ChromaDB delete failed: %s", e)
+            logger.warning("ChromaDB %s failed (%d items): %s", op, len(ids), e)
             raise
+        _notify_lexical_upsert(ids, documents, metadatas)
 
     def _get_collection(self, collection_name: str, use_cosine: bool = False) -> Any:
         """컬렉션명으로 컬렉션 반환. semantic cache(qa_cache)는 cosine 사용."""
@@ -311,10 +454,12 @@ class _VectorDbWrapper:
     ) -> List[Dict[str, Any]]:
         """LangGraph semantic_cache 호환: 벡터 유사 검색 → [{score, metadata}, ...]. where로 intent/category 필터 가능."""
         use_cosine = collection_name == "qa_cache"
-        coll = self._get_collection(collection_name, use_cosine=use_cosine)
+        gateway = get_vector_store_gateway()
         w = _normalize_where(where) if where else None
         try:
-            res = coll.query(
+            coll = await gateway.run("get", self._get_collection, collection_name, use_cosine=use_cosine)
+            res = await gateway.query(
+                coll,
                 query_embeddings=[vector],
                 n_results=top_k,
                 where=w,
@@ -332,7 +477,7 @@ class _VectorDbWrapper:
                 for i, d in enumerate(distances)
             ]
         except Exception as e:
-            logger.warning("ChromaDB search_collection failed: %s", e)
+            logger.warning("ChromaDB search_collection failed: %s", e or type(e).__name__)
             return []
 
     async def upsert_to_collection(
@@ -346,26 +491,30 @@ class _VectorDbWrapper:
     ) -> None:
         """LangGraph semantic_cache 호환: 단일 문서 추가/갱신."""
         use_cosine = collection_name == "qa_cache"
-        coll = self._get_collection(collection_name, use_cosine=use_cosine)
-        try:
-            coll.upsert(
-                ids=[doc_id],
-                embeddings=[embedding],
-                documents=[text],
-                metadatas=[metadata],
-            )
-        except Exception as e:
-            # Chroma 구버전은 add만 지원할 수 있음
+
+        def _run() -> None:
+            coll = self._get_collection(collection_name, use_cosine=use_cosine)
             try:
-                coll.add(
+                coll.upsert(
                     ids=[doc_id],
                     embeddings=[embedding],
                     documents=[text],
                     metadatas=[metadata],
                 )
-            except Exception as e2:
-                logger.warning("ChromaDB upsert_to_collection failed: %s", e2)
-                raise
+            except Exception as e:
+                # Chroma 구버전은 add만 지원할 수 있음
+                try:
+                    coll.add(
+                        ids=[doc_id],
+                        embeddings=[embedding],
+                        documents=[text],
+                        metadatas=[metadata],
+                    )
+                except Exception as e2:
+                    logger.warning("ChromaDB upsert_to_collection failed: %s", e2)
+                    raise
+
+        await get_vector_store_gateway().run("upsert", _run)
 
 
 class _ChromaClientWrapper:
@@ -4,17 +4,151 @@ TextEmbedder — SentenceTransformer 기반 텍스트 임베딩.
 - model_name으로 모델 로드. SentenceTransformer(model_name_or_path)만 사용하며,
   dimension 인자는 사용하지 않음 (모델이 정한 차원 사용).
 - embed_text() 동기, embed() 비동기(내부적으로 to_thread→embed_text). 지식 API·RAG·추출 파이프라인에서 사용.
+- embed_texts()/embed_batch(): 여러 문장을 한 번의 encode로 처리 (추출 파이프라인 배치용).
+
+공유 인스턴스:
+- get_text_embedder()는 (모델, backend)당 프로세스 단일 인스턴스를 락으로 보호해 생성한다.
+  API 스레드(set_knowledge_embedder)·AI 팩토리·지식 추출 워커가 동시에 불러도 모델은 1회만 로드된다.
+- consumer 인자를 주면 같은 모델을 공유하는 소비자별 프록시를 돌려주고, 소비자별 encode 지연을 따로 집계한다.
+  설정의 batch_size는 프록시별로 적용되고(모델은 공유), dimension은 로드된 모델 차원과 다르면 경고만 남긴다.
+
+Backend (config ai_voicebot.embedding.backend 또는 환경변수 EMBEDDING_BACKEND):
+- torch (기본): SentenceTransformer
+- onnx / onnx-int8: optimum + onnxruntime로 같은 모델을 ONNX export(int8은 동적 양자화) 후 mean pooling.
+  optimum/onnxruntime 미설치·export 실패 시 경고 후 torch로 폴백.
 """
 
 import asyncio
 import logging
-from typing import List, Optional
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 # SentenceTransformer는 __init__에 dimension 인자를 지원하지 않음 (모델별 고정 차원)
 _DEFAULT_MODEL = "paraphrase-multilingual-mpnet-base-v2"
 _embedder_instance: Optional["TextEmbedder"] = None
+_embedder_instances: Dict[Tuple[str, str], "TextEmbedder"] = {}
+_embedder_lock = threading.Lock()
+
+BACKEND_TORCH = "torch"
+BACKEND_ONNX = "onnx"
+BACKEND_ONNX_INT8 = "onnx-int8"
+_BACKENDS = (BACKEND_TORCH, BACKEND_ONNX, BACKEND_ONNX_INT8)
+
+# 워밍업용 고정 배치 — 길이가 다른 문장을 섞어 토크나이저/어텐션 커널 경로를 모두 한 번씩 태운다
+_WARMUP_TEXTS = (
+    "안녕하세요",
+    "영업시간이 어떻게 되나요?",
+    "예약을 다음 주 화요일 오후 세 시로 변경하고 싶은데 가능한 시간이 있을까요?",
+    "주차는 건물 지하 2층 주차장을 이용하시면 되고, 방문 고객은 두 시간 무료입니다.",
+)
+
+
+def _resolve_backend(backend: Optional[str]) -> str:
+    b = (backend or os.environ.get("EMBEDDING_BACKEND") or BACKEND_TORCH).strip().lower()
+    if b not in _BACKENDS:
+        logger.warning("Unknown embedding backend %r — using torch", b)
+        return BACKEND_TORCH
+    return b
+
+
+def _onnx_cache_dir(model_name: str, quantized: bool) -> Path:
+    # src/ai_voicebot/knowledge/embedder.py -> 프로젝트 루트 = parents[3]
+    base = os.environ.get("EMBEDDING_ONNX_CACHE_DIR") or str(
+        Path(__file__).resolve().parents[3] / "data" / "models" / "onnx"
+    )
+    leaf = model_name.replace("/", "__") + ("-int8" if quantized else "")
+    return Path(base) / leaf
+
+
+class _EncodeStats:
+    """encode 호출 지연 집계 (thread-safe)."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.texts = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, elapsed_ms: float, n_texts: int) -> None:
+        with self._lock:
+            self.calls += 1
+            self.texts += n_texts
+            self.total_ms += elapsed_ms
+            if elapsed_ms > self.max_ms:
+                self.max_ms = elapsed_ms
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "texts": self.texts,
+                "avg_ms": round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+                "avg_ms_per_text": round(self.total_ms / self.texts, 2) if self.texts else 0.0,
+                "max_ms": round(self.max_ms, 2),
+            }
+
+
+class _OnnxSentenceEncoder:
+    """optimum ORTModelForFeatureExtraction + mean pooling — SentenceTransformer.encode 최소 호환.
+
+    paraphrase-multilingual-mpnet-base-v2는 mean pooling(정규화 없음) 모델이므로 같은 후처리를 적용한다.
+    export·양자화 결과는 data/models/onnx/ 아래에 캐시해 두 번째 기동부터는 로드만 한다.
+    """
+
+    def __init__(self, model_name: str, quantized: bool):
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        hf_id = model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+        cache_dir = _onnx_cache_dir(model_name, quantized)
+        file_name = "model_quantized.onnx" if quantized else "model.onnx"
+        if not (cache_dir / file_name).exists():
+            export_dir = _onnx_cache_dir(model_name, False)
+            if not (export_dir / "model.onnx").exists():
+                logger.info("Exporting embedding model to ONNX: %s -> %s", hf_id, export_dir)
+                exported = ORTModelForFeatureExtraction.from_pretrained(hf_id, export=True)
+                exported.save_pretrained(export_dir)
+                AutoTokenizer.from_pretrained(hf_id).save_pretrained(export_dir)
+            if quantized:
+                from optimum.onnxruntime import ORTQuantizer
+                from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+                logger.info("Quantizing ONNX embedding model (dynamic int8): %s", cache_dir)
+                quantizer = ORTQuantizer.from_pretrained(export_dir)
+                quantizer.quantize(
+                    save_dir=cache_dir,
+                    quantization_config=AutoQuantizationConfig.avx2(is_static=False, per_channel=False),
+                )
+                AutoTokenizer.from_pretrained(export_dir).save_pretrained(cache_dir)
+        self._model = ORTModelForFeatureExtraction.from_pretrained(cache_dir, file_name=file_name)
+        self._tokenizer = AutoTokenizer.from_pretrained(cache_dir)
+        self._dimension: Optional[int] = getattr(getattr(self._model, "config", None), "hidden_size", None)
+
+    def get_sentence_embedding_dimension(self) -> Optional[int]:
+        return self._dimension
+
+    def encode(self, sentences: Any, convert_to_numpy: bool = True, batch_size: int = 32, **kwargs: Any) -> Any:
+        import numpy as np
+
+        single = isinstance(sentences, str)
+        items = [sentences] if single else list(sentences)
+        out = []
+        for i in range(0, len(items), max(1, batch_size)):
+            batch = items[i : i + batch_size]
+            enc = self._tokenizer(batch, padding=True, truncation=True, max_length=128, return_tensors="np")
+            hidden = self._model(**enc).last_hidden_state
+            hidden = hidden.numpy() if hasattr(hidden, "numpy") else np.asarray(hidden)
+            mask = enc["attention_mask"][..., None].astype(hidden.dtype)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            out.append(pooled)
+        result = np.concatenate(out, axis=0) if out else np.zeros((0, self._dimension or 0))
+        return result[0] if single else result
 
 
 class TextEmbedder:
@@ -24,17 +158,26 @@ class TextEmbedder:
         self,
         model_name: Optional[str] = None,
         model: Optional[object] = None,
+        backend: Optional[str] = None,
         **kwargs,
     ):
         """
         model_name 또는 model 중 하나로 초기화.
         kwargs의 dimension 등은 SentenceTransformer에 전달하지 않음 (API 미지원).
+        backend: torch | onnx | onnx-int8 (None이면 EMBEDDING_BACKEND 환경변수, 기본 torch)
         """
         self._model = None
         self._dimension: Optional[int] = None
-        name = model_name or getattr(model, "model_name", None) if model else None
+        self._batch_size = int(kwargs.get("batch_size") or 32)
+        self._stats: Dict[str, _EncodeStats] = {}
+        self._stats_lock = threading.Lock()
+        self.backend = BACKEND_TORCH
+        self.load_time_ms = 0.0
+        self.warmup_ms: Optional[float] = None
+        name = model_name or (getattr(model, "model_name", None) if model else None)
         if model is not None:
             self._model = model
+            self.model_name = name or _DEFAULT_MODEL
             try:
                 self._dimension = getattr(model, "get_sentence_embedding_dimension", lambda: None)()
             except Exception:
@@ -42,6 +185,35 @@ class TextEmbedder:
             logger.info("TextEmbedder initialized with provided model")
             return
         name = name or _DEFAULT_MODEL
+        self.model_name = name
+        requested_backend = _resolve_backend(backend)
+        load_start = time.perf_counter()
+        if requested_backend in (BACKEND_ONNX, BACKEND_ONNX_INT8):
+            try:
+                self._model = _OnnxSentenceEncoder(name, quantized=requested_backend == BACKEND_ONNX_INT8)
+                self.backend = requested_backend
+                self._dimension = self._model.get_sentence_embedding_dimension()
+            except ImportError as e:
+                logger.warning(
+                    "TextEmbedder ONNX backend unavailable (pip install optimum[onnxruntime]) — torch fallback: %s",
+                    e,
+                )
+            except Exception as e:
+                logger.warning("TextEmbedder ONNX backend load failed — torch fallback: %s", e)
+        if self._model is None:
+            self._load_sentence_transformer(name)
+        self.load_time_ms = round((time.perf_counter() - load_start) * 1000, 1)
+        logger.info(
+            "TextEmbedder model_name load ok",
+            extra={
+                "model_name": name,
+                "embedding_dim": self._dimension,
+                "backend": self.backend,
+                "load_time_ms": self.load_time_ms,
+            },
+        )
+
+    def _load_sentence_transformer(self, name: str) -> None:
         try:
             from sentence_transformers import SentenceTransformer
 
@@ -67,10 +239,7 @@ class TextEmbedder:
             )()
             if self._dimension is None and hasattr(self._model, "dimension"):
                 self._dimension = getattr(self._model, "dimension", None)
-            logger.info(
-                "TextEmbedder model_name load ok",
-                extra={"model_name": name, "embedding_dim": self._dimension},
-            )
+            self.backend = BACKEND_TORCH
         except Exception as e:
             logger.warning(
                 "TextEmbedder model_name load failed: %s",
@@ -79,20 +248,61 @@ class TextEmbedder:
             )
             raise
 
-    def embed_text(self, text: str) -> List[float]:
-        """단일 텍스트 임베딩. 빈 문자열이면 제로 벡터(차원은 get_dimension 기준)."""
+    def _record(self, consumer: str, elapsed_ms: float, n_texts: int) -> None:
+        stats = self._stats.get(consumer)
+        if stats is None:
+            with self._stats_lock:
+                stats = self._stats.setdefault(consumer, _EncodeStats())
+        stats.record(elapsed_ms, n_texts)
+
+    def _embed_text_as(self, text: str, consumer: str) -> List[float]:
         if not self._model:
             return []
         if not (text or "").strip():
             dim = self.get_dimension()
             return [0.0] * dim if dim else []
         try:
+            t0 = time.perf_counter()
             emb = self._model.encode(text, convert_to_numpy=True)
+            self._record(consumer, (time.perf_counter() - t0) * 1000, 1)
             return emb.tolist()
         except Exception as e:
             logger.warning("TextEmbedder embed_text error: %s", e)
             return []
 
+    def _embed_texts_as(
+        self, texts: List[str], consumer: str, batch_size: Optional[int] = None
+    ) -> List[List[float]]:
+        if not texts:
+            return []
+        if not self._model:
+            return [[] for _ in texts]
+        dim = self.get_dimension()
+        out: List[List[float]] = [[0.0] * dim if dim else [] for _ in texts]
+        idx = [i for i, t in enumerate(texts) if (t or "").strip()]
+        if not idx:
+            return out
+        try:
+            t0 = time.perf_counter()
+            embs = self._model.encode(
+                [texts[i] for i in idx], convert_to_numpy=True, batch_size=batch_size or self._batch_size
+            )
+            self._record(consumer, (time.perf_counter() - t0) * 1000, len(idx))
+            for j, i in enumerate(idx):
+                out[i] = embs[j].tolist()
+            return out
+        except Exception as e:
+            logger.warning("TextEmbedder embed_texts error: %s", e)
+            return [[] for _ in texts]
+
+    def embed_text(self, text: str) -> List[float]:
+        """단일 텍스트 임베딩. 빈 문자열이면 제로 벡터(차원은 get_dimension 기준)."""
+        return self._embed_text_as(text, "default")
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """여러 텍스트를 한 번의 encode로 임베딩 (입력 순서 유지, 빈 문자열은 제로 벡터)."""
+        return self._embed_texts_as(list(texts or []), "default")
+
     async def embed(self, text: str) -> List[float]:
         """
         비동기 컨텍스트용 임베딩.
@@ -105,6 +315,10 @@ class TextEmbedder:
         """
         return await asyncio.to_thread(self.embed_text, text)
 
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """embed_texts의 비동기 버전 (스레드에서 1회 encode)."""
+        return await asyncio.to_thread(self.embed_texts, texts)
+
     def get_dimension(self) -> int:
         """임베딩 차원. 모델에서 조회하며, 알 수 없으면 768 반환."""
         if self._dimension is not None:
@@ -117,14 +331,121 @@ class TextEmbedder:
                 pass
         return 768
 
+    def warm_up(self) -> float:
+        """고정 합성 배치로 encode를 1회 실행해 첫 통화가 커널 초기화 비용을 내지 않게 한다. 소요 ms 반환."""
+        if not self._model:
+            return 0.0
+        t0 = time.perf_counter()
+        self._embed_texts_as(list(_WARMUP_TEXTS), "warmup")
+        self._embed_text_as(_WARMUP_TEXTS[1], "warmup")
+        self.warmup_ms = round((time.perf_counter() - t0) * 1000, 1)
+        logger.info(
+            "TextEmbedder warm-up done",
+            extra={"model_name": self.model_name, "backend": self.backend, "warmup_ms": self.warmup_ms},
+        )
+        return self.warmup_ms
+
+    def for_consumer(
+        self,
+        consumer: str,
+        batch_size: Optional[int] = None,
+        dimension: Optional[int] = None,
+    ) -> "_ConsumerEmbedder":
+        """같은 모델을 공유하되 encode 지연을 consumer별로 집계하는 프록시.
+
+        batch_size: 이 consumer의 embed_texts 배치 크기 (None이면 인스턴스 기본값)
+        dimension: 설정상 기대 차원 — 모델 차원과 다르면 경고 (차원은 모델이 정한다)
+        """
+        if dimension and self._dimension and int(dimension) != int(self._dimension):
+            logger.warning(
+                "TextEmbedder configured dimension differs from model: configured=%s model=%s consumer=%s",
+                dimension,
+                self._dimension,
+                consumer,
+            )
+        return _ConsumerEmbedder(self, consumer, batch_size=batch_size)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            per_consumer = {k: v.as_dict() for k, v in self._stats.items()}
+        return {
+            "model_name": self.model_name,
+            "backend": self.backend,
+            "dimension": self._dimension,
+            "load_time_ms": self.load_time_ms,
+            "warmup_ms": self.warmup_ms,
+            "consumers": per_consumer,
+        }
+
+
+class _ConsumerEmbedder:
+    """TextEmbedder 공유 인스턴스의 consumer별 뷰 (API/AI 파이프라인/지식 추출 지연 분리 집계)."""
+
+    def __init__(self, base: TextEmbedder, consumer: str, batch_size: Optional[int] = None):
+        self._base = base
+        self.consumer = consumer
+        self._batch_size = int(batch_size) if batch_size else None
+
+    def embed_text(self, text: str) -> List[float]:
+        return self._base._embed_text_as(text, self.consumer)
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        return self._base._embed_texts_as(list(texts or []), self.consumer, self._batch_size)
+
+    async def embed(self, text: str) -> List[float]:
+        return await asyncio.to_thread(self.embed_text, text)
+
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        return await asyncio.to_thread(self.embed_texts, texts)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._base, name)
+
 
 def get_text_embedder(
     model_name: Optional[str] = None,
     force_new: bool = False,
-) -> TextEmbedder:
-    """TextEmbedder 싱글톤. model_name 없으면 기본 모델 사용."""
+    backend: Optional[str] = None,
+    consumer: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    dimension: Optional[int] = None,
+) -> Any:
+    """TextEmbedder 싱글톤. model_name 없으면 기본 모델 사용.
+
+    (model_name, backend)당 1개 인스턴스를 락 안에서 생성하므로 여러 스레드가 동시에 불러도 1회만 로드된다.
+    backend=None이면 같은 모델로 이미 로드된 인스턴스를 backend와 무관하게 재사용한다
+    (지식 API 라우터 등 설정을 모르는 호출부가 두 번째 모델을 띄우지 않도록).
+    consumer를 주면 consumer별 지연 집계 프록시를 반환한다(모델은 공유).
+    batch_size·dimension(설정 ai_voicebot.embedding)은 프록시에 적용된다 — consumer 없이 주면 "default" 프록시.
+    """
     global _embedder_instance
-    if _embedder_instance is not None and not force_new:
-        return _embedder_instance
-    _embedder_instance = TextEmbedder(model_name=model_name or _DEFAULT_MODEL)
-    return _embedder_instance
+    name = model_name or _DEFAULT_MODEL
+    key = (name, _resolve_backend(backend))
+    with _embedder_lock:
+        instance = None if force_new else _embedder_instances.get(key)
+        if instance is None and backend is None and not force_new:
+            instance = next((v for (n, _), v in _embedder_instances.items() if n == name), None)
+        if instance is None:
+            instance = TextEmbedder(model_name=name, backend=key[1], batch_size=batch_size)
+            _embedder_instances[key] = instance
+            # 실제 로드된 backend(ONNX 폴백 시 torch)로도 조회되게 등록
+            _embedder_instances.setdefault((name, instance.backend), instance)
+        if name == _DEFAULT_MODEL or _embedder_instance is None:
+            _embedder_instance = instance
+    if consumer or batch_size or dimension:
+        return instance.for_consumer(consumer or "default", batch_size=batch_size, dimension=dimension)
+    return instance
+
+
+def warm_up_text_embedder(model_name: Optional[str] = None, backend: Optional[str] = None) -> Dict[str, Any]:
+    """기동 시 공유 임베더를 로드·워밍업하고 통계를 반환 (main.py에서 to_thread로 호출)."""
+    embedder = get_text_embedder(model_name=model_name, backend=backend)
+    embedder.warm_up()
+    return embedder.get_stats()
+
+
+def get_text_embedder_stats() -> List[Dict[str, Any]]:
+    """로드된 모든 공유 임베더의 로드 시간·consumer별 encode 지연."""
+    with _embedder_lock:
+        unique = {id(v): v for v in _embedder_instances.values()}
+    return [e.get_stats() for e in unique.values()]
@@ -9,10 +9,16 @@ Chain-of-Interactions (EMNLP 2025) 참조.
   Stage 2: 멀티스텝 추출 (요약 → QA → 엔티티 → 유용성)
   Stage 3: 품질 검증 (환각 → 중복 → 품질 게이트)
   Stage 4: VectorDB 저장 (확장 메타데이터)
+
+배치 처리: 통화 1건의 항목은 한 번에 임베딩(전사 임베딩은 1회 계산 후 재사용)하고,
+환각 검증은 세마포어로 제한해 동시 실행, 중복 검사는 다중 벡터 질의 1회, 저장은 bulk upsert 1회.
+동시 추출 통화 수는 `max_concurrent_extractions`로 제한 (초과 통화는 대기 — 업무 외 시간 폭주 시
+추출 작업이 라이브 통화와 CPU·임베딩 모델을 다투지 않도록).
 """
 
 import asyncio
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -30,6 +36,7 @@ from .semantic_deduplicator import (
     SemanticDeduplicator,
 )
 from .quality_gate import QualityGate
+from .help_cache import get_help_cache
 from .extraction_category import normalize_extraction_category
 from .rag_knowledge_text import apply_rag_knowledge_prefix, strip_rag_knowledge_prefix
 from src.common.sip_owner import normalize_owner_username
@@ -140,6 +147,14 @@ class ExtractionPipeline:
         self.max_llm_calls = self.config.get("max_llm_calls_per_extraction", 6)
         self.skip_short_calls = self.config.get("skip_short_calls_seconds", 30)
 
+        # 동시성 제어: 통화 단위 추출 대기열 + 항목 단위 환각 검증 병렬도
+        self.max_concurrent_extractions = max(1, int(self.config.get("max_concurrent_extractions", 2)))
+        self.hallucination_concurrency = max(1, int(quality_cfg.get("hallucination_concurrency", 4)))
+        self._extraction_slots = asyncio.Semaphore(self.max_concurrent_extractions)
+        self._active_extractions = 0
+        self._queued_extractions = 0
+        self._last_queue_wait_ms = 0.0
+
         # 서브 컴포넌트
         self.summarizer = ConversationSummarizer(llm_client)
         self.qa_extractor = QAPairExtractor(llm_client)
@@ -171,6 +186,8 @@ class ExtractionPipeline:
             "ExtractionPipeline v2 initialized",
             steps=steps,
             quality=quality_cfg,
+            max_concurrent_extractions=self.max_concurrent_extractions,
+            hallucination_concurrency=self.hallucination_concurrency,
         )
 
     async def extract_from_call(
@@ -192,7 +209,37 @@ class ExtractionPipeline:
         Returns:
             ExtractionResult
         """
-        import time
+        # 추출 대기열: 동시 추출 통화 수 제한 (대기 시간은 로그로 남김)
+        self._queued_extractions += 1
+        wait_start = time.time()
+        try:
+            await self._extraction_slots.acquire()
+        finally:
+            self._queued_extractions -= 1
+        self._last_queue_wait_ms = (time.time() - wait_start) * 1000
+        if self._last_queue_wait_ms >= 1.0:
+            logger.info(
+                "pipeline_queue_wait",
+                call_id=call_id,
+                wait_ms=f"{self._last_queue_wait_ms:.0f}",
+                queued=self._queued_extractions,
+                max_concurrent=self.max_concurrent_extractions,
+            )
+        self._active_extractions += 1
+        try:
+            return await self._run_extraction(call_id, transcript_path, owner_id, speaker)
+        finally:
+            self._active_extractions -= 1
+            self._extraction_slots.release()
+
+    async def _run_extraction(
+        self,
+        call_id: str,
+        transcript_path: str,
+        owner_id: str,
+        speaker: str,
+    ) -> ExtractionResult:
+        """extract_from_call 본체 (추출 슬롯 확보 후 실행)."""
         start_time = time.time()
 
         result = ExtractionResult(call_id=call_id, success=False)
@@ -350,20 +397,49 @@ class ExtractionPipeline:
 
             verified_items: List[ExtractionItem] = []
 
-            for item in items:
-                # 3-1: 환각 검증 (전사 대비). knowledge는 RAG 검색 접두가 붙어 있어
-                # 구문 토큰 매칭이 전사와 어긋나 전부 탈락할 수 있으므로 접두 제거 후 검증.
-                if self.enable_hallucination:
-                    _halluc_text = (
-                        strip_rag_knowledge_prefix(item.text)
-                        if item.doc_type == "knowledge"
-                        else item.text
-                    )
-                    halluc = await self.hallucination_checker.check(
-                        _halluc_text,
-                        transcript,
-                        skip_entailment=(item.confidence >= 0.9),
-                    )
+            # 3-0: 일괄 임베딩 — 항목 텍스트(중복 검사·저장 공용)와 환각 검증용 텍스트를 한 번에,
+            # 전사 임베딩은 통화당 1회만 계산해 모든 항목의 의미 검증에 재사용
+            halluc_texts = [
+                strip_rag_knowledge_prefix(item.text) if item.doc_type == "knowledge" else item.text
+                for item in items
+            ]
+            embed_inputs = [item.text for item in items]
+            if self.enable_hallucination:
+                embed_inputs += halluc_texts
+            original_embedding_task = None
+            if self.enable_hallucination:
+                original_embedding_task = asyncio.create_task(
+                    self.hallucination_checker.embed_original(transcript)
+                )
+            embeddings_by_text = await self._embed_unique(embed_inputs)
+            original_embedding = (
+                await original_embedding_task if original_embedding_task else None
+            )
+
+            # 3-1: 환각 검증 (전사 대비, 세마포어로 동시 실행 제한). knowledge는 RAG 검색 접두가 붙어 있어
+            # 구문 토큰 매칭이 전사와 어긋나 전부 탈락할 수 있으므로 접두 제거 후 검증.
+            halluc_results = [None] * len(items)
+            if self.enable_hallucination:
+                halluc_sem = asyncio.Semaphore(self.hallucination_concurrency)
+
+                async def _check_one(idx: int):
+                    async with halluc_sem:
+                        return await self.hallucination_checker.check(
+                            halluc_texts[idx],
+                            transcript,
+                            skip_entailment=(items[idx].confidence >= 0.9),
+                            extracted_embedding=embeddings_by_text.get(halluc_texts[idx]),
+                            original_embedding=original_embedding,
+                        )
+
+                halluc_results = await asyncio.gather(
+                    *(_check_one(i) for i in range(len(items)))
+                )
+
+            gated_items: List[ExtractionItem] = []
+            for idx, item in enumerate(items):
+                halluc = halluc_results[idx]
+                if halluc is not None:
                     item.hallucination_passed = halluc.passed
                     if not halluc.passed:
                         result.skipped_hallucination += 1
@@ -387,7 +463,7 @@ class ExtractionPipeline:
                             semantic_score=round(halluc.semantic_score, 4),
                             entailment_result=halluc.entailment_result,
                             reason=(halluc.details or "")[:800],
-                            text_preview=(_halluc_text or "")[:400],
+                            text_preview=(halluc_texts[idx] or "")[:400],
                             pipeline_version=PIPELINE_VERSION,
                             **chroma_context_for_call_data(),
                         )
@@ -411,14 +487,16 @@ class ExtractionPipeline:
                     )
                     continue
 
-                # 3-3: 중복 검증
-                if self.enable_dedup:
-                    embedding = await self.embedder.embed(item.text)
-                    dedup = await self.deduplicator.check(
-                        item.text,
-                        embedding,
-                        owner_filter=owner_id,
-                    )
+                gated_items.append(item)
+
+            # 3-3: 중복 검증 (다중 벡터 질의 1회)
+            if self.enable_dedup and gated_items:
+                dedups = await self.deduplicator.check_many(
+                    [item.text for item in gated_items],
+                    [embeddings_by_text.get(item.text) for item in gated_items],
+                    owner_filter=owner_id,
+                )
+                for item, dedup in zip(gated_items, dedups):
                     item.dedup_status = dedup.status
                     item.merged_with = dedup.similar_doc_id
                     if dedup.action == "skip":
@@ -429,8 +507,9 @@ class ExtractionPipeline:
                             similar=dedup.similar_doc_id,
                         )
                         continue
-
-                verified_items.append(item)
+                    verified_items.append(item)
+            else:
+                verified_items = gated_items
 
             logger.info(
                 "✅ [Pipeline v2] Stage 3 완료",
@@ -446,9 +525,10 @@ class ExtractionPipeline:
 
             now = datetime.now().isoformat()
 
+            upserts: List[Dict] = []
             for idx, item in enumerate(verified_items):
                 doc_id = f"{call_id}_{item.doc_type}_{idx}"
-                embedding = await self.embedder.embed(item.text)
+                embedding = embeddings_by_text.get(item.text) or await self.embedder.embed(item.text)
 
                 # 자동 승인 판정
                 review_status = "pending"
@@ -505,25 +585,51 @@ class ExtractionPipeline:
                     metadata["normalized_value"] = item.normalized_value or ""
                     metadata["entity_speaker"] = item.entity_speaker or ""
 
-                await self.vector_db.upsert(
-                    doc_id=doc_id,
-                    embedding=embedding,
-                    text=item.text,
-                    metadata=metadata,
+                upserts.append({
+                    "doc_id": doc_id,
+                    "embedding": embedding,
+                    "item": item,
+                    "metadata": metadata,
+                    "store_category": store_category,
+                    "review_status": review_status,
+                })
+
+            # bulk upsert 1회 (미지원 vector_db는 단건 upsert로 폴백)
+            upsert_many = getattr(self.vector_db, "upsert_many", None)
+            if upserts and callable(upsert_many):
+                await upsert_many(
+                    ids=[u["doc_id"] for u in upserts],
+                    embeddings=[u["embedding"] for u in upserts],
+                    texts=[u["item"].text for u in upserts],
+                    metadatas=[u["metadata"] for u in upserts],
                 )
+            else:
+                for u in upserts:
+                    await self.vector_db.upsert(
+                        doc_id=u["doc_id"],
+                        embedding=u["embedding"],
+                        text=u["item"].text,
+                        metadata=u["metadata"],
+                    )
+
+            if upserts:
+                get_help_cache().notify_knowledge_changed(owner_id)
+
+            for u in upserts:
                 log_call_data(
                     call_id,
                     "knowledge",
                     "chroma_knowledge_upsert",
-                    doc_id=doc_id,
+                    doc_id=u["doc_id"],
                     owner_id=owner_id,
-                    doc_type=item.doc_type,
-                    storage_category=store_category,  # "category"는 위치 인자이므로 키 이름 변경
-                    review_status=review_status,
-                    embedding_dims=len(embedding) if embedding else 0,
-                    text_preview=item.text,
-                    metadata_keys=list(metadata.keys()),
+                    doc_type=u["item"].doc_type,
+                    storage_category=u["store_category"],  # "category"는 위치 인자이므로 키 이름 변경
+                    review_status=u["review_status"],
+                    embedding_dims=len(u["embedding"]) if u["embedding"] else 0,
+                    text_preview=u["item"].text,
+                    metadata_keys=list(u["metadata"].keys()),
                     pipeline_version=PIPELINE_VERSION,
+                    bulk=bool(callable(upsert_many)),
                     **chroma_context_for_call_data(),
                 )
                 result.stored_count += 1
@@ -583,6 +689,18 @@ class ExtractionPipeline:
 
     # ── 유틸리티 ──
 
+    async def _embed_unique(self, texts: List[str]) -> Dict[str, List[float]]:
+        """중복 제거한 텍스트를 한 번에 임베딩 → {text: embedding}. embed_batch 미지원 시 embed 동시 실행."""
+        unique = [t for t in dict.fromkeys(texts) if t]
+        if not unique:
+            return {}
+        embed_batch = getattr(self.embedder, "embed_batch", None)
+        if callable(embed_batch):
+            vectors = await embed_batch(unique)
+        else:
+            vectors = await asyncio.gather(*(self.embedder.embed(t) for t in unique))
+        return {t: list(v) for t, v in zip(unique, vectors) if v is not None and len(v) > 0}
+
     def _load_transcript(self, path: str) -> str:
         try:
             return Path(path).read_text(encoding="utf-8")
@@ -621,6 +739,10 @@ class ExtractionPipeline:
             "total_extractions": self.total_extractions,
             "total_stored": self.total_stored,
             "pipeline_version": PIPELINE_VERSION,
+            "max_concurrent_extractions": self.max_concurrent_extractions,
+            "active_extractions": self._active_extractions,
+            "queued_extractions": self._queued_extractions,
+            "last_queue_wait_ms": round(self._last_queue_wait_ms, 1),
             "steps": {
                 "summarize": self.enable_summarize,
                 "qa_extract": self.enable_qa_extract,
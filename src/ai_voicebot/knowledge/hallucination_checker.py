@@ -93,6 +93,8 @@ class HallucinationChecker:
         extracted_text: str,
         original_text: str,
         skip_entailment: bool = False,
+        extracted_embedding: Optional[List[float]] = None,
+        original_embedding: Optional[List[float]] = None,
     ) -> HallucinationResult:
         """
         추출 결과가 원문에 근거하는지 3중 검증
@@ -101,6 +103,8 @@ class HallucinationChecker:
             extracted_text: 추출된 텍스트
             original_text: 원문 전사 텍스트
             skip_entailment: 함의 검증 스킵 여부
+            extracted_embedding: 추출 텍스트 임베딩 (파이프라인 일괄 임베딩 재사용, 없으면 생성)
+            original_embedding: `embed_original()` 결과 (통화당 1회 계산해 재사용, 없으면 생성)
 
         Returns:
             HallucinationResult
@@ -140,7 +144,12 @@ class HallucinationChecker:
         # Stage 2: 의미 검증 (임베딩 비용만)
         semantic_score = 0.0
         if self.embedder:
-            semantic_score = await self._semantic_check(extracted_text, transcript_for_check)
+            semantic_score = await self._semantic_check(
+                extracted_text,
+                transcript_for_check,
+                emb_extracted=extracted_embedding,
+                emb_original=original_embedding,
+            )
             if semantic_score < self.semantic_threshold:
                 return HallucinationResult(
                     passed=False,
@@ -178,6 +187,24 @@ class HallucinationChecker:
             details="3중 검증 통과",
         )
 
+    async def embed_original(self, original_text: str) -> Optional[List[float]]:
+        """
+        의미 검증용 원문 임베딩을 미리 계산 (check()와 같은 정규화·길이 제한 적용).
+        한 통화의 여러 항목을 검증할 때 원문 임베딩을 항목마다 다시 만들지 않도록 한다.
+        """
+        if not self.embedder:
+            return None
+        transcript_for_check = (
+            self._normalize_transcript(original_text)
+            if self._normalize_for_hallucination
+            else original_text
+        )
+        try:
+            return await self.embedder.embed(transcript_for_check[:2000])
+        except Exception as e:
+            logger.warning("original_embedding_failed", error=str(e))
+            return None
+
     def _looks_like_short_turn_transcript(self, text: str) -> bool:
         """짧은 턴(4자 이하)이 전체의 50% 이상이면 초단문 전사로 본다."""
         if not self._collapse_short_turns:
@@ -253,11 +280,19 @@ class HallucinationChecker:
         
         return matched / len(extracted_tokens)
 
-    async def _semantic_check(self, extracted: str, original: str) -> float:
-        """의미 검증: 임베딩 코사인 유사도"""
+    async def _semantic_check(
+        self,
+        extracted: str,
+        original: str,
+        emb_extracted: Optional[List[float]] = None,
+        emb_original: Optional[List[float]] = None,
+    ) -> float:
+        """의미 검증: 임베딩 코사인 유사도 (미리 계산된 임베딩이 있으면 재사용)"""
         try:
-            emb_extracted = await self.embedder.embed(extracted)
-            emb_original = await self.embedder.embed(original[:2000])  # 원문 길이 제한
+            if not emb_extracted:
+                emb_extracted = await self.embedder.embed(extracted)
+            if not emb_original:
+                emb_original = await self.embedder.embed(original[:2000])  # 원문 길이 제한
 
             # 코사인 유사도 계산
             dot_product = sum(a * b for a, b in zip(emb_extracted, emb_original))
@@ -0,0 +1,501 @@
+"""
+Help / Capability 사전 계산 캐시 (owner별).
+
+"뭘 할 수 있어요?"(intent=help) 안내 항목과 2차 인사·capability 안내 멘트는 통화마다
+RAG + LLM 왕복으로 만들던 값이지만, 실제로는 owner 지식 집합이 바뀔 때만 달라진다.
+지식 변경(upsert/delete) 시 백그라운드에서 owner 단위로 다시 계산해 두고 통화 중에는 dict 조회로 응답한다.
+
+- knowledge_fingerprint(): owner 지식 집합(id·본문·안내 관련 메타) 해시 — 같으면 재계산 생략
+- HelpCacheService.notify_knowledge_changed(owner): 변경 알림 → dirty 표시 + 디바운스 재계산 예약
+- HelpCacheService.get(owner): O(1) 조회 (dirty/미구성(configure 전)이면 None → 호출부는 기존 경로)
+- SQLite 영속화: 환경변수 HELP_CACHE_DB_PATH (기본 data/help_cache.db) — 재기동 직후에도 바로 응답.
+  공유 SQLite 풀(src.common.sqlite_pool)의 writer로 쓰고, 저장은 sqlite executor 스레드에서 실행
+- owner별 재계산 직렬화는 이벤트 루프별 asyncio.Lock — 대기자가 없어지면 바로 버린다
+
+hit_count 등 통화마다 바뀌는 메타는 지문에 넣지 않는다(사용 통계 갱신으로 재계산이 돌지 않도록).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import structlog
+
+from src.common.sqlite_pool import run as _pool_run
+from src.common.sqlite_pool import to_thread as _db_to_thread
+
+logger = structlog.get_logger(__name__)
+
+_DEFAULT_DB = "data/help_cache.db"
+HELP_CACHE_REBUILD_DELAY_SEC = 2.0
+HELP_CACHE_SOURCE_LIMIT = 2000
+CAPABILITY_GUIDE_MAX_ITEMS = 5
+
+# 지문에 포함하는 메타 키 (안내 항목·멘트 결과에 영향을 주는 것만)
+_FINGERPRINT_META_KEYS = (
+    "category",
+    "doc_type",
+    "is_active",
+    "priority",
+    "display_name",
+    "department",
+    "created_at",
+)
+# help 항목 후보에서 제외 (인사/종료 멘트는 "할 수 있는 일"이 아님)
+_HELP_EXCLUDED_CATEGORIES = frozenset({"greeting_phase1", "farewell"})
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS help_cache (
+    owner TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    payload_json TEXT NOT NULL,
+    built_at TEXT NOT NULL
+)
+"""
+
+CAPABILITY_GUIDE_SYSTEM_PROMPT = "전화 상담 안내 멘트를 간결하게 한 문장으로 생성하세요. 존댓말을 사용하세요."
+
+
+def build_capability_guide_prompt(display_names: List[str]) -> str:
+    """capability display_name 목록 → 한 문장 안내 생성 프롬프트 (AIOrchestrator와 공용)."""
+    items_text = ", ".join(display_names)
+    return (
+        f"다음 서비스 항목들을 자연어 한 문장으로 안내하세요.\n"
+        f"항목: {items_text}\n"
+        f"형식 예시: '저는 A, B, C를 안내해 드릴 수 있어요. 어떤 것이 궁금하신가요?'"
+    )
+
+
+def capability_guide_template(display_names: List[str]) -> str:
+    """LLM 없이 만드는 capability 안내 한 문장 (LLM 미설정·실패 시)."""
+    return f"저는 {', '.join(display_names)}를 안내해 드릴 수 있어요. 어떤 것이 궁금하신가요?"
+
+
+def _coerce_active(v: Any) -> bool:
+    if isinstance(v, bool):
+        return v
+    if isinstance(v, str):
+        return v.strip().lower() not in ("false", "0", "no", "off", "")
+    if v is None:
+        return True
+    return bool(v)
+
+
+def _priority(meta: Dict[str, Any]) -> int:
+    try:
+        return int(meta.get("priority", 50))
+    except (TypeError, ValueError):
+        return 50
+
+
+def knowledge_fingerprint(ids: List[str], documents: List[str], metadatas: List[Dict[str, Any]]) -> str:
+    """owner 지식 집합의 지문 (문서 순서 무관)."""
+    rows: List[str] = []
+    for i, doc_id in enumerate(ids):
+        text = documents[i] if i < len(documents) else ""
+        meta = metadatas[i] if i < len(metadatas) else {}
+        if not isinstance(meta, dict):
+            meta = {}
+        picked = {k: meta.get(k) for k in _FINGERPRINT_META_KEYS if meta.get(k) not in (None, "")}
+        text_hash = hashlib.sha1((text or "").encode("utf-8")).hexdigest()
+        rows.append(f"{doc_id}\x1f{text_hash}\x1f{json.dumps(picked, sort_keys=True, default=str)}")
+    rows.sort()
+    h = hashlib.sha1()
+    for r in rows:
+        h.update(r.encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+@dataclass
+class HelpCacheEntry:
+    """owner 1명의 사전 계산 결과."""
+
+    owner: str
+    fingerprint: str
+    help_items: List[str] = field(default_factory=list)
+    help_response: str = ""
+    help_source: str = ""
+    help_confidence: float = 0.0
+    capability_names: List[str] = field(default_factory=list)
+    capability_guide: str = ""
+    greeting_phase2: str = ""
+    doc_count: int = 0
+    built_at: str = ""
+    build_ms: float = 0.0
+
+
+class HelpCacheService:
+    """owner별 help/capability 안내를 지식 변경 시점에 미리 계산해 두는 캐시."""
+
+    def __init__(self, db_path: Optional[str] = None, rebuild_delay_sec: float = HELP_CACHE_REBUILD_DELAY_SEC):
+        self._db_path = db_path
+        self.rebuild_delay_sec = max(0.0, float(rebuild_delay_sec))
+        self._entries: Dict[str, HelpCacheEntry] = {}
+        self._dirty: set = set()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        # (id(loop), owner) → [asyncio.Lock, 사용 중 수] — 0이 되면 제거 (루프마다 별도 락)
+        self._owner_locks: Dict[Tuple[int, str], List[Any]] = {}
+        self._owner_locks_guard = threading.Lock()
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        self._loaded = False
+        self._configured = False
+        self._vector_db: Any = None
+        self._llm: Any = None
+        self._hits = 0
+        self._misses = 0
+        self._rebuilds = 0
+        self._unchanged = 0
+        self._errors = 0
+        self._llm_calls = 0
+
+    # ── 구성/영속화 ──
+
+    def configure(self, vector_db: Any = None, llm: Any = None) -> None:
+        """재계산에 쓸 지식 컬렉션·LLM 지정 (None이면 기존 값 유지, vector_db 미지정 시 get_vector_db())."""
+        if vector_db is not None:
+            self._vector_db = vector_db
+        if llm is not None:
+            self._llm = llm
+        self._configured = True
+        self._ensure_loaded()
+
+    @property
+    def enabled(self) -> bool:
+        """configure() 이후에만 조회·재계산 (미구성 프로세스·테스트에서는 기존 경로 그대로)."""
+        return self._configured
+
+    def _get_db_path(self) -> str:
+        path = self._db_path or os.environ.get("HELP_CACHE_DB_PATH", _DEFAULT_DB)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        if not self._schema_ready:
+            conn.execute(_DDL)
+            self._schema_ready = True
+
+    def _load_rows(self, conn: sqlite3.Connection) -> List[Tuple[str, str]]:
+        self._ensure_schema(conn)
+        return conn.execute("SELECT owner, payload_json FROM help_cache").fetchall()
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            try:
+                rows = _pool_run(self._get_db_path(), self._load_rows, write=True)
+                for owner, payload in rows:
+                    try:
+                        self._entries[owner] = HelpCacheEntry(**json.loads(payload))
+                    except (TypeError, ValueError) as e:
+                        logger.warning("help_cache_row_invalid", owner=owner, error=str(e))
+                logger.info("help_cache_loaded", owners=len(self._entries))
+            except sqlite3.Error as e:
+                logger.warning("help_cache_load_failed", error=str(e))
+            self._loaded = True
+
+    def _persist(self, entry: HelpCacheEntry) -> None:
+        row = (entry.owner, entry.fingerprint, json.dumps(asdict(entry), ensure_ascii=False), entry.built_at)
+
+        def _write(conn: sqlite3.Connection) -> None:
+            self._ensure_schema(conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO help_cache (owner, fingerprint, payload_json, built_at) VALUES (?, ?, ?, ?)",
+                row,
+            )
+
+        _pool_run(self._get_db_path(), _write, write=True)
+
+    @asynccontextmanager
+    async def _owner_lock(self, owner: str) -> AsyncIterator[None]:
+        """현재 이벤트 루프에서 owner 재계산 직렬화 (마지막 사용자가 나가면 락 제거)."""
+        key = (id(asyncio.get_running_loop()), owner)
+        with self._owner_locks_guard:
+            slot = self._owner_locks.get(key)
+            if slot is None:
+                slot = self._owner_locks[key] = [asyncio.Lock(), 0]
+            slot[1] += 1
+        try:
+            async with slot[0]:
+                yield
+        finally:
+            with self._owner_locks_guard:
+                slot[1] -= 1
+                if slot[1] == 0 and self._owner_locks.get(key) is slot:
+                    del self._owner_locks[key]
+
+    # ── 조회 ──
+
+    def get(self, owner: Optional[str]) -> Optional[HelpCacheEntry]:
+        """
+        owner의 사전 계산 결과 (dict 조회). 변경 알림 후 재계산 전(dirty)이면 None.
+        """
+        owner = (owner or "").strip()
+        if not owner or not self._configured:
+            return None
+        self._ensure_loaded()
+        entry = self._entries.get(owner)
+        if entry is None or owner in self._dirty:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return entry
+
+    # ── 변경 알림 / 재계산 ──
+
+    def notify_knowledge_changed(self, owner: Optional[str] = None) -> None:
+        """
+        지식 upsert/delete 후 호출. owner를 모르면(문서 id 삭제 등) 캐시된 모든 owner를 대상으로 한다.
+        실행 중인 이벤트 루프가 있으면 디바운스 후 백그라운드 재계산, 없으면 dirty 표시만 한다.
+        LLM 응답 캐시의 지식 버전도 올려 이전 지식 기반 캐시 결과가 재사용되지 않게 한다.
+        """
+        from src.ai_voicebot.ai_pipeline.llm_response_cache import bump_knowledge_version
+
+        bump_knowledge_version()
+        if not self._configured:
+            return
+        self._ensure_loaded()
+        owner = (owner or "").strip()
+        owners = [owner] if owner else list(self._entries.keys())
+        for o in owners:
+            self._dirty.add(o)
+            self.schedule_rebuild(o)
+
+    def schedule_rebuild(self, owner: Optional[str], delay: Optional[float] = None, restart: bool = True) -> None:
+        """
+        owner 재계산 예약.
+
+        Args:
+            delay: 디바운스 지연(초). None이면 rebuild_delay_sec
+            restart: True면 대기 중인 예약을 취소하고 다시 미룸(연속 변경 디바운스),
+                     False면 이미 예약/실행 중일 때 아무것도 하지 않음(통화 중 캐시 미스)
+        """
+        owner = (owner or "").strip()
+        if not owner or not self._configured:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        prev = self._tasks.get(owner)
+        if prev is not None and not prev.done():
+            if not restart:
+                return
+            prev.cancel()
+        wait = self.rebuild_delay_sec if delay is None else max(0.0, delay)
+        self._tasks[owner] = loop.create_task(self._delayed_rebuild(owner, wait))
+
+    async def _delayed_rebuild(self, owner: str, delay: float) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+        try:
+            await self.rebuild(owner)
+        except Exception as e:
+            self._errors += 1
+            logger.warning("help_cache_rebuild_failed", owner=owner, error=str(e))
+
+    def _resolve_vector_db(self) -> Any:
+        if self._vector_db is None:
+            from .chromadb_client import get_vector_db
+
+            self._vector_db = get_vector_db()
+        return self._vector_db
+
+    async def rebuild(self, owner: str, force: bool = False) -> Optional[HelpCacheEntry]:
+        """
+        owner 지식을 읽어 지문 비교 후 help 항목·capability 안내·2차 인사를 다시 계산해 저장.
+
+        Returns:
+            최신 HelpCacheEntry (vector_db 미구성이면 None)
+        """
+        from .vector_store_gateway import get_vector_store_gateway
+
+        owner = (owner or "").strip()
+        vector_db = self._resolve_vector_db()
+        if not owner or vector_db is None:
+            return None
+        async with self._owner_lock(owner):
+            started = time.perf_counter()
+            res = await get_vector_store_gateway().run(
+                "get", vector_db.get, where={"owner": owner}, limit=HELP_CACHE_SOURCE_LIMIT
+            )
+            ids = list(res.get("ids") or [])
+            documents = list(res.get("documents") or [])
+            metadatas = [m if isinstance(m, dict) else {} for m in (res.get("metadatas") or [])]
+            fp = knowledge_fingerprint(ids, documents, metadatas)
+            current = self._entries.get(owner)
+            if current is not None and current.fingerprint == fp and not force:
+                self._unchanged += 1
+                self._dirty.discard(owner)
+                logger.debug("help_cache_unchanged", owner=owner, fingerprint=fp[:12])
+                return current
+
+            entry = await self._build_entry(owner, fp, ids, documents, metadatas)
+            entry.build_ms = round((time.perf_counter() - started) * 1000, 1)
+            self._entries[owner] = entry
+            self._dirty.discard(owner)
+            self._rebuilds += 1
+            try:
+                await _db_to_thread(self._persist, entry)
+            except sqlite3.Error as e:
+                logger.warning("help_cache_persist_failed", owner=owner, error=str(e))
+            logger.info(
+                "help_cache_rebuilt",
+                owner=owner,
+                fingerprint=fp[:12],
+                doc_count=entry.doc_count,
+                help_items=entry.help_items,
+                help_source=entry.help_source,
+                has_capability_guide=bool(entry.capability_guide),
+                build_ms=entry.build_ms,
+            )
+            return entry
+
+    async def _build_entry(
+        self,
+        owner: str,
+        fingerprint: str,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> HelpCacheEntry:
+        from src.ai_voicebot.knowledge.vector_db import Document
+        from src.ai_voicebot.langgraph.nodes.response_shortcuts import (
+            HELP_CAPABILITY_TEMPLATE,
+            HELP_RAG_TOP_K,
+            select_help_items,
+        )
+
+        rows = [
+            (doc_id, documents[i] if i < len(documents) else "", metadatas[i] if i < len(metadatas) else {})
+            for i, doc_id in enumerate(ids)
+        ]
+        entry = HelpCacheEntry(
+            owner=owner,
+            fingerprint=fingerprint,
+            doc_count=len(rows),
+            built_at=datetime.now().isoformat(),
+        )
+
+        # 2차 인사: greeting_phase2 최신 본문 (get_knowledge_greeting_text와 같은 규칙)
+        greetings = sorted(
+            (r for r in rows if r[2].get("category") == "greeting_phase2" and len((r[1] or "").strip()) >= 2),
+            key=lambda r: str(r[2].get("created_at") or ""),
+            reverse=True,
+        )
+        if greetings:
+            entry.greeting_phase2 = greetings[0][1].strip()
+
+        # capability 안내: 활성 capability priority 순 display_name
+        caps = sorted(
+            (
+                r for r in rows
+                if r[2].get("doc_type") == "capability" and _coerce_active(r[2].get("is_active"))
+            ),
+            key=lambda r: (_priority(r[2]), str(r[2].get("display_name") or "")),
+        )
+        entry.capability_names = [
+            str(r[2].get("display_name")).strip()
+            for r in caps
+            if str(r[2].get("display_name") or "").strip()
+        ][:CAPABILITY_GUIDE_MAX_ITEMS]
+        if entry.capability_names:
+            entry.capability_guide = await self._summarize_capabilities(owner, entry.capability_names)
+
+        # help 항목: help 카테고리 → capability → 나머지(최신순), 통화 중 경로와 같은 선정 함수 사용
+        def _rank(r: tuple) -> tuple:
+            meta = r[2]
+            if meta.get("category") == "help":
+                return (0, 0)
+            if meta.get("doc_type") == "capability":
+                return (1, _priority(meta))
+            return (2, 0)
+
+        candidates = [
+            r for r in rows
+            if r[2].get("category") not in _HELP_EXCLUDED_CATEGORIES
+            and not (r[2].get("doc_type") == "capability" and not _coerce_active(r[2].get("is_active")))
+        ]
+        # 최신순 정렬 후 그룹 정렬(안정 정렬)로 그룹 내 최신 문서 우선
+        candidates.sort(key=lambda r: str(r[2].get("created_at") or ""), reverse=True)
+        candidates.sort(key=_rank)
+        docs = [
+            Document(id=doc_id, text=text or "", score=1.0, metadata=meta)
+            for doc_id, text, meta in candidates[:HELP_RAG_TOP_K]
+        ]
+        if docs:
+            if self._llm is not None:
+                self._llm_calls += 1
+            items, source, _ = await select_help_items(docs, self._llm, owner=owner)
+            if items:
+                entry.help_items = items
+                entry.help_source = source
+                entry.help_response = HELP_CAPABILITY_TEMPLATE.format(items=", ".join(items))
+                entry.help_confidence = 0.85 if source == "help_intent_rag_llm" else 0.75
+        return entry
+
+    async def _summarize_capabilities(self, owner: str, display_names: List[str]) -> str:
+        llm = self._llm
+        gen = getattr(llm, "generate_response", None) if llm is not None else None
+        if callable(gen):
+            try:
+                self._llm_calls += 1
+                text = await gen(
+                    user_text=build_capability_guide_prompt(display_names),
+                    context_docs=[],
+                    system_prompt=CAPABILITY_GUIDE_SYSTEM_PROMPT,
+                    update_history=False,
+                )
+                if text and len(str(text).strip()) >= 2:
+                    return str(text).strip()
+            except Exception as e:
+                logger.warning("help_cache_capability_guide_llm_failed", owner=owner, error=str(e))
+        return capability_guide_template(display_names)
+
+    # ── 통계 ──
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "owners": len(self._entries),
+            "dirty": sorted(self._dirty),
+            "pending_rebuilds": sum(1 for t in self._tasks.values() if not t.done()),
+            "hits": self._hits,
+            "misses": self._misses,
+            "rebuilds": self._rebuilds,
+            "unchanged": self._unchanged,
+            "errors": self._errors,
+            "llm_calls": self._llm_calls,
+            "entries": {
+                o: {"fingerprint": e.fingerprint[:12], "built_at": e.built_at, "build_ms": e.build_ms}
+                for o, e in self._entries.items()
+            },
+        }
+
+
+_help_cache: Optional[HelpCacheService] = None
+_help_cache_lock = threading.Lock()
+
+
+def get_help_cache() -> HelpCacheService:
+    """프로세스 공유 HelpCacheService 싱글톤."""
+    global _help_cache
+    if _help_cache is None:
+        with _help_cache_lock:
+            if _help_cache is None:
+                _help_cache = HelpCacheService()
+    return _help_cache
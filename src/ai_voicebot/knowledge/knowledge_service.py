@@ -4,6 +4,7 @@
 - add_knowledge: knowledge 컬렉션에 category 메타데이터로 저장.
 - greeting_phase1/2, farewell 인 경우 qa_cache 즉시 upsert (TTL 7일).
 - help 카테고리 직접 등록 시 qa_cache(intent=help) 즉시 upsert.
+- add_knowledge / delete_knowledge 후 owner별 help 캐시(help_cache.py) 재계산 예약.
 - build_help_cache_on_startup(): 서버 기동 시 호출.
     1. help 카테고리 KB가 있으면 → 해당 내용으로 qa_cache(intent=help) 구성.
     2. help 카테고리 KB가 없으면 → question(질의/FAQ) 목록에서 LLM으로
@@ -21,6 +22,7 @@ from .chromadb_client import (
     QA_CACHE_COLLECTION,
     get_vector_db,
 )
+from .help_cache import get_help_cache
 from src.common.sip_owner import normalize_owner_username
 
 logger = logging.getLogger(__name__)
@@ -126,6 +128,7 @@ def add_knowledge(
         return {"ok": False, "error": str(e), "doc_id": doc_id}
 
     result = {"ok": True, "doc_id": doc_id, "category": category}
+    get_help_cache().notify_knowledge_changed(owner)
 
     # greeting/farewell 즉시 캐싱 신호 — API에서 immediate_cache_for_knowledge 호출
     if category in IMMEDIATE_CACHE_CATEGORIES:
@@ -458,6 +461,7 @@ def delete_knowledge(vector_db: Any, doc_id: str) -> Dict[str, Any]:
         return {"ok": False, "error": "vector_db and doc_id required"}
     try:
         vector_db.delete(ids=[doc_id])
+        get_help_cache().notify_knowledge_changed()
         return {"ok": True, "deleted_id": doc_id}
     except Exception as e:
         logger.warning("knowledge_delete_failed", doc_id=doc_id, error=str(e))
@@ -15,6 +15,7 @@ from datetime import datetime
 import structlog
 
 from src.config.models import OrganizationPersona
+from src.ai_voicebot.knowledge.vector_store_gateway import get_vector_store_gateway
 
 logger = structlog.get_logger(__name__)
 
@@ -42,7 +43,9 @@ class PersonaService:
     async def initialize(self):
         """Persona collection 초기화"""
         try:
-            self._collection = self._chroma.get_or_create_collection(
+            self._collection = await get_vector_store_gateway().run(
+                "get",
+                self._chroma.get_or_create_collection,
                 name=self._collection_name,
                 metadata={"description": "Organization personas for chitchat classification"}
             )
@@ -90,7 +93,9 @@ class PersonaService:
                 "updated_at": datetime.now().isoformat(),
             }
             
-            self._collection.upsert(
+            await get_vector_store_gateway().run(
+                "upsert",
+                self._collection.upsert,
                 ids=[doc_id],
                 embeddings=[embedding],
                 documents=[persona.description],
@@ -136,7 +141,9 @@ class PersonaService:
                 await self.initialize()
             
             doc_id = f"persona_{owner}"
-            result = self._collection.get(
+            result = await get_vector_store_gateway().run(
+                "get",
+                self._collection.get,
                 ids=[doc_id],
                 include=["documents", "metadatas"]
             )
@@ -193,7 +200,7 @@ class PersonaService:
                 await self.initialize()
             
             doc_id = f"persona_{owner}"
-            self._collection.delete(ids=[doc_id])
+            await get_vector_store_gateway().run("delete", self._collection.delete, ids=[doc_id])
             
             # 캐시 제거
             self._cache.pop(owner, None)
@@ -245,7 +252,8 @@ class PersonaService:
             
             # Persona description과 유사도 계산
             doc_id = f"persona_{owner}"
-            results = self._collection.query(
+            results = await get_vector_store_gateway().query(
+                self._collection,
                 query_embeddings=[query_embedding],
                 n_results=1,
                 where={"owner": owner},
@@ -301,7 +309,9 @@ class PersonaService:
             if not self._collection:
                 await self.initialize()
             
-            result = self._collection.get(
+            result = await get_vector_store_gateway().run(
+                "get",
+                self._collection.get,
                 include=["documents", "metadatas"]
             )
             
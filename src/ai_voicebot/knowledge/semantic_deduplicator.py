@@ -6,6 +6,7 @@ VectorDB 기반 의미적 중복 검사.
 (순수 코사인 유사도와 동일하지 않을 수 있음 — extraction_pipeline.md / 리포트 §9 참고)
 """
 
+import asyncio
 import structlog
 from typing import Dict, List, Optional
 from dataclasses import dataclass
@@ -98,78 +99,132 @@ class SemanticDeduplicator:
                 filter=fltr,
             )
 
-            if not results:
-                return DeduplicationResult(
-                    status="unique",
-                    similar_doc_id=None,
-                    similarity_score=0.0,
-                    action="insert",
-                )
-
-            # 유사도 기반 판정 (ChromaDB는 distance를 반환, cosine distance = 1 - cosine_similarity)
-            for doc in results:
-                doc_id = doc.id
-                # exclude list 확인
-                if exclude_doc_ids and doc_id in exclude_doc_ids:
-                    continue
-
-                # ChromaDB score는 거리(distance). cosine distance라면 similarity = 1 - distance
-                # 하지만 일부 구현에서는 직접 similarity를 반환하므로 범위로 판단
-                score = doc.score
-                if score > 1.0:
-                    # distance 형식 (0=같음, 2=반대)
-                    similarity = 1.0 - (score / 2.0)
-                else:
-                    # similarity 형식 (1=같음, 0=무관)
-                    similarity = score
-
-                if similarity >= self.duplicate_threshold:
-                    logger.info(
-                        "duplicate_detected",
-                        similar_doc_id=doc_id,
-                        similarity=similarity,
-                        duplicate_threshold=self.duplicate_threshold,
-                    )
-                    return DeduplicationResult(
-                        status="duplicate",
-                        similar_doc_id=doc_id,
-                        similarity_score=similarity,
-                        action="skip",
-                    )
-
-                if similarity >= self.near_duplicate_threshold:
-                    logger.info(
-                        "near_duplicate_detected",
-                        similar_doc_id=doc_id,
-                        similarity=similarity,
-                        near_duplicate_threshold=self.near_duplicate_threshold,
-                    )
-                    return DeduplicationResult(
-                        status="near_duplicate",
-                        similar_doc_id=doc_id,
-                        similarity_score=similarity,
-                        action="merge_candidate",
-                    )
-
-            # 유사 문서 없음
-            best_score = 0.0
-            if results:
-                s = results[0].score
-                best_score = s if s <= 1.0 else 1.0 - (s / 2.0)
+            return self._judge(results, exclude_doc_ids)
 
+        except Exception as e:
+            logger.warning("deduplication_check_failed", error=str(e))
+            # 실패 시 저장 진행 (안전 우선)
             return DeduplicationResult(
                 status="unique",
                 similar_doc_id=None,
-                similarity_score=best_score,
+                similarity_score=0.0,
                 action="insert",
             )
 
+    async def check_many(
+        self,
+        texts: List[str],
+        embeddings: List[Optional[List[float]]],
+        owner_filter: Optional[str] = None,
+    ) -> List[DeduplicationResult]:
+        """
+        여러 텍스트의 중복 검사를 한 번에 수행 (통화 1건의 추출 항목 일괄 검사용).
+
+        vector_db가 `search_many`를 지원하면 다중 벡터 질의 1회, 아니면 `search`를 동시 실행한다.
+        판정 규칙은 `check`와 동일하다.
+
+        Args:
+            texts: 검사할 텍스트 목록
+            embeddings: texts와 같은 순서의 임베딩 (None/빈 값이면 unique 처리)
+            owner_filter: 테넌트 격리용 owner
+
+        Returns:
+            입력 순서와 같은 DeduplicationResult 목록
+        """
+        unique = DeduplicationResult(
+            status="unique", similar_doc_id=None, similarity_score=0.0, action="insert"
+        )
+        if not texts:
+            return []
+        fltr = {"owner": owner_filter} if (owner_filter or "").strip() else None
+        vectors = [list(e) if e else [] for e in embeddings]
+        try:
+            search_many = getattr(self.vector_db, "search_many", None)
+            if callable(search_many):
+                rows = await search_many(vectors, top_k=3, filter=fltr)
+            else:
+                async def _one(vec: List[float]):
+                    if not vec:
+                        return []
+                    return await self.vector_db.search(vector=vec, top_k=3, filter=fltr)
+
+                rows = await asyncio.gather(*(_one(v) for v in vectors))
         except Exception as e:
-            logger.warning("deduplication_check_failed", error=str(e))
-            # 실패 시 저장 진행 (안전 우선)
+            logger.warning("deduplication_check_many_failed", error=str(e), count=len(texts))
+            return [unique for _ in texts]
+        out: List[DeduplicationResult] = []
+        for vec, results in zip(vectors, rows):
+            out.append(self._judge(results, None) if vec else unique)
+        return out
+
+    def _judge(
+        self,
+        results: Optional[List],
+        exclude_doc_ids: Optional[List[str]],
+    ) -> DeduplicationResult:
+        """검색 결과(top-k) → 중복 판정."""
+        if not results:
             return DeduplicationResult(
                 status="unique",
                 similar_doc_id=None,
                 similarity_score=0.0,
                 action="insert",
             )
+
+        # 유사도 기반 판정 (ChromaDB는 distance를 반환, cosine distance = 1 - cosine_similarity)
+        for doc in results:
+            doc_id = doc.id
+            # exclude list 확인
+            if exclude_doc_ids and doc_id in exclude_doc_ids:
+                continue
+
+            # ChromaDB score는 거리(distance). cosine distance라면 similarity = 1 - distance
+            # 하지만 일부 구현에서는 직접 similarity를 반환하므로 범위로 판단
+            score = doc.score
+            if score > 1.0:
+                # distance 형식 (0=같음, 2=반대)
+                similarity = 1.0 - (score / 2.0)
+            else:
+                # similarity 형식 (1=같음, 0=무관)
+                similarity = score
+
+            if similarity >= self.duplicate_threshold:
+                logger.info(
+                    "duplicate_detected",
+                    similar_doc_id=doc_id,
+                    similarity=similarity,
+                    duplicate_threshold=self.duplicate_threshold,
+                )
+                return DeduplicationResult(
+                    status="duplicate",
+                    similar_doc_id=doc_id,
+                    similarity_score=similarity,
+                    action="skip",
+                )
+
+            if similarity >= self.near_duplicate_threshold:
+                logger.info(
+                    "near_duplicate_detected",
+                    similar_doc_id=doc_id,
+                    similarity=similarity,
+                    near_duplicate_threshold=self.near_duplicate_threshold,
+                )
+                return DeduplicationResult(
+                    status="near_duplicate",
+                    similar_doc_id=doc_id,
+                    similarity_score=similarity,
+                    action="merge_candidate",
+                )
+
+        # 유사 문서 없음
+        best_score = 0.0
+        if results:
+            s = results[0].score
+            best_score = s if s <= 1.0 else 1.0 - (s / 2.0)
+
+        return DeduplicationResult(
+            status="unique",
+            similar_doc_id=None,
+            similarity_score=best_score,
+            action="insert",
+        )
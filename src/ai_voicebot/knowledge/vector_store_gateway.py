@@ -0,0 +1,338 @@
+"""
+Vector Store Gateway — Chroma 접근 전용 스레드 풀.
+
+Chroma(PersistentClient)는 SQLite 기반 동기 I/O라 이벤트 루프에서 직접 부르면 RTP/SIP 처리가 멈추고,
+asyncio.to_thread는 기본 executor를 다른 작업(임베딩·TTS 등)과 공유해 대기열이 섞인다.
+게이트웨이는 Chroma 호출만 전용 고정 크기 풀에서 실행한다.
+
+- run(op, fn, ...): 임의의 동기 Chroma 호출을 전용 풀에서 실행 (op별 기본 타임아웃)
+- query(collection, ...): 같은 컬렉션·필터·n_results로 동시에 들어온 질의를
+  짧은 창(batch_window_ms) 동안 모아 query_embeddings=[...] 1회로 처리 후 행 단위로 분배
+- get_stats(): 대기열 깊이·실행 중 건수·op별 지연(p50/p95/max)·타임아웃·배치 통계
+
+타임아웃은 호출자 대기만 끊는다(이미 실행 중인 SQLite 호출은 스레드에서 끝까지 수행).
+스레드 수는 환경변수 VECTOR_STORE_WORKERS (기본 4).
+"""
+
+import asyncio
+import concurrent.futures
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+DEFAULT_TIMEOUTS: Dict[str, float] = {
+    "query": 3.0,
+    "get": 10.0,
+    "upsert": 15.0,
+    "update": 15.0,
+    "delete": 15.0,
+    "count": 5.0,
+}
+DEFAULT_TIMEOUT_SEC = 15.0
+DEFAULT_BATCH_WINDOW_MS = 2.0
+DEFAULT_MAX_BATCH = 32
+
+# query 결과 중 질의 행 단위로 나뉘는 키 (included 등 메타 키는 그대로 복사)
+_ROW_KEYS = ("ids", "documents", "metadatas", "distances", "embeddings", "uris", "data")
+
+
+class _OpStats:
+    """op별 호출 수·오류·타임아웃·지연(대기열 포함) 통계."""
+
+    __slots__ = ("calls", "errors", "timeouts", "latencies_ms", "queue_wait_ms")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.latencies_ms: Deque[float] = deque(maxlen=512)
+        self.queue_wait_ms: Deque[float] = deque(maxlen=512)
+
+    def snapshot(self) -> Dict[str, Any]:
+        lat = sorted(self.latencies_ms)
+        waits = list(self.queue_wait_ms)
+
+        def _pct(p: float) -> float:
+            if not lat:
+                return 0.0
+            return round(lat[min(len(lat) - 1, int(len(lat) * p))], 2)
+
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "latency_ms_p50": _pct(0.5),
+            "latency_ms_p95": _pct(0.95),
+            "latency_ms_max": round(lat[-1], 2) if lat else 0.0,
+            "queue_wait_ms_avg": round(sum(waits) / len(waits), 2) if waits else 0.0,
+        }
+
+
+class _QueryBatch:
+    __slots__ = ("collection", "kwargs", "items", "timeout", "flush_handle")
+
+    def __init__(self, collection: Any, kwargs: Dict[str, Any]) -> None:
+        self.collection = collection
+        self.kwargs = kwargs
+        self.items: List[Tuple[List[List[float]], asyncio.Future]] = []
+        self.timeout: Optional[float] = None
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+
+
+class VectorStoreGateway:
+    """Chroma 동기 호출을 전용 스레드 풀에서 실행하고 동시 질의를 묶는 게이트웨이."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+        batch_window_ms: float = DEFAULT_BATCH_WINDOW_MS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        """
+        Args:
+            max_workers: 전용 스레드 수 (None이면 VECTOR_STORE_WORKERS 또는 4)
+            timeouts: op별 타임아웃(초) 덮어쓰기. 0 이하면 타임아웃 없음
+            batch_window_ms: 질의 묶음 대기 창. 0이면 같은 루프 틱에 들어온 질의만 묶음
+            max_batch: 한 번에 묶을 최대 질의 행 수 (도달 시 즉시 실행)
+        """
+        if max_workers is None:
+            try:
+                max_workers = int(os.getenv("VECTOR_STORE_WORKERS", str(DEFAULT_WORKERS)))
+            except ValueError:
+                max_workers = DEFAULT_WORKERS
+        self.max_workers = max(1, max_workers)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="vector-store"
+        )
+        self._timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self._timeouts.update(timeouts)
+        self.batch_window_ms = max(0.0, float(batch_window_ms))
+        self.max_batch = max(1, int(max_batch))
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self._max_queue_depth = 0
+        self._ops: Dict[str, _OpStats] = {}
+        self._pending: Dict[Tuple[Any, ...], _QueryBatch] = {}
+        self._batched_queries = 0
+        self._batch_calls = 0
+        self._max_batch_seen = 0
+        self._closed = False
+
+    # ── 실행 ──
+
+    def _timeout_for(self, op: str, timeout: Optional[float]) -> Optional[float]:
+        t = self._timeouts.get(op, DEFAULT_TIMEOUT_SEC) if timeout is None else timeout
+        return t if t and t > 0 else None
+
+    def _stats_for(self, op: str) -> _OpStats:
+        st = self._ops.get(op)
+        if st is None:
+            with self._lock:
+                st = self._ops.setdefault(op, _OpStats())
+        return st
+
+    async def run(
+        self,
+        op: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        동기 함수 fn(*args, **kwargs)를 전용 풀에서 실행.
+
+        Raises:
+            asyncio.TimeoutError: op 타임아웃 초과 (호출자 대기만 중단)
+            fn이 던진 예외는 그대로 전파
+        """
+        if self._closed:
+            raise RuntimeError("VectorStoreGateway is shut down")
+        stats = self._stats_for(op)
+        enqueued = time.perf_counter()
+
+        def _call() -> Any:
+            started = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._in_flight += 1
+            stats.queue_wait_ms.append((started - enqueued) * 1000)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+
+        def _on_done(f: concurrent.futures.Future) -> None:
+            # 실행 전에 취소(타임아웃)된 작업은 _call이 돌지 않으므로 대기열 수를 여기서 정리
+            if f.cancelled():
+                with self._lock:
+                    self._queued -= 1
+
+        with self._lock:
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+            stats.calls += 1
+        cf = self._executor.submit(_call)
+        cf.add_done_callback(_on_done)
+        t = self._timeout_for(op, timeout)
+        try:
+            fut = asyncio.wrap_future(cf)
+            return await (asyncio.wait_for(fut, t) if t else fut)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            logger.warning("vector store %s timed out after %.1fs (queue=%d)", op, t or 0, self._queued)
+            raise
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.latencies_ms.append((time.perf_counter() - enqueued) * 1000)
+
+    async def query(
+        self,
+        collection: Any,
+        query_embeddings: List[List[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        collection.query를 전용 풀에서 실행. 같은 (컬렉션, n_results, where, include)로 동시에 들어온
+        질의는 한 번의 query_embeddings=[...] 호출로 묶는다 (where_document 등 추가 인자가 있으면 단독 실행).
+
+        Returns:
+            Chroma query 결과와 같은 형태 (행 단위 키는 이 호출의 질의 행만 포함)
+        """
+        call_kwargs: Dict[str, Any] = {"n_results": n_results, "where": where}
+        if include is not None:
+            call_kwargs["include"] = list(include)
+        if kwargs or not query_embeddings:
+            return await self.run(
+                "query",
+                collection.query,
+                query_embeddings=query_embeddings,
+                timeout=timeout,
+                **call_kwargs,
+                **kwargs,
+            )
+
+        loop = asyncio.get_running_loop()
+        key = (
+            id(loop),
+            id(collection),
+            n_results,
+            json.dumps(where, sort_keys=True, default=str),
+            tuple(include or ()),
+        )
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _QueryBatch(collection, call_kwargs)
+            self._pending[key] = batch
+            batch.flush_handle = loop.call_later(
+                self.batch_window_ms / 1000.0, lambda: asyncio.ensure_future(self._flush(key))
+            )
+        fut: asyncio.Future = loop.create_future()
+        batch.items.append((list(query_embeddings), fut))
+        t = self._timeout_for("query", timeout)
+        if t is not None:
+            batch.timeout = max(batch.timeout or 0.0, t)
+        if sum(len(e) for e, _ in batch.items) >= self.max_batch:
+            if batch.flush_handle is not None:
+                batch.flush_handle.cancel()
+            asyncio.ensure_future(self._flush(key))
+        return await fut
+
+    async def _flush(self, key: Tuple[Any, ...]) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None or not batch.items:
+            return
+        all_embeddings = [e for embs, _ in batch.items for e in embs]
+        with self._lock:
+            self._batch_calls += 1
+            self._batched_queries += len(batch.items)
+            self._max_batch_seen = max(self._max_batch_seen, len(batch.items))
+        try:
+            raw = await self.run(
+                "query",
+                batch.collection.query,
+                query_embeddings=all_embeddings,
+                timeout=batch.timeout if batch.timeout is not None else 0,
+                **batch.kwargs,
+            )
+        except BaseException as e:
+            for _, fut in batch.items:
+                if not fut.done():
+                    fut.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        offset = 0
+        for embs, fut in batch.items:
+            n = len(embs)
+            part: Dict[str, Any] = {}
+            for k, v in dict(raw or {}).items():
+                if k in _ROW_KEYS and isinstance(v, list) and len(v) == len(all_embeddings):
+                    part[k] = v[offset:offset + n]
+                else:
+                    part[k] = v
+            offset += n
+            if not fut.done():
+                fut.set_result(part)
+
+    # ── 통계/종료 ──
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            ops = dict(self._ops)
+            queued, in_flight = self._queued, self._in_flight
+        return {
+            "workers": self.max_workers,
+            "queue_depth": queued,
+            "in_flight": in_flight,
+            "max_queue_depth": self._max_queue_depth,
+            "batch_window_ms": self.batch_window_ms,
+            "batched_queries": self._batched_queries,
+            "batch_calls": self._batch_calls,
+            "max_batch_size": self._max_batch_seen,
+            "timeouts_sec": dict(self._timeouts),
+            "ops": {op: st.snapshot() for op, st in ops.items()},
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._closed = True
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_gateway: Optional[VectorStoreGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_vector_store_gateway() -> VectorStoreGateway:
+    """프로세스 공유 게이트웨이 싱글톤."""
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = VectorStoreGateway()
+    return _gateway
+
+
+def shutdown_vector_store_gateway() -> None:
+    global _gateway
+    with _gateway_lock:
+        if _gateway is not None:
+            _gateway.shutdown(wait=False)
+            _gateway = None
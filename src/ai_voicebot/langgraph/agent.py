@@ -30,7 +30,11 @@ from src.ai_voicebot.langgraph.nodes.classify_intent import classify_intent_node
 from src.ai_voicebot.langgraph.nodes.route_utterance import route_utterance_node
 from src.ai_voicebot.langgraph.nodes.semantic_cache import check_cache_node, update_cache_node
 from src.ai_voicebot.langgraph.nodes.rewrite_query import rewrite_query_node
-from src.ai_voicebot.langgraph.nodes.adaptive_rag import adaptive_rag_node
+from src.ai_voicebot.langgraph.nodes.adaptive_rag import (
+    SENTENCE_TOP_K,
+    _merge_dialog_context_for_rag,
+    adaptive_rag_node,
+)
 from src.ai_voicebot.langgraph.nodes.generate_response import generate_response_node
 from src.ai_voicebot.langgraph.nodes.hitl_alert import hitl_alert_node
 from src.ai_voicebot.langgraph.nodes.update_state import update_state_node
@@ -44,6 +48,10 @@ from src.ai_voicebot.langgraph.nodes.response_shortcuts import (
 )
 from src.ai_voicebot.langgraph.nodes.booking_agent import booking_agent_node
 from src.ai_voicebot.langgraph.nodes.self_service_agent import self_service_agent_node
+from src.ai_voicebot.langgraph.speculative_prefetch import (
+    SpeculativePrefetch,
+    speculative_prefetch_enabled,
+)
 from src.common.call_data_record_logger import log_call_data
 
 logger = structlog.get_logger(__name__)
@@ -67,6 +75,20 @@ _LANGGRAPH_NODE_NAMES = frozenset(
         "check_greeting_farewell_cache",
         "greeting_farewell_kb",
         "booking_agent",  # 예약 에이전트 노드
+        "self_service_agent",
+    }
+)
+
+# update_state로 직행하는(HITL/캐시 노드를 거치지 않는) 응답 노드 — 노드 완료 즉시 문장 스트리밍 대상
+_SENTENCE_STREAM_TERMINAL_NODES = frozenset(
+    {
+        "template_response",
+        "repeat_response",
+        "clarification_response",
+        "help_response",
+        "greeting_farewell_kb",
+        "booking_agent",
+        "self_service_agent",
     }
 )
 
@@ -618,6 +640,32 @@ class ConversationAgent:
         # checkpointer(AsyncSqliteSaver/MemorySaver)가 state를 msgpack 직렬화할 때
         # LLMClient 등이 포함되면 "Type is not msgpack serializable" 오류가 발생.
         # 해결: 직렬화 불가 객체는 state 대신 ContextVar(asyncio Task 스코프)로 전달.
+        # 문장 스트리밍 채널 (langgraph/sentence_stream.py) — 아웃바운드는 JSON 응답 파싱이 필요해 제외
+        sentence_stream = None if is_outbound_session else kwargs.get("sentence_stream")
+
+        # ── 추측 선행 조회 (langgraph/speculative_prefetch.py) ──
+        # classify_intent(LLM 폴백 가능)와 동시에 원 발화 임베딩·1차 RAG 검색을 시작한다.
+        # 라우팅 결과 check_cache/adaptive_rag가 같은 조건으로 조회하면 재사용, 아니면 버린다.
+        speculative: Optional[SpeculativePrefetch] = None
+        if (
+            speculative_prefetch_enabled()
+            and not is_outbound_session
+            and not _is_self_service
+            and (user_text or "").strip()
+            and (self.embedder is not None or self.rag_engine is not None)
+        ):
+            speculative = SpeculativePrefetch(
+                query=user_text,
+                search_query=_merge_dialog_context_for_rag(
+                    {**self._state, "_call_id": call_id or ""}, user_text
+                ),
+                owner=self.owner,
+                embedder=self.embedder,
+                rag_engine=self.rag_engine,
+                top_k=SENTENCE_TOP_K,
+                call_id=call_id or "",
+            ).start()
+
         from src.ai_voicebot.langgraph.call_context import set_call_context
         set_call_context(
             llm_client=self.llm_client,
@@ -626,6 +674,9 @@ class ConversationAgent:
             vector_db=self.vector_db,
             org_manager=self.org_manager,
             hangup_callback=hangup_callback if is_outbound_session else None,
+            sentence_stream=sentence_stream,
+            speculative_prefetch=speculative,
+            turn_cancel_event=kwargs.get("cancel_event"),
         )
         logger.debug(
             "call_context_registered",
@@ -696,20 +747,55 @@ class ConversationAgent:
                         call_id=call_id or "", error=str(e), error_type=type(e).__name__,
                     )
 
-            timed_result, node_durations_sec = await _invoke_graph_with_node_timing(
-                self.graph, invoke_state, config=thread_config,
-                on_node_update=_maybe_fire_first_sentence if _on_first_sentence is not None else None,
-            )
-            if timed_result is not None:
-                result = timed_result
-            else:
-                logger.debug(
-                    "langgraph_ainvoke_no_astream_events_or_empty",
-                    call_id=call_id or "",
-                    note="astream_events 미수신 시 단일 ainvoke",
+            async def _forward_to_sentence_stream(node_name: str, node_output: Dict[str, Any]) -> None:
+                # generate_response는 LLM 스트리밍 중에 이미 문장을 넘긴다. 여기서는 비스트리밍
+                # LLM 폴백과 update_state 직행 노드의 응답을 노드 완료 즉시 넘긴다.
+                if sentence_stream is None or not sentence_stream.is_open or sentence_stream.has_streamed:
+                    return
+                if node_name == "generate_response":
+                    if node_output.get("needs_follow_up"):
+                        return
+                elif node_name not in _SENTENCE_STREAM_TERMINAL_NODES:
+                    return
+                from src.ai_voicebot.langgraph.sentence_stream import split_sentences
+
+                node_chunks = node_output.get("response_chunks") or split_sentences(
+                    node_output.get("response") or ""
+                )
+                for chunk in node_chunks:
+                    if not await sentence_stream.offer(chunk, source=node_name, check_unknown=False):
+                        break
+
+            async def _on_node_update(node_name: str, node_output: Dict[str, Any]) -> None:
+                if sentence_stream is not None:
+                    await _forward_to_sentence_stream(node_name, node_output)
+                if _on_first_sentence is not None:
+                    await _maybe_fire_first_sentence(node_name, node_output)
+
+            try:
+                timed_result, node_durations_sec = await _invoke_graph_with_node_timing(
+                    self.graph, invoke_state, config=thread_config,
+                    on_node_update=(
+                        _on_node_update
+                        if (_on_first_sentence is not None or sentence_stream is not None)
+                        else None
+                    ),
                 )
-                result = await self.graph.ainvoke(invoke_state, config=thread_config)
-                node_durations_sec = {}
+                if sentence_stream is not None:
+                    sentence_stream.close()
+                if timed_result is not None:
+                    result = timed_result
+                else:
+                    logger.debug(
+                        "langgraph_ainvoke_no_astream_events_or_empty",
+                        call_id=call_id or "",
+                        note="astream_events 미수신 시 단일 ainvoke",
+                    )
+                    result = await self.graph.ainvoke(invoke_state, config=thread_config)
+                    node_durations_sec = {}
+            finally:
+                if speculative is not None:
+                    speculative.finish()
             graph_elapsed = time.time() - graph_start
 
             # 단축 경로/캐시 히트 경로는 messages를 반환하지 않음 → 이 턴의 user+assistant 보강
@@ -859,7 +945,20 @@ class ConversationAgent:
         2차 인사 (LLM 없음).
 
         지식베이스 category=greeting_phase2 본문 우선. 없거나 조회 실패 시 기본 문구로 TTS.
+        owner별 help 캐시(지식 변경 시 사전 계산)가 있으면 Chroma 조회 없이 사용.
         """
+        if self.owner:
+            from src.ai_voicebot.knowledge.help_cache import get_help_cache
+
+            precomputed = get_help_cache().get(self.owner)
+            if precomputed is not None and precomputed.greeting_phase2:
+                logger.info(
+                    "greeting_phase2_from_help_cache",
+                    owner=self.owner,
+                    text_len=len(precomputed.greeting_phase2),
+                    fingerprint=precomputed.fingerprint[:12],
+                )
+                return precomputed.greeting_phase2
         if self.vector_db and self.owner:
             try:
                 from src.ai_voicebot.knowledge.knowledge_service import get_knowledge_greeting_text
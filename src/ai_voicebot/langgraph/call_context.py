@@ -34,6 +34,9 @@ _ctx_embedder: ContextVar[Optional[Any]] = ContextVar("embedder", default=None)
 _ctx_vector_db: ContextVar[Optional[Any]] = ContextVar("vector_db", default=None)
 _ctx_org_manager: ContextVar[Optional[Any]] = ContextVar("org_manager", default=None)
 _ctx_hangup_callback: ContextVar[Optional[Any]] = ContextVar("hangup_callback", default=None)
+_ctx_sentence_stream: ContextVar[Optional[Any]] = ContextVar("sentence_stream", default=None)
+_ctx_speculative_prefetch: ContextVar[Optional[Any]] = ContextVar("speculative_prefetch", default=None)
+_ctx_turn_cancel_event: ContextVar[Optional[Any]] = ContextVar("turn_cancel_event", default=None)
 
 
 def set_call_context(
@@ -43,6 +46,9 @@ def set_call_context(
     vector_db=None,
     org_manager=None,
     hangup_callback=None,
+    sentence_stream=None,
+    speculative_prefetch=None,
+    turn_cancel_event=None,
 ) -> None:
     """invoke 직전에 호출해 Task 스코프 레지스트리를 채운다."""
     _ctx_llm_client.set(llm_client)
@@ -51,6 +57,9 @@ def set_call_context(
     _ctx_vector_db.set(vector_db)
     _ctx_org_manager.set(org_manager)
     _ctx_hangup_callback.set(hangup_callback)
+    _ctx_sentence_stream.set(sentence_stream)
+    _ctx_speculative_prefetch.set(speculative_prefetch)
+    _ctx_turn_cancel_event.set(turn_cancel_event)
 
 
 def clear_call_context() -> None:
@@ -61,6 +70,9 @@ def clear_call_context() -> None:
     _ctx_vector_db.set(None)
     _ctx_org_manager.set(None)
     _ctx_hangup_callback.set(None)
+    _ctx_sentence_stream.set(None)
+    _ctx_speculative_prefetch.set(None)
+    _ctx_turn_cancel_event.set(None)
 
 
 def get_llm_client() -> Optional[Any]:
@@ -85,3 +97,18 @@ def get_org_manager() -> Optional[Any]:
 
 def get_hangup_callback() -> Optional[Any]:
     return _ctx_hangup_callback.get()
+
+
+def get_sentence_stream() -> Optional[Any]:
+    """이번 턴의 문장 스트리밍 채널 (langgraph/sentence_stream.SentenceStream, 없으면 None)."""
+    return _ctx_sentence_stream.get()
+
+
+def get_speculative_prefetch() -> Optional[Any]:
+    """이번 턴의 선행 조회 (langgraph/speculative_prefetch.SpeculativePrefetch, 없으면 None)."""
+    return _ctx_speculative_prefetch.get()
+
+
+def get_turn_cancel_event() -> Optional[Any]:
+    """이번 턴의 중단 신호 (asyncio.Event — barge-in/Supersede 시 set, 없으면 None)."""
+    return _ctx_turn_cancel_event.get()
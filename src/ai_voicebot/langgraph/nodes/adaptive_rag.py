@@ -10,7 +10,7 @@ Small-to-Big Retrieval + Contextual Compression:
 import structlog
 from typing import Dict, List
 from src.ai_voicebot.langgraph.state import ConversationState
-from src.ai_voicebot.langgraph.call_context import get_rag_engine
+from src.ai_voicebot.langgraph.call_context import get_rag_engine, get_speculative_prefetch
 from src.common.call_data_record_logger import log_call_data
 from src.common.rag_hit_serializer import build_rag_hits_llm_context, build_rag_hits_retrieval
 from src.common.sip_owner import normalize_owner_username
@@ -153,22 +153,33 @@ async def adaptive_rag_node(state: ConversationState) -> dict:
             and raw_merged.strip() != (query or "").strip()
         )
 
-        if run_dual:
-            # 두 검색을 동시 실행 (순차 대비 ~50% 단축)
-            primary_coro = rag_engine.search(
-                query,
-                owner_filter=owner,
-                call_id=call_id or None,
-                top_k_override=SENTENCE_TOP_K,
-                intent=intent,
-            )
-            raw_coro = rag_engine.search(
-                raw_merged,
+        async def _search(q: str):
+            # 그래프 시작과 함께 돌린 선행 검색이 같은 조건이면 그대로 사용 (speculative_prefetch)
+            prefetch = get_speculative_prefetch()
+            if prefetch is not None:
+                prefetched = await prefetch.take_search(
+                    q, owner=owner, intent=intent, top_k=SENTENCE_TOP_K, call_id=call_id or None,
+                )
+                if prefetched is not None:
+                    logger.info(
+                        "adaptive_rag_speculative_hit",
+                        call_id=call_id or "",
+                        query_preview=q[:80],
+                        note="classify_intent와 병렬로 시작한 선행 검색 결과 사용",
+                    )
+                    return prefetched
+            return await rag_engine.search(
+                q,
                 owner_filter=owner,
                 call_id=call_id or None,
                 top_k_override=SENTENCE_TOP_K,
                 intent=intent,
             )
+
+        if run_dual:
+            # 두 검색을 동시 실행 (순차 대비 ~50% 단축)
+            primary_coro = _search(query)
+            raw_coro = _search(raw_merged)
             results_gathered = await _asyncio.gather(primary_coro, raw_coro, return_exceptions=True)
             primary_out = results_gathered[0]
             raw_out = results_gathered[1]
@@ -221,13 +232,7 @@ async def adaptive_rag_node(state: ConversationState) -> dict:
                     note="원문 보조 검색 실패 시 1-pass 결과만 사용",
                 )
         else:
-            search_out = await rag_engine.search(
-                query,
-                owner_filter=owner,
-                call_id=call_id or None,
-                top_k_override=SENTENCE_TOP_K,
-                intent=intent,
-            )
+            search_out = await _search(query)
             search_results = list(search_out.documents or [])
             rag_search_trace = getattr(search_out, "trace", None) or {}
 
@@ -31,6 +31,7 @@ import structlog
 from src.ai_voicebot.langgraph.state import ConversationState
 from src.ai_voicebot.langgraph.call_context import get_llm_client, get_rag_engine
 from src.common.call_data_record_logger import log_call_data
+from src.common.sqlite_pool import to_thread as _db_to_thread
 
 logger = structlog.get_logger(__name__)
 
@@ -295,7 +296,9 @@ async def booking_agent_node(state: ConversationState) -> dict:
     if caller_number:
         try:
             from src.services.booking_service import search_bookings_by_phone
-            future_bookings = search_bookings_by_phone(owner, caller_number, include_past=False, limit=5)
+            future_bookings = await _db_to_thread(
+                search_bookings_by_phone, owner, caller_number, include_past=False, limit=5
+            )
             if future_bookings:
                 lines = []
                 for b in future_bookings:
@@ -506,7 +509,8 @@ async def booking_agent_node(state: ConversationState) -> dict:
                     round_idx=round_idx,
                 )
             _t_tool = time.perf_counter()
-            tool_result = _execute_tool(tool_name, tool_args)
+            # 도구는 booking.db·외부 연동을 동기로 호출 — sqlite executor에서 (ContextVar 전파)
+            tool_result = await _db_to_thread(_execute_tool, tool_name, tool_args)
             _dur_ms = int((time.perf_counter() - _t_tool) * 1000)
             _ok = _booking_tool_result_ok(str(tool_result))
             _summary = (str(tool_result) or "")[:240]
@@ -843,11 +847,11 @@ async def _fallback_text_booking(
     import time
     from src.services.booking_service import get_settings, list_slots
 
-    settings = get_settings(owner) or {}
+    settings = await _db_to_thread(get_settings, owner) or {}
     service_name = settings.get("service_name", "예약 서비스")
 
     today = date.today().strftime("%Y-%m-%d")
-    slots = list_slots(owner, slot_date=today, include_full=False)
+    slots = await _db_to_thread(list_slots, owner, slot_date=today, include_full=False)
     slot_text = "\n".join(
         f"- {s['slot_time']} (잔여: {s['available']}석)" for s in slots
     ) if slots else "오늘 예약 가능한 슬롯 없음"
@@ -756,6 +756,7 @@ async def classify_intent_node(state: ConversationState) -> dict:
                 system_prompt="의도 분류 및 쿼리 변환기",
                 max_output_tokens=1024,
                 update_history=False,
+                cache_site="classify_intent",
             )
         except Exception as llm_err:
             elapsed = time.time() - node_start
@@ -15,7 +15,16 @@ from typing import Dict, List, Optional, Tuple
 import structlog
 from src.ai_voicebot.langgraph.hitl_escalation_policy import is_social_direct_path
 from src.ai_voicebot.langgraph.state import ConversationState
-from src.ai_voicebot.langgraph.call_context import get_llm_client
+from src.ai_voicebot.langgraph.call_context import (
+    get_llm_client,
+    get_sentence_stream,
+    get_turn_cancel_event,
+)
+from src.ai_voicebot.langgraph.prompt_assembler import (
+    PromptSection,
+    assemble_prompt,
+    estimate_tokens,
+)
 from src.common.rag_hit_serializer import build_rag_hits_llm_context
 from src.common.call_data_record_logger import log_call_data
 
@@ -50,19 +59,16 @@ RESPONSE_QUESTION_NO_KNOWLEDGE = HITL_CUSTOMER_TTS_MESSAGE
 # 최적화 4.6: 전화 상담 특성상 3턴이면 충분. 입력 토큰 절감 → 응답 속도 향상
 HISTORY_MAX_TURNS = 3
 
-RESPONSE_SYSTEM_PROMPT = """당신은 {org_name}의 AI 통화 비서입니다.
-{persona_context}
-기관 정보:
-{org_context}
+# 구역별 토큰 예산 (prompt_assembler). 전체 상한은 PROMPT_TOKEN_BUDGET
+PERSONA_TOKEN_BUDGET = 320
+ORG_CONTEXT_TOKEN_BUDGET = 800
+HISTORY_TOKEN_BUDGET = 600
+RAG_TOKEN_BUDGET = 1500
 
-{stage_and_summary}
-대화 기록:
-{history}
+# 턴 간 고정 접두사 (기관·페르소나·규칙) — 턴마다 바뀌는 단계/요약·대화 기록·참고 정보는 그 뒤에 붙인다
+RESPONSE_SYSTEM_INTRO = "당신은 {org_name}의 AI 통화 비서입니다.\n"
 
-검색된 참고 정보:
-{rag_context}
-
-응답 규칙:
+RESPONSE_RULES = """응답 규칙:
 1. 한국어로 자연스럽게 대화하세요 (구어체).
 2. [최우선] 검색된 참고 정보가 있으면 반드시 그 내용을 바탕으로 답하세요.
    - 참고 정보에 질문과 유사한 Q&A가 있으면 그 A를 활용해 안내하세요.
@@ -74,9 +80,7 @@ RESPONSE_SYSTEM_PROMPT = """당신은 {org_name}의 AI 통화 비서입니다.
 5. 문장은 반드시 마침표(.) 또는 물음표(?)로 끝내세요. 중간에 끊기지 마세요.
 6. 고객이 불편을 호소하면 공감하고 해결 방안을 제시하세요.
 7. "더 도움이 필요하시면 말씀해 주세요" 같은 안내로 마무리하세요.
-8. 사용자 질문을 그대로 반복하거나 인용하지 마세요. "○○ 말씀하셨죠" 같은 확인 멘트 없이 바로 답변으로 들어가세요.
-{chitchat_rule}
-"""
+8. 사용자 질문을 그대로 반복하거나 인용하지 마세요. "○○ 말씀하셨죠" 같은 확인 멘트 없이 바로 답변으로 들어가세요."""
 
 
 async def generate_response_node(state: ConversationState) -> dict:
@@ -182,11 +186,12 @@ async def generate_response_node(state: ConversationState) -> dict:
     _social = False
 
     try:
-        # 컨텍스트 조립 (§13.2 history 8턴, §4.3 chitchat 짧은 응답)
-        rag_context = _format_rag_context(rag_results)
+        # 컨텍스트 조립 (§13.2 history 8턴, §4.3 chitchat 짧은 응답) — 토큰 예산은 prompt_assembler
+        rag_texts, rag_scores = _rag_context_items(rag_results)
         messages = state.get("messages", [])
-        history = _format_history(messages, max_turns=HISTORY_MAX_TURNS)
+        history_lines = _history_lines(messages, max_turns=HISTORY_MAX_TURNS)
         org_context = state.get("org_context", "")
+        reserved_tokens = estimate_tokens(user_query) + 16
 
         if _is_outbound:
             # ── 아웃바운드 전용 프롬프트 ──
@@ -249,13 +254,20 @@ async def generate_response_node(state: ConversationState) -> dict:
                     "  3. 2~3문장 이내로 간결하게."
                 )
 
-            system_prompt = (
-                "당신은 아웃바운드 AI 통화 어시스턴트입니다.\n\n"
-                f"[통화 목적]\n{outbound_purpose}\n\n"
-                f"{progress_block}\n\n"
-                f"[대화 기록]\n{history}\n\n"
-                f"{json_format_instruction}"
+            assembled = assemble_prompt(
+                [
+                    PromptSection(
+                        "system",
+                        text=f"당신은 아웃바운드 AI 통화 어시스턴트입니다.\n\n[통화 목적]\n{outbound_purpose}",
+                        static=True,
+                    ),
+                    PromptSection("progress", text=progress_block),
+                    _history_section(history_lines, header="[대화 기록]\n"),
+                    PromptSection("instruction", text=json_format_instruction, suffix=""),
+                ],
+                reserved_tokens=reserved_tokens,
             )
+            system_prompt = assembled.text
             logger.info(
                 "generate_response_outbound_prompt",
                 outbound_purpose=outbound_purpose[:60],
@@ -300,15 +312,39 @@ async def generate_response_node(state: ConversationState) -> dict:
                 except Exception as _pe:
                     logger.debug("generate_response_persona_load_skipped", error=str(_pe))
 
-            system_prompt = RESPONSE_SYSTEM_PROMPT.format(
-                org_name=org_name,
-                persona_context=persona_context,
-                org_context=org_context,
-                stage_and_summary=stage_and_summary,
-                history=history,
-                rag_context=rag_context or "(관련 정보 없음)",
-                chitchat_rule=chitchat_rule,
+            assembled = assemble_prompt(
+                [
+                    PromptSection("system", text=RESPONSE_SYSTEM_INTRO.format(org_name=org_name), static=True, suffix=""),
+                    PromptSection("persona", text=persona_context, budget=PERSONA_TOKEN_BUDGET, static=True, suffix="\n"),
+                    PromptSection(
+                        "org", text=org_context, header="기관 정보:\n", budget=ORG_CONTEXT_TOKEN_BUDGET, static=True,
+                    ),
+                    PromptSection("rules", text=RESPONSE_RULES, static=True, suffix="\n"),
+                    PromptSection("chitchat_rule", text=chitchat_rule, suffix="\n\n" if chitchat_rule else "\n"),
+                    PromptSection("summary", text=stage_and_summary, priority=2, suffix=""),
+                    _history_section(history_lines, header="대화 기록:\n"),
+                    PromptSection(
+                        "rag",
+                        items=rag_texts,
+                        scores=rag_scores,
+                        priority=1,
+                        budget=RAG_TOKEN_BUDGET,
+                        header="검색된 참고 정보:\n",
+                        empty_text="(관련 정보 없음)",
+                        numbered=True,
+                        suffix="\n",
+                    ),
+                ],
+                reserved_tokens=reserved_tokens,
             )
+            system_prompt = assembled.text
+
+        logger.info(
+            "prompt_assembled",
+            call_id=state.get("_call_id") or "",
+            outbound=_is_outbound,
+            **assembled.log_fields(),
+        )
 
         # 스트리밍 LLM 호출 (최적화 4.9: 문장 단위로 수집)
         request_sent_at = datetime.now().isoformat()
@@ -316,10 +352,14 @@ async def generate_response_node(state: ConversationState) -> dict:
                     call_site="generate_response_streaming",
                     request_sent_ts_iso=request_sent_at,
                     prompt_len=len(system_prompt) + len(user_query),
+                    prompt_tokens=assembled.total_tokens,
                     prompt_preview=user_query)
 
         chunks = []
         response = ""
+        # 문장 스트리밍 채널: 완성된 문장을 그래프 종료 전에 TTS로 넘긴다 (아웃바운드는 JSON 응답이라 제외)
+        sentence_stream = None if _is_outbound else get_sentence_stream()
+        _stream_check_unknown = not (_social or intent in ("chitchat", "out_of_scope", "greeting"))
         llm_first_sentence_elapsed_sec: Optional[float] = None
         llm_first_sentence_preview = ""
         llm_first_sentence_source = "none"
@@ -333,10 +373,13 @@ async def generate_response_node(state: ConversationState) -> dict:
                 async def _collect_streaming() -> list:
                     nonlocal llm_first_sentence_elapsed_sec, llm_first_sentence_preview, llm_first_sentence_source
                     result = []
+                    # 참고 정보는 system_prompt(rag 구역)에 이미 있음 — context_docs로 중복 전달하지 않는다
+                    # barge-in/Supersede 시 턴 중단 신호가 set되면 스트림을 추가 문장 없이 닫는다
                     async for sentence in llm.generate_response_streaming(
                         user_text=user_query,
-                        context_docs=[rag_context] if rag_context else [],
+                        context_docs=[],
                         system_prompt=system_prompt,
+                        cancel_event=get_turn_cancel_event(),
                     ):
                         if sentence:
                             if llm_first_sentence_elapsed_sec is None:
@@ -353,6 +396,10 @@ async def generate_response_node(state: ConversationState) -> dict:
                                     note="스트리밍 LLM 첫 문장 완성 — 조기 TTS 가정 시 이 시점부터 TTS 가능",
                                 )
                             result.append(sentence)
+                            if sentence_stream is not None:
+                                await sentence_stream.offer(
+                                    sentence, check_unknown=_stream_check_unknown,
+                                )
                     return result
 
                 collect_task = asyncio.create_task(_collect_streaming())
@@ -369,7 +416,7 @@ async def generate_response_node(state: ConversationState) -> dict:
             else:
                 response = await llm.generate_response(
                     user_text=user_query,
-                    context_docs=[rag_context] if rag_context else [],
+                    context_docs=[],
                     system_prompt=system_prompt,
                 )
                 if response:
@@ -441,6 +488,10 @@ async def generate_response_node(state: ConversationState) -> dict:
             if _social or intent in ("chitchat", "out_of_scope", "greeting"):
                 needs_follow_up = False
 
+        if sentence_stream is not None and needs_follow_up:
+            # HITL 멘트로 대체될 응답 — 남은 문장 송출 중단 (이미 보낸 문장은 소비자가 정리)
+            sentence_stream.rollback("needs_follow_up")
+
         elapsed = time.time() - start
         if llm_first_sentence_elapsed_sec is None and response:
             _fc = _split_into_chunks(response)
@@ -454,6 +505,7 @@ async def generate_response_node(state: ConversationState) -> dict:
                     request_sent_ts_iso=request_sent_at,
                     response_received_ts_iso=response_received_at,
                     elapsed_ms=round(elapsed * 1000),
+                    prompt_tokens=assembled.total_tokens,
                     response_len=len(response),
                     chunk_count=len(chunks))
 
@@ -473,6 +525,8 @@ async def generate_response_node(state: ConversationState) -> dict:
                 intent=intent,
                 rag_hit_count=len(rag_results or []),
                 response_len=len(response),
+                prompt_tokens=assembled.total_tokens,
+                prompt_prefix_tokens=assembled.prefix_tokens,
             )
 
         # 대화 기록 업데이트
@@ -702,10 +756,12 @@ _RAG_CONTEXT_EXCLUDED_CATEGORIES = frozenset({
 })
 
 
-def _format_rag_context(results: list) -> str:
+def _rag_context_items(results: list) -> Tuple[List[str], List[float]]:
+    """LLM 참고 정보 항목 (본문, 검색 점수) — 예산 초과 시 점수 낮은 항목부터 버린다."""
     if not results:
-        return ""
-    lines = []
+        return [], []
+    lines: List[str] = []
+    scores: List[float] = []
     excluded = 0
     for doc in results:
         if len(lines) >= MAX_RAG_CONTEXT_FOR_LLM:
@@ -726,7 +782,12 @@ def _format_rag_context(results: list) -> str:
             )
             continue
         if text:
-            lines.append(f"[{len(lines)+1}] {text}")
+            lines.append(text)
+            raw_score = doc.get("score", 0) if isinstance(doc, dict) else getattr(doc, "score", 0)
+            try:
+                scores.append(float(raw_score or 0))
+            except (TypeError, ValueError):
+                scores.append(0.0)
     if excluded:
         logger.info(
             "rag_context_excluded_count",
@@ -734,7 +795,7 @@ def _format_rag_context(results: list) -> str:
             kept=len(lines),
             note="greeting/farewell 카테고리 문서 LLM 컨텍스트 제외",
         )
-    return "\n".join(lines)
+    return lines, scores
 
 
 # [D] AI 히스토리에서 제외할 fallback/오류 응답 패턴
@@ -755,7 +816,19 @@ def _is_ai_fallback_message(content: str) -> bool:
     return any(p in content for p in _HISTORY_FALLBACK_PATTERNS)
 
 
-def _format_history(messages: list, max_turns: int = 6) -> str:
+def _history_section(lines: List[str], *, header: str) -> PromptSection:
+    """대화 기록 구역 — 예산 초과 시 오래된 발화부터 버린다."""
+    return PromptSection(
+        "history",
+        items=list(lines),
+        priority=3,
+        budget=HISTORY_TOKEN_BUDGET,
+        header=header,
+        empty_text="(첫 대화)",
+    )
+
+
+def _history_lines(messages: list, max_turns: int = 6) -> List[str]:
     recent = messages[-(max_turns * 2):]
     lines = []
     fallback_filtered = 0
@@ -779,7 +852,7 @@ def _format_history(messages: list, max_turns: int = 6) -> str:
             count=fallback_filtered,
             note="이전 AI fallback 응답을 LLM 히스토리에서 제거",
         )
-    return "\n".join(lines) if lines else "(첫 대화)"
+    return lines
 
 
 def _extract_org_name(org_context: str) -> str:
@@ -5,7 +5,7 @@
 - template_response: B 그룹 반응/피드백 (affirm, deny, gratitude 등)
 - repeat_response: 다시 말해줘
 - clarification_response: 무슨 뜻이에요
-- help_response: 뭘 할 수 있어요 → 테넌트 지식 RAG + LLM으로 안내 항목 5개 선정
+- help_response: 뭘 할 수 있어요 → owner별 사전 계산 help 캐시, 없으면 테넌트 지식 RAG + LLM으로 안내 항목 5개 선정
 - fallback_response: out_of_scope, nlu_fallback (고정 멘트, 선택적 HITL)
 """
 
@@ -13,7 +13,7 @@ import json
 import random
 import re
 import structlog
-from typing import List
+from typing import List, Tuple
 
 from src.ai_voicebot.langgraph.state import ConversationState
 from src.common.call_data_record_logger import log_call_data
@@ -344,66 +344,21 @@ def _help_items_from_documents(docs: list) -> List[str]:
     return out[:5]
 
 
-async def help_response_node(state: ConversationState) -> dict:
-    """
-    intent=help: 테넌트(owner) 지식베이스 전체를 RAG 검색한 뒤 LLM이 안내 항목 최대 5개 선정.
-    RAG 0건 또는 LLM 실패 시 DEFAULT_HELP_MESSAGE.
+async def select_help_items(
+    docs: list,
+    llm,
+    user_q: str = "",
+    owner: str = "",
+    call_id: str = "",
+) -> Tuple[List[str], str, str]:
     """
-    owner = (state.get("_owner") or "").strip()
-    call_id = (state.get("_call_id") or "").strip()
-    user_q = (state.get("user_query") or "").strip()
-    rag_engine = state.get("_rag_engine")
-    llm = state.get("_llm_client")
+    help 안내 항목 선정: 지식 조각 → LLM JSON(items) → 실패 시 문서 메타 휴리스틱 → TTS 안전 필터.
 
-    rag_query = user_q if user_q else HELP_RAG_QUERY_FALLBACK
-    docs: list = []
-    trace: dict = {}
-
-    if rag_engine and owner:
-        try:
-            search_out = await rag_engine.search(
-                rag_query,
-                owner_filter=owner,
-                call_id=call_id or None,
-                top_k_override=HELP_RAG_TOP_K,
-                intent="help",
-            )
-            docs = list(search_out.documents or [])
-            trace = search_out.trace or {}
-        except Exception as e:
-            logger.warning(
-                "help_response_rag_failed",
-                owner=owner,
-                call_id=call_id or None,
-                error=str(e),
-            )
-            trace = {"error": str(e), "path": "help_response_rag"}
-
-    if not docs:
-        logger.info(
-            "help_response_no_rag_hits",
-            owner=owner or None,
-            call_id=call_id or None,
-            note="RAG 0건 — DEFAULT_HELP_MESSAGE",
-        )
-        if call_id:
-            log_call_data(
-                call_id,
-                "rag",
-                "help_response_no_rag",
-                owner=owner,
-                query=rag_query,
-            )
-        return {
-            "response": DEFAULT_HELP_MESSAGE,
-            "response_chunks": [DEFAULT_HELP_MESSAGE],
-            "confidence": 0.35,
-            "llm_rag_applied": [],
-            "llm_rag_context_source": "help_intent_rag_empty",
-            "rag_search_trace": trace,
-            "rag_results": [],
-        }
+    help_response_node(통화 중)와 HelpCacheService(지식 변경 시 백그라운드 사전 계산)가 공용으로 사용.
 
+    Returns:
+        (items, source, llm_raw) — source: help_intent_rag_llm | help_intent_rag_heuristic
+    """
     knowledge_block = _build_help_knowledge_block(docs)
     prompt = (
         f"{HELP_LLM_SYSTEM_HINT}\n\n"
@@ -471,6 +426,109 @@ async def help_response_node(state: ConversationState) -> dict:
             )
 
     items = _filter_tts_safe_help_items(items)
+    return items, source, llm_raw
+
+
+async def help_response_node(state: ConversationState) -> dict:
+    """
+    intent=help: owner별 help 캐시(HelpCacheService)가 있으면 그대로 응답.
+    없으면 테넌트(owner) 지식베이스 전체를 RAG 검색한 뒤 LLM이 안내 항목 최대 5개 선정.
+    RAG 0건 또는 LLM 실패 시 DEFAULT_HELP_MESSAGE.
+    """
+    owner = (state.get("_owner") or "").strip()
+    call_id = (state.get("_call_id") or "").strip()
+    user_q = (state.get("user_query") or "").strip()
+    rag_engine = state.get("_rag_engine")
+    llm = state.get("_llm_client")
+
+    # 지식 변경 시 미리 계산해 둔 owner별 help 안내 (LLM·RAG 왕복 없음)
+    if owner:
+        from src.ai_voicebot.knowledge.help_cache import get_help_cache
+
+        help_cache = get_help_cache()
+        cached = help_cache.get(owner)
+        if cached is not None and cached.help_items:
+            if call_id:
+                log_call_data(
+                    call_id,
+                    "rag",
+                    "help_response_ok",
+                    owner=owner,
+                    rag_hit_count=0,
+                    item_count=len(cached.help_items),
+                    items=cached.help_items,
+                    source="help_cache",
+                )
+            return {
+                "response": cached.help_response,
+                "response_chunks": [cached.help_response],
+                "confidence": cached.help_confidence,
+                "llm_rag_applied": [],
+                "llm_rag_context_source": "help_cache",
+                "rag_search_trace": {
+                    "path": "help_cache",
+                    "fingerprint": cached.fingerprint[:12],
+                    "built_at": cached.built_at,
+                    "item_source": cached.help_source,
+                },
+                "rag_results": [],
+            }
+        if cached is None:
+            # 캐시 없음/변경 대기 → 이번 턴은 기존 경로, 다음 help 턴부터 캐시 응답
+            help_cache.schedule_rebuild(owner, restart=False)
+
+    rag_query = user_q if user_q else HELP_RAG_QUERY_FALLBACK
+    docs: list = []
+    trace: dict = {}
+
+    if rag_engine and owner:
+        try:
+            search_out = await rag_engine.search(
+                rag_query,
+                owner_filter=owner,
+                call_id=call_id or None,
+                top_k_override=HELP_RAG_TOP_K,
+                intent="help",
+            )
+            docs = list(search_out.documents or [])
+            trace = search_out.trace or {}
+        except Exception as e:
+            logger.warning(
+                "help_response_rag_failed",
+                owner=owner,
+                call_id=call_id or None,
+                error=str(e),
+            )
+            trace = {"error": str(e), "path": "help_response_rag"}
+
+    if not docs:
+        logger.info(
+            "help_response_no_rag_hits",
+            owner=owner or None,
+            call_id=call_id or None,
+            note="RAG 0건 — DEFAULT_HELP_MESSAGE",
+        )
+        if call_id:
+            log_call_data(
+                call_id,
+                "rag",
+                "help_response_no_rag",
+                owner=owner,
+                query=rag_query,
+            )
+        return {
+            "response": DEFAULT_HELP_MESSAGE,
+            "response_chunks": [DEFAULT_HELP_MESSAGE],
+            "confidence": 0.35,
+            "llm_rag_applied": [],
+            "llm_rag_context_source": "help_intent_rag_empty",
+            "rag_search_trace": trace,
+            "rag_results": [],
+        }
+
+    items, source, llm_raw = await select_help_items(
+        docs, llm, user_q=user_q, owner=owner, call_id=call_id
+    )
 
     if not items:
         logger.info(
@@ -131,6 +131,7 @@ async def rewrite_query_node(state: ConversationState) -> dict:
                 system_prompt="쿼리 변환기",
                 max_output_tokens=256,
                 update_history=False,
+                cache_site="rewrite_query",
             )
         except Exception as llm_err:
             elapsed_err = time.time() - _start
@@ -14,6 +14,7 @@ from typing import Optional
 
 import structlog
 from src.ai_voicebot.langgraph.state import ConversationState
+from src.ai_voicebot.langgraph.call_context import get_speculative_prefetch
 from src.common.call_data_record_logger import log_call_data
 
 logger = structlog.get_logger(__name__)
@@ -176,27 +177,31 @@ async def _check_cache_inner(state: ConversationState, _start: float) -> dict:
         # run_in_executor로 스레드풀에서 실행하여 블로킹 해제
         import asyncio as _asyncio_cache
         _embed_start = time.time()
-        if hasattr(embedder, "embed_text"):
-            fn = embedder.embed_text
-            if _asyncio_cache.iscoroutinefunction(fn):
-                query_embedding = await fn(query)
+        # 그래프 시작과 함께 계산한 선행 임베딩이 있으면 재사용 (speculative_prefetch)
+        _prefetch = get_speculative_prefetch()
+        query_embedding = await _prefetch.take_embedding(query) if _prefetch is not None else None
+        if query_embedding is None:
+            if hasattr(embedder, "embed_text"):
+                fn = embedder.embed_text
+                if _asyncio_cache.iscoroutinefunction(fn):
+                    query_embedding = await fn(query)
+                else:
+                    loop = _asyncio_cache.get_event_loop()
+                    query_embedding = await loop.run_in_executor(None, fn, query)
+            elif hasattr(embedder, "embed"):
+                fn_e = embedder.embed
+                if _asyncio_cache.iscoroutinefunction(fn_e):
+                    query_embedding = await fn_e(query)
+                else:
+                    loop = _asyncio_cache.get_event_loop()
+                    query_embedding = await loop.run_in_executor(None, fn_e, query)
             else:
-                loop = _asyncio_cache.get_event_loop()
-                query_embedding = await loop.run_in_executor(None, fn, query)
-        elif hasattr(embedder, "embed"):
-            fn_e = embedder.embed
-            if _asyncio_cache.iscoroutinefunction(fn_e):
-                query_embedding = await fn_e(query)
-            else:
-                loop = _asyncio_cache.get_event_loop()
-                query_embedding = await loop.run_in_executor(None, fn_e, query)
-        else:
-            elapsed = time.time() - _start
-            logger.warning("semantic_cache_no_embedder", elapsed_sec=round(elapsed, 3))
-            return _log_miss(
-                miss_reason="skipped_embedder_has_no_embed_method",
-                miss_detail={"embedder_type": type(embedder).__name__},
-            )
+                elapsed = time.time() - _start
+                logger.warning("semantic_cache_no_embedder", elapsed_sec=round(elapsed, 3))
+                return _log_miss(
+                    miss_reason="skipped_embedder_has_no_embed_method",
+                    miss_detail={"embedder_type": type(embedder).__name__},
+                )
         _embed_elapsed = time.time() - _embed_start
         logger.debug(
             "semantic_cache_embed_done",
@@ -0,0 +1,241 @@
+"""
+토큰 예산 기반 프롬프트 조립기.
+
+generate_response 노드는 매 턴 대화 기록·대화 요약·검색 청크·페르소나를 그대로 이어 붙여
+통화가 길어질수록(청크·발화가 길수록) 프롬프트와 첫 토큰 지연이 커졌다.
+
+- estimate_tokens(): 로컬 근사 (한글·CJK 글자 1토큰, 그 외 약 4글자 1토큰) — 외부 토크나이저 불필요
+- PromptSection: 구역별 우선순위·예산. items가 있으면 항목 단위로 버린다
+  (scores 있으면 낮은 점수부터 = 검색 청크, 없으면 앞쪽(오래된 것)부터 = 대화 기록)
+- assemble_prompt(): 1) 구역 예산으로 자르고 2) 전체 예산을 넘으면 우선순위가 낮은 구역부터 더 줄인다.
+  priority 0(필수)은 줄이지 않는다.
+- static 구역(시스템 규칙·기관 정보·페르소나)은 항상 맨 앞에 같은 바이트로 렌더링한다 —
+  턴마다 바뀌는 내용은 그 뒤에만 오므로 공급자 측 프롬프트 접두사 캐시가 적용될 수 있다.
+  static 구역은 자기 예산으로만 자르고(입력이 같으면 결과도 같음) 전체 예산 조정에서는 건드리지 않는다.
+
+전체 예산은 환경변수 PROMPT_TOKEN_BUDGET (기본 3000).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_PROMPT_TOKEN_BUDGET = 3000
+_ELLIPSIS = "…"
+
+
+def _is_wide(ch: str) -> bool:
+    code = ord(ch)
+    return (
+        0xAC00 <= code <= 0xD7A3  # 한글 음절
+        or 0x1100 <= code <= 0x11FF  # 한글 자모
+        or 0x3130 <= code <= 0x318F  # 호환 자모
+        or 0x4E00 <= code <= 0x9FFF  # CJK 한자
+        or 0x3040 <= code <= 0x30FF  # 가나
+    )
+
+
+def estimate_tokens(text: str) -> int:
+    """Gemini SentencePiece 토큰 수 근사 (한국어 위주 프롬프트에서 약간 과대 추정)."""
+    if not text:
+        return 0
+    wide = 0
+    narrow = 0
+    for ch in text:
+        if ch.isspace():
+            continue
+        if _is_wide(ch):
+            wide += 1
+        else:
+            narrow += 1
+    return wide + math.ceil(narrow / 4)
+
+
+def prompt_token_budget() -> int:
+    try:
+        return int(os.environ.get("PROMPT_TOKEN_BUDGET", DEFAULT_PROMPT_TOKEN_BUDGET))
+    except ValueError:
+        return DEFAULT_PROMPT_TOKEN_BUDGET
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """앞부분을 남기고 max_tokens 이하로 자름 (잘렸으면 말줄임표)."""
+    if max_tokens <= 0:
+        return ""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) + 1 <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip() + _ELLIPSIS if lo else ""
+
+
+@dataclass
+class PromptSection:
+    """
+    프롬프트 한 구역.
+
+    Attributes:
+        name: 로그·통계 키 (system, persona, org, summary, history, rag, ...)
+        priority: 0이면 필수(전체 예산 조정 때 줄이지 않음). 클수록 먼저 줄인다
+        text: 항목이 없는 구역의 본문
+        items: 항목 단위로 버릴 수 있는 구역의 항목들 (렌더링 순서대로)
+        scores: items별 점수 — 낮은 것부터 버림. None이면 앞쪽(오래된) 항목부터 버림
+        budget: 구역 자체 토큰 상한 (None이면 없음)
+        static: True면 턴 간 고정 접두사 구역 (맨 앞 렌더링, 전체 예산 조정 제외)
+        header: 본문 앞에 붙는 제목 줄 (본문이 비어도 유지)
+        empty_text: 본문이 비었을 때 대신 쓸 문구
+        numbered: items를 "[1] ..." 형식으로 번호 매겨 렌더링
+        suffix: 구역 뒤 구분 문자열
+    """
+
+    name: str
+    priority: int = 0
+    text: str = ""
+    items: Optional[List[str]] = None
+    scores: Optional[List[float]] = None
+    budget: Optional[int] = None
+    static: bool = False
+    header: str = ""
+    empty_text: str = ""
+    numbered: bool = False
+    suffix: str = "\n\n"
+    dropped: int = field(default=0, init=False)
+    truncated: bool = field(default=False, init=False)
+
+    def body(self) -> str:
+        if self.items is not None:
+            if self.numbered:
+                lines = [f"[{i + 1}] {item}" for i, item in enumerate(self.items)]
+            else:
+                lines = list(self.items)
+            content = "\n".join(lines)
+        else:
+            content = self.text
+        return content if content else self.empty_text
+
+    def render(self) -> str:
+        return f"{self.header}{self.body()}{self.suffix}"
+
+    def tokens(self) -> int:
+        return estimate_tokens(self.render())
+
+    def can_shrink(self) -> bool:
+        if self.items is not None:
+            return bool(self.items)
+        return bool(self.text)
+
+    def shrink_once(self, deficit: int) -> None:
+        """항목 1개를 버리거나, 본문을 deficit만큼 줄인다."""
+        if self.items is not None:
+            if not self.items:
+                return
+            if self.scores is not None:
+                idx = min(range(len(self.items)), key=lambda i: (self.scores[i], -i))
+                del self.scores[idx]
+            else:
+                idx = 0
+            del self.items[idx]
+            self.dropped += 1
+            return
+        target = max(0, estimate_tokens(self.text) - max(1, deficit))
+        self.text = truncate_to_tokens(self.text, target)
+        self.truncated = True
+
+    def fit_budget(self) -> None:
+        if self.budget is None:
+            return
+        while self.tokens() > self.budget and self.can_shrink():
+            self.shrink_once(self.tokens() - self.budget)
+
+
+@dataclass
+class AssembledPrompt:
+    static_prefix: str
+    dynamic: str
+    total_tokens: int
+    prefix_tokens: int
+    budget: int
+    section_tokens: Dict[str, int]
+    dropped: Dict[str, int]
+    truncated: List[str]
+
+    @property
+    def text(self) -> str:
+        return self.static_prefix + self.dynamic
+
+    @property
+    def prefix_hash(self) -> str:
+        return hashlib.sha256(self.static_prefix.encode("utf-8")).hexdigest()[:12]
+
+    def log_fields(self) -> Dict[str, object]:
+        return {
+            "prompt_tokens": self.total_tokens,
+            "prefix_tokens": self.prefix_tokens,
+            "token_budget": self.budget,
+            "section_tokens": self.section_tokens,
+            "dropped": self.dropped,
+            "truncated": self.truncated,
+            "prefix_hash": self.prefix_hash,
+        }
+
+
+def assemble_prompt(
+    sections: List[PromptSection],
+    total_budget: Optional[int] = None,
+    *,
+    reserved_tokens: int = 0,
+) -> AssembledPrompt:
+    """
+    구역들을 예산 안으로 줄여 하나의 프롬프트로 조립.
+
+    Args:
+        sections: 렌더링 순서대로 (static 구역은 순서를 유지한 채 맨 앞으로 모은다). 입력 객체를 수정한다
+        total_budget: 전체 토큰 상한 (None이면 PROMPT_TOKEN_BUDGET)
+        reserved_tokens: 프롬프트 밖에서 덧붙는 몫(사용자 발화 등) — 예산에서 미리 뺀다
+    """
+    budget = prompt_token_budget() if total_budget is None else int(total_budget)
+    for section in sections:
+        section.fit_budget()
+
+    static = [s for s in sections if s.static]
+    dynamic = [s for s in sections if not s.static]
+    limit = budget - reserved_tokens
+
+    def _total() -> int:
+        return sum(s.tokens() for s in sections)
+
+    # 우선순위가 낮은(숫자가 큰) 동적 구역부터 줄인다
+    shrinkable = sorted((s for s in dynamic if s.priority > 0), key=lambda s: -s.priority)
+    total = _total()
+    while total > limit:
+        target = next((s for s in shrinkable if s.can_shrink()), None)
+        if target is None:
+            break
+        target.shrink_once(total - limit)
+        total = _total()
+
+    prefix = "".join(s.render() for s in static)
+    rest = "".join(s.render() for s in dynamic)
+    return AssembledPrompt(
+        static_prefix=prefix,
+        dynamic=rest,
+        total_tokens=total + reserved_tokens,
+        prefix_tokens=estimate_tokens(prefix),
+        budget=budget,
+        section_tokens={s.name: s.tokens() for s in sections},
+        dropped={s.name: s.dropped for s in sections if s.dropped},
+        truncated=[s.name for s in sections if s.truncated],
+    )
@@ -0,0 +1,186 @@
+"""
+LangGraph → 음성 파이프라인 문장 스트리밍 채널 (턴 단위).
+
+generate_response 노드가 LLM 스트리밍으로 완성한 문장을, 그래프의 나머지 노드
+(hitl_alert → update_cache → update_state)가 끝나기를 기다리지 않고 곧바로 TTS
+쪽 소비자(rag_processor)로 넘긴다. 단축/예약/셀프서비스 노드의 응답도 노드 완료 즉시
+같은 채널로 넘겨 update_state 이전에 첫 오디오가 재생되도록 한다.
+
+안전장치:
+- 문장마다 검증(JSON/마크다운 조각, LLM 오류 멘트, "모르는 내용" 패턴)을 거치고,
+  하나라도 걸리면 채널을 롤백해 이후 문장을 더 이상 넘기지 않는다.
+- 그래프 종료 후 소비자는 reconcile(final_response)로 최종 응답(HITL 멘트·정화 반영)이
+  이미 보낸 문장들로 시작하는지 확인한다. 일치하면 남은 문장만 이어서 보내고,
+  아니면 롤백 후 재생 전 오디오를 버리고, 보낸 문장 중 최종 응답 앞부분과 일치하는 것은 빼고
+  나머지(replay_sentences)만 다시 발화한다 (이미 재생된 오디오는 되돌릴 수 없으므로 되풀이하지 않는다).
+
+채널 객체는 직렬화 불가이므로 call_context ContextVar로 노드에 전달된다.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from typing import Awaitable, Callable, List, Optional
+
+import structlog
+
+from src.common.tts_output_sanitize import sanitize_voice_assistant_text
+
+logger = structlog.get_logger(__name__)
+
+# generate_response._split_into_chunks 와 동일한 문장 경계
+_SENTENCE_SPLIT = re.compile(r"(?<=[.?!])\s+")
+
+SentenceCallback = Callable[[str], Awaitable[None]]
+
+
+def _normalize(text: str) -> str:
+    return " ".join((text or "").split())
+
+
+def rejection_reason(sentence: str, *, check_unknown: bool = True) -> Optional[str]:
+    """스트리밍 송출 전에 문장을 검증한다. 송출 불가면 사유 코드를, 통과면 None을 반환."""
+    t = (sentence or "").strip()
+    if not t:
+        return None
+    if t.startswith("{") or t.startswith("`") or "```" in t:
+        return "json_or_markdown_fragment"
+    _san, frag_reason = sanitize_voice_assistant_text(t)
+    if frag_reason:
+        return frag_reason
+
+    from src.ai_voicebot.langgraph.nodes.generate_response import (
+        _is_llm_error_fallback,
+        _is_unknown_content_response,
+    )
+
+    if _is_llm_error_fallback(t):
+        return "llm_error_fallback"
+    if check_unknown and _is_unknown_content_response(t):
+        return "unknown_content"
+    return None
+
+
+class SentenceStream:
+    """
+    한 턴의 문장 스트리밍 채널.
+
+    상태: open → (rolled_back | closed). rolled_back/closed 이후의 offer()는 무시된다.
+    """
+
+    def __init__(self, on_sentence: SentenceCallback, *, call_id: str = ""):
+        self._on_sentence = on_sentence
+        self._call_id = call_id
+        self._sent: List[str] = []
+        self._rolled_back = False
+        self._closed = False
+        self.rollback_reason = ""
+        self.first_sentence_at: Optional[float] = None
+        # reconcile 불일치 시: 최종 응답 앞부분과 일치한 보낸 문장 수 / 다시 보낼 문장
+        self.kept_count = 0
+        self.replay_sentences: List[str] = []
+
+    @property
+    def sent(self) -> List[str]:
+        return list(self._sent)
+
+    @property
+    def streamed_text(self) -> str:
+        return " ".join(self._sent)
+
+    @property
+    def has_streamed(self) -> bool:
+        return bool(self._sent)
+
+    @property
+    def rolled_back(self) -> bool:
+        return self._rolled_back
+
+    @property
+    def is_open(self) -> bool:
+        return not (self._rolled_back or self._closed)
+
+    async def offer(self, sentence: str, *, source: str = "generate_response", check_unknown: bool = True) -> bool:
+        """문장을 검증 후 소비자로 넘긴다. 실제로 넘겼으면 True."""
+        if not self.is_open:
+            return False
+        text = (sentence or "").strip()
+        if not text:
+            return False
+        reason = rejection_reason(text, check_unknown=check_unknown)
+        if reason:
+            self.rollback(reason)
+            return False
+        try:
+            await self._on_sentence(text)
+        except Exception as e:
+            logger.warning(
+                "sentence_stream_consumer_failed",
+                call_id=self._call_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            self.rollback("consumer_error")
+            return False
+        if self.first_sentence_at is None:
+            self.first_sentence_at = time.time()
+        self._sent.append(text)
+        logger.debug(
+            "sentence_stream_forwarded",
+            call_id=self._call_id,
+            source=source,
+            sentence_num=len(self._sent),
+            sentence_preview=text[:80],
+        )
+        return True
+
+    def rollback(self, reason: str) -> None:
+        """이후 문장 송출을 중단한다. 이미 보낸 문장은 소비자가 reconcile 단계에서 정리한다."""
+        if self._rolled_back:
+            return
+        self._rolled_back = True
+        self.rollback_reason = reason
+        logger.info(
+            "sentence_stream_rolled_back",
+            call_id=self._call_id,
+            reason=reason,
+            streamed_count=len(self._sent),
+            streamed_preview=self.streamed_text[:120],
+        )
+
+    def close(self) -> None:
+        """그래프 종료 — 더 이상 노드로부터 문장을 받지 않는다."""
+        self._closed = True
+
+    def reconcile(self, final_response: str) -> Optional[List[str]]:
+        """
+        최종 응답과 이미 보낸 문장을 맞춘다.
+
+        Returns:
+            이어서 보낼 남은 문장 목록(빈 리스트 가능). 최종 응답이 보낸 문장들로
+            시작하지 않으면 None — 호출부는 롤백 후 replay_sentences(최종 응답 중 일치한
+            앞부분 kept_count개 문장 뒤)를 다시 발화한다.
+        """
+        self.close()
+        if not self._sent:
+            return split_sentences(final_response)
+        streamed = _normalize(self.streamed_text)
+        final = _normalize(final_response)
+        if not final.startswith(streamed):
+            kept_text = ""
+            for k in range(len(self._sent) - 1, 0, -1):
+                prefix = _normalize(" ".join(self._sent[:k]))
+                if final == prefix or final.startswith(prefix + " "):
+                    self.kept_count = k
+                    kept_text = prefix
+                    break
+            self.replay_sentences = split_sentences(final[len(kept_text):])
+            self.rollback("final_response_mismatch")
+            return None
+        return split_sentences(final[len(streamed):])
+
+
+def split_sentences(text: str) -> List[str]:
+    parts = _SENTENCE_SPLIT.split((text or "").strip())
+    return [p.strip() for p in parts if p.strip()]
@@ -0,0 +1,264 @@
+"""
+LangGraph 추측(speculative) 선행 조회.
+
+그래프는 classify_intent → route_utterance → check_cache → rewrite_query → adaptive_rag
+순서로 실행되어, 임베딩·벡터 검색이 의도 분류(LLM 폴백 포함)가 끝난 뒤에야 시작된다.
+이 모듈은 그래프 실행과 동시에 원 발화에 대한
+
+  - 쿼리 임베딩 (check_cache 재사용 대상)
+  - 1차 RAG 검색 (adaptive_rag 재사용 대상, category 미필터 의도와 동일 조건)
+
+을 미리 시작하고, 라우팅 결과 실제로 같은 조건의 조회가 필요해지면 결과를 넘겨주고
+아니면 버린다. 노드별 적중(hit)/불일치(mismatch)/미사용(unused) 횟수를 집계한다.
+
+객체는 직렬화 불가이므로 call_context ContextVar로 노드에 전달된다.
+환경변수 LANGGRAPH_SPECULATIVE_PREFETCH=0 으로 비활성화.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+SPECULATIVE_PREFETCH_ENV = "LANGGRAPH_SPECULATIVE_PREFETCH"
+
+# 선행 검색에 쓰는 의도 — INTENT_CATEGORY_MAP에서 category 미필터(owner만 적용)
+SPECULATIVE_SEARCH_INTENT = "question"
+
+NODE_CHECK_CACHE = "check_cache"
+NODE_ADAPTIVE_RAG = "adaptive_rag"
+
+
+def speculative_prefetch_enabled() -> bool:
+    return os.environ.get(SPECULATIVE_PREFETCH_ENV, "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+def _search_reusable_for_intent(intent: Optional[str]) -> bool:
+    """선행 검색(category 미필터) 결과를 이 의도의 검색에 그대로 쓸 수 있는지."""
+    if intent == "help":
+        # help는 임계값 컷 없이 상위 K만 사용하는 별도 경로
+        return False
+    if not intent:
+        return True
+    from src.ai_voicebot.ai_pipeline.rag_engine import RAGEngine
+
+    return not RAGEngine.INTENT_CATEGORY_MAP.get(intent)
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # 버려진 태스크의 예외가 "Task exception was never retrieved"로 남지 않도록 소비
+    if not task.cancelled():
+        task.exception()
+
+
+class SpeculativeStats:
+    """노드별 선행 조회 결과 집계 (프로세스 전역)."""
+
+    def __init__(self):
+        self._nodes: Dict[str, Dict[str, int]] = {}
+
+    def record(self, node: str, outcome: str) -> None:
+        row = self._nodes.setdefault(node, {"started": 0, "hit": 0, "mismatch": 0, "unused": 0})
+        row["started"] += 1
+        row[outcome] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"enabled": speculative_prefetch_enabled()}
+        for node, row in self._nodes.items():
+            started = row["started"] or 1
+            out[node] = {
+                **row,
+                "hit_rate": round(row["hit"] / started, 3),
+                "waste_rate": round((row["mismatch"] + row["unused"]) / started, 3),
+            }
+        return out
+
+    def reset(self) -> None:
+        self._nodes.clear()
+
+
+class SpeculativePrefetch:
+    """
+    한 턴의 선행 조회.
+
+    start()로 임베딩/검색 태스크를 시작하고, 노드는 take_embedding()/take_search()로
+    조건이 맞을 때만 결과를 받는다. 그래프 종료 후 finish()가 남은 태스크를 취소하고
+    노드별 결과를 집계한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        query: str,
+        search_query: str,
+        owner: Optional[str],
+        embedder: Any,
+        rag_engine: Any = None,
+        top_k: int = 5,
+        call_id: str = "",
+        stats: Optional[SpeculativeStats] = None,
+    ):
+        self.query = query
+        self.search_query = search_query
+        self.owner = owner
+        self.top_k = top_k
+        self.call_id = call_id
+        self._embedder = embedder
+        self._rag_engine = rag_engine
+        self._stats = stats if stats is not None else get_speculative_stats()
+        self._embed_task: Optional[asyncio.Task] = None
+        self._search_task: Optional[asyncio.Task] = None
+        self._search_latency_ms = 0
+        # 노드별 결과: hit / mismatch (노드가 요청했으나 조건 불일치)
+        self._outcome: Dict[str, str] = {}
+        self._finished = False
+
+    def start(self) -> "SpeculativePrefetch":
+        if self._embedder is not None and self.query:
+            self._embed_task = asyncio.ensure_future(self._embed())
+            self._embed_task.add_done_callback(_retrieve_exception)
+        if self._rag_engine is not None and self.search_query:
+            self._search_task = asyncio.ensure_future(self._search())
+            self._search_task.add_done_callback(_retrieve_exception)
+        logger.debug(
+            "speculative_prefetch_started",
+            call_id=self.call_id,
+            embedding=self._embed_task is not None,
+            retrieval=self._search_task is not None,
+            query_preview=self.query[:80],
+        )
+        return self
+
+    async def _embed(self) -> Optional[List[float]]:
+        embedder = self._embedder
+        fn = getattr(embedder, "embed_text", None) or getattr(embedder, "embed", None)
+        if fn is None:
+            return None
+        if asyncio.iscoroutinefunction(fn):
+            return await fn(self.query)
+        # 동기 임베더는 이벤트 루프 밖에서 실행 (classify_intent와 실제로 겹치도록)
+        return await asyncio.get_running_loop().run_in_executor(None, fn, self.query)
+
+    async def _search(self):
+        embedding = None
+        if self._embed_task is not None and self.search_query == self.query:
+            embedding = await self._embed_task
+        started = time.perf_counter()
+        # call_id=None: 버려질 수 있는 조회이므로 DB 로깅은 채택 시점(take_search)에 수행
+        kwargs: Dict[str, Any] = {
+            "owner_filter": self.owner,
+            "call_id": None,
+            "top_k_override": self.top_k,
+            "intent": SPECULATIVE_SEARCH_INTENT,
+        }
+        if embedding:
+            kwargs["query_embedding"] = embedding
+        result = await self._rag_engine.search(self.search_query, **kwargs)
+        self._search_latency_ms = int((time.perf_counter() - started) * 1000)
+        return result
+
+    @staticmethod
+    async def _result_of(task: Optional[asyncio.Task]):
+        if task is None:
+            return None
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled():
+                return None
+            raise
+        except Exception as e:
+            logger.warning("speculative_prefetch_task_failed", error=str(e), error_type=type(e).__name__)
+            return None
+
+    async def take_embedding(self, query: str, *, node: str = NODE_CHECK_CACHE) -> Optional[List[float]]:
+        """같은 쿼리의 선행 임베딩을 반환. 조건이 다르거나 실패했으면 None (노드가 직접 계산)."""
+        if self._embed_task is None:
+            return None
+        if (query or "") != self.query:
+            self._outcome.setdefault(node, "mismatch")
+            return None
+        embedding = await self._result_of(self._embed_task)
+        if not embedding:
+            self._outcome.setdefault(node, "mismatch")
+            return None
+        self._outcome[node] = "hit"
+        return embedding
+
+    async def take_search(
+        self,
+        query: str,
+        *,
+        owner: Optional[str],
+        intent: Optional[str],
+        top_k: int,
+        call_id: Optional[str] = None,
+        node: str = NODE_ADAPTIVE_RAG,
+    ):
+        """같은 조건의 선행 검색 결과(RAGSearchResult)를 반환. 조건이 다르면 None."""
+        if self._search_task is None:
+            return None
+        if (
+            (query or "") != self.search_query
+            or owner != self.owner
+            or top_k != self.top_k
+            or not _search_reusable_for_intent(intent)
+        ):
+            self._outcome.setdefault(node, "mismatch")
+            return None
+        result = await self._result_of(self._search_task)
+        trace = getattr(result, "trace", None) or {}
+        if result is None or trace.get("abort_reason"):
+            self._outcome.setdefault(node, "mismatch")
+            return None
+        self._outcome[node] = "hit"
+        if call_id and hasattr(self._rag_engine, "log_search_to_db"):
+            self._rag_engine.log_search_to_db(
+                call_id, self.search_query, list(result.documents or []), self._search_latency_ms
+            )
+        return type(result)(
+            documents=list(result.documents or []),
+            trace={
+                **trace,
+                "intent_classified": intent,
+                "search_intent_used": intent,
+                "speculative_prefetch": True,
+            },
+        )
+
+    def finish(self) -> Dict[str, str]:
+        """남은 태스크를 취소하고 노드별 결과를 집계한다. 반환: {node: outcome}."""
+        if self._finished:
+            return {}
+        self._finished = True
+        summary: Dict[str, str] = {}
+        for node, task in ((NODE_CHECK_CACHE, self._embed_task), (NODE_ADAPTIVE_RAG, self._search_task)):
+            if task is None:
+                continue
+            outcome = self._outcome.get(node, "unused")
+            summary[node] = outcome
+            self._stats.record(node, outcome)
+        for task in (self._search_task, self._embed_task):
+            if task is not None and not task.done():
+                task.cancel()
+        if summary:
+            logger.info(
+                "speculative_prefetch_outcome",
+                call_id=self.call_id,
+                outcomes=summary,
+                note="hit=노드가 선행 결과 사용, mismatch=조건 불일치로 재조회, unused=라우팅상 불필요",
+            )
+        return summary
+
+
+_stats = SpeculativeStats()
+
+
+def get_speculative_stats() -> SpeculativeStats:
+    return _stats
@@ -80,10 +80,23 @@ def _check_available_slots(owner: str, slot_date: str, party_size: int = 1) -> s
             slot_count=len(slots),
         )
         if not slots:
+            from datetime import date as _date, timedelta as _timedelta
+            from src.services.booking_service import find_next_available_slots
+
+            try:
+                next_from = (_date.fromisoformat(slot_date) + _timedelta(days=1)).isoformat()
+                upcoming = find_next_available_slots(owner, next_from, party_size)
+            except ValueError:
+                upcoming = []
             return json.dumps({
                 "available": False,
                 "message": f"{slot_date}에 예약 가능한 시간대가 없습니다.",
                 "slots": [],
+                "next_available": [
+                    {"date": s["slot_date"], "time": s["slot_time"], "slot_id": s["slot_id"],
+                     "available_count": s["available"]}
+                    for s in upcoming
+                ],
             }, ensure_ascii=False)
         return json.dumps({
             "available": True,
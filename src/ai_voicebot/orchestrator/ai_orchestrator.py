@@ -605,6 +605,23 @@ class AIOrchestrator:
         """VectorDB에서 활성 서비스 목록 → LLM 자연어 요약 (캐시 지원)"""
         try:
             cache_key = self.callee or "__default__"
+            max_items = self.config.get('capability_guide', {}).get('max_items', 5) if isinstance(self.config.get('capability_guide'), dict) else 5
+            
+            # 지식 변경 시 미리 계산된 owner별 안내 (LLM 호출 없음)
+            from src.ai_voicebot.knowledge.help_cache import CAPABILITY_GUIDE_MAX_ITEMS, get_help_cache
+            help_cache = get_help_cache()
+            precomputed = help_cache.get(self.callee)
+            # 사전 계산은 상위 CAPABILITY_GUIDE_MAX_ITEMS개 기준 — 설정 max_items와 같은 목록일 때만 사용
+            names = precomputed.capability_names if precomputed is not None else []
+            if max_items <= CAPABILITY_GUIDE_MAX_ITEMS:
+                same_items = len(names) <= max_items
+            else:
+                same_items = len(names) < CAPABILITY_GUIDE_MAX_ITEMS
+            if precomputed is not None and precomputed.capability_guide and same_items:
+                logger.debug("capability_guide_help_cache_hit", owner=cache_key)
+                return precomputed.capability_guide
+            if precomputed is None:
+                help_cache.schedule_rebuild(self.callee, restart=False)
             
             # 캐시 확인
             if cache_key in AIOrchestrator._capability_guide_cache:
@@ -626,25 +643,21 @@ class AIOrchestrator:
                 return None
             
             # display_name 추출 (priority 순, 최대 5개)
-            max_items = self.config.get('capability_guide', {}).get('max_items', 5) if isinstance(self.config.get('capability_guide'), dict) else 5
             display_names = [cap["display_name"] for cap in capabilities[:max_items]]
             
             if not display_names:
                 return None
             
             # LLM으로 자연어 요약
-            items_text = ", ".join(display_names)
-            prompt = (
-                f"다음 서비스 항목들을 자연어 한 문장으로 안내하세요.\n"
-                f"항목: {items_text}\n"
-                f"형식 예시: '저는 A, B, C를 안내해 드릴 수 있어요. 어떤 것이 궁금하신가요?'"
+            from src.ai_voicebot.knowledge.help_cache import (
+                CAPABILITY_GUIDE_SYSTEM_PROMPT,
+                build_capability_guide_prompt,
             )
-            
             guide_text = await self.llm.generate_response(
-                user_text=prompt,
+                user_text=build_capability_guide_prompt(display_names),
                 context_docs=[],
                 call_id=self.call_id,
-                system_prompt="전화 상담 안내 멘트를 간결하게 한 문장으로 생성하세요. 존댓말을 사용하세요."
+                system_prompt=CAPABILITY_GUIDE_SYSTEM_PROMPT,
             )
             
             # 캐시 저장
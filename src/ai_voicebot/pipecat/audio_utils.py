@@ -172,7 +172,18 @@ class RTPPacketBuilder:
         
         # G.711 인코딩
         g711_data = encode_g711(pcm_8k, self.codec)
-        
+        return self.build_packets_from_g711(g711_data)
+
+    def build_packets_from_g711(self, g711_data: bytes) -> list:
+        """
+        이미 인코딩된 G.711(self.codec) 바이트를 RTP 패킷들로 변환 (리샘플링·인코딩 생략).
+
+        Args:
+            g711_data: 8kHz G.711 데이터 (TTS 문구 캐시의 20ms 프레임 등)
+
+        Returns:
+            RTP 패킷 리스트
+        """
         # 20ms 단위로 분할하여 RTP 패킷 생성
         packets = []
         offset = 0
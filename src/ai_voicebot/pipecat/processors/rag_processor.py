@@ -32,6 +32,7 @@ from src.common.call_data_record_logger import log_call_data
 from src.common.rag_hit_serializer import build_rag_hits_llm_context, build_rag_hits_retrieval
 from src.common.tts_output_sanitize import sanitize_voice_assistant_text
 from src.common.tts_streaming_chunk_dedupe import dedupe_streaming_tts_chunks
+from src.ai_voicebot.langgraph.sentence_stream import SentenceStream
 
 from pipecat.frames.frames import (
     EndFrame,
@@ -149,6 +150,8 @@ class RAGLLMProcessor(FrameProcessor):
         # 후속 STT 최종이 도착했을 때 진행 중인 에이전트 턴 취소·문장 병합 (seq N 처리 중 seq N+1)
         self._stt_enqueue_lock: Optional[asyncio.Lock] = None
         self._agent_turn_task: Optional[asyncio.Task] = None
+        # 진행 중 턴의 중단 신호 — 턴 취소 직전에 set해 LLM 스트림이 추가 문장 없이 닫히게 한다
+        self._turn_cancel_event: Optional[asyncio.Event] = None
         self._utterance_in_flight: Optional[str] = None
         self._agent_superseded: bool = False
         # 발신자 맥락: 통화당 1회 이력 행 생성 (설계: CALLER_MEMORY_DESIGN.md)
@@ -667,6 +670,27 @@ class RAGLLMProcessor(FrameProcessor):
                 snap["pipecat_tts_pcm_queue_size"] = None
         return snap
 
+    def _drop_unplayed_tts_audio(self) -> int:
+        """RTP 송신 대기 중인 TTS PCM을 버린다 (이미 재생된 오디오는 되돌릴 수 없음). 버린 청크 수 반환."""
+        rw = (self._tts_sync_context or {}).get("_rtp_worker_ref")
+        discard = getattr(rw, "discard_pending_tts_audio", None) if rw is not None else None
+        return discard() if callable(discard) else 0
+
+    async def _abort_sentence_stream(self, sentence_stream: Optional[SentenceStream], reason: str) -> None:
+        """문장 스트리밍 도중 턴이 취소된 경우 재생 전 오디오를 버리고 열린 TTS 응답 구간을 닫는다."""
+        if sentence_stream is None or not sentence_stream.has_streamed:
+            return
+        sentence_stream.rollback(reason)
+        dropped = self._drop_unplayed_tts_audio()
+        logger.info(
+            "sentence_stream_aborted",
+            call_id=self._call_id or "",
+            reason=reason,
+            streamed_count=len(sentence_stream.sent),
+            dropped_pcm_chunks=dropped,
+        )
+        await self.push_frame(LLMFullResponseEndFrame())
+
     async def _stt_transcript_watchdog(self) -> None:
         """STT TranscriptionFrame 무응답 워치독.
 
@@ -774,6 +798,11 @@ class RAGLLMProcessor(FrameProcessor):
                              error=str(e),
                              exc_info=True)
 
+    def _signal_turn_cancel(self) -> None:
+        """진행 중 턴의 LLM 스트림에 중단 신호 (task.cancel()과 함께 호출)."""
+        if self._turn_cancel_event is not None:
+            self._turn_cancel_event.set()
+
     def _get_stt_enqueue_lock(self) -> asyncio.Lock:
         if self._stt_enqueue_lock is None:
             self._stt_enqueue_lock = asyncio.Lock()
@@ -815,6 +844,7 @@ class RAGLLMProcessor(FrameProcessor):
                         self._user_message_queue.get_nowait()
                     except asyncio.QueueEmpty:
                         break
+                self._signal_turn_cancel()
                 self._agent_turn_task.cancel()
                 log_call_data(
                     self._call_id or "",
@@ -1406,7 +1436,7 @@ class RAGLLMProcessor(FrameProcessor):
                        note="간단한 query → rewrite 스킵 가능")
         
         # 발신자 맥락: Agent가 caller_context 인자를 지원하면 전달 (설계: CALLER_MEMORY_DESIGN.md)
-        caller_context = self._get_caller_context_sync()
+        caller_context = await self._get_caller_context()
         
         # ── LLM 대기 안내 멘트: LLM 질의 시작 직전에 즉시 발화 ──
         # - 아웃바운드: 어색하므로 스킵
@@ -1562,6 +1592,7 @@ class RAGLLMProcessor(FrameProcessor):
         
         result: Optional[Dict[str, Any]] = None
         agent_elapsed = 0.0
+        sentence_stream: Optional[SentenceStream] = None
         mark_llm_start(self._tts_sync_context)
         try:
             agent_start = time.time()
@@ -1592,6 +1623,7 @@ class RAGLLMProcessor(FrameProcessor):
             # 전까지 연결하지 않는다(리스크 미확인). 대신 "조기 전송이 가능했을 시점"과 그 이후
             # 이 턴이 실제로 취소(Supersede)되는지를 로그로 남겨, 다음 실통화 QA에서 안전성을
             # 판단할 데이터를 미리 축적한다 — TTS 프레임은 전혀 건드리지 않는 순수 로깅.
+            # (실제 조기 송출은 아래 문장 스트리밍 채널이 모든 intent에 대해 담당한다.)
             _shadow_first_sentence_fired_at: list = []  # closure 내부 갱신용 (nonlocal 대체)
 
             async def _shadow_on_first_sentence(text: str, intent_out: str) -> None:
@@ -1612,6 +1644,50 @@ class RAGLLMProcessor(FrameProcessor):
                     ),
                 )
 
+            # ── 문장 스트리밍 (langgraph/sentence_stream.py) ──
+            # LLM이 완성한 문장(및 단축/예약 노드 응답)을 그래프 종료(hitl_alert·update_cache·
+            # update_state) 전에 바로 TTS로 보낸다. 최종 응답과의 대조·롤백은 TTS push 단계에서 수행.
+            _stream_tts_event: list = []  # 첫 문장 송출 시 등록한 on_tts_complete 이벤트
+
+            async def _push_streamed_sentence(text: str) -> None:
+                if not _stream_tts_event:
+                    # 대기 안내 멘트 정리 — 그래프 종료 후 finally 블록과 동일한 순서
+                    done.set()
+                    if notify_task and not notify_task.done():
+                        notify_task.cancel()
+                        try:
+                            await notify_task
+                        except asyncio.CancelledError:
+                            pass
+                    mark_tts_text_pushed(
+                        self._tts_sync_context,
+                        text_len=len(text),
+                        chunk_count=1,
+                        delivery_mode="sentence_stream",
+                    )
+                    stream_event = asyncio.Event()
+                    self._tts_sync_context["on_tts_complete"] = stream_event
+                    _stream_tts_event.append(stream_event)
+                    await self.push_frame(LLMFullResponseStartFrame())
+                    logger.info(
+                        "sentence_stream_first_sentence_pushed",
+                        call=True,
+                        call_id=self._call_id or "",
+                        category="timing",
+                        progress="tts",
+                        elapsed_since_turn_start_sec=round(time.time() - agent_start, 3),
+                        sentence_preview=text[:80],
+                        note="그래프 종료 전 첫 문장 TTS 송출 (hitl_alert/update_cache/update_state는 재생 중 진행)",
+                    )
+                await self.push_frame(TextFrame(text=text))
+
+            sentence_stream = (
+                None if outbound_extra
+                else SentenceStream(_push_streamed_sentence, call_id=self._call_id or "")
+            )
+            turn_cancel_event = asyncio.Event()
+            self._turn_cancel_event = turn_cancel_event
+
             if caller_context:
                 try:
                     result = await self._agent.process_utterance(
@@ -1621,6 +1697,8 @@ class RAGLLMProcessor(FrameProcessor):
                         caller_number=caller_number_for_agent,
                         user_query_raw=stt_query_raw,
                         on_first_sentence=_shadow_on_first_sentence,
+                        sentence_stream=sentence_stream,
+                        cancel_event=turn_cancel_event,
                         **outbound_extra,
                     )
                 except TypeError:
@@ -1629,6 +1707,8 @@ class RAGLLMProcessor(FrameProcessor):
                         caller_number=caller_number_for_agent,
                         user_query_raw=stt_query_raw,
                         on_first_sentence=_shadow_on_first_sentence,
+                        sentence_stream=sentence_stream,
+                        cancel_event=turn_cancel_event,
                         **outbound_extra,
                     )
             else:
@@ -1637,6 +1717,8 @@ class RAGLLMProcessor(FrameProcessor):
                     caller_number=caller_number_for_agent,
                     user_query_raw=stt_query_raw,
                     on_first_sentence=_shadow_on_first_sentence,
+                    sentence_stream=sentence_stream,
+                    cancel_event=turn_cancel_event,
                     **outbound_extra,
                 )
             agent_elapsed = time.time() - agent_start
@@ -1653,7 +1735,9 @@ class RAGLLMProcessor(FrameProcessor):
                     round(time.time() - _shadow_first_sentence_fired_at[0], 3)
                     if _shadow_first_sentence_fired_at else None
                 ),
+                sentence_stream_started=bool(sentence_stream and sentence_stream.has_streamed),
             )
+            await self._abort_sentence_stream(sentence_stream, "turn_cancelled")
             raise
         finally:
             # 대기 안내 태스크 취소
@@ -1666,6 +1750,7 @@ class RAGLLMProcessor(FrameProcessor):
                     pass
         
         if not result:
+            await self._abort_sentence_stream(sentence_stream, "empty_agent_result")
             return
 
         # ── Cancellation checkpoint: LLM 완료 후 TTS push 직전 ──
@@ -1681,6 +1766,7 @@ class RAGLLMProcessor(FrameProcessor):
                 user_text_preview=(user_text or ""),
                 note="[Supersede checkpoint] LLM 완료 후 TTS push 직전에 취소됨 → 병합 문장으로 재처리",
             )
+            await self._abort_sentence_stream(sentence_stream, "turn_cancelled")
             raise
 
         try:
@@ -2027,6 +2113,30 @@ class RAGLLMProcessor(FrameProcessor):
                     response = _san
                     chunks = []
 
+            # 문장 스트리밍 대조: 이미 TTS로 보낸 문장이 최종 응답(HITL 멘트·정화 반영)의 앞부분이면
+            # 남은 문장만 이어서 보내고, 아니면 재생 전 오디오를 버리고 최종 응답 중 이미 보낸 문장과
+            # 일치하는 앞부분을 뺀 나머지(replay_sentences)만 다시 보낸다 — 재생된 부분을 되풀이하지 않는다.
+            _stream_started = bool(sentence_stream is not None and sentence_stream.has_streamed)
+            _stream_remaining: Optional[List[str]] = None
+            if _stream_started:
+                _stream_remaining = sentence_stream.reconcile(response or "")
+                if _stream_remaining is None:
+                    logger.warning(
+                        "sentence_stream_rollback_replay",
+                        call=True,
+                        call_id=self._call_id or "",
+                        category="tts",
+                        reason=sentence_stream.rollback_reason,
+                        streamed_preview=sentence_stream.streamed_text[:120],
+                        final_preview=(response or "")[:120],
+                        kept_streamed_count=sentence_stream.kept_count,
+                        replay_count=len(sentence_stream.replay_sentences),
+                        dropped_pcm_chunks=self._drop_unplayed_tts_audio(),
+                        note="스트리밍 송출 문장이 최종 응답과 불일치(HITL/검증) → 최종 응답으로 교체 발화",
+                    )
+                if not response:
+                    await self.push_frame(LLMFullResponseEndFrame())
+
             if response:
                 if intent == "farewell":
                     logger.info("farewell_closing_pushed",
@@ -2037,17 +2147,19 @@ class RAGLLMProcessor(FrameProcessor):
                                response_len=len(response))
                 # Streaming RAG: 청크 단위 전송
                 tts_push_start = time.time()
-                _delivery = (
-                    "chunked_after_llm_complete"
-                    if chunks and len(chunks) > 1
-                    else "batch_after_llm_complete"
-                )
-                mark_tts_text_pushed(
-                    self._tts_sync_context,
-                    text_len=len(response),
-                    chunk_count=len(chunks) if chunks else 1,
-                    delivery_mode=_delivery,
-                )
+                if not _stream_started:
+                    # 스트리밍 송출 시에는 첫 문장 시점에 이미 기록됨
+                    _delivery = (
+                        "chunked_after_llm_complete"
+                        if chunks and len(chunks) > 1
+                        else "batch_after_llm_complete"
+                    )
+                    mark_tts_text_pushed(
+                        self._tts_sync_context,
+                        text_len=len(response),
+                        chunk_count=len(chunks) if chunks else 1,
+                        delivery_mode=_delivery,
+                    )
                 
                 # 📌 실제 TTS로 나가는 최종 텍스트 로깅 (farewell 템플릿, HITL 멘트 등 모든 override 반영 후)
                 _llm_rag = result.get("llm_rag_applied") or []
@@ -2114,10 +2226,13 @@ class RAGLLMProcessor(FrameProcessor):
                         logger.debug("tts_started_event_failed", error=str(e))
                 
                 # ✅ TTS 완료 이벤트를 EndFrame 전에 설정 (Notifier가 event.set() 가능하도록)
-                event = asyncio.Event()
-                self._tts_sync_context["on_tts_complete"] = event
-                
-                await self.push_frame(LLMFullResponseStartFrame())
+                if _stream_started:
+                    # 문장 스트리밍: Start 프레임과 완료 이벤트는 첫 문장 송출 시 이미 등록됨
+                    event = _stream_tts_event[0]
+                else:
+                    event = asyncio.Event()
+                    self._tts_sync_context["on_tts_complete"] = event
+                    await self.push_frame(LLMFullResponseStartFrame())
                 
                 # 📌 RAG → TTS 전달 직전 로깅 (분할 여부 추적)
                 logger.info("rag_textframe_pushed",
@@ -2131,7 +2246,22 @@ class RAGLLMProcessor(FrameProcessor):
                 
                 # 스트리밍 TTS: response_chunks가 있으면 문장 단위로 TTS 전송 (체감 지연 감소)
                 # 없으면 전체 텍스트를 한 번에 전송 (기존 동작)
-                if chunks and len(chunks) > 1:
+                if _stream_started:
+                    _tail = (
+                        _stream_remaining
+                        if _stream_remaining is not None
+                        else sentence_stream.replay_sentences
+                    )
+                    logger.info("rag_sentence_stream_tail",
+                               call_id=self._call_id or "",
+                               streamed_count=len(sentence_stream.sent),
+                               tail_count=len(_tail),
+                               rolled_back=_stream_remaining is None,
+                               note="그래프 종료 후 남은 문장(롤백 시 이미 보낸 앞부분을 뺀 최종 응답) 전송")
+                    for chunk_text in _tail:
+                        if chunk_text.strip():
+                            await self.push_frame(TextFrame(text=chunk_text.strip()))
+                elif chunks and len(chunks) > 1:
                     chunks = dedupe_streaming_tts_chunks(chunks)
                     logger.info("rag_streaming_tts_chunks",
                                call_id=self._call_id or "",
@@ -2221,6 +2351,9 @@ class RAGLLMProcessor(FrameProcessor):
             _eerr = "죄송합니다. 오류가 발생했습니다."
             self._pipeline_tx_callee(self._call_id or "", _eerr)
             await self.push_frame(TextFrame(text=_eerr))
+            if sentence_stream is not None and sentence_stream.has_streamed:
+                # 문장 스트리밍으로 열린 TTS 응답 구간을 닫는다
+                await self.push_frame(LLMFullResponseEndFrame())
     
     # Phase1↔Phase2 사이 예상 대기 시간을 계산하기 위한 상수
     # 한국어 TTS는 대략 초당 5~7글자 속도로 발화
@@ -2739,6 +2872,7 @@ class RAGLLMProcessor(FrameProcessor):
         self._utterance_in_flight = None
         self._agent_superseded = False
         if self._agent_turn_task and not self._agent_turn_task.done():
+            self._signal_turn_cancel()
             self._agent_turn_task.cancel()
         self._agent_turn_task = None
         # 워커 취소 및 큐 비우기 (이전 통화 발화가 새 통화에 섞이지 않도록)
@@ -2821,6 +2955,7 @@ class RAGLLMProcessor(FrameProcessor):
         # 진행 중인 LLM 에이전트 턴 취소
         agent_task = self._agent_turn_task
         if agent_task and not agent_task.done():
+            self._signal_turn_cancel()
             agent_task.cancel()
             try:
                 await agent_task
@@ -2996,7 +3131,7 @@ class RAGLLMProcessor(FrameProcessor):
                 except Exception:
                     pass
             
-            caller_context = self._get_caller_context_sync()
+            caller_context = await self._get_caller_context()
             system_prompt = self._build_system_prompt(org_context, rag_context, caller_context)
             conversation_history = self._format_history()
             
@@ -3072,6 +3207,14 @@ class RAGLLMProcessor(FrameProcessor):
             self._pipeline_tx_callee(self._call_id or "", _lerr)
             await self.push_frame(TextFrame(text=_lerr))
     
+    async def _get_caller_context(self) -> str:
+        """_get_caller_context_sync를 sqlite executor에서 (calls.db 조회로 루프를 막지 않도록)."""
+        if not self._owner or not getattr(self, "_caller_id", None):
+            return ""
+        from src.common.sqlite_pool import to_thread as _db_to_thread
+
+        return await _db_to_thread(self._get_caller_context_sync)
+
     def _get_caller_context_sync(self) -> str:
         """발신자별 이전 통화 요약을 DB에서 조회해 [이전 통화 맥락] 블록 문자열로 반환. 설계: CALLER_MEMORY_DESIGN.md"""
         if not self._owner or not getattr(self, "_caller_id", None) or not self._caller_id:
@@ -3,8 +3,12 @@ Google / Gemini TTS 서비스 래퍼 (오디오 버퍼링 + API 호출 로깅)
 
 스트리밍 API는 여러 청크를 비동기적으로 반환하므로 청크 간 지연이
 RTP 타이밍에 영향을 줄 수 있다.
-→ 모든 오디오 청크를 먼저 수집한 뒤 한꺼번에 yield하여
-   RTP 스케줄러가 연속적으로 20ms 프레임을 소비할 수 있게 한다.
+→ 적응형 플레이아웃 버퍼(tts_playout.TTSPlayoutBuffer)로 pre-roll(기본 250ms)이 쌓이고
+   합성 속도가 재생 속도를 앞서면 바로 yield를 시작하고, 실시간보다 느린 스트림만 계속 모아
+   RTP 스케줄러가 공백 없이 20ms 프레임을 소비할 수 있게 한다.
+
+고정 문구(인사·종료·대기 멘트 등)는 API 호출 전에 TTS 문구 캐시(ai_pipeline/tts_phrase_cache.py)를
+확인해 있으면 캐시 음원으로 즉시 응답하고, 캐시에 등록된 문구가 합성되면 결과를 저장한다.
 
 클래스:
   DebugGoogleTTSService  — Chirp 3 HD 스트리밍 (16kHz 출력)
@@ -13,15 +17,69 @@ RTP 타이밍에 영향을 줄 수 있다.
 """
 
 import time
-from typing import AsyncGenerator, List
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 from pipecat.services.google.tts import GoogleTTSService, GeminiTTSService
 from pipecat.frames.frames import Frame, TTSAudioRawFrame, TTSStartedFrame, TTSStoppedFrame
 import structlog
 
+from src.ai_voicebot.ai_pipeline.tts_client import normalize_tts_language_code
+from src.ai_voicebot.ai_pipeline.tts_phrase_cache import get_tts_phrase_cache
+from src.ai_voicebot.pipecat.services.tts_playout import TTSPlayoutBuffer, estimate_speech_ms
+
 logger = structlog.get_logger(__name__)
 
 
+def _phrase_cache_identity(kwargs: Dict[str, Any]) -> Tuple[str, str, Optional[float]]:
+    """서비스 생성 인자 → 문구 캐시 키 구성요소 (voice, language, speaking_rate)."""
+    voice = kwargs.get("voice_id") or ""
+    params = kwargs.get("params")
+    language = getattr(params, "language", None)
+    language = getattr(language, "value", language)
+    speaking_rate = getattr(params, "speaking_rate", None)
+    return voice, normalize_tts_language_code(str(language or ""), voice_name=voice), speaking_rate
+
+
+def _cached_tts_frames(
+    identity: Tuple[str, str, Optional[float]], text: str, sample_rate: int, call_id: str
+) -> Optional[List[Frame]]:
+    """문구 캐시 hit이면 TTSStarted/Audio/Stopped 프레임 목록, 아니면 None."""
+    voice, language, speaking_rate = identity
+    pcm = get_tts_phrase_cache().get_pcm(
+        text, voice=voice, language=language, speaking_rate=speaking_rate, sample_rate=sample_rate
+    )
+    if not pcm:
+        return None
+    logger.info("tts_phrase_cache_hit",
+                 call_id=call_id,
+                 progress="tts",
+                 category="tts",
+                 voice=voice,
+                 text_preview=text[:100],
+                 duration_sec=round(len(pcm) / (sample_rate * 2), 3),
+                 note="고정 문구 캐시 음원 사용 — TTS API 호출 생략")
+    return [
+        TTSStartedFrame(),
+        TTSAudioRawFrame(audio=pcm, sample_rate=sample_rate, num_channels=1),
+        TTSStoppedFrame(),
+    ]
+
+
+def _store_tts_frames(
+    identity: Tuple[str, str, Optional[float]], text: str, frames: List[Frame], sample_rate: int
+) -> None:
+    """등록된 고정 문구면 합성된 오디오 프레임을 문구 캐시에 저장."""
+    cache = get_tts_phrase_cache()
+    if not cache.is_registered(text):
+        return
+    audio = b"".join(
+        f.audio for f in frames if isinstance(getattr(f, "audio", None), bytes)
+    )
+    rate = next((getattr(f, "sample_rate", 0) for f in frames if getattr(f, "audio", None)), 0) or sample_rate
+    voice, language, speaking_rate = identity
+    cache.put_pcm(text, audio, rate, voice=voice, language=language, speaking_rate=speaking_rate)
+
+
 def _collect_and_yield_tts(service_name: str):
     """
     TTS 스트리밍 래퍼 공통 로직을 반환하는 데코레이터 팩토리.
@@ -33,14 +91,23 @@ def _collect_and_yield_tts(service_name: str):
 
 
 class DebugGoogleTTSService(GoogleTTSService):
-    """Chirp 3 HD TTS — 오디오 전체를 수집 후 일괄 yield (스트리밍 갭 방지)."""
+    """Chirp 3 HD TTS — pre-roll 버퍼 후 점진 yield (느린 스트림은 수집 후 yield로 갭 방지)."""
 
-    def __init__(self, call_id: str = "", **kwargs):
+    def __init__(self, call_id: str = "", preroll_ms: Optional[int] = None, **kwargs):
         super().__init__(**kwargs)
         self._call_id = call_id
+        self._preroll_ms = preroll_ms
         self._api_call_count = 0
+        self._phrase_identity = _phrase_cache_identity(kwargs)
 
     async def run_tts(self, text: str, context_id: str = "") -> AsyncGenerator[Frame, None]:
+        sample_rate = getattr(self, "sample_rate", 0) or 16000
+        cached = _cached_tts_frames(self._phrase_identity, text, sample_rate, self._call_id)
+        if cached is not None:
+            for frame in cached:
+                yield frame
+            return
+
         self._api_call_count += 1
         call_num = self._api_call_count
 
@@ -51,12 +118,17 @@ class DebugGoogleTTSService(GoogleTTSService):
                      api_call_num=call_num,
                      text_len=len(text),
                      text_preview=text[:100] if text else "",
-                     note="Chirp3 HD TTS API 호출 (스트리밍 → 일괄 수집 후 yield)")
+                     note="Chirp3 HD TTS API 호출 (스트리밍 → pre-roll 후 점진 yield)")
 
         t0 = time.perf_counter()
         collected_frames: List[Frame] = []
         total_audio_bytes = 0
         audio_frame_count = 0
+        playout = TTSPlayoutBuffer(
+            sample_rate=sample_rate,
+            preroll_ms=self._preroll_ms,
+            expected_ms=estimate_speech_ms(text),
+        )
 
         async for frame in super().run_tts(text, context_id):
             audio = getattr(frame, "audio", None)
@@ -64,6 +136,20 @@ class DebugGoogleTTSService(GoogleTTSService):
                 audio_frame_count += 1
                 total_audio_bytes += len(audio)
             collected_frames.append(frame)
+            was_released = playout.released
+            for out in playout.push(frame):
+                yield out
+            if playout.released and not was_released:
+                logger.info("google_tts_playout_started",
+                             call_id=self._call_id,
+                             progress="tts",
+                             category="tts",
+                             api_call_num=call_num,
+                             reason=playout.release_reason,
+                             wait_ms=round(playout.release_wait_ms or 0, 1),
+                             buffered_ms=round(playout.release_buffered_ms, 1),
+                             synthesis_speed=round(playout.synthesis_speed() or 0, 2),
+                             note="pre-roll 충족 — 합성 완료 전 yield 시작")
 
         elapsed_ms = (time.perf_counter() - t0) * 1000
         # Chirp3 HD: 16kHz, 16-bit (2 bytes/sample) → bytes_per_sec = 16000 * 2 = 32000
@@ -78,14 +164,17 @@ class DebugGoogleTTSService(GoogleTTSService):
                      total_audio_bytes=total_audio_bytes,
                      duration_sec=duration_sec,
                      api_elapsed_ms=round(elapsed_ms, 1),
-                     note="Chirp3 HD TTS 수집 완료 — 일괄 yield 시작 (스트리밍 갭 제거)")
+                     playout_reason=playout.release_reason,
+                     playout_wait_ms=round(playout.release_wait_ms or 0, 1),
+                     note="Chirp3 HD TTS 스트림 종료 — 남은 프레임 yield")
 
-        for frame in collected_frames:
+        _store_tts_frames(self._phrase_identity, text, collected_frames, sample_rate)
+        for frame in playout.flush():
             yield frame
 
 
 class DebugGeminiTTSService(GeminiTTSService):
-    """Gemini 2.5 Flash/Pro TTS — 오디오 전체를 수집 후 일괄 yield (스트리밍 갭 방지).
+    """Gemini 2.5 Flash/Pro TTS — pre-roll 버퍼 후 점진 yield (느린 스트림은 수집 후 yield로 갭 방지).
 
     Gemini TTS는 24kHz PCM을 출력한다.
     RTPPacketBuilder.build_packets()가 입력 sample_rate를 받아 8kHz로 리샘플링하므로
@@ -95,12 +184,21 @@ class DebugGeminiTTSService(GeminiTTSService):
     # Gemini TTS 고정 출력 샘플레이트 (Google 공식 spec)
     GEMINI_SAMPLE_RATE = 24000
 
-    def __init__(self, call_id: str = "", **kwargs):
+    def __init__(self, call_id: str = "", preroll_ms: Optional[int] = None, **kwargs):
         super().__init__(**kwargs)
         self._call_id = call_id
+        self._preroll_ms = preroll_ms
         self._api_call_count = 0
+        self._phrase_identity = _phrase_cache_identity(kwargs)
 
     async def run_tts(self, text: str, context_id: str = "") -> AsyncGenerator[Frame, None]:
+        sample_rate = getattr(self, "sample_rate", 0) or self.GEMINI_SAMPLE_RATE
+        cached = _cached_tts_frames(self._phrase_identity, text, sample_rate, self._call_id)
+        if cached is not None:
+            for frame in cached:
+                yield frame
+            return
+
         self._api_call_count += 1
         call_num = self._api_call_count
 
@@ -111,12 +209,17 @@ class DebugGeminiTTSService(GeminiTTSService):
                      api_call_num=call_num,
                      text_len=len(text),
                      text_preview=text[:100] if text else "",
-                     note="Gemini TTS API 호출 (24kHz 스트리밍 → 일괄 수집 후 yield)")
+                     note="Gemini TTS API 호출 (24kHz 스트리밍 → pre-roll 후 점진 yield)")
 
         t0 = time.perf_counter()
         collected_frames: List[Frame] = []
         total_audio_bytes = 0
         audio_frame_count = 0
+        playout = TTSPlayoutBuffer(
+            sample_rate=sample_rate,
+            preroll_ms=self._preroll_ms,
+            expected_ms=estimate_speech_ms(text),
+        )
 
         async for frame in super().run_tts(text, context_id):
             audio = getattr(frame, "audio", None)
@@ -124,6 +227,20 @@ class DebugGeminiTTSService(GeminiTTSService):
                 audio_frame_count += 1
                 total_audio_bytes += len(audio)
             collected_frames.append(frame)
+            was_released = playout.released
+            for out in playout.push(frame):
+                yield out
+            if playout.released and not was_released:
+                logger.info("gemini_tts_playout_started",
+                             call_id=self._call_id,
+                             progress="tts",
+                             category="tts",
+                             api_call_num=call_num,
+                             reason=playout.release_reason,
+                             wait_ms=round(playout.release_wait_ms or 0, 1),
+                             buffered_ms=round(playout.release_buffered_ms, 1),
+                             synthesis_speed=round(playout.synthesis_speed() or 0, 2),
+                             note="pre-roll 충족 — 합성 완료 전 yield 시작")
 
         elapsed_ms = (time.perf_counter() - t0) * 1000
         # Gemini TTS: 24kHz, 16-bit (2 bytes/sample) → bytes_per_sec = 24000 * 2 = 48000
@@ -139,7 +256,10 @@ class DebugGeminiTTSService(GeminiTTSService):
                      duration_sec=duration_sec,
                      api_elapsed_ms=round(elapsed_ms, 1),
                      sample_rate=self.GEMINI_SAMPLE_RATE,
-                     note="Gemini TTS 수집 완료 — 일괄 yield 시작 (24kHz → RTP에서 8kHz 리샘플링)")
+                     playout_reason=playout.release_reason,
+                     playout_wait_ms=round(playout.release_wait_ms or 0, 1),
+                     note="Gemini TTS 스트림 종료 — 남은 프레임 yield (24kHz → RTP에서 8kHz 리샘플링)")
 
-        for frame in collected_frames:
+        _store_tts_frames(self._phrase_identity, text, collected_frames, sample_rate)
+        for frame in playout.flush():
             yield frame
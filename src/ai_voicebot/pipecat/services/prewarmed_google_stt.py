@@ -0,0 +1,77 @@
+"""
+Google STT 서비스 래퍼 (스트림 사전 연결·회전)
+
+Pipecat GoogleSTTService의 _stream_audio는 오디오가 대기열에 들어온 뒤에야 스트림을 열고,
+스트림이 정상 종료되면 루프를 빠져나가 다음 재연결까지 전사가 멈출 수 있다.
+이 래퍼는 스트림 수명을 SttStreamSession(pipecat/stt_stream_manager.py)에 맡긴다:
+  - StartFrame(_connect) 직후 인사 재생 중에 스트림을 확보 (공용 대기 스트림이 있으면 즉시)
+  - 스트림이 끝나면 다음 오디오를 기다리지 않고 바로 대기 스트림으로 교체
+  - 4분 한도 전에 발화가 없는 시점에 overlap 오디오와 함께 교체
+  - 최종 전사마다 stt_turn_stream_setup 로그 (스트림 설정·대기 시간)
+
+응답 처리(전사 프레임 생성)는 부모의 _process_responses를 그대로 쓴다.
+"""
+
+import hashlib
+import time
+from typing import Optional
+
+import structlog
+from google.cloud.speech_v2.types import cloud_speech
+from pipecat.services.google.stt import GoogleSTTService
+
+from src.ai_voicebot.pipecat.stt_stream_manager import (
+    SttStream,
+    SttStreamSession,
+    SttStreamSpec,
+    get_stt_stream_manager,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class PrewarmedGoogleSTTService(GoogleSTTService):
+    def __init__(self, *, call_id: str = "", **kwargs):
+        super().__init__(**kwargs)
+        self._call_id = call_id
+        self._stream_session: Optional[SttStreamSession] = None
+
+    def _stream_spec(self) -> SttStreamSpec:
+        recognizer = f"projects/{self._project_id}/locations/{self._location}/recognizers/_"
+        config = self._config
+        # 같은 공용 클라이언트·같은 설정이면 다른 통화가 미리 연 스트림을 그대로 쓸 수 있다
+        identity = f"{id(self._client)}|{recognizer}|{cloud_speech.StreamingRecognitionConfig.to_json(config)}"
+        key = f"{','.join(self._settings['language_codes'])}:{hashlib.sha1(identity.encode()).hexdigest()[:12]}"
+        client = self._client
+        return SttStreamSpec(
+            key=key,
+            open_call=lambda requests: client.streaming_recognize(requests=requests),
+            first_request=cloud_speech.StreamingRecognizeRequest(recognizer=recognizer, streaming_config=config),
+            audio_request=lambda audio: cloud_speech.StreamingRecognizeRequest(audio=audio),
+        )
+
+    def _on_stream_switch(self, stream: SttStream) -> None:
+        # 부모의 STREAMING_LIMIT 검사 기준을 새 스트림 시작 시각으로 맞춘다 (새 스트림에는 진행 중인 중간 전사가 없음)
+        self._stream_start_time = int((time.time() - stream.age_sec) * 1000)
+        self._last_transcript_was_final = True
+
+    async def _stream_audio(self):
+        self._stream_session = SttStreamSession(
+            get_stt_stream_manager(),
+            self._stream_spec(),
+            self._request_queue,
+            self._process_responses,
+            is_quiet=lambda: self._last_transcript_was_final,
+            on_switch=self._on_stream_switch,
+            sample_rate=self.sample_rate,
+            call_id=self._call_id,
+        )
+        try:
+            await self._stream_session.run()
+        except Exception as e:
+            await self.push_error(error_msg=f"STT stream session error: {e}", exception=e)
+
+    async def _handle_transcription(self, transcript: str, is_final: bool, language: Optional[str] = None):
+        await super()._handle_transcription(transcript, is_final, language)
+        if is_final and self._stream_session is not None:
+            self._stream_session.report_turn()
@@ -0,0 +1,141 @@
+"""
+TTS 출력 적응형 플레이아웃 버퍼 (pre-roll).
+
+DebugGoogleTTSService/DebugGeminiTTSService는 청크 간 지연이 RTP 20ms 송출에 공백을 만들지 않도록
+전체 음원을 모은 뒤 yield했지만, 그만큼 문장마다 합성 시간 전체가 첫 오디오 지연에 더해진다.
+
+이 버퍼는
+  1) pre-roll(기본 250ms)만큼 오디오가 쌓이면
+  2) 합성 속도(수신 오디오 길이 / 경과 시간)가 실시간 이상이거나,
+     실시간보다 느려도 남은 예상 길이를 받는 동안 이미 받은 분량으로 재생이 끊기지 않으면
+방출을 시작하고, 이후 프레임은 도착 즉시 통과시킨다. 실시간보다 느린 스트림은 조건이 맞을 때까지
+(최악의 경우 끝까지) 계속 모으므로 기존 수집 후 일괄 yield와 같은 무공백 특성을 유지한다.
+
+pipecat 의존성이 없도록 프레임은 audio/sample_rate 속성만 본다.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, Callable, List, Optional
+
+# 방출 시작 전 최소 버퍼 (ms). 음수면 적응형 비활성 (전체 수집 후 일괄 방출)
+DEFAULT_PREROLL_MS = 250
+# 문장 길이 추정 (공백 제외 글자당 ms, 한국어 Chirp3 HD 기준)
+DEFAULT_MS_PER_CHAR = 140
+# 예상 길이 과소추정 대비 여유
+_EXPECTED_MARGIN = 1.2
+
+
+def resolve_preroll_ms(preroll_ms: Optional[int] = None) -> int:
+    if preroll_ms is not None:
+        return int(preroll_ms)
+    try:
+        return int(os.environ.get("TTS_PLAYOUT_PREROLL_MS", DEFAULT_PREROLL_MS))
+    except ValueError:
+        return DEFAULT_PREROLL_MS
+
+
+def estimate_speech_ms(text: str, ms_per_char: int = DEFAULT_MS_PER_CHAR) -> int:
+    return int(sum(1 for c in (text or "") if not c.isspace()) * ms_per_char)
+
+
+def _audio_ms(frame: Any, default_rate: int) -> float:
+    audio = getattr(frame, "audio", None)
+    if not isinstance(audio, bytes) or not audio:
+        return 0.0
+    rate = getattr(frame, "sample_rate", None) or default_rate
+    channels = getattr(frame, "num_channels", None) or 1
+    return len(audio) / (rate * 2 * channels) * 1000.0
+
+
+class TTSPlayoutBuffer:
+    """
+    run_tts 한 번의 프레임 흐름을 조절한다.
+
+    push(frame)은 지금 내보낼 프레임 목록을, flush()는 스트림 종료 시 남은 프레임을 반환한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int,
+        preroll_ms: Optional[int] = None,
+        expected_ms: int = 0,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self._sample_rate = sample_rate or 16000
+        self.preroll_ms = resolve_preroll_ms(preroll_ms)
+        self._expected_ms = expected_ms * _EXPECTED_MARGIN
+        self._clock = clock
+        self._started_at = clock()
+        self._first_audio_at: Optional[float] = None
+        self._first_audio_ms = 0.0
+        self._received_ms = 0.0
+        self._pending: List[Any] = []
+        self.released = False
+        self.release_reason = ""
+        self.release_wait_ms: Optional[float] = None
+        self.release_buffered_ms = 0.0
+
+    @property
+    def received_ms(self) -> float:
+        return self._received_ms
+
+    def synthesis_speed(self) -> Optional[float]:
+        """첫 청크 이후 수신 오디오 길이 / 경과 시간 (1.0 = 실시간). 측정 불가면 None."""
+        if self._first_audio_at is None:
+            return None
+        elapsed_ms = (self._clock() - self._first_audio_at) * 1000.0
+        produced_ms = self._received_ms - self._first_audio_ms
+        if produced_ms <= 0:
+            return None
+        if elapsed_ms <= 1.0:
+            return float("inf")
+        return produced_ms / elapsed_ms
+
+    def _should_release(self) -> str:
+        if self.preroll_ms < 0 or self._received_ms < self.preroll_ms:
+            return ""
+        speed = self.synthesis_speed()
+        if speed is None:
+            return ""
+        if speed >= 1.0:
+            return "realtime"
+        if self._expected_ms <= 0:
+            return ""
+        # 지금부터 남은 분량을 speed로 받는 동안, 받은 분량 + 남은 분량 재생이 끊기지 않는가
+        remaining_ms = max(0.0, self._expected_ms - self._received_ms)
+        if remaining_ms * (1.0 / speed - 1.0) <= self._received_ms:
+            return "buffered_for_slow_stream"
+        return ""
+
+    def push(self, frame: Any) -> List[Any]:
+        ms = _audio_ms(frame, self._sample_rate)
+        if ms:
+            if self._first_audio_at is None:
+                self._first_audio_at = self._clock()
+                self._first_audio_ms = ms
+            self._received_ms += ms
+        if self.released:
+            return [frame]
+        self._pending.append(frame)
+        reason = self._should_release()
+        if not reason:
+            return []
+        self.released = True
+        self.release_reason = reason
+        self.release_wait_ms = (self._clock() - self._started_at) * 1000.0
+        self.release_buffered_ms = self._received_ms
+        out, self._pending = self._pending, []
+        return out
+
+    def flush(self) -> List[Any]:
+        """스트림 종료 — 남은 프레임 전부 (방출 전이면 기존 일괄 yield와 동일)."""
+        if not self.released:
+            self.release_reason = "stream_end"
+            self.release_wait_ms = (self._clock() - self._started_at) * 1000.0
+            self.release_buffered_ms = self._received_ms
+        out, self._pending = self._pending, []
+        return out
@@ -0,0 +1,64 @@
+"""
+공용 Smart Turn 추론 서버를 쓰는 pipecat 턴 분석기.
+
+BaseSmartTurn의 오디오 버퍼링·침묵 추적·세그먼트 추출은 그대로 두고, 모델 추론(_predict_endpoint)만
+SmartTurnInferenceServer로 보낸다 — 통화별 ONNX 세션을 만들지 않는다.
+
+서버가 포화(queue_full)·지연(timeout)·오류면 SmartTurnTimeoutException을 던져 BaseSmartTurn이
+기존 stop_secs 경로처럼 발화 완료(VAD 침묵 기준)로 처리하게 한다.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+import structlog
+from pipecat.audio.turn.smart_turn.base_smart_turn import BaseSmartTurn, SmartTurnTimeoutException
+
+from src.ai_voicebot.pipecat.smart_turn_inference import (
+    SmartTurnInferenceServer,
+    SmartTurnUnavailable,
+    get_smart_turn_inference_server,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class SharedSmartTurnAnalyzer(BaseSmartTurn):
+    """LocalSmartTurnAnalyzerV3 대체 — 판단 기준(8초 창, 확률 > 0.5)은 동일, 모델은 프로세스 공용."""
+
+    def __init__(self, server: SmartTurnInferenceServer, *, call_id: str = "", **kwargs):
+        super().__init__(**kwargs)
+        self._server = server
+        self._call_id = call_id
+
+    def _predict_endpoint(self, audio_array: np.ndarray) -> Dict[str, Any]:
+        try:
+            result = self._server.predict(audio_array, call_id=self._call_id)
+        except SmartTurnUnavailable as e:
+            logger.info(
+                "smart_turn_vad_fallback",
+                call_id=self._call_id,
+                reason=e.reason,
+                detail=str(e),
+            )
+            raise SmartTurnTimeoutException(str(e)) from e
+        logger.debug(
+            "smart_turn_inference",
+            call_id=self._call_id,
+            prediction=result["prediction"],
+            probability=round(result["probability"], 3),
+            batch_size=result["batch_size"],
+            queue_ms=round(result["queue_ms"], 1),
+            latency_ms=round(result["latency_ms"], 1),
+        )
+        return result
+
+
+def create_smart_turn_analyzer(*, call_id: str = "") -> Optional[Any]:
+    """공용 서버가 있으면 SharedSmartTurnAnalyzer, 없으면(비활성·로드 실패) 통화별 LocalSmartTurnAnalyzerV3."""
+    server = get_smart_turn_inference_server()
+    if server is not None:
+        return SharedSmartTurnAnalyzer(server, call_id=call_id)
+    from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
+
+    return LocalSmartTurnAnalyzerV3()
@@ -0,0 +1,401 @@
+"""
+Smart Turn v3 공용 추론 서버 (프로세스당 모델 1개, 통화 간 마이크로 배치).
+
+통화마다 LocalSmartTurnAnalyzerV3()를 만들면 ONNX 세션(모델 가중치·스레드 풀)이 통화 수만큼 올라가고,
+발화 종료 판단도 각자 단건 추론으로 CPU 스레드 하나씩을 점유한다.
+
+이 서버는
+- 모델을 한 번만 로드하고 (intra-op 스레드 수 제한)
+- 동시 통화의 요청을 짧은 창(batch_window_ms) 동안 모아 input_features 배치 1회로 추론하며
+- 고정 크기 워커(workers)에서만 실행한다.
+대기열이 가득 차거나(queue_full) 응답이 timeout_ms를 넘거나 추론이 실패하면 SmartTurnUnavailable을 던지고,
+호출부(SharedSmartTurnAnalyzer)는 pipecat의 SmartTurnTimeoutException 경로 = VAD 침묵 기준 종료로 폴백한다.
+
+pipecat/onnxruntime 의존은 load_smart_turn_batch_predictor()에만 있다 (서버 자체는 predict_batch 콜러블만 받음).
+
+환경변수:
+  SMART_TURN_SHARED=0            통화별 LocalSmartTurnAnalyzerV3 (기존 동작)
+  SMART_TURN_BATCH_WINDOW_MS     배치 대기 창 (기본 8)
+  SMART_TURN_MAX_BATCH           배치 최대 크기 (기본 8)
+  SMART_TURN_WORKERS             동시 배치 추론 수 (기본 2)
+  SMART_TURN_INTRA_OP_THREADS    ONNX intra-op 스레드 (기본 2)
+  SMART_TURN_MAX_QUEUE           대기열 상한 (기본 32)
+  SMART_TURN_TIMEOUT_MS          요청당 최대 대기 (기본 500)
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_BATCH_WINDOW_MS = 8.0
+DEFAULT_MAX_BATCH = 8
+DEFAULT_WORKERS = 2
+DEFAULT_INTRA_OP_THREADS = 2
+DEFAULT_MAX_QUEUE = 32
+DEFAULT_TIMEOUT_MS = 500.0
+
+# LocalSmartTurnAnalyzerV3와 동일: 16kHz 마지막 8초, 확률 > 0.5 → 발화 완료
+_SAMPLE_RATE = 16000
+_WINDOW_SECS = 8
+_COMPLETE_THRESHOLD = 0.5
+
+PredictBatch = Callable[[List[np.ndarray]], List[float]]
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def shared_smart_turn_enabled() -> bool:
+    return os.environ.get("SMART_TURN_SHARED", "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+class SmartTurnUnavailable(Exception):
+    """공용 추론을 제때 못 받음 — 호출부는 VAD 기준 종료로 폴백."""
+
+    def __init__(self, reason: str, detail: str = ""):
+        super().__init__(f"{reason}: {detail}" if detail else reason)
+        self.reason = reason
+
+
+class _Request:
+    __slots__ = ("audio", "call_id", "enqueued_at", "done", "result", "error", "cancelled")
+
+    def __init__(self, audio: np.ndarray, call_id: str, enqueued_at: float) -> None:
+        self.audio = audio
+        self.call_id = call_id
+        self.enqueued_at = enqueued_at
+        self.done = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+        self.cancelled = False
+
+
+class SmartTurnInferenceServer:
+    """동시 통화의 발화 종료 추론 요청을 묶어 공용 모델 1개로 처리."""
+
+    def __init__(
+        self,
+        predict_batch: PredictBatch,
+        *,
+        batch_window_ms: float = DEFAULT_BATCH_WINDOW_MS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        workers: int = DEFAULT_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        timeout_ms: float = DEFAULT_TIMEOUT_MS,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Args:
+            predict_batch: 오디오(float32, 16kHz) 목록 → 발화 완료 확률 목록
+            batch_window_ms: 첫 요청 도착 후 같은 배치로 모을 시간. 0이면 이미 쌓인 요청만 묶음
+            max_batch: 배치 최대 크기 (도달 시 즉시 실행)
+            workers: 동시에 실행할 배치 수. 모두 바쁘면 요청은 대기열에서 다음 배치로 합쳐진다
+            max_queue: 대기 요청 상한 (초과 시 즉시 queue_full 폴백)
+            timeout_ms: 요청당 최대 대기 (초과 시 timeout 폴백, 배치에서 제외)
+        """
+        self._predict_batch = predict_batch
+        self.batch_window_ms = max(0.0, float(batch_window_ms))
+        self.max_batch = max(1, int(max_batch))
+        self.workers = max(1, int(workers))
+        self.max_queue = max(1, int(max_queue))
+        self.timeout_ms = float(timeout_ms)
+        self._clock = clock
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="smart-turn"
+        )
+        self._slots = threading.Semaphore(self.workers)
+        self._cond = threading.Condition()
+        self._pending: Deque[_Request] = deque()
+        self._closed = False
+        # 통계
+        self.requests = 0
+        self.completed = 0
+        self.batches = 0
+        self.batched_requests = 0
+        self.max_batch_seen = 0
+        self.in_flight = 0
+        self.fallbacks: Dict[str, int] = {"queue_full": 0, "timeout": 0, "error": 0, "closed": 0}
+        self._latencies_ms: Deque[float] = deque(maxlen=512)
+        self._queue_wait_ms: Deque[float] = deque(maxlen=512)
+        self._inference_ms: Deque[float] = deque(maxlen=512)
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop, name="smart-turn-dispatch", daemon=True
+        )
+        self._dispatcher.start()
+
+    # ── 요청 ──
+
+    def predict(self, audio: np.ndarray, *, call_id: str = "") -> Dict[str, Any]:
+        """
+        발화 종료 추론 (블로킹 — 분석기 전용 스레드에서 호출).
+
+        반환은 LocalSmartTurnAnalyzerV3._predict_endpoint와 같은 형식
+        ({"prediction", "probability", "metrics": {"inference_time", "total_time"}})에
+        batch_size·queue_ms·latency_ms를 더한 dict. 제때 못 받으면 SmartTurnUnavailable.
+        """
+        req = _Request(audio, call_id, self._clock())
+        with self._cond:
+            self.requests += 1
+            if self._closed:
+                self.fallbacks["closed"] += 1
+                raise SmartTurnUnavailable("closed")
+            if len(self._pending) >= self.max_queue:
+                self.fallbacks["queue_full"] += 1
+                raise SmartTurnUnavailable("queue_full", f"pending={len(self._pending)}")
+            self._pending.append(req)
+            self._cond.notify_all()
+
+        timeout = self.timeout_ms / 1000.0 if self.timeout_ms > 0 else None
+        if not req.done.wait(timeout):
+            with self._cond:
+                req.cancelled = True
+                try:
+                    self._pending.remove(req)
+                except ValueError:
+                    pass  # 이미 배치에 들어감 — 결과는 버린다
+                self.fallbacks["timeout"] += 1
+            raise SmartTurnUnavailable("timeout", f"{self.timeout_ms:.0f}ms")
+        if req.error is not None:
+            with self._cond:
+                self.fallbacks["error"] += 1
+            raise SmartTurnUnavailable("error", f"{type(req.error).__name__}: {req.error}")
+        return req.result  # type: ignore[return-value]
+
+    # ── 배치 ──
+
+    def _take_batch(self) -> List[_Request]:
+        """다음 배치 (cancelled 제외). 닫혔고 대기열이 비면 빈 목록."""
+        with self._cond:
+            while not self._pending and not self._closed:
+                self._cond.wait()
+            if not self._pending:
+                return []
+            deadline = self._pending[0].enqueued_at + self.batch_window_ms / 1000.0
+            while len(self._pending) < self.max_batch and not self._closed:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+        # 워커가 모두 바쁘면 여기서 기다리는 동안 들어온 요청도 같은 배치에 합쳐진다
+        self._slots.acquire()
+        with self._cond:
+            batch: List[_Request] = []
+            while self._pending and len(batch) < self.max_batch:
+                req = self._pending.popleft()
+                if not req.cancelled:
+                    batch.append(req)
+            if batch:
+                self.in_flight += len(batch)
+        if not batch:
+            self._slots.release()
+        return batch
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if batch:
+                self._executor.submit(self._run_batch, batch)
+                continue
+            with self._cond:
+                if self._closed and not self._pending:
+                    return
+
+    def _run_batch(self, batch: List[_Request]) -> None:
+        started = self._clock()
+        try:
+            probabilities = self._predict_batch([r.audio for r in batch])
+            if len(probabilities) != len(batch):
+                raise RuntimeError(f"predict_batch returned {len(probabilities)} for {len(batch)}")
+        except Exception as e:
+            logger.warning("smart_turn_batch_failed", batch_size=len(batch), error=str(e))
+            for req in batch:
+                req.error = e
+                req.done.set()
+            with self._cond:
+                self.in_flight -= len(batch)
+            self._slots.release()
+            return
+
+        finished = self._clock()
+        inference_sec = finished - started
+        with self._cond:
+            self.batches += 1
+            self.batched_requests += len(batch)
+            self.max_batch_seen = max(self.max_batch_seen, len(batch))
+            self.in_flight -= len(batch)
+            self._inference_ms.append(inference_sec * 1000.0)
+            for req, probability in zip(batch, probabilities):
+                probability = float(probability)
+                queue_ms = (started - req.enqueued_at) * 1000.0
+                latency_ms = (finished - req.enqueued_at) * 1000.0
+                req.result = {
+                    "prediction": 1 if probability > _COMPLETE_THRESHOLD else 0,
+                    "probability": probability,
+                    "metrics": {"inference_time": inference_sec, "total_time": finished - req.enqueued_at},
+                    "batch_size": len(batch),
+                    "queue_ms": queue_ms,
+                    "latency_ms": latency_ms,
+                }
+                if not req.cancelled:
+                    self.completed += 1
+                    self._latencies_ms.append(latency_ms)
+                    self._queue_wait_ms.append(queue_ms)
+        self._slots.release()
+        for req in batch:
+            req.done.set()
+
+    # ── 통계·종료 ──
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            lat = sorted(self._latencies_ms)
+            waits = list(self._queue_wait_ms)
+            infer = list(self._inference_ms)
+            pending = len(self._pending)
+            fallbacks = dict(self.fallbacks)
+
+            def _pct(p: float) -> float:
+                if not lat:
+                    return 0.0
+                return round(lat[min(len(lat) - 1, int(len(lat) * p))], 2)
+
+            return {
+                "workers": self.workers,
+                "max_batch": self.max_batch,
+                "batch_window_ms": self.batch_window_ms,
+                "queue_depth": pending,
+                "in_flight": self.in_flight,
+                "requests": self.requests,
+                "completed": self.completed,
+                "batches": self.batches,
+                "avg_batch_size": round(self.batched_requests / self.batches, 2) if self.batches else 0.0,
+                "max_batch_seen": self.max_batch_seen,
+                "vad_fallbacks": fallbacks,
+                "latency_ms_p50": _pct(0.5),
+                "latency_ms_p95": _pct(0.95),
+                "latency_ms_max": round(lat[-1], 2) if lat else 0.0,
+                "queue_wait_ms_avg": round(sum(waits) / len(waits), 2) if waits else 0.0,
+                "inference_ms_avg": round(sum(infer) / len(infer), 2) if infer else 0.0,
+            }
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._dispatcher.join(timeout=1.0)
+        self._executor.shutdown(wait=False)
+
+
+# ── Smart Turn v3 ONNX 모델 (pipecat 번들) ──
+
+
+def _fit_window(audio: np.ndarray) -> np.ndarray:
+    """마지막 8초만 남기거나 앞쪽을 0으로 채움 (LocalSmartTurnAnalyzerV3와 동일)."""
+    max_samples = _WINDOW_SECS * _SAMPLE_RATE
+    if len(audio) > max_samples:
+        return audio[-max_samples:]
+    if len(audio) < max_samples:
+        return np.pad(audio, (max_samples - len(audio), 0), mode="constant", constant_values=0)
+    return audio
+
+
+def load_smart_turn_batch_predictor(intra_op_threads: int = DEFAULT_INTRA_OP_THREADS) -> PredictBatch:
+    """
+    pipecat 번들 Smart Turn v3 모델을 한 번 로드하고 배치 추론 함수를 반환.
+
+    모델 로드·특징 추출은 LocalSmartTurnAnalyzerV3 인스턴스 1개를 재사용하고(cpu_count=intra-op 스레드),
+    배치 차원이 고정인 모델이면 첫 실패 이후 단건 추론을 차례로 수행한다.
+    """
+    from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
+
+    model = LocalSmartTurnAnalyzerV3(cpu_count=max(1, int(intra_op_threads)))
+    feature_extractor = model._feature_extractor
+    session = model._session
+    state = {"batched": True}
+
+    def _features(audios: List[np.ndarray]) -> np.ndarray:
+        inputs = feature_extractor(
+            [_fit_window(a) for a in audios],
+            sampling_rate=_SAMPLE_RATE,
+            return_tensors="np",
+            padding="max_length",
+            max_length=_WINDOW_SECS * _SAMPLE_RATE,
+            truncation=True,
+            do_normalize=True,
+        )
+        return inputs.input_features.astype(np.float32)
+
+    def predict_batch(audios: List[np.ndarray]) -> List[float]:
+        if state["batched"] and len(audios) > 1:
+            try:
+                outputs = session.run(None, {"input_features": _features(audios)})
+                return [float(p) for p in np.asarray(outputs[0]).reshape(len(audios), -1)[:, 0]]
+            except Exception as e:
+                state["batched"] = False
+                logger.warning("smart_turn_batch_unsupported_fallback_sequential", error=str(e))
+        return [float(model._predict_endpoint(a)["probability"]) for a in audios]
+
+    return predict_batch
+
+
+_server: Optional[SmartTurnInferenceServer] = None
+_server_failed = False
+_server_lock = threading.Lock()
+
+
+def get_smart_turn_inference_server() -> Optional[SmartTurnInferenceServer]:
+    """공용 서버 (첫 호출 시 모델 로드). 비활성이거나 로드 실패면 None — 호출부는 통화별 분석기로 폴백."""
+    global _server, _server_failed
+    if _server is not None or _server_failed or not shared_smart_turn_enabled():
+        return _server
+    with _server_lock:
+        if _server is None and not _server_failed:
+            t0 = time.perf_counter()
+            try:
+                predict_batch = load_smart_turn_batch_predictor(
+                    int(_env_number("SMART_TURN_INTRA_OP_THREADS", DEFAULT_INTRA_OP_THREADS))
+                )
+            except Exception as e:
+                _server_failed = True
+                logger.warning("smart_turn_shared_model_load_failed", error=str(e))
+                return None
+            _server = SmartTurnInferenceServer(
+                predict_batch,
+                batch_window_ms=_env_number("SMART_TURN_BATCH_WINDOW_MS", DEFAULT_BATCH_WINDOW_MS),
+                max_batch=int(_env_number("SMART_TURN_MAX_BATCH", DEFAULT_MAX_BATCH)),
+                workers=int(_env_number("SMART_TURN_WORKERS", DEFAULT_WORKERS)),
+                max_queue=int(_env_number("SMART_TURN_MAX_QUEUE", DEFAULT_MAX_QUEUE)),
+                timeout_ms=_env_number("SMART_TURN_TIMEOUT_MS", DEFAULT_TIMEOUT_MS),
+            )
+            logger.info(
+                "smart_turn_shared_model_loaded",
+                elapsed_ms=round((time.perf_counter() - t0) * 1000, 1),
+                workers=_server.workers,
+                max_batch=_server.max_batch,
+                batch_window_ms=_server.batch_window_ms,
+            )
+    return _server
+
+
+def get_smart_turn_stats() -> Dict[str, Any]:
+    """런타임 메트릭용 (모델을 로드하지 않음)."""
+    stats: Dict[str, Any] = {"enabled": shared_smart_turn_enabled(), "loaded": _server is not None}
+    if _server is not None:
+        stats.update(_server.get_stats())
+    elif _server_failed:
+        stats["load_failed"] = True
+    return stats
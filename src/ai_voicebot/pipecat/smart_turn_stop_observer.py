@@ -13,6 +13,10 @@ Story 7.1에서 실제 실행으로 확인했다.
 독립적으로 실행되므로, 이 관측 핸들러를 추가해도 기존 turn-stop 동작(사용자 턴 종료 트리거)에는
 전혀 영향을 주지 않는다(회귀 위험 없음).
 
+턴 분석기는 통화마다 LocalSmartTurnAnalyzerV3()를 만드는 대신 `create_smart_turn_analyzer()`로
+프로세스 공용 추론 서버(smart_turn_inference.py)를 쓰는 분석기를 받는다 — 같은 모델·같은 판단 기준이며,
+서버 포화 시에는 VAD 침묵 기준 종료로 폴백한다.
+
 관측 목적: 사용자가 "말하다가 쉬었다가 다시 말하는" 경우에도 이 모델이 실제로 잘 판단하는지
 (Epic 7, Story 7.2 설계 결정의 근거 데이터)를 실통화에서 파악하기 위함.
 """
@@ -32,9 +36,6 @@ def build_observed_smart_turn_stop_strategy(*, call_id: str = "") -> Optional[An
     (stop 미지정)으로 폴백해야 한다(기존 동작과 동일 보장).
     """
     try:
-        from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import (
-            LocalSmartTurnAnalyzerV3,
-        )
         from pipecat.turns.user_stop.turn_analyzer_user_turn_stop_strategy import (
             TurnAnalyzerUserTurnStopStrategy,
         )
@@ -43,7 +44,10 @@ def build_observed_smart_turn_stop_strategy(*, call_id: str = "") -> Optional[An
         return None
 
     try:
-        strategy = TurnAnalyzerUserTurnStopStrategy(turn_analyzer=LocalSmartTurnAnalyzerV3())
+        # 모델은 프로세스 공용 추론 서버 (SMART_TURN_SHARED=0 이면 통화별 LocalSmartTurnAnalyzerV3)
+        from src.ai_voicebot.pipecat.shared_smart_turn_analyzer import create_smart_turn_analyzer
+
+        strategy = TurnAnalyzerUserTurnStopStrategy(turn_analyzer=create_smart_turn_analyzer(call_id=call_id))
     except Exception as e:
         logger.warning("smart_turn_stop_strategy_build_failed", error=str(e), call_id=call_id)
         return None
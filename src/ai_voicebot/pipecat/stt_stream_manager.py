@@ -0,0 +1,481 @@
+"""
+Google STT 스트리밍 세션 관리자 (사전 연결·회전·언어별 대기 스트림 풀).
+
+Pipecat GoogleSTTService는 대기열에 오디오가 들어온 뒤에야 streaming_recognize를 열고,
+스트림이 끝나면(무음 10초 Aborted·오류·4분 한도) 다음 오디오가 올 때 다시 연다.
+그래서 인사 직후 첫 발화와 긴 침묵 뒤 발화는 스트림 설정(RPC 핸드셰이크 + 설정 요청) 시간을 기다렸다.
+
+- SttStreamManager: 설정(언어·모델·샘플레이트·리전·클라이언트)별 키마다 설정 요청까지 보낸
+  대기 스트림을 pool_size개 유지한다. 해당 키를 쓰는 통화가 있을 때만 채우며, 무음 Aborted 전에
+  standby_ttl_sec가 지나면 버리고 다시 연다.
+- SttStreamSession: 통화 1건의 오디오 대기열을 현재 스트림으로 흘려보낸다. 시작 즉시(StartFrame, 인사
+  재생 전) 스트림을 확보하고, 스트림이 끝나면 오디오를 기다리지 않고 바로 다음 스트림으로 넘어간다.
+  한도(max_stream_sec) rotate_margin_sec 전부터 발화가 끝난 시점에 미리 열린 스트림으로 교체하며,
+  마지막 overlap_ms 오디오를 새 스트림에 먼저 보내 경계의 음절이 잘리지 않게 한다.
+- 턴마다 스트림 설정 시간(stream_setup_ms)과 오디오가 스트림을 기다린 시간(audio_wait_ms)을 로그로 남긴다.
+
+pipecat·google 의존은 호출부(PrewarmedGoogleSTTService)가 넘기는 SttStreamSpec 콜러블에만 있다.
+
+환경변수:
+  STT_STREAM_MANAGER=0           Pipecat 기본 GoogleSTTService (기존 동작)
+  STT_STREAM_POOL_SIZE           키별 대기 스트림 수 (기본 1, 0이면 풀 없이 통화 시작 시 사전 연결만)
+  STT_STREAM_STANDBY_TTL_SEC     대기 스트림 수명 (기본 8, Google 무음 Aborted 10초 전)
+  STT_STREAM_MAX_SEC             스트림 최대 길이 (기본 240 = Pipecat STREAMING_LIMIT)
+  STT_STREAM_ROTATE_MARGIN_SEC   한도 몇 초 전부터 교체할지 (기본 20)
+  STT_STREAM_OVERLAP_MS          교체 시 새 스트림에 다시 보낼 오디오 (기본 300)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_POOL_SIZE = 1
+DEFAULT_STANDBY_TTL_SEC = 8.0
+DEFAULT_MAX_STREAM_SEC = 240.0
+DEFAULT_ROTATE_MARGIN_SEC = 20.0
+DEFAULT_OVERLAP_MS = 300.0
+# 발화 중이라 교체를 미뤄도 한도 이 시간 전에는 강제 교체
+_FORCE_ROTATE_MARGIN_SEC = 5.0
+# 오디오 대기 중 스트림 종료·교체 시점 확인 주기
+_POLL_SEC = 0.2
+_RETRY_DELAY_SEC = 1.0
+_SAMPLE_WINDOW = 200
+
+_stream_ids = itertools.count(1)
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def stt_stream_manager_enabled() -> bool:
+    return os.environ.get("STT_STREAM_MANAGER", "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+@dataclass
+class SttStreamSpec:
+    """
+    스트림을 여는 방법 (같은 key의 스트림은 통화 간에 바꿔 써도 된다).
+
+    Attributes:
+        key: 언어·모델·샘플레이트·리전·클라이언트를 구분하는 풀 키
+        open_call: 요청 async iterator를 받아 응답 async iterator를 돌려주는 코루틴 함수
+            (예: lambda reqs: client.streaming_recognize(requests=reqs))
+        first_request: 스트림 첫 요청 (recognizer + streaming_config)
+        audio_request: 오디오 bytes → 요청 객체
+    """
+
+    key: str
+    open_call: Callable[[AsyncIterator[Any]], Awaitable[Any]]
+    first_request: Any
+    audio_request: Callable[[bytes], Any]
+
+
+class SttStream:
+    """열린 streaming_recognize 호출 1개. send()로 오디오, close()로 half-close."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.stream_id = next(_stream_ids)
+        self.responses: Any = None
+        self.requested_at = time.monotonic()
+        self.ready_at: Optional[float] = None
+        self.setup_ms = 0.0
+        self.prewarmed = False
+        self.closed = False
+        self._queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()
+
+    async def requests(self, spec: SttStreamSpec) -> AsyncIterator[Any]:
+        yield spec.first_request
+        while True:
+            audio = await self._queue.get()
+            if audio is None:
+                return
+            yield spec.audio_request(audio)
+
+    @property
+    def age_sec(self) -> float:
+        return time.monotonic() - (self.ready_at or self.requested_at)
+
+    def send(self, audio: bytes) -> None:
+        if not self.closed:
+            self._queue.put_nowait(audio)
+
+    def close(self) -> None:
+        """요청 스트림 종료 — 서버는 받은 오디오의 최종 결과를 보낸 뒤 응답 스트림을 닫는다."""
+        if not self.closed:
+            self.closed = True
+            self._queue.put_nowait(None)
+
+    def cancel(self) -> None:
+        """결과가 필요 없는 스트림(만료된 대기 스트림 등)을 즉시 끊는다."""
+        self.close()
+        cancel = getattr(self.responses, "cancel", None)
+        if callable(cancel):
+            try:
+                cancel()
+            except Exception:
+                pass
+
+
+class SttStreamManager:
+    """프로세스 공용 대기 스트림 풀과 스트림 설정 통계."""
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        standby_ttl_sec: float = DEFAULT_STANDBY_TTL_SEC,
+    ) -> None:
+        self.pool_size = max(0, int(pool_size))
+        self.standby_ttl_sec = float(standby_ttl_sec)
+        self._specs: Dict[str, SttStreamSpec] = {}
+        self._users: Dict[str, int] = {}
+        self._standby: Dict[str, List[SttStream]] = {}
+        self._filling: Dict[str, int] = {}
+        self._tasks: set = set()
+        self.opened = 0
+        self.open_failures = 0
+        self.pool_hits = 0
+        self.pool_misses = 0
+        self.expired_standby = 0
+        self.rotations = 0
+        self.stream_ends = 0
+        self._setup_ms: Deque[float] = deque(maxlen=_SAMPLE_WINDOW)
+        self._acquire_ms: Deque[float] = deque(maxlen=_SAMPLE_WINDOW)
+
+    # ── 사용 등록 (사용 중인 키만 대기 스트림 유지) ──
+
+    def register(self, spec: SttStreamSpec) -> None:
+        self._specs[spec.key] = spec
+        self._users[spec.key] = self._users.get(spec.key, 0) + 1
+        self._schedule_fill(spec.key)
+
+    def unregister(self, key: str) -> None:
+        remaining = self._users.get(key, 0) - 1
+        if remaining > 0:
+            self._users[key] = remaining
+            return
+        self._users.pop(key, None)
+        self._specs.pop(key, None)
+        for stream in self._standby.pop(key, []):
+            stream.cancel()
+
+    # ── 스트림 확보 ──
+
+    async def acquire(self, spec: SttStreamSpec) -> SttStream:
+        """대기 스트림이 있으면 즉시, 없으면 새로 열어 반환 (어느 쪽이든 풀을 다시 채운다)."""
+        t0 = time.monotonic()
+        stream = self._pop_standby(spec.key)
+        if stream is not None:
+            self.pool_hits += 1
+        else:
+            self.pool_misses += 1
+            stream = await self._open(spec)
+        self._acquire_ms.append((time.monotonic() - t0) * 1000)
+        self._schedule_fill(spec.key)
+        return stream
+
+    def _pop_standby(self, key: str) -> Optional[SttStream]:
+        pool = self._standby.get(key)
+        while pool:
+            stream = pool.pop(0)
+            if stream.age_sec < self.standby_ttl_sec and not stream.closed:
+                return stream
+            self.expired_standby += 1
+            stream.cancel()
+        return None
+
+    async def _open(self, spec: SttStreamSpec) -> SttStream:
+        stream = SttStream(spec.key)
+        try:
+            stream.responses = await spec.open_call(stream.requests(spec))
+        except Exception:
+            self.open_failures += 1
+            raise
+        stream.ready_at = time.monotonic()
+        stream.setup_ms = (stream.ready_at - stream.requested_at) * 1000
+        self.opened += 1
+        self._setup_ms.append(stream.setup_ms)
+        return stream
+
+    def _schedule_fill(self, key: str) -> None:
+        if key not in self._users:
+            return
+        missing = self.pool_size - len(self._standby.get(key, [])) - self._filling.get(key, 0)
+        for _ in range(max(0, missing)):
+            self._filling[key] = self._filling.get(key, 0) + 1
+            task = asyncio.ensure_future(self._fill(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fill(self, key: str) -> None:
+        try:
+            spec = self._specs.get(key)
+            if spec is None:
+                return
+            try:
+                stream = await self._open(spec)
+            except Exception as e:
+                logger.warning("stt_standby_stream_open_failed", key=key, error=str(e))
+                return
+            if key not in self._users:
+                stream.cancel()
+                return
+            stream.prewarmed = True
+            self._standby.setdefault(key, []).append(stream)
+            asyncio.get_running_loop().call_later(self.standby_ttl_sec, self._expire, key, stream)
+        finally:
+            self._filling[key] = max(0, self._filling.get(key, 1) - 1)
+
+    def _expire(self, key: str, stream: SttStream) -> None:
+        pool = self._standby.get(key)
+        if pool and stream in pool:
+            pool.remove(stream)
+            self.expired_standby += 1
+            stream.cancel()
+            self._schedule_fill(key)
+
+    # ── 통계 ──
+
+    def get_stats(self) -> Dict[str, Any]:
+        def _pct(values: Deque[float], p: float) -> float:
+            ordered = sorted(values)
+            if not ordered:
+                return 0.0
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))], 2)
+
+        acquisitions = self.pool_hits + self.pool_misses
+        return {
+            "pool_size": self.pool_size,
+            "standby_ttl_sec": self.standby_ttl_sec,
+            "active_keys": len(self._users),
+            "standby": sum(len(v) for v in self._standby.values()),
+            "opened": self.opened,
+            "open_failures": self.open_failures,
+            "pool_hits": self.pool_hits,
+            "pool_misses": self.pool_misses,
+            "pool_hit_rate": round(self.pool_hits / acquisitions, 3) if acquisitions else 0.0,
+            "expired_standby": self.expired_standby,
+            "rotations": self.rotations,
+            "stream_ends": self.stream_ends,
+            "setup_ms_p50": _pct(self._setup_ms, 0.5),
+            "setup_ms_p95": _pct(self._setup_ms, 0.95),
+            "acquire_ms_p50": _pct(self._acquire_ms, 0.5),
+            "acquire_ms_p95": _pct(self._acquire_ms, 0.95),
+        }
+
+
+class SttStreamSession:
+    """
+    통화 1건의 STT 스트림 수명 관리.
+
+    Args:
+        manager: 공용 SttStreamManager
+        spec: 이 통화의 스트림 설정
+        audio_queue: 서비스 run_stt가 오디오 bytes를 넣는 대기열
+        process_responses: 응답 iterator를 소비하며 전사 프레임을 내보내는 코루틴 함수
+        is_quiet: 진행 중인 중간 전사가 없으면 True (교체 시점 판단)
+        on_switch: 새 스트림으로 바뀔 때 호출 (서비스 내부 상태 동기화)
+        sample_rate: 16bit mono PCM 샘플레이트 (overlap 길이 계산)
+    """
+
+    def __init__(
+        self,
+        manager: SttStreamManager,
+        spec: SttStreamSpec,
+        audio_queue: "asyncio.Queue[bytes]",
+        process_responses: Callable[[Any], Awaitable[None]],
+        *,
+        is_quiet: Callable[[], bool] = lambda: True,
+        on_switch: Optional[Callable[[SttStream], None]] = None,
+        sample_rate: int = 16000,
+        call_id: str = "",
+        max_stream_sec: Optional[float] = None,
+        rotate_margin_sec: Optional[float] = None,
+        overlap_ms: Optional[float] = None,
+    ) -> None:
+        self._manager = manager
+        self._spec = spec
+        self._audio_queue = audio_queue
+        self._process_responses = process_responses
+        self._is_quiet = is_quiet
+        self._on_switch = on_switch
+        self._call_id = call_id
+        self.max_stream_sec = (
+            _env_number("STT_STREAM_MAX_SEC", DEFAULT_MAX_STREAM_SEC) if max_stream_sec is None else max_stream_sec
+        )
+        self.rotate_margin_sec = (
+            _env_number("STT_STREAM_ROTATE_MARGIN_SEC", DEFAULT_ROTATE_MARGIN_SEC)
+            if rotate_margin_sec is None
+            else rotate_margin_sec
+        )
+        overlap = _env_number("STT_STREAM_OVERLAP_MS", DEFAULT_OVERLAP_MS) if overlap_ms is None else overlap_ms
+        self._overlap_bytes = int(sample_rate * 2 * overlap / 1000)
+        self._overlap: Deque[bytes] = deque()
+        self._overlap_len = 0
+        self.current: Optional[SttStream] = None
+        self._response_tasks: Dict[int, "asyncio.Task[None]"] = {}
+        self.rotations = 0
+        self.stream_ends = 0
+        self._pending_wait_ms = 0.0
+        self._turns = 0
+
+    # ── 실행 ──
+
+    async def run(self) -> None:
+        self._manager.register(self._spec)
+        # wait_for(queue.get())는 get 완료와 취소가 겹치면 취소를 삼킨다 (3.11) — get 태스크를 유지하며 asyncio.wait 사용
+        getter: Optional["asyncio.Task[bytes]"] = None
+        try:
+            await self._switch("start")
+            while True:
+                if getter is None:
+                    getter = asyncio.ensure_future(self._audio_queue.get())
+                done, _ = await asyncio.wait({getter}, timeout=_POLL_SEC)
+                audio: Optional[bytes] = None
+                if getter in done:
+                    audio = getter.result()
+                    getter = None
+                if self._current_ended():
+                    self.stream_ends += 1
+                    self._manager.stream_ends += 1
+                    await self._switch("stream_ended")
+                elif self._should_rotate():
+                    self.rotations += 1
+                    self._manager.rotations += 1
+                    await self._switch("rotate")
+                if audio is not None:
+                    self._remember(audio)
+                    self.current.send(audio)
+                    self._audio_queue.task_done()
+        finally:
+            if getter is not None:
+                getter.cancel()
+            self._shutdown()
+
+    def _current_ended(self) -> bool:
+        task = self._response_tasks.get(self.current.stream_id) if self.current else None
+        return task is None or task.done()
+
+    def _should_rotate(self) -> bool:
+        age = self.current.age_sec
+        if age >= self.max_stream_sec - min(_FORCE_ROTATE_MARGIN_SEC, self.rotate_margin_sec / 2):
+            return True
+        return age >= self.max_stream_sec - self.rotate_margin_sec and self._is_quiet()
+
+    async def _switch(self, reason: str) -> None:
+        """새 스트림 확보 → overlap 오디오 재전송 → 이전 스트림 half-close (결과 소비는 끝까지 계속)."""
+        t0 = time.monotonic()
+        while True:
+            try:
+                stream = await self._manager.acquire(self._spec)
+                break
+            except Exception as e:
+                logger.warning("stt_stream_open_failed", call_id=self._call_id, reason=reason, error=str(e))
+                await asyncio.sleep(_RETRY_DELAY_SEC)
+        wait_ms = (time.monotonic() - t0) * 1000
+        # 통화 시작·스트림 종료 직후 오디오는 새 스트림이 준비될 때까지 대기열에서 기다린다
+        if reason != "rotate":
+            self._pending_wait_ms += wait_ms
+        previous = self.current
+        for chunk in self._overlap:
+            stream.send(chunk)
+        self.current = stream
+        self._response_tasks[stream.stream_id] = asyncio.ensure_future(self._consume(stream))
+        if previous is not None:
+            previous.close()
+        if self._on_switch is not None:
+            self._on_switch(stream)
+        logger.info(
+            "stt_stream_acquired",
+            call_id=self._call_id,
+            reason=reason,
+            stream_id=stream.stream_id,
+            prewarmed=stream.prewarmed,
+            stream_setup_ms=round(stream.setup_ms, 1),
+            acquire_ms=round(wait_ms, 1),
+            previous_age_sec=round(previous.age_sec, 1) if previous else None,
+            overlap_bytes=self._overlap_len if previous else 0,
+        )
+
+    async def _consume(self, stream: SttStream) -> None:
+        try:
+            await self._process_responses(stream.responses)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 무음 Aborted·오류 — run()이 다음 루프에서 다른 스트림으로 넘어간다
+            logger.debug("stt_stream_ended", call_id=self._call_id, stream_id=stream.stream_id, error=str(e))
+        finally:
+            self._response_tasks.pop(stream.stream_id, None)
+
+    def _remember(self, audio: bytes) -> None:
+        if self._overlap_bytes <= 0:
+            return
+        self._overlap.append(audio)
+        self._overlap_len += len(audio)
+        while self._overlap and self._overlap_len - len(self._overlap[0]) >= self._overlap_bytes:
+            self._overlap_len -= len(self._overlap.popleft())
+
+    # ── 턴 보고 ──
+
+    def report_turn(self) -> Dict[str, Any]:
+        """최종 전사 1건마다 호출 — 이 턴이 스트림 설정 때문에 기다린 시간을 로그로 남긴다."""
+        stream = self.current
+        self._turns += 1
+        report = {
+            "call_id": self._call_id,
+            "turn": self._turns,
+            "stream_id": stream.stream_id if stream else None,
+            "prewarmed": stream.prewarmed if stream else False,
+            "stream_setup_ms": round(stream.setup_ms, 1) if stream else 0.0,
+            "audio_wait_ms": round(self._pending_wait_ms, 1),
+            "stream_age_sec": round(stream.age_sec, 1) if stream else 0.0,
+            "rotations": self.rotations,
+            "stream_ends": self.stream_ends,
+        }
+        self._pending_wait_ms = 0.0
+        logger.info("stt_turn_stream_setup", **report)
+        return report
+
+    def _shutdown(self) -> None:
+        if self.current is not None:
+            self.current.cancel()
+        for task in list(self._response_tasks.values()):
+            task.cancel()
+        self._response_tasks.clear()
+        self._manager.unregister(self._spec.key)
+
+
+_manager: Optional[SttStreamManager] = None
+
+
+def get_stt_stream_manager() -> SttStreamManager:
+    global _manager
+    if _manager is None:
+        _manager = SttStreamManager(
+            pool_size=int(_env_number("STT_STREAM_POOL_SIZE", DEFAULT_POOL_SIZE)),
+            standby_ttl_sec=_env_number("STT_STREAM_STANDBY_TTL_SEC", DEFAULT_STANDBY_TTL_SEC),
+        )
+    return _manager
+
+
+def get_stt_stream_stats() -> Dict[str, Any]:
+    """런타임 메트릭용."""
+    stats: Dict[str, Any] = {"enabled": stt_stream_manager_enabled()}
+    if _manager is not None:
+        stats.update(_manager.get_stats())
+    return stats
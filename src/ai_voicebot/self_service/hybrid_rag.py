@@ -16,6 +16,7 @@ from typing import Any, List
 
 import structlog
 
+from src.ai_voicebot.knowledge.vector_store_gateway import get_vector_store_gateway
 from src.ai_voicebot.self_service import settings_catalog
 from src.ai_voicebot.self_service.knowledge_documents import KNOWLEDGE_DOCUMENT_DOC_TYPE
 from src.ai_voicebot.self_service.manual_indexer import SELF_SERVICE_MANUAL_DOC_TYPE
@@ -75,7 +76,8 @@ async def search_hybrid_multi_domain(
             ]
         }
         try:
-            raw = await asyncio.to_thread(
+            raw = await get_vector_store_gateway().run(
+                "query",
                 vector_db.query,
                 query_embeddings=[query_embedding],
                 n_results=top_k_per_domain,
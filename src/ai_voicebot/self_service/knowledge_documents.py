@@ -75,7 +75,7 @@ def _index_pairs(
                     cur_meta = ((current.get("metadatas") or [{}])[0]) or {}
                     cur_meta["section_title"] = section_title
                     cur_meta["related_domain"] = related_domain
-                    vector_db.collection.update(ids=[doc_id], metadatas=[cur_meta])
+                    vector_db.write("update", [doc_id], metadatas=[cur_meta])
                 except Exception as e:
                     logger.warning(
                         "knowledge_document_meta_update_failed", doc_id=doc_id, error=str(e)
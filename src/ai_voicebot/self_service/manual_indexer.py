@@ -254,7 +254,7 @@ def index_self_service_manual(
                     cur_meta = ((current.get("metadatas") or [{}])[0]) or {}
                     cur_meta["section_title"] = extra.get("section_title", "")
                     cur_meta["related_domain"] = extra.get("related_domain", "")
-                    vector_db.collection.update(ids=[doc_id], metadatas=[cur_meta])
+                    vector_db.write("update", [doc_id], metadatas=[cur_meta])
                 except Exception as e:
                     logger.warning(
                         "manual_index_meta_update_failed",
@@ -175,9 +175,10 @@ async def _get_general(owner: str) -> Dict[str, Any]:
 
 # ── integrations 도메인 (Google Calendar 연동) ──────────────────────────────
 async def _get_integrations(owner: str) -> Dict[str, Any]:
+    from src.common.sqlite_pool import to_thread as _db_to_thread
     from src.services import gcal_service
 
-    return gcal_service.get_oauth_status(owner)
+    return await _db_to_thread(gcal_service.get_oauth_status, owner)
 
 
 # ── 변경 함수 (Story 1.8) ───────────────────────────────────────────────────
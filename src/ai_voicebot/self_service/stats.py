@@ -33,6 +33,8 @@ from typing import Any, Dict, List, Optional, Set
 
 import structlog
 
+from src.common.call_data_record_logger import call_data_record_log_paths
+
 logger = structlog.get_logger(__name__)
 
 SUPPORTED_PERIODS = ("week", "month")
@@ -64,15 +66,13 @@ def _recordings_root() -> Path:
 
 
 def _daily_log_paths(since_dt: datetime) -> List[Path]:
-    """since_dt부터 오늘까지 날짜별 call_data_record_YYYYMMDD.log 경로 목록(존재 파일만)."""
+    """since_dt부터 오늘까지 날짜별 call_data_record_YYYYMMDD.log 경로 목록(존재 파일만, 크기 회전분 포함)."""
     log_dir = _PROJECT_ROOT / "logs"
     paths: List[Path] = []
     day = since_dt.date()
     today = datetime.now(timezone.utc).date()
     while day <= today:
-        p = log_dir / f"call_data_record_{day.strftime('%Y%m%d')}.log"
-        if p.exists():
-            paths.append(p)
+        paths.extend(call_data_record_log_paths(log_dir, day.strftime("%Y%m%d")))
         day += timedelta(days=1)
     return paths
 
@@ -16,10 +16,12 @@ from fastapi import APIRouter, Body, HTTPException, Query
 from fastapi.responses import FileResponse, PlainTextResponse
 from pydantic import BaseModel
 
+from src.common.call_data_record_index import read_call_data_records
 from src.common.call_insights_buffer import (
     load_call_insights_for_directory,
     resolve_callee_summary_for_list_item as _resolve_ai_flag,
 )
+from src.common.recordings_catalog import get_recordings_catalog
 from src.common.sip_owner import normalize_owner_username
 from src.common.caller_needle import caller_match_needle as _caller_match_needle
 
@@ -134,6 +136,9 @@ def _load_metadata_rows(root: Path) -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
     if not root.is_dir():
         return rows
+    catalog = get_recordings_catalog(root)
+    if catalog is not None:
+        return catalog.metadata_rows()
     for sub in root.iterdir():
         if not sub.is_dir() or sub.name.startswith("."):
             continue
@@ -172,6 +177,9 @@ def _find_call_dir(call_id: str) -> Optional[Path]:
     root = _recordings_root()
     if not root.is_dir():
         return None
+    catalog = get_recordings_catalog(root)
+    if catalog is not None:
+        return catalog.find_call_dir(str(call_id))
     for sub in root.iterdir():
         if not sub.is_dir() or sub.name.startswith("."):
             continue
@@ -189,38 +197,11 @@ def _find_call_dir(call_id: str) -> Optional[Path]:
 
 
 def _scan_call_data_record_for_call(call_id: str, max_items: int) -> Tuple[List[Dict[str, Any]], bool]:
-    """`logs/call_data_record_*.log` 에서 해당 call_id 행만 수집 (시간순 정렬)."""
+    """`logs/call_data_record_*.log` 에서 해당 call_id 행만 수집 (시간순 정렬, call_id 색인으로 seek)."""
     log_dir = _logs_dir()
     if not log_dir.is_dir():
         return [], False
-    files = sorted(log_dir.glob("call_data_record_*.log"), reverse=True)
-    out: List[Dict[str, Any]] = []
-    truncated = False
-    want = str(call_id)
-    for path in files:
-        if len(out) >= max_items:
-            truncated = True
-            break
-        try:
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                for line in f:
-                    if len(out) >= max_items:
-                        truncated = True
-                        break
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        obj = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    if str(obj.get("call_id") or "") != want:
-                        continue
-                    out.append(obj)
-        except OSError:
-            continue
-    out.sort(key=lambda x: str(x.get("ts") or ""))
-    return out, truncated
+    return read_call_data_records(log_dir, str(call_id), max_items)
 
 
 def _recording_flags(call_dir: Path, meta: Dict[str, Any]) -> Dict[str, bool]:
@@ -410,6 +410,7 @@ async def get_knowledge_list(
     try:
         # ChromaDB에서 조회 (미초기화 시 lazy init 시도 — API 단독 실행 시에도 목록 노출)
         from src.ai_voicebot.knowledge.chromadb_client import get_vector_db, get_chromadb_client
+        from src.ai_voicebot.knowledge.vector_store_gateway import get_vector_store_gateway
 
         vector_db = get_vector_db()
         if not vector_db:
@@ -434,7 +435,9 @@ async def get_knowledge_list(
         
         # 테넌트 필터로 모든 지식 조회 (owner는 확장자 1004 형태로 저장됨)
         owner_filter = _tenant_id_to_owner(tenant_id)
-        raw = vector_db.get(
+        raw = await get_vector_store_gateway().run(
+            "get",
+            vector_db.get,
             where={"owner": owner_filter},
             limit=1000,
         )
@@ -443,7 +446,7 @@ async def get_knowledge_list(
         metadatas = raw.get("metadatas", [])
         # 진단: 목록이 비었을 때 컬렉션 전체가 비었는지, 해당 tenant만 없는지 구분
         if len(ids) == 0:
-            raw_any = vector_db.get(where=None, limit=1)
+            raw_any = await get_vector_store_gateway().run("get", vector_db.get, where=None, limit=1)
             total_in_collection = len(raw_any.get("ids", []))
             if total_in_collection == 0:
                 logger.info("knowledge_list_empty_reason", reason="collection_empty", tenant_id=tenant_id, owner_filter=owner_filter,
@@ -521,6 +524,7 @@ async def get_knowledge_debug(tenant_id: str):
         get_chromadb_client,
         get_chroma_persist_path,
     )
+    from src.ai_voicebot.knowledge.vector_store_gateway import get_vector_store_gateway
     owner_filter = _tenant_id_to_owner(tenant_id)
     chroma_path = get_chroma_persist_path()
     result = {
@@ -542,9 +546,11 @@ async def get_knowledge_debug(tenant_id: str):
                 pass
         if vector_db:
             result["vector_db_available"] = True
-            raw_any = vector_db.get(where=None, limit=10000)
+            raw_any = await get_vector_store_gateway().run("get", vector_db.get, where=None, limit=10000)
             result["total_in_collection"] = len(raw_any.get("ids", []))
-            raw_owner = vector_db.get(where={"owner": owner_filter}, limit=10000)
+            raw_owner = await get_vector_store_gateway().run(
+                "get", vector_db.get, where={"owner": owner_filter}, limit=10000
+            )
             result["total_for_owner"] = len(raw_owner.get("ids", []))
     except Exception as e:
         result["error"] = str(e)
@@ -559,6 +565,8 @@ async def create_knowledge_item(body: KnowledgeCreate):
     """
     try:
         from src.ai_voicebot.knowledge.chromadb_client import get_vector_db, get_chromadb_client
+        from src.ai_voicebot.knowledge.help_cache import get_help_cache
+        from src.ai_voicebot.knowledge.vector_store_gateway import get_vector_store_gateway
         from src.ai_voicebot.knowledge.embedder import get_text_embedder
 
         vector_db = get_vector_db()
@@ -573,7 +581,7 @@ async def create_knowledge_item(body: KnowledgeCreate):
                 if "collections.topic" in err_msg:
                     hint = " [해결: pip install 'chromadb>=0.5.0' 또는 data/chroma 삭제 후 재시작. docs/reports/CHROMA_COLLECTIONS_TOPIC_ERROR.md]"
                 logger.warning(f"ChromaDB lazy init failed (knowledge create): {init_err}{hint}")
-        embedder = get_text_embedder()
+        embedder = get_text_embedder(consumer="api")
         if not vector_db or not embedder:
             raise HTTPException(
                 status_code=503,
@@ -593,12 +601,15 @@ async def create_knowledge_item(body: KnowledgeCreate):
             "call_id": body.call_id or "",
             "created_at": datetime.now().isoformat(),
         }
-        vector_db.add(
+        await get_vector_store_gateway().run(
+            "upsert",
+            vector_db.add,
             ids=[doc_id],
             embeddings=[embedding],
             documents=[body.text],
             metadatas=[metadata],
         )
+        get_help_cache().notify_knowledge_changed(owner)
         logger.info(f"Knowledge item created: id={doc_id}, owner={owner}, category={body.category}")
         return KnowledgeItem(
             id=doc_id,
@@ -632,6 +643,7 @@ async def get_knowledge_stats(
     """
     try:
         from src.ai_voicebot.knowledge.chromadb_client import get_vector_db, get_chromadb_client
+        from src.ai_voicebot.knowledge.vector_store_gateway import get_vector_store_gateway
 
         vector_db = get_vector_db()
         if not vector_db:
@@ -656,7 +668,9 @@ async def get_knowledge_stats(
         
         # 모든 지식 조회 (owner는 확장자 형태로 저장됨)
         owner_filter = _tenant_id_to_owner(tenant_id)
-        raw = vector_db.get(where={"owner": owner_filter}, limit=10000)
+        raw = await get_vector_store_gateway().run(
+            "get", vector_db.get, where={"owner": owner_filter}, limit=10000
+        )
         ids = raw.get("ids", [])
         metadatas = raw.get("metadatas", [])
         total_knowledge = len(ids)
@@ -728,6 +742,7 @@ async def search_knowledge(request: KnowledgeSearchRequest):
     """
     try:
         from src.ai_voicebot.knowledge.chromadb_client import get_vector_db, get_chromadb_client
+        from src.ai_voicebot.knowledge.vector_store_gateway import get_vector_store_gateway
         from src.ai_voicebot.knowledge.embedder import get_text_embedder
 
         vector_db = get_vector_db()
@@ -738,7 +753,7 @@ async def search_knowledge(request: KnowledgeSearchRequest):
                 vector_db = get_vector_db()
             except Exception:
                 pass
-        embedder = get_text_embedder()
+        embedder = get_text_embedder(consumer="api")
         
         if not vector_db or not embedder:
             return KnowledgeSearchResponse(
@@ -759,7 +774,9 @@ async def search_knowledge(request: KnowledgeSearchRequest):
         
         # 벡터 검색 (owner는 확장자 형태로 저장됨)
         owner_filter = _tenant_id_to_owner(request.tenant_id)
-        raw = vector_db.query(
+        raw = await get_vector_store_gateway().run(
+            "query",
+            vector_db.query,
             query_embeddings=query_embedding,
             n_results=request.top_k,
             where={"owner": owner_filter}
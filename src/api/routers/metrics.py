@@ -57,25 +57,25 @@ def _get_avg_confidence_today(owner: str) -> float:
     """오늘 통화의 평균 AI 신뢰도 (logs/call_data_record_*.log 분석)."""
     try:
         today_str = datetime.now().strftime("%Y%m%d")
-        log_path = Path("logs") / f"call_data_record_{today_str}.log"
-        if not log_path.exists():
-            return 0.0
+        from src.common.call_data_record_logger import call_data_record_log_paths
 
         confidences = []
-        with open(log_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                    # llm_response_generated 이벤트에서 confidence 추출
-                    if obj.get("event") == "llm_response_generated" and "confidence" in obj:
-                        conf = float(obj["confidence"])
-                        if 0 <= conf <= 1:
-                            confidences.append(conf)
-                except (json.JSONDecodeError, ValueError, KeyError):
-                    continue
+        # 크기 회전분(.1.log, ...) 포함
+        for log_path in call_data_record_log_paths(Path("logs"), today_str):
+            with open(log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        obj = json.loads(line)
+                        # llm_response_generated 이벤트에서 confidence 추출
+                        if obj.get("event") == "llm_response_generated" and "confidence" in obj:
+                            conf = float(obj["confidence"])
+                            if 0 <= conf <= 1:
+                                confidences.append(conf)
+                    except (json.JSONDecodeError, ValueError, KeyError):
+                        continue
 
         if not confidences:
             return 0.0
@@ -117,22 +117,9 @@ def _count_unresolved_calls(owner: str) -> int:
                     rec_dir_raw = it.get("recordings_dir") or ""
                     call_dir = Path(rec_dir_raw) if rec_dir_raw else None
                     if call_dir is None or not call_dir.is_dir():
-                        # recordings root에서 call_id로 탐색
-                        for sub in root.iterdir():
-                            if not sub.is_dir():
-                                continue
-                            meta_p = sub / "metadata.json"
-                            if not meta_p.is_file():
-                                continue
-                            try:
-                                import json as _json
-                                with open(meta_p, "r", encoding="utf-8") as f:
-                                    meta = _json.load(f)
-                                if str(meta.get("call_id") or "") == cid:
-                                    call_dir = sub
-                                    break
-                            except Exception:
-                                continue
+                        # recordings root에서 call_id로 탐색 (녹음 카탈로그 조회)
+                        from src.api.routers.call_history import _find_call_dir
+                        call_dir = _find_call_dir(cid)
                     if call_dir and call_dir.is_dir():
                         insights = load_call_insights_for_directory(call_dir)
                         if insights and "is_unresolved" in insights:
@@ -154,22 +141,12 @@ def _count_unresolved_calls(owner: str) -> int:
             return 0
         want = normalize_owner_username(owner) if owner else ""
         count = 0
-        for sub in root.iterdir():
-            if not sub.is_dir() or sub.name.startswith("."):
-                continue
-            meta_p = sub / "metadata.json"
-            if not meta_p.is_file():
-                continue
-            try:
-                import json as _json
-                with open(meta_p, "r", encoding="utf-8") as f:
-                    meta = _json.load(f)
-            except Exception:
-                continue
+        from src.api.routers.call_history import _load_metadata_rows, _owner_matches_row
+        for meta in _load_metadata_rows(root):
             if owner:
-                from src.api.routers.call_history import _owner_matches_row
                 if not _owner_matches_row(owner, str(meta.get("callee_id") or ""), str(meta.get("caller_id") or "")):
                     continue
+            sub = Path(meta["_call_dir"])
             insights = load_call_insights_for_directory(sub)
             if insights and insights.get("is_unresolved"):
                 count += 1
@@ -236,3 +213,56 @@ async def get_dashboard_metrics(
         "knowledge_base_size": _get_knowledge_base_size(owner),
         "unresolved_calls_count": _count_unresolved_calls(owner),
     }
+
+
+@router.get("/runtime")
+async def get_runtime_metrics() -> Dict[str, Any]:
+    """
+    AI 런타임 공유 자원 메트릭 (운영 진단용)
+
+    Returns:
+        {
+            "embedders": [{"model_name", "backend", "load_time_ms", "warmup_ms", "consumers": {...}}],
+            "lexical_index": {"owners": 1, "documents": {"1004": 120}},
+            "vector_store": {"workers": 4, "queue_depth": 0, "in_flight": 0, "ops": {"query": {...}}},
+            "help_cache": {"owners": 2, "hits": 10, "misses": 1, "rebuilds": 3, "unchanged": 5},
+            "speculative_prefetch": {"enabled": true, "adaptive_rag": {"started": 20, "hit": 12, "hit_rate": 0.6, ...}},
+            "tts_phrase_cache": {"entries": 24, "hits": 130, "misses": 4, "hit_rate": 0.97, ...},
+            "google_clients": {"channels": [{"kind": "tts", "ready": true, "in_flight": 1, ...}], "auth_refreshes": 2},
+            "smart_turn": {"loaded": true, "avg_batch_size": 1.8, "latency_ms_p95": 42.0, "vad_fallbacks": {...}, ...},
+            "llm_cache": {"entries": 310, "hit_rate": 0.41, "call_sites": {"rewrite_query": {"hits": 52, ...}}, ...},
+            "stt_streams": {"standby": 1, "pool_hit_rate": 0.93, "setup_ms_p95": 180.0, "rotations": 2, ...},
+            "call_data_record_writer": {"queue_depth": 0, "dropped": 0, "flush_ms_p95": 0.8, ...},
+            "sqlite_pools": {"booking.db": {"acquired": 900, "reused": 896, "opened": 4, "slow_queries": 0, ...}},
+            "booking_availability": {"days": 14, "hits": 320, "loads": 6, "applied": 3, "answer_hits": 12, ...}
+        }
+    """
+    from src.ai_voicebot.ai_pipeline.google_client_pool import get_google_client_pool
+    from src.ai_voicebot.ai_pipeline.lexical_index import get_lexical_index_registry
+    from src.ai_voicebot.ai_pipeline.llm_response_cache import get_llm_response_cache
+    from src.ai_voicebot.ai_pipeline.tts_phrase_cache import get_tts_phrase_cache
+    from src.ai_voicebot.knowledge.embedder import get_text_embedder_stats
+    from src.ai_voicebot.knowledge.help_cache import get_help_cache
+    from src.ai_voicebot.knowledge.vector_store_gateway import get_vector_store_gateway
+    from src.ai_voicebot.langgraph.speculative_prefetch import get_speculative_stats
+    from src.ai_voicebot.pipecat.smart_turn_inference import get_smart_turn_stats
+    from src.ai_voicebot.pipecat.stt_stream_manager import get_stt_stream_stats
+    from src.common.call_data_record_logger import get_call_data_record_writer_stats
+    from src.common.sqlite_pool import get_sqlite_pool_stats
+    from src.services.booking_availability import get_booking_availability_index
+
+    return {
+        "embedders": get_text_embedder_stats(),
+        "lexical_index": get_lexical_index_registry().get_stats(),
+        "vector_store": get_vector_store_gateway().get_stats(),
+        "help_cache": get_help_cache().get_stats(),
+        "speculative_prefetch": get_speculative_stats().get_stats(),
+        "tts_phrase_cache": get_tts_phrase_cache().get_stats(),
+        "google_clients": get_google_client_pool().get_stats(),
+        "smart_turn": get_smart_turn_stats(),
+        "llm_cache": get_llm_response_cache().get_stats(),
+        "stt_streams": get_stt_stream_stats(),
+        "call_data_record_writer": get_call_data_record_writer_stats(),
+        "sqlite_pools": get_sqlite_pool_stats(),
+        "booking_availability": get_booking_availability_index().get_stats(),
+    }
@@ -14,9 +14,8 @@ from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import FileResponse, Response
 
 from src.api.utils.recording_paths import (
-    find_call_directory,
+    get_call_recording_entry,
     get_recordings_dir,
-    list_recording_audio_files,
     resolve_safe_audio_path,
 )
 
@@ -29,12 +28,13 @@ router = APIRouter(prefix="/api/recordings", tags=["recordings"])
 async def get_recording_info(call_id: str) -> Dict[str, Any]:
     """통화 ID에 연결된 녹음 파일 메타데이터."""
     recordings_dir = get_recordings_dir()
-    call_dir = find_call_directory(call_id, recordings_dir)
-    if call_dir is None:
+    entry = get_call_recording_entry(call_id, recordings_dir)
+    if entry is None:
         logger.info("recordings_info_not_found", call_id=call_id, recordings_dir=recordings_dir)
         raise HTTPException(status_code=404, detail="해당 통화의 녹음 디렉터리를 찾을 수 없습니다.")
 
-    files = list_recording_audio_files(call_dir)
+    call_dir = entry["directory"]
+    files = entry["files"]
     logger.info(
         "recordings_info_ok",
         call_id=call_id,
@@ -47,6 +47,7 @@ async def get_recording_info(call_id: str) -> Dict[str, Any]:
         "recordings_root": recordings_dir,
         "files": files,
         "has_recording": len(files) > 0,
+        "duration": entry.get("duration"),
     }
 
 
@@ -56,10 +57,11 @@ def _media_response(
     as_attachment: bool,
 ) -> FileResponse:
     recordings_dir = get_recordings_dir()
-    call_dir = find_call_directory(call_id, recordings_dir)
-    if call_dir is None:
+    entry = get_call_recording_entry(call_id, recordings_dir)
+    if entry is None:
         raise HTTPException(status_code=404, detail="통화 녹음을 찾을 수 없습니다.")
 
+    call_dir = entry["directory"]
     path = resolve_safe_audio_path(call_dir, file)
     if path is None:
         logger.warning(
@@ -70,7 +72,7 @@ def _media_response(
         raise HTTPException(status_code=404, detail="요청한 파일이 없거나 허용되지 않습니다.")
 
     media_type = next(
-        (f["mime"] for f in list_recording_audio_files(call_dir) if f["name"] == path.name),
+        (f["mime"] for f in entry["files"] if f["name"] == path.name),
         "application/octet-stream",
     )
 
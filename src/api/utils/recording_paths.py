@@ -1,7 +1,8 @@
 """
 통화별 녹음 디렉터리 탐색 및 오디오 파일 목록.
 
-recordings/<세션디렉터리>/metadata.json 의 call_id 로 매칭.
+recordings/<세션디렉터리>/metadata.json 의 call_id 로 매칭 — 녹음 카탈로그(src.common.recordings_catalog)로
+call_id 조회 1회, 카탈로그 비활성(RECORDINGS_CATALOG=0)이면 디렉터리 스캔.
 """
 
 from __future__ import annotations
@@ -11,17 +12,12 @@ import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-# 지원 오디오 확장자 (소문자)
-AUDIO_EXTENSIONS = frozenset({".wav", ".mp3", ".m4a", ".ogg", ".webm", ".flac"})
-
-MIME_BY_EXT = {
-    ".wav": "audio/wav",
-    ".mp3": "audio/mpeg",
-    ".m4a": "audio/mp4",
-    ".ogg": "audio/ogg",
-    ".webm": "audio/webm",
-    ".flac": "audio/flac",
-}
+from src.common.recordings_catalog import (
+    AUDIO_EXTENSIONS,
+    MIME_BY_EXT,
+    get_recordings_catalog,
+    list_audio_files,
+)
 
 
 def get_recordings_dir() -> str:
@@ -37,6 +33,10 @@ def find_call_directory(call_id: str, recordings_dir: Optional[str] = None) -> O
     if not root.exists() or not root.is_dir():
         return None
 
+    catalog = get_recordings_catalog(root)
+    if catalog is not None:
+        return catalog.find_call_dir(call_id)
+
     for dir_path in root.iterdir():
         if not dir_path.is_dir():
             continue
@@ -53,26 +53,27 @@ def find_call_directory(call_id: str, recordings_dir: Optional[str] = None) -> O
     return None
 
 
+def get_call_recording_entry(call_id: str, recordings_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    call_id의 녹음 항목 {call_id, directory(Path), duration, files, metadata}.
+
+    카탈로그가 있으면 저장된 파일 목록(크기·mime)을 그대로 쓰고, 없으면 디렉터리 스캔 후 구성한다.
+    """
+    root = Path(recordings_dir or get_recordings_dir())
+    if not root.is_dir():
+        return None
+    catalog = get_recordings_catalog(root)
+    if catalog is not None:
+        return catalog.get(call_id)
+    call_dir = find_call_directory(call_id, recordings_dir)
+    if call_dir is None:
+        return None
+    return {"call_id": call_id, "directory": call_dir, "duration": None, "files": list_audio_files(call_dir), "metadata": {}}
+
+
 def list_recording_audio_files(call_dir: Path) -> List[Dict[str, Any]]:
     """세션 디렉터리 내 오디오 파일 목록 (이름·크기·mime)."""
-    out: List[Dict[str, Any]] = []
-    try:
-        for p in sorted(call_dir.iterdir()):
-            if not p.is_file():
-                continue
-            ext = p.suffix.lower()
-            if ext not in AUDIO_EXTENSIONS:
-                continue
-            out.append(
-                {
-                    "name": p.name,
-                    "size_bytes": p.stat().st_size,
-                    "mime": MIME_BY_EXT.get(ext, "application/octet-stream"),
-                }
-            )
-    except OSError:
-        pass
-    return out
+    return list_audio_files(call_dir)
 
 
 def call_has_audio_recording(call_id: str, recordings_dir: Optional[str] = None) -> bool:
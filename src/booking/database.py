@@ -19,6 +19,9 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator
 
+from src.common.sqlite_pool import connect as _pool_connect
+from src.common.sqlite_pool import connect_writer as _pool_connect_writer
+
 logger = logging.getLogger(__name__)
 
 _DB_PATH: str | None = None
@@ -36,12 +39,11 @@ def _get_db_path() -> str:
 
 
 def get_connection() -> sqlite3.Connection:
-    """새 SQLite 연결 반환 (WAL 모드, row_factory=Row)."""
-    conn = sqlite3.connect(_get_db_path(), check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
-    return conn
+    """공유 풀의 SQLite 연결 반환 (WAL·foreign_keys는 연결 생성 시 한 번, row_factory=Row).
+
+    close()는 연결을 닫지 않고 풀에 반납한다 (커밋 안 된 트랜잭션은 롤백).
+    """
+    return _pool_connect(_get_db_path(), row_factory=sqlite3.Row, foreign_keys=True)
 
 
 @contextmanager
@@ -58,6 +60,26 @@ def get_db() -> Generator[sqlite3.Connection, None, None]:
         conn.close()
 
 
+@contextmanager
+def get_write_db() -> Generator[sqlite3.Connection, None, None]:
+    """컨텍스트 매니저: booking.db 전용 writer 연결 (프로세스 내 쓰기 직렬화, 자동 commit/rollback).
+
+    같은 스레드에서 중첩되면 바깥 블록의 트랜잭션에 합류한다 (commit은 가장 바깥에서).
+    """
+    conn = _pool_connect_writer(_get_db_path(), row_factory=sqlite3.Row, foreign_keys=True)
+    outer = not conn.in_transaction
+    try:
+        yield conn
+        if outer:
+            conn.commit()
+    except Exception:
+        if outer:
+            conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
 _DDL = """
 -- 테넌트별 도메인 설정
 CREATE TABLE IF NOT EXISTS booking_settings (
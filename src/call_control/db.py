@@ -10,12 +10,16 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import structlog
 
+from src.common.sqlite_pool import connect as _pool_connect
+from src.common.sqlite_pool import connect_writer as _pool_connect_writer
+
 logger = structlog.get_logger(__name__)
 
 _DEFAULT_DB = "data/call_control.db"
@@ -28,9 +32,29 @@ def _get_db_path() -> str:
 
 
 def _conn() -> sqlite3.Connection:
-    c = sqlite3.connect(_get_db_path(), check_same_thread=False)
-    c.row_factory = sqlite3.Row
-    return c
+    """공유 풀 연결 (close()는 풀 반납)."""
+    return _pool_connect(_get_db_path(), row_factory=sqlite3.Row)
+
+
+def _write_conn() -> sqlite3.Connection:
+    """DB 전용 writer 연결 (쓰기 직렬화, close()로 반납)."""
+    return _pool_connect_writer(_get_db_path(), row_factory=sqlite3.Row)
+
+
+# 라우팅 규칙·스케줄·발신자 필터를 쓸 때마다 증가 — routing_engine이 owner별 스냅샷을 다시 만드는 신호
+_routing_version = 0
+_routing_version_lock = threading.Lock()
+
+
+def routing_version() -> int:
+    """라우팅 관련 테이블의 프로세스 내 쓰기 버전."""
+    return _routing_version
+
+
+def _bump_routing_version() -> None:
+    global _routing_version
+    with _routing_version_lock:
+        _routing_version += 1
 
 
 def _now() -> str:
@@ -344,7 +368,7 @@ def _migrate_ringback_schedule_assignments_tts_audio(conn: sqlite3.Connection) -
 
 def init_db() -> None:
     """테이블과 인덱스 생성 (없을 때만). 기존 테이블 컬럼 migration도 수행."""
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.executescript(_DDL)
         _migrate_announcement_profiles(conn)
@@ -394,7 +418,7 @@ def get_rule(rule_id: str) -> Optional[Dict[str, Any]]:
 
 def create_rule(data: Dict[str, Any]) -> Dict[str, Any]:
     now = _now()
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             """INSERT INTO call_routing_rules
@@ -417,6 +441,7 @@ def create_rule(data: Dict[str, Any]) -> Dict[str, Any]:
             ),
         )
         conn.commit()
+        _bump_routing_version()
         return get_rule(data["id"])  # type: ignore[return-value]
     finally:
         conn.close()
@@ -435,25 +460,27 @@ def update_rule(rule_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any
         return get_rule(rule_id)
     set_clause = ", ".join(f"{k} = ?" for k in filtered)
     values = list(filtered.values()) + [now, rule_id]
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             f"UPDATE call_routing_rules SET {set_clause}, updated_at = ? WHERE id = ?",
             values,
         )
         conn.commit()
+        _bump_routing_version()
         return get_rule(rule_id)
     finally:
         conn.close()
 
 
 def delete_rule(rule_id: str) -> bool:
-    conn = _conn()
+    conn = _write_conn()
     try:
         cur = conn.execute(
             "DELETE FROM call_routing_rules WHERE id = ?", (rule_id,)
         )
         conn.commit()
+        _bump_routing_version()
         return cur.rowcount > 0
     finally:
         conn.close()
@@ -504,7 +531,7 @@ def get_schedule(schedule_id: str) -> Optional[Dict[str, Any]]:
 
 def create_schedule(data: Dict[str, Any]) -> Dict[str, Any]:
     now = _now()
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             """INSERT INTO call_schedules
@@ -524,6 +551,7 @@ def create_schedule(data: Dict[str, Any]) -> Dict[str, Any]:
             ),
         )
         conn.commit()
+        _bump_routing_version()
         return get_schedule(data["id"])  # type: ignore[return-value]
     finally:
         conn.close()
@@ -546,25 +574,27 @@ def update_schedule(schedule_id: str, updates: Dict[str, Any]) -> Optional[Dict[
         return get_schedule(schedule_id)
     set_clause = ", ".join(f"{k} = ?" for k in filtered)
     values = list(filtered.values()) + [now, schedule_id]
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             f"UPDATE call_schedules SET {set_clause}, updated_at = ? WHERE id = ?",
             values,
         )
         conn.commit()
+        _bump_routing_version()
         return get_schedule(schedule_id)
     finally:
         conn.close()
 
 
 def delete_schedule(schedule_id: str) -> bool:
-    conn = _conn()
+    conn = _write_conn()
     try:
         cur = conn.execute(
             "DELETE FROM call_schedules WHERE id = ?", (schedule_id,)
         )
         conn.commit()
+        _bump_routing_version()
         return cur.rowcount > 0
     finally:
         conn.close()
@@ -609,7 +639,7 @@ def get_announcement(announcement_id: str) -> Optional[Dict[str, Any]]:
 
 def create_announcement(data: Dict[str, Any]) -> Dict[str, Any]:
     now = _now()
-    conn = _conn()
+    conn = _write_conn()
     try:
         # use_as_ringback_greeting=True 시 다른 행의 플래그를 먼저 해제
         if data.get("use_as_ringback_greeting"):
@@ -664,7 +694,7 @@ def update_announcement(announcement_id: str, updates: Dict[str, Any]) -> Option
         filtered[k] = (1 if v else 0) if k in bool_cols else v
     if not filtered:
         return get_announcement(announcement_id)
-    conn = _conn()
+    conn = _write_conn()
     try:
         # use_as_ringback_greeting=True로 변경할 때 다른 행 플래그 해제
         if filtered.get("use_as_ringback_greeting") == 1:
@@ -700,7 +730,7 @@ def get_ringback_greeting_announcement(owner: str) -> Optional[Dict[str, Any]]:
 
 
 def delete_announcement(announcement_id: str) -> bool:
-    conn = _conn()
+    conn = _write_conn()
     try:
         cur = conn.execute(
             "DELETE FROM announcement_profiles WHERE id = ?", (announcement_id,)
@@ -779,7 +809,7 @@ def create_ringback_schedule_assignment(data: Dict[str, Any]) -> Dict[str, Any]:
     gm = (data.get("generation_mode") or "suno").strip().lower()
     if gm not in ("tts", "suno"):
         gm = "suno"
-    conn = _conn()
+    conn = _write_conn()
     try:
         pos_row = conn.execute(
             "SELECT COALESCE(MAX(position), -1) + 1 AS n FROM ringback_schedule_assignments WHERE owner = ?",
@@ -895,7 +925,7 @@ def update_ringback_schedule_assignment(
         return get_ringback_schedule_assignment(assignment_id)
     set_clause = ", ".join(f"{k} = ?" for k in filtered)
     values = list(filtered.values()) + [now, assignment_id]
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             f"UPDATE ringback_schedule_assignments SET {set_clause}, updated_at = ? WHERE id = ?",
@@ -910,7 +940,7 @@ def update_ringback_schedule_assignment(
 def reorder_ringback_schedule_assignments(owner: str, ordered_ids: List[str]) -> None:
     """목록 순서(위→아래)대로 position 0..n-1 재설정."""
     now = _now()
-    conn = _conn()
+    conn = _write_conn()
     try:
         for pos, aid in enumerate(ordered_ids):
             conn.execute(
@@ -927,7 +957,7 @@ def reorder_ringback_schedule_assignments(owner: str, ordered_ids: List[str]) ->
 
 
 def delete_ringback_schedule_assignment(assignment_id: str) -> bool:
-    conn = _conn()
+    conn = _write_conn()
     try:
         cur = conn.execute(
             "DELETE FROM ringback_schedule_assignments WHERE id = ?",
@@ -978,7 +1008,7 @@ def get_ring_group(group_id: str) -> Optional[Dict[str, Any]]:
 
 def create_ring_group(data: Dict[str, Any]) -> Dict[str, Any]:
     now = _now()
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             """INSERT INTO call_ring_groups (id, owner, name, members, mode, no_answer_timeout, created_at, updated_at)
@@ -1012,7 +1042,7 @@ def update_ring_group(group_id: str, updates: Dict[str, Any]) -> Optional[Dict[s
         return get_ring_group(group_id)
     set_clause = ", ".join(f"{k} = ?" for k in filtered)
     values = list(filtered.values()) + [now, group_id]
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             f"UPDATE call_ring_groups SET {set_clause}, updated_at = ? WHERE id = ?", values
@@ -1024,7 +1054,7 @@ def update_ring_group(group_id: str, updates: Dict[str, Any]) -> Optional[Dict[s
 
 
 def delete_ring_group(group_id: str) -> bool:
-    conn = _conn()
+    conn = _write_conn()
     try:
         cur = conn.execute("DELETE FROM call_ring_groups WHERE id = ?", (group_id,))
         conn.commit()
@@ -1075,7 +1105,7 @@ def get_forward_target(target_id: str) -> Optional[Dict[str, Any]]:
 
 def create_forward_target(data: Dict[str, Any]) -> Dict[str, Any]:
     now = _now()
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             """INSERT INTO call_forward_targets
@@ -1118,7 +1148,7 @@ def update_forward_target(target_id: str, updates: Dict[str, Any]) -> Optional[D
         return get_forward_target(target_id)
     set_clause = ", ".join(f"{k} = ?" for k in filtered)
     values = list(filtered.values()) + [now, target_id]
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             f"UPDATE call_forward_targets SET {set_clause}, updated_at = ? WHERE id = ?", values
@@ -1130,7 +1160,7 @@ def update_forward_target(target_id: str, updates: Dict[str, Any]) -> Optional[D
 
 
 def delete_forward_target(target_id: str) -> bool:
-    conn = _conn()
+    conn = _write_conn()
     try:
         cur = conn.execute("DELETE FROM call_forward_targets WHERE id = ?", (target_id,))
         conn.commit()
@@ -1175,7 +1205,7 @@ def get_caller_filter(filter_id: str) -> Optional[Dict[str, Any]]:
 
 def create_caller_filter(data: Dict[str, Any]) -> Dict[str, Any]:
     now = _now()
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             """INSERT INTO call_caller_filters
@@ -1197,6 +1227,7 @@ def create_caller_filter(data: Dict[str, Any]) -> Dict[str, Any]:
             ),
         )
         conn.commit()
+        _bump_routing_version()
         return get_caller_filter(data["id"])  # type: ignore[return-value]
     finally:
         conn.close()
@@ -1210,20 +1241,22 @@ def update_caller_filter(filter_id: str, updates: Dict[str, Any]) -> Optional[Di
         return get_caller_filter(filter_id)
     set_clause = ", ".join(f"{k} = ?" for k in filtered)
     values = list(filtered.values()) + [now, filter_id]
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(f"UPDATE call_caller_filters SET {set_clause}, updated_at = ? WHERE id = ?", values)
         conn.commit()
+        _bump_routing_version()
         return get_caller_filter(filter_id)
     finally:
         conn.close()
 
 
 def delete_caller_filter(filter_id: str) -> bool:
-    conn = _conn()
+    conn = _write_conn()
     try:
         cur = conn.execute("DELETE FROM call_caller_filters WHERE id = ?", (filter_id,))
         conn.commit()
+        _bump_routing_version()
         return cur.rowcount > 0
     finally:
         conn.close()
@@ -1253,7 +1286,7 @@ def get_overflow_policy(owner: str) -> Optional[Dict[str, Any]]:
 
 def upsert_overflow_policy(owner: str, data: Dict[str, Any]) -> Dict[str, Any]:
     now = _now()
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             """INSERT INTO call_overflow_policies (owner, enabled, max_concurrent_calls, overflow_action, announcement_id, updated_at)
@@ -8,17 +8,29 @@ Call Control Routing Engine
   2. priority ASC 정렬 후 순서대로 스케줄 조건 확인
   3. schedule_id=None 이면 항상 매칭 (default fallback)
   4. 가장 먼저 매칭된 규칙 반환
+
+INVITE 경로 비용:
+  owner별 RoutingSnapshot(정렬된 활성 규칙 + 파싱된 스케줄 창 + 발신자 패턴 prefix trie)을 메모리에 두고
+  평가한다. db.routing_version()이 바뀌면(같은 프로세스의 CRUD 쓰기) 또는 ROUTING_SNAPSHOT_TTL_SEC(기본 30초)가
+  지나면(다른 프로세스의 쓰기 대비) 새로 만들어 통째로 교체한다. 공휴일은 (국가, 연도)별 날짜 집합을 메모이즈.
+  ROUTING_SNAPSHOT=0이면 매 호출 DB에서 다시 읽는다 (이전 동작).
+  이벤트 루프(INVITE 처리)에서는 aresolve_caller_filter()/aresolve_rule()을 쓴다 — 스냅샷이 유효하면
+  메모리에서 바로, 다시 만들어야 하면 sqlite 전용 executor에서 빌드한다.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, time, timezone, timedelta
-from typing import Optional
+import os
+import threading
+import time as _time
+from datetime import date, datetime, time, timezone, timedelta
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 import structlog
 
 from src.call_control import db as _db
 from src.call_control.models import RoutingAction
+from src.common.sqlite_pool import to_thread as _db_to_thread
 
 logger = structlog.get_logger(__name__)
 
@@ -80,45 +92,78 @@ def _parse_time(t: str) -> time:
     return time(int(h), int(m))
 
 
+_holiday_cache: Dict[Tuple[str, int], FrozenSet[date]] = {}
+_holiday_cache_lock = threading.Lock()
+_tz_cache: Dict[str, Any] = {}
+
+
+def _holiday_dates(country: str, year: int) -> FrozenSet[date]:
+    """(국가, 연도) 공휴일 날짜 집합 — 프로세스 수명 동안 메모이즈."""
+    key = (country, year)
+    cached = _holiday_cache.get(key)
+    if cached is not None:
+        return cached
+    try:
+        dates = frozenset(_holidays_lib.country_holidays(country, years=year).keys())
+    except Exception:
+        dates = frozenset()
+    with _holiday_cache_lock:
+        _holiday_cache[key] = dates
+    return dates
+
+
 def _is_holiday(dt: datetime, country: str) -> bool:
     """공휴일 여부 확인."""
     if not _HOLIDAYS_AVAILABLE:
         return False
-    try:
-        country_holidays = _holidays_lib.country_holidays(country, years=dt.year)
-        return dt.date() in country_holidays
-    except Exception:
-        return False
+    return dt.date() in _holiday_dates(country, dt.year)
+
+
+def _cached_tz(tz_name: str):
+    """_get_tz 결과 캐시 (폴백 경고도 타임존당 한 번)."""
+    tz = _tz_cache.get(tz_name)
+    if tz is None:
+        tz = _get_tz(tz_name)
+        _tz_cache[tz_name] = tz
+    return tz
+
+
+class CompiledSchedule:
+    """파싱된 스케줄 (타임존 객체·요일 집합·시간 창을 미리 계산)."""
+
+    __slots__ = ("raw", "tz", "days", "windows", "include_holidays", "holiday_country")
+
+    def __init__(self, schedule_raw: dict):
+        self.raw = schedule_raw
+        self.tz = _cached_tz(schedule_raw.get("timezone", "Asia/Seoul"))
+        self.days: FrozenSet[str] = frozenset(schedule_raw.get("days") or [])
+        self.windows: List[Tuple[time, time]] = [
+            (_parse_time(tr["start"]), _parse_time(tr["end"]))
+            for tr in (schedule_raw.get("time_ranges") or [])
+        ]
+        self.include_holidays = bool(schedule_raw.get("include_holidays"))
+        self.holiday_country = schedule_raw.get("holiday_country", "KR")
+
+    def matches(self, now: datetime) -> bool:
+        local_now = now.astimezone(self.tz)
+
+        # 요일 체크 — 공휴일이고 include_holidays=True 이면 요일 조건 무시
+        if self.days and _WEEKDAY_MAP[local_now.weekday()] not in self.days:
+            if not (self.include_holidays and _is_holiday(local_now, self.holiday_country)):
+                return False
+
+        # 시간 범위 체크
+        if self.windows:
+            current_t = local_now.time().replace(second=0, microsecond=0)
+            if not any(start <= current_t <= end for start, end in self.windows):
+                return False
+
+        return True
 
 
 def _schedule_matches(schedule_raw: dict, now: datetime) -> bool:
     """스케줄이 now 시각에 활성인지 판단."""
-    tz_name = schedule_raw.get("timezone", "Asia/Seoul")
-    tz = _get_tz(tz_name)
-    local_now = now.astimezone(tz)
-    weekday_str = _WEEKDAY_MAP[local_now.weekday()]
-
-    # 요일 체크
-    days: list = schedule_raw.get("days") or []
-    if days and weekday_str not in days:
-        # 공휴일이고 include_holidays=True 이면 요일 조건 무시
-        if schedule_raw.get("include_holidays") and _is_holiday(local_now, schedule_raw.get("holiday_country", "KR")):
-            pass  # 공휴일은 모든 요일에 매칭
-        else:
-            return False
-
-    # 시간 범위 체크
-    time_ranges: list = schedule_raw.get("time_ranges") or []
-    if time_ranges:
-        current_t = local_now.time().replace(second=0, microsecond=0)
-        in_range = any(
-            _parse_time(tr["start"]) <= current_t <= _parse_time(tr["end"])
-            for tr in time_ranges
-        )
-        if not in_range:
-            return False
-
-    return True
+    return CompiledSchedule(schedule_raw).matches(now)
 
 
 # ---------------------------------------------------------------------------
@@ -137,25 +182,184 @@ def _pattern_matches(pattern: str, caller: str) -> bool:
     return caller == pattern
 
 
+class CallerPatternIndex:
+    """활성 발신자 필터 색인 — 정확 일치 dict + prefix trie.
+
+    여러 패턴이 맞으면 priority 순서(목록 순번)가 가장 앞선 필터를 돌려준다 (선형 평가와 동일 결과).
+    """
+
+    def __init__(self, filters: List[dict]):
+        self.filters = filters
+        self._exact: Dict[str, int] = {}
+        self._trie: Dict[str, Any] = {}
+        for idx, cf in enumerate(filters):
+            pattern = cf["pattern"]
+            if pattern.endswith("*"):
+                node = self._trie
+                for ch in pattern[:-1]:
+                    node = node.setdefault(ch, {})
+                node.setdefault("", idx)  # "" 키: 이 노드에서 끝나는 prefix 중 가장 앞선 순번
+            else:
+                self._exact.setdefault(pattern, idx)
+
+    def match(self, caller: str) -> Optional[dict]:
+        best = self._exact.get(caller)
+        node = self._trie
+        for ch in caller:
+            idx = node.get("")
+            if idx is not None and (best is None or idx < best):
+                best = idx
+            node = node.get(ch)
+            if node is None:
+                break
+        else:
+            idx = node.get("")
+            if idx is not None and (best is None or idx < best):
+                best = idx
+        return self.filters[best] if best is not None else None
+
+
+# ---------------------------------------------------------------------------
+# owner별 라우팅 스냅샷
+# ---------------------------------------------------------------------------
+
+
+class RoutingSnapshot:
+    """owner 한 명의 컴파일된 라우팅 테이블 (불변 — 변경 시 새로 만들어 교체)."""
+
+    def __init__(self, owner: str, version: int, rules: List[Tuple[dict, Optional[CompiledSchedule]]], caller_index: CallerPatternIndex):
+        self.owner = owner
+        self.version = version
+        self.built_at = _time.monotonic()
+        self.rules = rules
+        self.caller_index = caller_index
+
+    @classmethod
+    def build(cls, owner: str) -> "RoutingSnapshot":
+        version = _db.routing_version()  # 읽기 전에 잡아 두면 빌드 중 쓰기는 다음 호출에서 반영
+        rules = [r for r in _db.list_rules(owner) if r.get("enabled")]
+        schedules = {s["id"]: s for s in _db.list_schedules(owner)}
+        compiled: List[Tuple[dict, Optional[CompiledSchedule]]] = []
+        for rule in rules:
+            schedule_id = rule.get("schedule_id")
+            if schedule_id is None:
+                compiled.append((rule, None))
+                continue
+            schedule_raw = schedules.get(schedule_id) or _db.get_schedule(schedule_id)
+            if schedule_raw is None:
+                # 스케줄이 삭제된 경우 건너뜀
+                continue
+            compiled.append((rule, CompiledSchedule(schedule_raw)))
+        filters = [f for f in _db.list_caller_filters(owner) if f.get("enabled")]
+        return cls(owner, version, compiled, CallerPatternIndex(filters))
+
+    def resolve_rule(self, now: datetime) -> Optional[dict]:
+        for rule, schedule in self.rules:
+            if schedule is None:
+                # 항상(always) 적용 규칙
+                logger.debug(
+                    "routing_rule_matched_always",
+                    owner=self.owner,
+                    rule_id=rule["id"],
+                    action=rule["action"],
+                )
+                return {"rule": dict(rule), "schedule": None, "is_schedule_active": True}
+            if schedule.matches(now):
+                logger.debug(
+                    "routing_rule_matched_schedule",
+                    owner=self.owner,
+                    rule_id=rule["id"],
+                    schedule_id=rule.get("schedule_id"),
+                    action=rule["action"],
+                )
+                return {"rule": dict(rule), "schedule": dict(schedule.raw), "is_schedule_active": True}
+        return None
+
+
+_snapshots: Dict[Tuple[str, str], RoutingSnapshot] = {}
+_schedule_cache: Dict[Tuple[str, str], Tuple[int, float, Optional[CompiledSchedule]]] = {}
+
+
+def _snapshot_enabled() -> bool:
+    return os.environ.get("ROUTING_SNAPSHOT", "1") != "0"
+
+
+def _snapshot_ttl() -> float:
+    try:
+        return float(os.environ.get("ROUTING_SNAPSHOT_TTL_SEC", "30"))
+    except ValueError:
+        return 30.0
+
+
+def _db_key() -> str:
+    return os.environ.get("CALL_CONTROL_DB_PATH", _db._DEFAULT_DB)
+
+
+def _fresh_snapshot(owner: str) -> Optional[RoutingSnapshot]:
+    """버전·TTL이 유효한 캐시 스냅샷 (없거나 낡았으면 None)."""
+    if not _snapshot_enabled():
+        return None
+    snap = _snapshots.get((_db_key(), owner))
+    if (
+        snap is None
+        or snap.version != _db.routing_version()
+        or _time.monotonic() - snap.built_at > _snapshot_ttl()
+    ):
+        return None
+    return snap
+
+
+def get_routing_snapshot(owner: str) -> RoutingSnapshot:
+    """owner 스냅샷 (버전·TTL이 유효하면 메모리에서, 아니면 DB에서 다시 컴파일)."""
+    snap = _fresh_snapshot(owner)
+    if snap is not None:
+        return snap
+    snap = RoutingSnapshot.build(owner)
+    if _snapshot_enabled():
+        _snapshots[(_db_key(), owner)] = snap  # dict 항목 교체 — 평가 중인 호출은 이전 스냅샷을 끝까지 사용
+    return snap
+
+
+async def aget_routing_snapshot(owner: str) -> RoutingSnapshot:
+    """get_routing_snapshot의 이벤트 루프용 — DB 빌드가 필요할 때만 sqlite executor로 넘긴다."""
+    snap = _fresh_snapshot(owner)
+    if snap is not None:
+        return snap
+    return await _db_to_thread(get_routing_snapshot, owner)
+
+
+def invalidate_routing_snapshots() -> None:
+    """모든 스냅샷·스케줄 캐시 폐기 (외부에서 DB를 직접 고친 경우)."""
+    _snapshots.clear()
+    _schedule_cache.clear()
+
+
 def resolve_caller_filter(owner: str, caller: str) -> Optional[dict]:
     """발신자 번호에 매칭되는 첫 번째 활성 필터 반환.
 
     VIP/차단 규칙이 일반 라우팅 규칙보다 우선 평가된다.
     """
-    filters = _db.list_caller_filters(owner)
-    enabled = [f for f in filters if f.get("enabled")]
-    for cf in enabled:
-        if _pattern_matches(cf["pattern"], caller):
-            logger.debug(
-                "caller_filter_matched",
-                owner=owner,
-                caller=caller,
-                filter_id=cf["id"],
-                pattern=cf["pattern"],
-                action=cf["action"],
-            )
-            return cf
-    return None
+    return _matched_caller_filter(owner, caller, get_routing_snapshot(owner))
+
+
+async def aresolve_caller_filter(owner: str, caller: str) -> Optional[dict]:
+    """resolve_caller_filter의 이벤트 루프용 (스냅샷 빌드는 sqlite executor에서)."""
+    return _matched_caller_filter(owner, caller, await aget_routing_snapshot(owner))
+
+
+def _matched_caller_filter(owner: str, caller: str, snap: RoutingSnapshot) -> Optional[dict]:
+    cf = snap.caller_index.match(caller)
+    if cf is None:
+        return None
+    logger.debug(
+        "caller_filter_matched",
+        owner=owner,
+        caller=caller,
+        filter_id=cf["id"],
+        pattern=cf["pattern"],
+        action=cf["action"],
+    )
+    return dict(cf)
 
 
 # ---------------------------------------------------------------------------
@@ -175,41 +379,15 @@ def resolve_rule(owner: str, now: Optional[datetime] = None) -> Optional[dict]:
     매칭되는 규칙이 없으면 None.
     """
     if now is None:
-        from datetime import timezone as _tz
-        now = datetime.now(_tz.utc)
-
-    rules = _db.list_rules(owner)
-    enabled_rules = [r for r in rules if r.get("enabled")]
-
-    for rule in enabled_rules:
-        schedule_id = rule.get("schedule_id")
-
-        if schedule_id is None:
-            # 항상(always) 적용 규칙
-            logger.debug(
-                "routing_rule_matched_always",
-                owner=owner,
-                rule_id=rule["id"],
-                action=rule["action"],
-            )
-            return {"rule": rule, "schedule": None, "is_schedule_active": True}
-
-        schedule_raw = _db.get_schedule(schedule_id)
-        if schedule_raw is None:
-            # 스케줄이 삭제된 경우 건너뜀
-            continue
-
-        if _schedule_matches(schedule_raw, now):
-            logger.debug(
-                "routing_rule_matched_schedule",
-                owner=owner,
-                rule_id=rule["id"],
-                schedule_id=schedule_id,
-                action=rule["action"],
-            )
-            return {"rule": rule, "schedule": schedule_raw, "is_schedule_active": True}
+        now = datetime.now(timezone.utc)
+    return get_routing_snapshot(owner).resolve_rule(now)
 
-    return None
+
+async def aresolve_rule(owner: str, now: Optional[datetime] = None) -> Optional[dict]:
+    """resolve_rule의 이벤트 루프용 (스냅샷 빌드는 sqlite executor에서)."""
+    if now is None:
+        now = datetime.now(timezone.utc)
+    return (await aget_routing_snapshot(owner)).resolve_rule(now)
 
 
 def get_effective_no_answer_timeout(owner: str, default: int = 20) -> int:
@@ -234,7 +412,22 @@ def schedule_active_now(schedule_id: Optional[str], now: Optional[datetime] = No
         return True
     if now is None:
         now = datetime.now(timezone.utc)
-    raw = _db.get_schedule(str(schedule_id))
-    if not raw:
+    compiled = _get_compiled_schedule(str(schedule_id))
+    if compiled is None:
         return False
-    return _schedule_matches(raw, now)
+    return compiled.matches(now)
+
+
+def _get_compiled_schedule(schedule_id: str) -> Optional[CompiledSchedule]:
+    if not _snapshot_enabled():
+        raw = _db.get_schedule(schedule_id)
+        return CompiledSchedule(raw) if raw else None
+    key = (_db_key(), schedule_id)
+    cached = _schedule_cache.get(key)
+    version = _db.routing_version()
+    if cached is not None and cached[0] == version and _time.monotonic() - cached[1] <= _snapshot_ttl():
+        return cached[2]
+    raw = _db.get_schedule(schedule_id)
+    compiled = CompiledSchedule(raw) if raw else None
+    _schedule_cache[key] = (version, _time.monotonic(), compiled)
+    return compiled
@@ -0,0 +1,339 @@
+"""
+통화 데이터 기록(call_data_record_*.log) call_id 색인 (SQLite 사이드카).
+
+통화 상세(debug-trace)·셀프서비스 조회는 모든 일자 로그의 모든 줄을 JSON 디코딩해 call_id 하나를 찾았다.
+로그가 쌓일수록 통화 1건 조회 비용이 전체 로그 양에 비례해 커진다.
+
+- 색인: logs/call_data_record_index.db
+    cdr_index(call_id, ts, file, offset, length)  — (call_id, ts) 인덱스, (file, offset) 유일
+    cdr_files(file, indexed_bytes)                 — 파일별로 색인이 끝난 바이트 위치
+- 기록: log_call_data()가 줄을 쓴 직후 add()로 위치를 넘기면 메모리에 모았다가
+  flush_every건 또는 flush_interval_sec마다 한 트랜잭션으로 넣는다.
+- 조회: read_records()는 대기분을 flush하고, 파일 크기가 indexed_bytes보다 큰 파일(다른 프로세스 기록·
+  색인 도입 전 로그)의 꼬리만 읽어 보충(sync)한 뒤 색인 행의 위치로 바로 seek해 읽는다.
+  사라진 파일의 색인은 지우고, 크기가 줄어든(재작성된) 파일은 처음부터 다시 색인한다.
+- 재구축: python -m src.common.call_data_record_index [--rebuild] [--log-dir DIR]
+
+환경변수 CDR_INDEX=0 이면 조회는 기존 전체 스캔, 기록 측 색인도 생략.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.common.call_data_record_logger import parse_call_data_record_name
+
+logger = logging.getLogger(__name__)
+
+INDEX_DB_NAME = "call_data_record_index.db"
+LOG_GLOB = "call_data_record_*.log"
+DEFAULT_FLUSH_EVERY = 200
+DEFAULT_FLUSH_INTERVAL_SEC = 1.0
+
+_IndexEntry = Tuple[str, str, str, int, int]
+
+
+def cdr_index_enabled() -> bool:
+    return os.environ.get("CDR_INDEX", "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+class CallDataRecordIndex:
+    """로그 디렉터리 1개의 call_id → (파일, 오프셋, 길이) 색인."""
+
+    def __init__(
+        self,
+        log_dir: Path,
+        db_path: Optional[Path] = None,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+        flush_interval_sec: float = DEFAULT_FLUSH_INTERVAL_SEC,
+    ) -> None:
+        self.log_dir = Path(log_dir)
+        self.db_path = Path(db_path) if db_path else self.log_dir / INDEX_DB_NAME
+        self.flush_every = max(1, int(flush_every))
+        self.flush_interval_sec = float(flush_interval_sec)
+        self._lock = threading.RLock()
+        self._pending: List[_IndexEntry] = []
+        self._last_flush = time.monotonic()
+        self._init_db()
+
+    # ── DB ──
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=5.0)
+
+    def _init_db(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS cdr_index (
+                    call_id TEXT NOT NULL,
+                    ts TEXT NOT NULL DEFAULT '',
+                    file TEXT NOT NULL,
+                    offset INTEGER NOT NULL,
+                    length INTEGER NOT NULL,
+                    UNIQUE(file, offset)
+                );
+                CREATE INDEX IF NOT EXISTS idx_cdr_index_call ON cdr_index(call_id, ts);
+                CREATE TABLE IF NOT EXISTS cdr_files (
+                    file TEXT PRIMARY KEY,
+                    indexed_bytes INTEGER NOT NULL DEFAULT 0
+                );
+                """
+            )
+
+    # ── 기록 측 ──
+
+    def add(self, call_id: str, ts: str, file_name: str, offset: int, length: int) -> None:
+        """log_call_data가 쓴 한 줄의 위치 등록 (모아서 flush)."""
+        if not call_id:
+            return
+        with self._lock:
+            self._pending.append((str(call_id), ts or "", file_name, int(offset), int(length)))
+            if (
+                len(self._pending) >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval_sec
+            ):
+                self.flush()
+
+    def flush(self) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+            if not pending:
+                return 0
+            ends: Dict[str, Tuple[int, int]] = {}
+            for _, _, file_name, offset, length in pending:
+                lo, hi = ends.get(file_name, (offset, offset + length))
+                ends[file_name] = (min(lo, offset), max(hi, offset + length))
+            try:
+                with self._connect() as conn:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO cdr_index (call_id, ts, file, offset, length) VALUES (?, ?, ?, ?, ?)",
+                        pending,
+                    )
+                    for file_name, (lo, hi) in ends.items():
+                        row = conn.execute(
+                            "SELECT indexed_bytes FROM cdr_files WHERE file = ?", (file_name,)
+                        ).fetchone()
+                        indexed = int(row[0]) if row else 0
+                        # 색인된 구간과 이어질 때만 전진 — 앞에 색인 안 된 구간이 있으면 다음 sync가 메운다
+                        if lo <= indexed < hi:
+                            conn.execute(
+                                "INSERT INTO cdr_files (file, indexed_bytes) VALUES (?, ?) "
+                                "ON CONFLICT(file) DO UPDATE SET indexed_bytes = excluded.indexed_bytes",
+                                (file_name, hi),
+                            )
+            except sqlite3.Error as e:
+                logger.warning("cdr_index_flush_failed entries=%s err=%s", len(pending), e)
+                return 0
+            return len(pending)
+
+    # ── 보충·재구축 ──
+
+    def _indexed_bytes(self, conn: sqlite3.Connection) -> Dict[str, int]:
+        return {row[0]: int(row[1]) for row in conn.execute("SELECT file, indexed_bytes FROM cdr_files")}
+
+    def _index_tail(self, conn: sqlite3.Connection, path: Path, start: int) -> int:
+        """path의 start 바이트부터 완결된(개행으로 끝난) 줄을 색인. 색인한 줄 수 반환."""
+        entries: List[_IndexEntry] = []
+        pos = start
+        with open(path, "rb") as f:
+            f.seek(start)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # 기록 중인 마지막 줄
+                offset, pos = pos, pos + len(raw)
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    obj = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                call_id = obj.get("call_id") if isinstance(obj, dict) else None
+                if call_id:
+                    entries.append((str(call_id), str(obj.get("ts") or ""), path.name, offset, len(raw)))
+        conn.executemany(
+            "INSERT OR IGNORE INTO cdr_index (call_id, ts, file, offset, length) VALUES (?, ?, ?, ?, ?)",
+            entries,
+        )
+        conn.execute(
+            "INSERT INTO cdr_files (file, indexed_bytes) VALUES (?, ?) "
+            "ON CONFLICT(file) DO UPDATE SET indexed_bytes = excluded.indexed_bytes",
+            (path.name, pos),
+        )
+        return len(entries)
+
+    def sync(self) -> int:
+        """디스크의 로그와 색인을 맞춘다 (새 꼬리 색인, 삭제·축소된 파일 정리). 새로 색인한 줄 수 반환."""
+        self.flush()
+        added = 0
+        with self._lock, self._connect() as conn:
+            known = self._indexed_bytes(conn)
+            on_disk = {p.name: p for p in self.log_dir.glob(LOG_GLOB)}
+            for name in set(known) - set(on_disk):
+                conn.execute("DELETE FROM cdr_index WHERE file = ?", (name,))
+                conn.execute("DELETE FROM cdr_files WHERE file = ?", (name,))
+            for name, path in sorted(on_disk.items()):
+                try:
+                    size = path.stat().st_size
+                except OSError:
+                    continue
+                start = known.get(name, 0)
+                if size < start:
+                    conn.execute("DELETE FROM cdr_index WHERE file = ?", (name,))
+                    start = 0
+                if size > start:
+                    try:
+                        added += self._index_tail(conn, path, start)
+                    except OSError as e:
+                        logger.warning("cdr_index_sync_failed file=%s err=%s", name, e)
+        return added
+
+    def rebuild(self) -> int:
+        """색인을 비우고 모든 로그에서 다시 만든다."""
+        with self._lock:
+            self._pending.clear()
+            with self._connect() as conn:
+                conn.execute("DELETE FROM cdr_index")
+                conn.execute("DELETE FROM cdr_files")
+        return self.sync()
+
+    # ── 조회 ──
+
+    def read_records(self, call_id: str, max_items: int = 5000) -> Tuple[List[Dict[str, Any]], bool]:
+        """call_id 행을 ts 순으로 최대 max_items개. (rows, truncated)"""
+        if not call_id or not str(call_id).strip():
+            return [], False
+        self.sync()
+        with self._connect() as conn:
+            hits = conn.execute(
+                "SELECT file, offset, length, ts FROM cdr_index WHERE call_id = ? ORDER BY ts, file, offset LIMIT ?",
+                (str(call_id), int(max_items) + 1),
+            ).fetchall()
+        truncated = len(hits) > max_items
+        hits = hits[:max_items]
+
+        keyed: List[Tuple[Tuple[str, int, int], Dict[str, Any]]] = []
+        by_file: Dict[str, List[Tuple[int, int, str]]] = {}
+        for file_name, offset, length, ts in hits:
+            by_file.setdefault(file_name, []).append((offset, length, ts))
+        for file_name, spans in by_file.items():
+            # 같은 ms의 줄은 기록 순서(일자·회전 조각·오프셋)로 — "x.1.log"가 "x.log"보다 앞에 정렬되지 않도록
+            parsed = parse_call_data_record_name(file_name)
+            part = parsed[1] if parsed else 0
+            try:
+                with open(self.log_dir / file_name, "rb") as f:
+                    for offset, length, ts in spans:
+                        f.seek(offset)
+                        try:
+                            obj = json.loads(f.read(length))
+                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            continue
+                        if isinstance(obj, dict) and str(obj.get("call_id") or "") == str(call_id):
+                            keyed.append(((str(obj.get("ts") or ts or ""), part, offset), obj))
+            except OSError:
+                continue
+        keyed.sort(key=lambda t: t[0])
+        return [obj for _, obj in keyed], truncated
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock, self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM cdr_index").fetchone()[0]
+            files = conn.execute("SELECT COUNT(*) FROM cdr_files").fetchone()[0]
+            return {"entries": int(entries), "files": int(files), "pending": len(self._pending)}
+
+
+def scan_call_data_records(log_dir: Path, call_id: str, max_items: int = 5000) -> Tuple[List[Dict[str, Any]], bool]:
+    """색인 없이 모든 로그를 읽는 기존 방식 (CDR_INDEX=0 또는 색인 오류 시)."""
+    rows: List[Dict[str, Any]] = []
+    want = str(call_id)
+    for path in sorted(Path(log_dir).glob(LOG_GLOB)):
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        obj = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if str(obj.get("call_id") or "") != want:
+                        continue
+                    if len(rows) >= max_items:
+                        rows.sort(key=lambda r: str(r.get("ts") or ""))
+                        return rows, True
+                    rows.append(obj)
+        except OSError:
+            continue
+    rows.sort(key=lambda r: str(r.get("ts") or ""))
+    return rows, False
+
+
+_indexes: Dict[str, CallDataRecordIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_call_data_record_index(log_dir: Path) -> Optional[CallDataRecordIndex]:
+    """로그 디렉터리별 색인 (비활성·DB 오류면 None)."""
+    if not cdr_index_enabled():
+        return None
+    key = str(Path(log_dir).resolve())
+    index = _indexes.get(key)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(key)
+            if index is None:
+                try:
+                    index = CallDataRecordIndex(Path(log_dir))
+                except (sqlite3.Error, OSError) as e:
+                    logger.warning("cdr_index_open_failed dir=%s err=%s", log_dir, e)
+                    return None
+                _indexes[key] = index
+    return index
+
+
+def read_call_data_records(log_dir: Path, call_id: str, max_items: int = 5000) -> Tuple[List[Dict[str, Any]], bool]:
+    """call_id의 call_data_record 행 (색인 우선, 실패 시 전체 스캔). (rows, truncated)"""
+    if not call_id or not str(call_id).strip() or not Path(log_dir).is_dir():
+        return [], False
+    index = get_call_data_record_index(log_dir)
+    if index is not None:
+        try:
+            return index.read_records(call_id, max_items)
+        except sqlite3.Error as e:
+            logger.warning("cdr_index_read_failed call_id=%s err=%s", call_id, e)
+    return scan_call_data_records(log_dir, call_id, max_items)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="call_data_record 로그 색인 보충/재구축")
+    parser.add_argument("--log-dir", default=str(Path(__file__).resolve().parent.parent.parent / "logs"))
+    parser.add_argument("--rebuild", action="store_true", help="색인을 비우고 처음부터 다시 만든다")
+    args = parser.parse_args(argv)
+
+    index = CallDataRecordIndex(Path(args.log_dir))
+    t0 = time.perf_counter()
+    added = index.rebuild() if args.rebuild else index.sync()
+    stats = index.get_stats()
+    print(
+        f"[cdr-index] {'rebuilt' if args.rebuild else 'synced'}: +{added} lines, "
+        f"{stats['entries']} entries / {stats['files']} files ({time.perf_counter() - t0:.2f}s) → {index.db_path}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,26 +1,106 @@
 """
 통화 데이터 기록 로그 (call_data_record_yyyymmdd.log)
 
-- 로그 경로: logs/call_data_record_YYYYMMDD.log (일 단위 파일)
-- 실시간 한 줄 단위 기록 (JSON Lines)
+- 로그 경로: logs/call_data_record_YYYYMMDD.log (일 단위 파일, 크기 초과 시 .1.log, .2.log ... 로 이어 씀)
+- 한 줄 단위 기록 (JSON Lines)
 - call_id, category, event 및 추가 필드 포함
 - 동일 페이로드를 WebSocket 이벤트 `call_debug_trace`로 브로드캐스트 (대시보드 실시간 디버그)
+- 줄마다 (call_id, ts, 파일, 바이트 오프셋, 길이)를 색인(call_data_record_index)에 넘겨
+  통화 상세 조회가 전체 로그를 스캔하지 않고 바로 seek한다
+
+기록은 백그라운드 writer 스레드가 맡는다. log_call_data()는 페이로드를 JSON 한 줄로 인코딩해(호출 시점의
+불변 스냅샷 — 호출부가 넘긴 list/dict를 나중에 고쳐도 기록은 바뀌지 않는다) bounded 큐(deque)에 넣고 바로
+반환하므로 SIP/RTP/AI 경로(이벤트 루프)에서 파일 I/O·락 대기가 빠진다.
+- 배치: CDR_FLUSH_INTERVAL_MS마다 또는 CDR_BATCH_SIZE건이 쌓이면 한 번에 write·flush
+- fsync: CDR_FSYNC_INTERVAL_SEC마다 (0=끔, 기본 — 기존과 같이 OS 버퍼까지만)
+- 회전: 날짜가 바뀌거나 파일이 CDR_LOG_MAX_MB를 넘으면 다음 파일 (0=크기 회전 끔)
+- 큐가 CDR_QUEUE_MAX건을 넘으면 새 기록을 버리고 dropped로 센다 (로그가 통화 처리를 막지 않도록)
+- 종료 시 close_call_data_record_log()가 큐를 비우고 닫는다 (atexit 에서도 호출)
+
+환경변수 CDR_ASYNC_WRITER=0 이면 호출 스레드에서 즉시 기록한다 (이전 동작).
 """
 
-import copy
+import atexit
 import json
+import logging
+import os
+import re
 import threading
+import time
+from collections import deque
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 # 한국 시간
 KST = timezone(timedelta(hours=9))
 
+LOG_PREFIX = "call_data_record_"
+_LOG_NAME_RE = re.compile(r"^call_data_record_(\d{8})(?:\.(\d+))?\.log$")
+
 _lock = threading.Lock()
 _current_date: Optional[str] = None
+_current_part: int = 0
 _file_handle: Optional[Any] = None
+_file_name: str = ""
+_file_offset: int = 0
 _log_dir: Optional[Path] = None
+_last_fsync: float = 0.0
+
+# writer 큐 — deque append/popleft는 GIL 아래 원자적이라 생산자 측 락이 없다
+# 항목: (ts, call_id, JSON 한 줄) — 인코딩은 log_call_data 호출 시점에 끝난다
+_Record = Tuple[str, str, str]
+_queue: Deque[_Record] = deque()
+_wake = threading.Event()
+_drain_lock = threading.Lock()
+_writer_lock = threading.Lock()
+_writer_thread: Optional[threading.Thread] = None
+_writer_stop = False
+_atexit_registered = False
+_last_drop_warning = 0.0
+
+_stats: Dict[str, int] = {
+    "enqueued": 0,
+    "written": 0,
+    "dropped": 0,
+    "batches": 0,
+    "fsyncs": 0,
+    "rotations": 0,
+}
+_flush_ms: Deque[float] = deque(maxlen=512)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _async_enabled() -> bool:
+    return os.environ.get("CDR_ASYNC_WRITER", "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+def _queue_max() -> int:
+    return max(1, int(_env_float("CDR_QUEUE_MAX", 20000)))
+
+
+def _batch_size() -> int:
+    return max(1, int(_env_float("CDR_BATCH_SIZE", 256)))
+
+
+def _flush_interval_sec() -> float:
+    return max(0.01, _env_float("CDR_FLUSH_INTERVAL_MS", 100) / 1000.0)
+
+
+def _fsync_interval_sec() -> float:
+    return max(0.0, _env_float("CDR_FSYNC_INTERVAL_SEC", 0))
+
+
+def _max_file_bytes() -> int:
+    return max(0, int(_env_float("CDR_LOG_MAX_MB", 256) * 1024 * 1024))
 
 
 def _project_root() -> Path:
@@ -39,6 +119,33 @@ def _today_str() -> str:
     return datetime.now(KST).strftime("%Y%m%d")
 
 
+def parse_call_data_record_name(name: str) -> Optional[Tuple[str, int]]:
+    """call_data_record_20260314.log → ("20260314", 0), call_data_record_20260314.2.log → ("20260314", 2)."""
+    m = _LOG_NAME_RE.match(name)
+    if not m:
+        return None
+    return m.group(1), int(m.group(2) or 0)
+
+
+def _log_path(log_dir: Path, day: str, part: int) -> Path:
+    if part <= 0:
+        return log_dir / f"{LOG_PREFIX}{day}.log"
+    return log_dir / f"{LOG_PREFIX}{day}.{part}.log"
+
+
+def call_data_record_log_paths(log_dir: Path, day: str) -> List[Path]:
+    """해당 일자(YYYYMMDD)의 로그 파일들 (크기 회전분 포함, 기록 순서)."""
+    paths: List[Tuple[int, Path]] = []
+    try:
+        for p in Path(log_dir).glob(f"{LOG_PREFIX}{day}*.log"):
+            parsed = parse_call_data_record_name(p.name)
+            if parsed and parsed[0] == day and p.is_file():
+                paths.append((parsed[1], p))
+    except OSError:
+        return []
+    return [p for _, p in sorted(paths)]
+
+
 # WebSocket 브로드캐스트용 — 과대 페이로드 방지 (파일 로그는 전체 유지)
 _WS_MAX_STR = 6000
 _WS_MAX_LIST = 80
@@ -73,47 +180,173 @@ def _broadcast_call_debug_trace(payload: Dict[str, Any]) -> None:
     try:
         from src.websocket.server import schedule_socket_emit
 
-        safe = _truncate_for_ws(copy.deepcopy(payload))
-        schedule_socket_emit("call_debug_trace", safe)
+        # _truncate_for_ws가 dict·list를 새로 만들어 돌려주므로 그 자체가 구독자용 스냅샷이다 (deepcopy 불필요)
+        schedule_socket_emit("call_debug_trace", _truncate_for_ws(payload))
     except Exception:
         pass
 
 
-def _ensure_file() -> Optional[Any]:
-    """날짜에 해당하는 오늘자 로그 파일 핸들 반환 (날짜 바뀌면 새 파일).
+def _close_file_locked() -> None:
+    global _file_handle
+    if _file_handle is not None:
+        try:
+            _file_handle.close()
+        except Exception:
+            pass
+        _file_handle = None
+
+
+def _ensure_file(day: Optional[str] = None) -> Optional[Any]:
+    """해당 일자 로그 파일 핸들 반환 (날짜 바뀌면 새 파일). _lock 안에서 호출.
 
-    파일을 처음 열 때 마지막 바이트를 확인한다.
-    이전 서버 비정상 종료로 마지막 라인이 개행 없이 끝났을 경우
+    파일을 처음 열 때 그날의 마지막 조각(.N.log)부터 이어 쓰고, 크기 한도를 넘었으면 다음 조각을 연다.
+    마지막 바이트도 확인한다 — 이전 서버 비정상 종료로 마지막 라인이 개행 없이 끝났을 경우
     새 개행을 삽입하여 다음 JSON 라인이 이전 라인에 붙지 않도록 한다.
     """
-    global _current_date, _file_handle
-    today = _today_str()
+    global _current_date, _current_part, _file_handle, _file_name, _file_offset
+    day = day or _today_str()
+    if _current_date != day:
+        _close_file_locked()
+        _current_date = day
+        existing = call_data_record_log_paths(_get_log_dir(), day)
+        _current_part = parse_call_data_record_name(existing[-1].name)[1] if existing else 0
+    if _file_handle is None:
+        log_dir = _get_log_dir()
+        max_bytes = _max_file_bytes()
+        path = _log_path(log_dir, day, _current_part)
+        try:
+            while max_bytes and path.exists() and path.stat().st_size >= max_bytes:
+                _current_part += 1
+                path = _log_path(log_dir, day, _current_part)
+            # 기존 파일이 있으면 마지막 바이트 확인 — 개행 없이 끝난 경우 복구
+            if path.exists() and path.stat().st_size > 0:
+                with open(path, "rb") as _rb:
+                    _rb.seek(-1, 2)
+                    last_byte = _rb.read(1)
+                if last_byte != b"\n":
+                    # 잘린 라인 뒤에 개행 추가 → 다음 JSON이 새 줄에 기록됨
+                    with open(path, "ab") as _ab:
+                        _ab.write(b"\n")
+            # 바이너리 append: 배치 단위로 버퍼에 모아 flush, 색인 바이트 오프셋이 실제 파일과 일치
+            _file_handle = open(path, "ab")
+            _file_name = path.name
+            _file_offset = path.stat().st_size
+        except Exception:
+            return None
+    return _file_handle
+
+
+def _index_line(call_id: str, ts: str, offset: int, length: int) -> None:
+    from src.common.call_data_record_index import get_call_data_record_index
+
+    index = get_call_data_record_index(_get_log_dir())
+    if index is not None:
+        index.add(call_id, ts, _file_name, offset, length)
+
+
+def _write_batch(records: List[_Record]) -> int:
+    """인코딩된 기록 묶음을 쓰고 한 번 flush. 쓴 줄 수."""
+    global _file_offset, _current_part, _last_fsync
+    started = time.perf_counter()
+    written = 0
+    max_bytes = _max_file_bytes()
     with _lock:
-        if _current_date != today:
-            if _file_handle is not None:
-                try:
-                    _file_handle.close()
-                except Exception:
-                    pass
-                _file_handle = None
-            _current_date = today
-        if _file_handle is None:
-            log_dir = _get_log_dir()
-            path = log_dir / f"call_data_record_{today}.log"
+        for ts, call_id, line in records:
+            # 줄의 ts 일자 파일에 기록 (자정 직전 큐에 들어간 기록이 다음 날 파일로 넘어가지 않도록)
+            day = ts[0:4] + ts[5:7] + ts[8:10] if len(ts) >= 10 else None
+            f = _ensure_file(day)
+            if f is None:
+                continue
+            data = (line + "\n").encode("utf-8")
+            f.write(data)
+            offset = _file_offset
+            _file_offset += len(data)
+            written += 1
+            try:
+                _index_line(call_id, ts, offset, len(data))
+            except Exception:
+                pass
+            if max_bytes and _file_offset >= max_bytes:
+                _close_file_locked()
+                _current_part += 1
+                _stats["rotations"] += 1
+        if _file_handle is not None:
             try:
-                # 기존 파일이 있으면 마지막 바이트 확인 — 개행 없이 끝난 경우 복구
-                if path.exists() and path.stat().st_size > 0:
-                    with open(path, "rb") as _rb:
-                        _rb.seek(-1, 2)
-                        last_byte = _rb.read(1)
-                    if last_byte != b"\n":
-                        # 잘린 라인 뒤에 개행 추가 → 다음 JSON이 새 줄에 기록됨
-                        with open(path, "ab") as _ab:
-                            _ab.write(b"\n")
-                _file_handle = open(path, "a", encoding="utf-8", buffering=1)
+                _file_handle.flush()
+                fsync_interval = _fsync_interval_sec()
+                if fsync_interval > 0 and time.monotonic() - _last_fsync >= fsync_interval:
+                    os.fsync(_file_handle.fileno())
+                    _last_fsync = time.monotonic()
+                    _stats["fsyncs"] += 1
             except Exception:
-                return None
-        return _file_handle
+                pass
+    _stats["written"] += written
+    _stats["batches"] += 1
+    _flush_ms.append((time.perf_counter() - started) * 1000.0)
+    return written
+
+
+def _drain() -> int:
+    """큐를 비울 때까지 배치 단위로 기록 + 브로드캐스트. writer 스레드·flush 호출이 같은 순서로 쓰도록 _drain_lock."""
+    total = 0
+    batch_size = _batch_size()
+    with _drain_lock:
+        while _queue:
+            batch: List[_Record] = []
+            while _queue and len(batch) < batch_size:
+                batch.append(_queue.popleft())
+            total += _write_batch(batch)
+            # 대시보드 실시간 디버그 (logs/call_data_record_*.log 와 동일 필드)
+            for record in batch:
+                _broadcast_record(record)
+    return total
+
+
+def _broadcast_record(record: _Record) -> None:
+    """기록된 한 줄을 다시 dict로 풀어 브로드캐스트 (call_id 없는 기록은 보내지 않으므로 디코딩 생략)."""
+    if not record[1]:
+        return
+    try:
+        _broadcast_call_debug_trace(json.loads(record[2]))
+    except Exception:
+        pass
+
+
+def _writer_loop() -> None:
+    interval = _flush_interval_sec()
+    while True:
+        _wake.wait(interval)
+        _wake.clear()
+        try:
+            _drain()
+        except Exception as e:
+            logger.warning("call_data_record_writer_error err=%s", e)
+        if _writer_stop and not _queue:
+            return
+
+
+def _start_writer() -> None:
+    global _writer_thread, _writer_stop, _atexit_registered
+    with _writer_lock:
+        if _writer_thread is not None and _writer_thread.is_alive():
+            return
+        _writer_stop = False
+        _writer_thread = threading.Thread(target=_writer_loop, name="call-data-record-writer", daemon=True)
+        _writer_thread.start()
+        if not _atexit_registered:
+            atexit.register(close_call_data_record_log)
+            _atexit_registered = True
+
+
+def _record_drop() -> None:
+    global _last_drop_warning
+    _stats["dropped"] += 1
+    now = time.monotonic()
+    if now - _last_drop_warning >= 10.0:
+        _last_drop_warning = now
+        logger.warning(
+            "call_data_record_queue_full depth=%s dropped=%s", len(_queue), _stats["dropped"]
+        )
 
 
 def log_call_data(
@@ -139,9 +372,6 @@ def log_call_data(
             chroma_knowledge_upsert(knowledge): doc_id·owner·category·embedding_dims·text_preview·chromadb_* .
     """
     try:
-        f = _ensure_file()
-        if f is None:
-            return
         now = datetime.now(KST).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3]
         payload = {
             "ts": now,
@@ -150,30 +380,76 @@ def log_call_data(
             "event": event,
             **kwargs,
         }
-        # JSON 직렬화 시 ensure_ascii=False, default=str
-        line = json.dumps(payload, ensure_ascii=False, default=str) + "\n"
-        with _lock:
-            # 서버 종료 시 close_call_data_record_log()가 먼저 호출된 뒤
-            # 이미 스케줄된 코루틴이 뒤늦게 log_call_data를 부르면 ValueError("I/O on closed file")가
-            # 발생해 main.py의 최상위 except에서 "Fatal Error"로 출력된다.
-            # f.closed를 명시적으로 확인해 조용히 스킵한다.
-            if f.closed:
-                return
-            f.write(line)
-            f.flush()
-        # 대시보드 실시간 디버그 (logs/call_data_record_*.log 와 동일 필드)
-        _broadcast_call_debug_trace(payload)
+        if not _async_enabled():
+            record = (now, str(call_id or ""), json.dumps(payload, ensure_ascii=False, default=str))
+            _write_batch([record])
+            _broadcast_call_debug_trace(payload)
+            return
+        if len(_queue) >= _queue_max():
+            _record_drop()
+            return
+        # 중첩 list/dict는 호출부와 공유되므로 큐에 넣기 전에 JSON으로 굳힌다 (writer는 이어 쓰기만)
+        _queue.append((now, str(call_id or ""), json.dumps(payload, ensure_ascii=False, default=str)))
+        _stats["enqueued"] += 1
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _start_writer()
+        elif len(_queue) >= _batch_size():
+            _wake.set()
     except Exception:
         pass  # 로그 실패가 비즈니스 로직에 영향 주지 않도록
 
 
+def flush_call_data_record_log() -> int:
+    """큐에 쌓인 기록을 호출 스레드에서 바로 써서 비운다 (종료·테스트·즉시 조회용). 쓴 줄 수."""
+    try:
+        return _drain()
+    except Exception:
+        return 0
+
+
 def close_call_data_record_log() -> None:
-    """현재 열린 call_data_record 로그 파일 핸들 닫기 (서버 종료 시 호출)."""
-    global _file_handle
+    """writer를 멈추고 큐를 비운 뒤 로그 파일 핸들 닫기 (서버 종료 시 호출)."""
+    global _writer_thread, _writer_stop
+    with _writer_lock:
+        thread = _writer_thread
+        if thread is not None:
+            _writer_stop = True
+            _wake.set()
+            if thread is not threading.current_thread():
+                thread.join(timeout=5.0)
+            _writer_thread = None
+    flush_call_data_record_log()
+    # 한 줄도 쓰지 않은 프로세스(종료 훅 등)에서 logs/·색인을 새로 만들지 않는다
+    if _log_dir is not None:
+        try:
+            from src.common.call_data_record_index import get_call_data_record_index
+
+            index = get_call_data_record_index(_log_dir)
+            if index is not None:
+                index.flush()
+        except Exception:
+            pass
     with _lock:
-        if _file_handle is not None:
-            try:
-                _file_handle.close()
-            except Exception:
-                pass
-            _file_handle = None
+        _close_file_locked()
+
+
+def get_call_data_record_writer_stats() -> Dict[str, Any]:
+    """writer 큐 깊이·드롭·배치 flush 지연 (운영 진단용)."""
+    recent = sorted(_flush_ms)
+
+    def _pct(q: float) -> float:
+        if not recent:
+            return 0.0
+        return round(recent[min(len(recent) - 1, int(q * len(recent)))], 3)
+
+    return {
+        "async": _async_enabled(),
+        "running": _writer_thread is not None and _writer_thread.is_alive(),
+        "queue_depth": len(_queue),
+        "queue_max": _queue_max(),
+        **_stats,
+        "flush_ms_p50": _pct(0.5),
+        "flush_ms_p95": _pct(0.95),
+        "flush_ms_max": round(recent[-1], 3) if recent else 0.0,
+        "file": _file_name,
+    }
@@ -9,7 +9,9 @@
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.common.call_data_record_logger import parse_call_data_record_name
 
 
 def _project_root() -> Path:
@@ -35,24 +37,22 @@ def get_call_data_record_log_paths(
     directory = log_dir or _default_log_dir()
     if not directory.exists():
         return []
-    paths: List[Path] = []
+    paths: List[Tuple[str, int, Path]] = []
     for f in directory.iterdir():
-        if not f.is_file() or not f.name.startswith("call_data_record_") or not f.name.endswith(".log"):
+        if not f.is_file():
             continue
-        try:
-            # call_data_record_20260314.log -> 20260314
-            date_str = f.stem.replace("call_data_record_", "")
-            if len(date_str) != 8 or not date_str.isdigit():
-                continue
-            if from_date and date_str < from_date:
-                continue
-            if to_date and date_str > to_date:
-                continue
-            paths.append(f)
-        except Exception:
+        # call_data_record_20260314.log -> ("20260314", 0), 크기 회전분 .1.log -> ("20260314", 1)
+        parsed = parse_call_data_record_name(f.name)
+        if parsed is None:
+            continue
+        date_str, part = parsed
+        if from_date and date_str < from_date:
+            continue
+        if to_date and date_str > to_date:
             continue
-    paths.sort(key=lambda p: p.name)
-    return paths
+        paths.append((date_str, part, f))
+    paths.sort(key=lambda t: (t[0], t[1]))
+    return [p for _, _, p in paths]
 
 
 def _parse_line(line: str) -> Optional[Dict[str, Any]]:
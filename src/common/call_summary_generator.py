@@ -138,7 +138,9 @@ async def generate_call_summary_llm(transcript: str, *, is_ai_call: bool) -> str
 [대본]
 {transcript}
 """
-        out = await llm.generate_simple(prompt, max_tokens=1024, timeout_seconds=45.0)
+        out = await llm.generate_simple(
+            prompt, max_tokens=1024, timeout_seconds=45.0, cache_site="call_summary"
+        )
         result = (out or "").strip()
         logger.info(
             "call_summary_llm_generated",
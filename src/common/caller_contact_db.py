@@ -1,4 +1,4 @@
-"""caller_contacts 테이블 CRUD (booking.db 공유)."""
+"""caller_contacts 테이블 CRUD (booking.db 공유 — 조회는 풀 연결, 쓰기는 booking.db writer)."""
 
 from __future__ import annotations
 
@@ -159,9 +159,9 @@ def insert_caller_contact_manual(
     fid = _norm_folder_id(folder_id)
     cid = f"cc_{uuid.uuid4().hex[:16]}"
     try:
-        from src.booking.database import get_db
+        from src.booking.database import get_write_db
 
-        with get_db() as conn:
+        with get_write_db() as conn:
             if fid:
                 from src.common.contact_folder_db import validate_folder_id_for_contact
 
@@ -209,9 +209,9 @@ def update_caller_contact(
     if not oid or not own:
         return None
     try:
-        from src.booking.database import get_db
+        from src.booking.database import get_write_db
 
-        with get_db() as conn:
+        with get_write_db() as conn:
             row = conn.execute(
                 "SELECT * FROM caller_contacts WHERE id = ? AND owner = ?", (oid, own)
             ).fetchone()
@@ -276,9 +276,9 @@ def delete_caller_contact(*, contact_id: str, owner: str) -> bool:
     if not oid or not own:
         return False
     try:
-        from src.booking.database import get_db
+        from src.booking.database import get_write_db
 
-        with get_db() as conn:
+        with get_write_db() as conn:
             cur = conn.execute(
                 "DELETE FROM caller_contacts WHERE id = ? AND owner = ?", (oid, own)
             )
@@ -303,9 +303,9 @@ def upsert_auto_llm_contact(
     if not own or not key or not name:
         return "skipped_empty"
     try:
-        from src.booking.database import get_db
+        from src.booking.database import get_write_db
 
-        with get_db() as conn:
+        with get_write_db() as conn:
             from src.common.contact_folder_db import ensure_default_unfiled_folder
 
             unif = ensure_default_unfiled_folder(conn, own)
@@ -0,0 +1,332 @@
+"""
+녹음 디렉터리 카탈로그 (recordings/<세션>/metadata.json 색인, SQLite 사이드카).
+
+녹음 정보·재생·다운로드·통화 이력은 call_id 하나를 찾으려고 모든 세션 디렉터리의 metadata.json을
+열어 json.load 했다 (요청 한 번에 두 번씩인 경로도 있음). 녹음이 쌓일수록 조회가 O(녹음 수) 파일 작업이 된다.
+
+- 카탈로그: <recordings_root>/.recordings_catalog.db
+    recordings(call_id PK, directory, dir_mtime_ns, meta_mtime_ns, start_time, end_time, duration,
+               files(JSON: name·size_bytes·mime), metadata(JSON))
+- 기록: SIPCallRecorder.stop_recording()이 metadata.json을 쓴 직후 upsert_directory()
+- 동기화(refresh): 세션 디렉터리·metadata.json의 mtime만 stat해서 바뀐 것만 다시 읽고, 사라진 디렉터리는 삭제.
+  첫 사용 때 전체, 이후에는 루트 mtime이 바뀌었거나
+  refresh_interval_sec가 지났을 때만. 조회 miss는 miss_refresh_sec 간격으로만 refresh를 유발한다.
+- 조회: get()/find_call_dir()는 call_id PK 조회 1회 (+ 디렉터리 존재 확인).
+
+환경변수 RECORDINGS_CATALOG=0 이면 호출부는 기존 디렉터리 스캔을 쓴다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CATALOG_DB_NAME = ".recordings_catalog.db"
+DEFAULT_REFRESH_INTERVAL_SEC = 30.0
+DEFAULT_MISS_REFRESH_SEC = 2.0
+
+# 지원 오디오 확장자 (소문자)
+AUDIO_EXTENSIONS = frozenset({".wav", ".mp3", ".m4a", ".ogg", ".webm", ".flac"})
+
+MIME_BY_EXT = {
+    ".wav": "audio/wav",
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".ogg": "audio/ogg",
+    ".webm": "audio/webm",
+    ".flac": "audio/flac",
+}
+
+
+def recordings_catalog_enabled() -> bool:
+    return os.environ.get("RECORDINGS_CATALOG", "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+def list_audio_files(call_dir: Path) -> List[Dict[str, Any]]:
+    """세션 디렉터리 내 오디오 파일 목록 (이름·크기·mime)."""
+    out: List[Dict[str, Any]] = []
+    try:
+        for p in sorted(call_dir.iterdir()):
+            if not p.is_file():
+                continue
+            ext = p.suffix.lower()
+            if ext not in AUDIO_EXTENSIONS:
+                continue
+            out.append(
+                {
+                    "name": p.name,
+                    "size_bytes": p.stat().st_size,
+                    "mime": MIME_BY_EXT.get(ext, "application/octet-stream"),
+                }
+            )
+    except OSError:
+        pass
+    return out
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+class RecordingsCatalog:
+    """녹음 루트 1개의 call_id → 세션 디렉터리·파일 카탈로그."""
+
+    def __init__(
+        self,
+        root: Path,
+        db_path: Optional[Path] = None,
+        refresh_interval_sec: float = DEFAULT_REFRESH_INTERVAL_SEC,
+        miss_refresh_sec: float = DEFAULT_MISS_REFRESH_SEC,
+    ) -> None:
+        self.root = Path(root)
+        self.db_path = Path(db_path) if db_path else self.root / CATALOG_DB_NAME
+        self.refresh_interval_sec = float(refresh_interval_sec)
+        self.miss_refresh_sec = float(miss_refresh_sec)
+        self._lock = threading.RLock()
+        self._synced = False
+        self._root_mtime_ns = 0
+        self._last_refresh = 0.0
+        self._last_miss_refresh = 0.0
+        self.lookups = 0
+        self.hits = 0
+        self.refreshes = 0
+        self._init_db()
+
+    # ── DB ──
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=5.0)
+
+    def _init_db(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS recordings (
+                    call_id TEXT PRIMARY KEY,
+                    directory TEXT NOT NULL,
+                    dir_mtime_ns INTEGER NOT NULL DEFAULT 0,
+                    meta_mtime_ns INTEGER NOT NULL DEFAULT 0,
+                    start_time TEXT,
+                    end_time TEXT,
+                    duration REAL,
+                    files TEXT NOT NULL DEFAULT '[]',
+                    metadata TEXT NOT NULL DEFAULT '{}',
+                    updated_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_recordings_directory ON recordings(directory);
+                CREATE INDEX IF NOT EXISTS idx_recordings_end_time ON recordings(end_time DESC);
+                """
+            )
+
+    # ── 기록 ──
+
+    def _upsert(self, conn: sqlite3.Connection, call_dir: Path) -> Optional[str]:
+        meta_path = call_dir / "metadata.json"
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(meta, dict) or not meta.get("call_id"):
+            return None
+        call_id = str(meta["call_id"])
+        duration = meta.get("duration")
+        conn.execute(
+            "DELETE FROM recordings WHERE directory = ? AND call_id != ?", (str(call_dir), call_id)
+        )
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO recordings
+                (call_id, directory, dir_mtime_ns, meta_mtime_ns, start_time, end_time, duration, files, metadata, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                call_id,
+                str(call_dir),
+                _mtime_ns(call_dir),
+                _mtime_ns(meta_path),
+                str(meta.get("start_time") or ""),
+                str(meta.get("end_time") or ""),
+                float(duration) if isinstance(duration, (int, float)) else None,
+                json.dumps(list_audio_files(call_dir), ensure_ascii=False),
+                json.dumps(meta, ensure_ascii=False, default=str),
+                time.time(),
+            ),
+        )
+        return call_id
+
+    def upsert_directory(self, call_dir: Path) -> Optional[str]:
+        """녹음 종료 시 세션 디렉터리 1개를 카탈로그에 반영. 반영한 call_id (metadata 없으면 None)."""
+        with self._lock, self._connect() as conn:
+            return self._upsert(conn, Path(call_dir))
+
+    # ── 동기화 ──
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """디스크와 카탈로그를 맞춘다 (mtime이 바뀐 디렉터리만 다시 읽음)."""
+        with self._lock:
+            root_mtime = _mtime_ns(self.root)
+            now = time.monotonic()
+            if (
+                not force
+                and self._synced
+                and root_mtime == self._root_mtime_ns
+                and now - self._last_refresh < self.refresh_interval_sec
+            ):
+                return {"scanned": 0, "updated": 0, "removed": 0}
+            scanned = updated = removed = 0
+            with self._connect() as conn:
+                known = {
+                    row[0]: (int(row[1]), int(row[2]))
+                    for row in conn.execute("SELECT directory, dir_mtime_ns, meta_mtime_ns FROM recordings")
+                }
+                seen = set()
+                if self.root.is_dir():
+                    for sub in self.root.iterdir():
+                        if sub.name.startswith(".") or not sub.is_dir():
+                            continue
+                        scanned += 1
+                        key = str(sub)
+                        seen.add(key)
+                        stamp = (_mtime_ns(sub), _mtime_ns(sub / "metadata.json"))
+                        if known.get(key) == stamp:
+                            continue
+                        if self._upsert(conn, sub) is not None:
+                            updated += 1
+                for directory in set(known) - seen:
+                    conn.execute("DELETE FROM recordings WHERE directory = ?", (directory,))
+                    removed += 1
+            self._synced = True
+            self._root_mtime_ns = root_mtime
+            self._last_refresh = now
+            self.refreshes += 1
+            if updated or removed:
+                logger.debug(
+                    "recordings_catalog_refreshed root=%s scanned=%s updated=%s removed=%s",
+                    self.root, scanned, updated, removed,
+                )
+            return {"scanned": scanned, "updated": updated, "removed": removed}
+
+    def _ensure_synced(self) -> None:
+        if not self._synced:
+            self.refresh(force=True)
+
+    # ── 조회 ──
+
+    def _select(self, call_id: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT call_id, directory, duration, files, metadata FROM recordings WHERE call_id = ?",
+                (call_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "call_id": row[0],
+            "directory": Path(row[1]),
+            "duration": row[2],
+            "files": json.loads(row[3] or "[]"),
+            "metadata": json.loads(row[4] or "{}"),
+        }
+
+    def get(self, call_id: str) -> Optional[Dict[str, Any]]:
+        """call_id의 {call_id, directory(Path), duration, files, metadata}. 없으면 None."""
+        if not (call_id or "").strip():
+            return None
+        call_id = str(call_id)
+        with self._lock:
+            self.lookups += 1
+            self._ensure_synced()
+            entry = self._select(call_id)
+            if entry is not None and not entry["directory"].is_dir():
+                self.refresh(force=True)
+                entry = self._select(call_id)
+            elif entry is None and time.monotonic() - self._last_miss_refresh >= self.miss_refresh_sec:
+                # 카탈로그 밖에서 만들어진 녹음(다른 프로세스·수동 복사) — miss 때만 제한적으로 보충
+                self._last_miss_refresh = time.monotonic()
+                self.refresh()
+                entry = self._select(call_id)
+            if entry is not None:
+                self.hits += 1
+            return entry
+
+    def find_call_dir(self, call_id: str) -> Optional[Path]:
+        entry = self.get(call_id)
+        return entry["directory"] if entry is not None else None
+
+    def metadata_rows(self) -> List[Dict[str, Any]]:
+        """모든 녹음의 metadata.json 내용 (+ `_call_dir`) — 통화 이력 파일 스캔 대체."""
+        with self._lock:
+            self._ensure_synced()
+            self.refresh()
+            with self._connect() as conn:
+                rows = conn.execute("SELECT directory, metadata FROM recordings").fetchall()
+        out: List[Dict[str, Any]] = []
+        for directory, raw in rows:
+            try:
+                meta = json.loads(raw or "{}")
+            except json.JSONDecodeError:
+                continue
+            meta["_call_dir"] = directory
+            out.append(meta)
+        return out
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock, self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM recordings").fetchone()[0]
+        return {
+            "root": str(self.root),
+            "entries": int(entries),
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "refreshes": self.refreshes,
+        }
+
+
+_catalogs: Dict[str, RecordingsCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_recordings_catalog(root: Path) -> Optional[RecordingsCatalog]:
+    """녹음 루트별 카탈로그 (비활성·DB 오류·루트 없음이면 None — 호출부는 디렉터리 스캔으로 폴백)."""
+    if not recordings_catalog_enabled():
+        return None
+    path = Path(root).resolve()
+    key = str(path)
+    catalog = _catalogs.get(key)
+    if catalog is None:
+        with _catalogs_lock:
+            catalog = _catalogs.get(key)
+            if catalog is None:
+                if not path.is_dir():
+                    return None
+                try:
+                    catalog = RecordingsCatalog(path)
+                except (sqlite3.Error, OSError) as e:
+                    logger.warning("recordings_catalog_open_failed root=%s err=%s", path, e)
+                    return None
+                _catalogs[key] = catalog
+    return catalog
+
+
+def record_finalized_recording(output_dir: Path, call_dir: Path) -> None:
+    """녹음기가 metadata.json을 쓴 직후 호출 (실패해도 녹음에는 영향 없음)."""
+    try:
+        catalog = get_recordings_catalog(output_dir)
+        if catalog is not None:
+            catalog.upsert_directory(Path(call_dir).resolve())
+    except Exception as e:
+        logger.warning("recordings_catalog_upsert_failed dir=%s err=%s", call_dir, e)
@@ -0,0 +1,447 @@
+"""
+공유 SQLite 접근 계층 — DB 파일별 연결 풀
+
+call_control.db·booking.db·calls.db 접근 계층이 작업마다 sqlite3.connect()를 새로 열던 것을 대신한다.
+
+- DB 파일(절대 경로)별 SQLitePool 하나 (get_sqlite_pool)
+- 연결을 만들 때 한 번만 PRAGMA 적용: journal_mode=WAL, synchronous=NORMAL, cache_size, mmap_size
+  (+ 요청 시 foreign_keys=ON). 연결마다 prepared statement 캐시(cached_statements)를 유지하므로
+  같은 SQL은 재컴파일되지 않는다
+- connect(): 기존 "conn = _conn(); ...; conn.close()" 코드를 그대로 쓰도록 PooledConnection을 돌려주며,
+  close()는 (열린 트랜잭션을 롤백한 뒤) 풀에 반납한다. 빈 연결이 없으면 새로 열고, 유휴 연결이
+  readers개를 넘으면 실제로 닫는다 (대기·고갈 없음)
+- connect_writer() / SQLitePool.write(): DB당 전용 writer 연결 하나를 RLock으로 직렬화해 빌려준다.
+  같은 스레드의 중첩 대여는 바깥 트랜잭션에 합류하고, close()/블록 종료가 잠금을 푼다
+  (가장 바깥에서 commit 안 된 트랜잭션은 롤백)
+- arun() / to_thread(): 이벤트 루프에서 부르는 DB 작업을 전용 executor 스레드("sqlite")에서 실행
+  (contextvars 전파) — 라우팅·예약 도구·링백·통화 이력 조회가 루프에서 디스크를 기다리지 않도록
+- execute 단위 지연 측정 — SQLITE_SLOW_QUERY_MS 이상이면 warning 로그
+- 통계 카운터는 여러 스레드에서 갱신되므로 풀 잠금 안에서만 바꾼다
+
+환경 변수:
+  SQLITE_POOL=0             풀 비활성 (매번 sqlite3.connect — 이전 동작)
+  SQLITE_POOL_READERS       DB당 유휴 연결 수 상한 (기본 4)
+  SQLITE_CACHE_KIB          연결당 page cache (기본 16384 KiB)
+  SQLITE_MMAP_MB            mmap_size (기본 256 MB, 0이면 끔)
+  SQLITE_SLOW_QUERY_MS      느린 쿼리 기준 (기본 200 ms)
+  SQLITE_EXECUTOR_WORKERS   arun()/to_thread() executor 스레드 수 (기본 4)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, str(default)))
+    except ValueError:
+        return default
+
+
+class PooledConnection(sqlite3.Connection):
+    """풀 소속 연결 — close()는 풀 반납, execute 계열은 지연 측정."""
+
+    _pool: Optional["SQLitePool"] = None
+    _checked_out = False
+    _is_writer = False
+
+    def execute(self, sql, parameters=(), /):
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            if self._pool is not None:
+                self._pool._observe(sql, started)
+
+    def executemany(self, sql, seq_of_parameters, /):
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            if self._pool is not None:
+                self._pool._observe(sql, started)
+
+    def executescript(self, sql_script, /):
+        started = time.perf_counter()
+        try:
+            return super().executescript(sql_script)
+        finally:
+            if self._pool is not None:
+                self._pool._observe(sql_script, started)
+
+    def close(self):
+        if self._is_writer:
+            if self._pool is not None:
+                self._pool.release_writer(self)
+            return  # writer는 풀 수명과 같다
+        pool = self._pool
+        if pool is None:
+            super().close()
+            return
+        pool.release(self)
+
+    def _close_for_real(self):
+        self._pool = None
+        sqlite3.Connection.close(self)
+
+
+class SQLitePool:
+    """DB 파일 하나의 연결 풀 (직렬화된 writer 1 + 유휴 reader 최대 readers개)"""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        readers: Optional[int] = None,
+        foreign_keys: bool = False,
+        timeout: float = 5.0,
+    ):
+        self.path = str(path)
+        self.readers = max(1, readers if readers is not None else _env_int("SQLITE_POOL_READERS", 4))
+        self.foreign_keys = foreign_keys
+        self.timeout = timeout
+        self.slow_query_ms = _env_float("SQLITE_SLOW_QUERY_MS", 200.0)
+        self._idle: List[PooledConnection] = []
+        self._lock = threading.Lock()
+        self._writer: Optional[PooledConnection] = None
+        self._writer_lock = threading.RLock()
+        self._writer_depth = 0
+        self._closed = False
+        self.stats = {
+            "acquired": 0,
+            "reused": 0,
+            "writer_acquired": 0,
+            "writer_wait_ms_total": 0.0,
+            "opened": 0,
+            "closed": 0,
+            "queries": 0,
+            "slow_queries": 0,
+            "query_ms_total": 0.0,
+        }
+
+    def _open(self) -> PooledConnection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            factory=PooledConnection,
+            cached_statements=256,
+        )
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error as e:
+            logger.warning("sqlite_pool_wal_unavailable path=%s err=%s", self.path, e)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{max(0, _env_int('SQLITE_CACHE_KIB', 16384))}")
+        conn.execute(f"PRAGMA mmap_size={max(0, _env_int('SQLITE_MMAP_MB', 256)) * 1024 * 1024}")
+        if self.foreign_keys:
+            conn.execute("PRAGMA foreign_keys=ON")
+        conn._pool = self
+        with self._lock:
+            self.stats["opened"] += 1
+        return conn
+
+    def acquire(self, row_factory: Optional[Callable] = None) -> PooledConnection:
+        """연결 하나 대여 (유휴 연결 재사용, 없으면 새로 연다)"""
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+            self.stats["acquired"] += 1
+            if conn is not None:
+                self.stats["reused"] += 1
+        if conn is None:
+            conn = self._open()
+        conn._checked_out = True
+        conn.row_factory = row_factory
+        return conn
+
+    def release(self, conn: PooledConnection):
+        """반납 — 커밋 안 된 트랜잭션은 롤백 (연결을 닫을 때와 같은 의미)"""
+        if not conn._checked_out:
+            return  # 중복 close()
+        conn._checked_out = False
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+        with self._lock:
+            if not self._closed and len(self._idle) < self.readers:
+                self._idle.append(conn)
+                return
+        self._discard(conn)
+
+    def acquire_writer(self, row_factory: Optional[Callable] = None) -> PooledConnection:
+        """전용 writer 연결 대여 — 다른 스레드의 writer가 반납될 때까지 대기.
+
+        같은 스레드의 중첩 대여는 같은 연결(바깥 트랜잭션)을 돌려준다. 대여마다 close() 또는
+        release_writer()를 정확히 한 번 불러야 잠금이 풀린다.
+        """
+        started = time.perf_counter()
+        self._writer_lock.acquire()
+        try:
+            if self._writer is None:
+                conn = self._open()
+                conn._is_writer = True
+                self._writer = conn
+            if self._writer_depth == 0:
+                self._writer.row_factory = row_factory
+            self._writer_depth += 1
+        except BaseException:
+            self._writer_lock.release()
+            raise
+        with self._lock:
+            self.stats["writer_acquired"] += 1
+            self.stats["writer_wait_ms_total"] += (time.perf_counter() - started) * 1000.0
+        return self._writer
+
+    def release_writer(self, conn: PooledConnection):
+        """writer 반납 — 가장 바깥 대여가 끝날 때 커밋 안 된 트랜잭션은 롤백"""
+        if self._writer_depth <= 0 or conn is not self._writer:
+            return  # 중복 close()
+        self._writer_depth -= 1
+        try:
+            if self._writer_depth == 0 and conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            pass
+        finally:
+            self._writer_lock.release()
+
+    def _discard(self, conn: PooledConnection):
+        try:
+            conn._close_for_real()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self.stats["closed"] += 1
+
+    def _observe(self, sql: str, started: float):
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        slow = elapsed_ms >= self.slow_query_ms
+        with self._lock:
+            self.stats["queries"] += 1
+            self.stats["query_ms_total"] += elapsed_ms
+            if slow:
+                self.stats["slow_queries"] += 1
+        if slow:
+            logger.warning(
+                "sqlite_slow_query db=%s ms=%.1f sql=%s",
+                Path(self.path).name,
+                elapsed_ms,
+                " ".join(str(sql).split())[:200],
+            )
+
+    @contextmanager
+    def connection(self, row_factory: Optional[Callable] = None) -> Iterator[PooledConnection]:
+        """대여 연결 — 정상 종료 시 commit, 예외 시 rollback, 끝나면 반납"""
+        conn = self.acquire(row_factory)
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.release(conn)
+
+    @contextmanager
+    def read(self, row_factory: Optional[Callable] = None) -> Iterator[PooledConnection]:
+        """읽기 전용 대여 (commit 없음)"""
+        conn = self.acquire(row_factory)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    @contextmanager
+    def write(self, row_factory: Optional[Callable] = None) -> Iterator[PooledConnection]:
+        """writer 대여 — 가장 바깥 블록에서 정상 종료 시 commit, 예외 시 rollback"""
+        conn = self.acquire_writer(row_factory)
+        outer = self._writer_depth == 1
+        try:
+            yield conn
+            if outer:
+                conn.commit()
+        except Exception:
+            if outer:
+                conn.rollback()
+            raise
+        finally:
+            self.release_writer(conn)
+
+    def run(self, fn: Callable[[sqlite3.Connection], T], *, write: bool = False, row_factory: Optional[Callable] = None) -> T:
+        """fn(conn)을 대여 연결(write=True면 writer)로 실행"""
+        ctx = self.write(row_factory) if write else self.connection(row_factory)
+        with ctx as conn:
+            return fn(conn)
+
+    async def arun(self, fn: Callable[[sqlite3.Connection], T], *, write: bool = False, row_factory: Optional[Callable] = None) -> T:
+        """run()을 전용 executor 스레드에서 (이벤트 루프 비차단)"""
+        return await to_thread(self.run, fn, write=write, row_factory=row_factory)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            self._discard(conn)
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+            if writer is not None:
+                try:
+                    writer._close_for_real()
+                except sqlite3.Error:
+                    pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            idle = len(self._idle)
+        queries = stats["queries"]
+        return {
+            **stats,
+            "query_ms_total": round(stats["query_ms_total"], 1),
+            "avg_query_ms": round(stats["query_ms_total"] / queries, 3) if queries else None,
+            "idle": idle,
+            "has_writer": self._writer is not None,
+        }
+
+
+_pools: Dict[str, SQLitePool] = {}
+_pools_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=max(1, _env_int("SQLITE_EXECUTOR_WORKERS", 4)),
+                    thread_name_prefix="sqlite",
+                )
+    return _executor
+
+
+async def to_thread(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """DB를 건드리는 동기 함수를 전용 executor에서 실행 (asyncio.to_thread처럼 contextvars 전파)"""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_get_executor(), functools.partial(ctx.run, fn, *args, **kwargs))
+
+
+def sqlite_pool_enabled() -> bool:
+    return os.environ.get("SQLITE_POOL", "1") != "0"
+
+
+def get_sqlite_pool(path: Union[str, Path], foreign_keys: bool = False) -> SQLitePool:
+    """DB 파일별 풀 싱글톤"""
+    key = os.path.abspath(str(path))
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = SQLitePool(key, foreign_keys=foreign_keys)
+                _pools[key] = pool
+    return pool
+
+
+def connect(
+    path: Union[str, Path],
+    row_factory: Optional[Callable] = None,
+    foreign_keys: bool = False,
+) -> sqlite3.Connection:
+    """풀 연결 대여 (close()로 반납). SQLITE_POOL=0이면 일반 sqlite3.connect"""
+    if not sqlite_pool_enabled():
+        conn = sqlite3.connect(str(path), check_same_thread=False)
+        conn.row_factory = row_factory
+        if foreign_keys:
+            conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+    return get_sqlite_pool(path, foreign_keys=foreign_keys).acquire(row_factory)
+
+
+def connect_writer(
+    path: Union[str, Path],
+    row_factory: Optional[Callable] = None,
+    foreign_keys: bool = False,
+) -> sqlite3.Connection:
+    """DB 전용 writer 대여 (close()로 반납·잠금 해제). SQLITE_POOL=0이면 일반 sqlite3.connect"""
+    if not sqlite_pool_enabled():
+        return connect(path, row_factory=row_factory, foreign_keys=foreign_keys)
+    return get_sqlite_pool(path, foreign_keys=foreign_keys).acquire_writer(row_factory)
+
+
+def run(
+    path: Union[str, Path],
+    fn: Callable[[sqlite3.Connection], T],
+    *,
+    write: bool = False,
+    row_factory: Optional[Callable] = None,
+    foreign_keys: bool = False,
+) -> T:
+    """fn(conn)을 path DB의 대여 연결(write=True면 writer)로 실행 — 정상 종료 시 commit, 예외 시 rollback"""
+    if sqlite_pool_enabled():
+        return get_sqlite_pool(path, foreign_keys=foreign_keys).run(fn, write=write, row_factory=row_factory)
+    conn = connect(path, row_factory=row_factory, foreign_keys=foreign_keys)
+    try:
+        result = fn(conn)
+        conn.commit()
+        return result
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+async def arun(
+    path: Union[str, Path],
+    fn: Callable[[sqlite3.Connection], T],
+    *,
+    write: bool = False,
+    row_factory: Optional[Callable] = None,
+    foreign_keys: bool = False,
+) -> T:
+    """run()을 전용 executor 스레드에서 (이벤트 루프 비차단)"""
+    return await to_thread(run, path, fn, write=write, row_factory=row_factory, foreign_keys=foreign_keys)
+
+
+def get_sqlite_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """DB 파일명별 풀 통계 (metrics /runtime)"""
+    return {Path(path).name: pool.get_stats() for path, pool in list(_pools.items())}
+
+
+def close_all_sqlite_pools():
+    """종료 시 모든 풀 연결 닫기"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
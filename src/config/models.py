@@ -211,6 +211,9 @@ class CDRConfig(BaseModel):
         default=False,
         description="True면 CDR을 들여쓰기된 JSON으로 저장(디버깅용 가시성). False면 한 줄 한 레코드(JSONL 표준).",
     )
+    max_file_mb: float = Field(default=64.0, ge=0, description="세그먼트 크기 한도 MB (0이면 날짜로만 회전)")
+    fsync_every: int = Field(default=32, ge=0, description="이 건수마다 fsync 그룹 커밋 (0이면 fsync 안 함)")
+    compact: bool = Field(default=True, description="닫힌 세그먼트를 cdr_store.db(SQLite)로 압축해 조회 색인")
 
 
 class LoggingConfig(BaseModel):
@@ -289,6 +292,9 @@ class KnowledgeExtractionConfig(BaseModel):
     auto_approve: Optional[dict] = Field(default=None, description="자동 승인 설정 (v2)")
     max_llm_calls_per_extraction: int = Field(default=6, description="추출당 최대 LLM 호출 수")
     skip_short_calls_seconds: int = Field(default=30, description="스킵할 짧은 통화 기준 (초)")
+    max_concurrent_extractions: int = Field(
+        default=2, description="동시에 추출을 진행할 최대 통화 수 (초과분은 대기열, v2)"
+    )
 
 
 class RecordingConfig(BaseModel):
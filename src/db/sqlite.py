@@ -6,11 +6,13 @@ SQLite 저장소 — 통화 이력(call_history), 발신자별 요약(call_summa
 
 import json
 import os
-import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from src.common.sqlite_pool import connect as _pool_connect
+from src.common.sqlite_pool import connect_writer as _pool_connect_writer
+
 # DB 경로 (디렉터리 생성 포함)
 def get_db_path() -> str:
     path = os.environ.get("SQLITE_DB_PATH", "data/calls.db")
@@ -19,7 +21,13 @@ def get_db_path() -> str:
 
 
 def _conn():
-    return sqlite3.connect(get_db_path(), check_same_thread=False)
+    """공유 풀 연결 (close()는 풀 반납)."""
+    return _pool_connect(get_db_path())
+
+
+def _write_conn():
+    """DB 전용 writer 연결 (쓰기 직렬화, close()로 반납)."""
+    return _pool_connect_writer(get_db_path())
 
 
 def _row_to_entry(row: tuple, col_names: List[str]) -> Dict[str, Any]:
@@ -48,7 +56,7 @@ _CALL_HISTORY_COLS = [
 
 def init_db() -> None:
     """테이블 생성 (없을 때만)."""
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.executescript("""
             CREATE TABLE IF NOT EXISTS call_history (
@@ -94,7 +102,7 @@ def append_call_history_row(entry: Dict[str, Any]) -> None:
     call_id = entry.get("call_id") or ""
     if not call_id:
         return
-    conn = _conn()
+    conn = _write_conn()
     try:
         transcripts = entry.get("transcripts")
         if isinstance(transcripts, list):
@@ -143,7 +151,7 @@ def record_hitl_request_row(
 ) -> None:
     """HITL 발생 시 행 있으면 UPDATE, 없으면 INSERT."""
     now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-    conn = _conn()
+    conn = _write_conn()
     try:
         cur = conn.execute(
             "SELECT id FROM call_history WHERE call_id = ?", (call_id,)
@@ -201,7 +209,7 @@ def record_hitl_request_row(
 
 
 def mark_hitl_resolved_row(call_id: str) -> None:
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             "UPDATE call_history SET hitl_status = ?, resolved = 1 WHERE call_id = ?",
@@ -213,7 +221,7 @@ def mark_hitl_resolved_row(call_id: str) -> None:
 
 
 def mark_pending_hitl_unresolved_row(call_id: str) -> None:
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             """UPDATE call_history SET hitl_status = 'unresolved'
@@ -281,7 +289,7 @@ def update_call_note_row(
     follow_up_phone: Optional[str] = None,
 ) -> bool:
     """메모 저장. 행 없으면 False."""
-    conn = _conn()
+    conn = _write_conn()
     try:
         cur = conn.execute(
             """UPDATE call_history SET operator_note = ?, follow_up_required = ?, follow_up_phone = ?
@@ -295,7 +303,7 @@ def update_call_note_row(
 
 
 def resolve_call_row(call_id: str) -> bool:
-    conn = _conn()
+    conn = _write_conn()
     try:
         cur = conn.execute(
             "UPDATE call_history SET resolved = 1, hitl_status = 'resolved' WHERE call_id = ?",
@@ -314,7 +322,7 @@ def save_call_summary(
     summary_text: str,
 ) -> None:
     now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             "INSERT INTO call_summaries (tenant_id, caller_id, call_id, summary_text, created_at) VALUES (?, ?, ?, ?, ?)",
@@ -360,7 +368,7 @@ def get_all_call_history_rows(limit: int = 10000) -> List[Dict[str, Any]]:
 def end_call_and_save_summary(call_id: str) -> None:
     """통화 종료: end_time 갱신 + 요약 저장(placeholder 또는 user_question 기반). 동일 call_id 요약은 1회만 저장."""
     now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-    conn = _conn()
+    conn = _write_conn()
     try:
         conn.execute(
             "UPDATE call_history SET end_time = ? WHERE call_id = ?",
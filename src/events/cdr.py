@@ -1,17 +1,28 @@
 """Call Detail Record (CDR)
 
-통화 상세 기록 생성 및 저장
+통화 상세 기록 생성 및 저장 (세그먼트 JSONL + 닫힌 세그먼트 SQLite 압축·조회)
 """
 
 import json
+import os
+import re
+import time
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union
 from pathlib import Path
 from enum import Enum
 import threading
 
 from src.common.logger import get_logger
+from src.events.cdr_store import (
+    CDR_STORE_DB_NAME,
+    CDRStore,
+    TimeBound,
+    format_time_bound,
+    iter_segment_records,
+    record_matches,
+)
 
 logger = get_logger(__name__)
 
@@ -113,6 +124,14 @@ class CDRWriter:
     
     JSON Lines 형식으로 CDR을 파일에 저장.
     pretty_json=True면 들여쓰기된 JSON으로 가시적 저장(디버깅용).
+
+    - 현재 세그먼트 파일 핸들을 열어 둔 채 이어 쓴다 (통화 종료마다 open/close 하지 않음)
+    - 기록마다 flush(다른 프로세스가 바로 읽을 수 있게), fsync는 그룹 커밋
+      (fsync_every건 또는 fsync_interval_sec마다 한 번, 0이면 끔)
+    - 날짜(filename_pattern)가 바뀌거나 max_file_mb를 넘으면 다음 세그먼트
+      (cdr-2026-01-08.jsonl → cdr-2026-01-08.1.jsonl ...)
+    - 닫힌 세그먼트는 백그라운드에서 cdr_store.db(CDRStore)로 압축, query()는 압축분은 SQLite로,
+      현재 세그먼트만 직접 읽는다
     """
 
     def __init__(
@@ -120,6 +139,10 @@ class CDRWriter:
         output_dir: str = "./cdr",
         filename_pattern: str = "cdr-%Y-%m-%d.jsonl",
         pretty_json: bool = False,
+        max_file_mb: float = 64.0,
+        fsync_every: int = 32,
+        fsync_interval_sec: float = 1.0,
+        compact: bool = True,
     ):
         """초기화
 
@@ -127,27 +150,118 @@ class CDRWriter:
             output_dir: CDR 출력 디렉토리
             filename_pattern: 파일명 패턴 (strftime 형식)
             pretty_json: True면 레코드마다 들여쓰기 JSON + \\n\\n 구분(디버깅용)
+            max_file_mb: 세그먼트 크기 한도 (0이면 날짜로만 회전)
+            fsync_every: 이 건수마다 fsync (0이면 fsync 안 함 — OS 버퍼까지만)
+            fsync_interval_sec: 마지막 fsync 후 이 시간이 지나면 건수와 무관하게 fsync
+            compact: 닫힌 세그먼트를 SQLite 저장소로 압축
         """
         self.output_dir = Path(output_dir)
         self.filename_pattern = filename_pattern
         self.pretty_json = pretty_json
+        self.max_file_bytes = int(max(0.0, float(max_file_mb)) * 1024 * 1024)
+        self.fsync_every = max(0, int(fsync_every))
+        self.fsync_interval_sec = float(fsync_interval_sec)
+        self.compact_enabled = compact
 
         # 디렉토리 생성
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Thread safety
         self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+
+        # 현재 세그먼트
+        self._handle: Optional[Any] = None
+        self._segment_base: Optional[str] = None
+        self._segment_part = 0
+        self._segment_path: Optional[Path] = None
+        self._unsynced = 0
+        self._last_fsync = time.monotonic()
+        self._store: Optional[CDRStore] = None
 
         # 통계
         self.stats = {
             "total_written": 0,
             "write_errors": 0,
+            "fsyncs": 0,
+            "segments_rotated": 0,
+            "segments_compacted": 0,
+            "records_compacted": 0,
         }
 
         logger.info("cdr_writer_initialized",
                    output_dir=str(self.output_dir),
                    filename_pattern=filename_pattern,
-                   pretty_json=pretty_json)
+                   pretty_json=pretty_json,
+                   max_file_mb=max_file_mb,
+                   fsync_every=self.fsync_every)
+
+    # ── 세그먼트 ──
+
+    def _part_path(self, base: str, part: int) -> Path:
+        if part <= 0:
+            return self.output_dir / base
+        stem, dot, suffix = base.rpartition(".")
+        if not dot:
+            return self.output_dir / f"{base}.{part}"
+        return self.output_dir / f"{stem}.{part}.{suffix}"
+
+    def _segment_glob(self) -> str:
+        # cdr-%Y-%m-%d.jsonl → cdr-*-*-*.jsonl (회전 조각 cdr-2026-01-08.1.jsonl 도 일치)
+        return re.sub(r"%.", "*", self.filename_pattern)
+
+    def _close_handle_locked(self) -> None:
+        if self._handle is None:
+            return
+        try:
+            self._handle.flush()
+            if self.fsync_every and self._unsynced:
+                os.fsync(self._handle.fileno())
+                self.stats["fsyncs"] += 1
+            self._handle.close()
+        except Exception as e:
+            logger.warning("cdr_segment_close_failed", error=str(e))
+        self._handle = None
+        self._unsynced = 0
+
+    def _open_segment_locked(self) -> Any:
+        base = datetime.now().strftime(self.filename_pattern)
+        if base != self._segment_base:
+            if self._handle is not None:
+                self._close_handle_locked()
+                self.stats["segments_rotated"] += 1
+                self._schedule_compaction()
+            self._segment_base = base
+            self._segment_part = 0
+        if self._handle is None:
+            path = self._part_path(base, self._segment_part)
+            # 재시작 시 그날의 마지막 조각부터 이어 쓴다
+            while self._part_path(base, self._segment_part + 1).exists() or (
+                self.max_file_bytes and path.exists() and path.stat().st_size >= self.max_file_bytes
+            ):
+                self._segment_part += 1
+                path = self._part_path(base, self._segment_part)
+            self._handle = open(path, "a", encoding="utf-8", newline="")
+            self._segment_path = path
+        return self._handle
+
+    def _rotate_if_full_locked(self) -> None:
+        if not self.max_file_bytes or self._handle is None:
+            return
+        if self._handle.tell() < self.max_file_bytes:
+            return
+        self._close_handle_locked()
+        self._segment_part += 1
+        self.stats["segments_rotated"] += 1
+        self._schedule_compaction()
+
+    @property
+    def current_path(self) -> Path:
+        """현재(또는 다음 기록이 들어갈) 세그먼트 경로"""
+        with self._lock:
+            if self._segment_path is not None and self._handle is not None:
+                return self._segment_path
+        return self.output_dir / datetime.now().strftime(self.filename_pattern)
 
     def write_cdr(self, cdr: CDR) -> bool:
         """CDR 작성
@@ -160,9 +274,6 @@ class CDRWriter:
         """
         with self._lock:
             try:
-                filename = datetime.now().strftime(self.filename_pattern)
-                filepath = self.output_dir / filename
-
                 if self.pretty_json:
                     # 디버깅용: 들여쓰기 JSON, 레코드 구분은 \n\n
                     body = json.dumps(
@@ -175,13 +286,28 @@ class CDRWriter:
                     # 표준 JSONL: 한 줄 한 레코드
                     line = cdr.to_json() + "\n"
 
-                with open(filepath, "a", encoding="utf-8") as f:
-                    f.write(line)
+                f = self._open_segment_locked()
+                f.write(line)
+                f.flush()
+                filepath = self._segment_path
+
+                # 그룹 커밋: fsync는 여러 건에 한 번
+                self._unsynced += 1
+                if self.fsync_every and (
+                    self._unsynced >= self.fsync_every
+                    or time.monotonic() - self._last_fsync >= self.fsync_interval_sec
+                ):
+                    os.fsync(f.fileno())
+                    self._unsynced = 0
+                    self._last_fsync = time.monotonic()
+                    self.stats["fsyncs"] += 1
+
+                self._rotate_if_full_locked()
 
                 self.stats["total_written"] += 1
                 logger.info("cdr_written",
                            call_id=cdr.call_id,
-                           cdr_file=filepath.as_posix(),
+                           cdr_file=filepath.as_posix() if filepath else "",
                            pretty_json=self.pretty_json)
                 return True
 
@@ -190,8 +316,103 @@ class CDRWriter:
                 logger.error("cdr_write_failed",
                             call_id=cdr.call_id,
                             error=str(e))
+                # 다음 기록에서 핸들을 다시 연다
+                self._handle = None
                 return False
-    
+
+    def close(self):
+        """현재 세그먼트를 fsync 후 닫는다 (서버 종료 시)"""
+        with self._lock:
+            self._close_handle_locked()
+
+    # ── 압축·조회 ──
+
+    def _get_store(self) -> CDRStore:
+        if self._store is None:
+            self._store = CDRStore(self.output_dir / CDR_STORE_DB_NAME)
+        return self._store
+
+    def _schedule_compaction(self):
+        if not self.compact_enabled:
+            return
+        threading.Thread(target=self._compact_quietly, name="cdr-compaction", daemon=True).start()
+
+    def _compact_quietly(self):
+        try:
+            self.compact()
+        except Exception as e:
+            logger.warning("cdr_compaction_failed", error=str(e))
+
+    def compact(self) -> int:
+        """닫힌 세그먼트(현재 기록 중인 것 제외) 중 아직 압축 안 된 것을 SQLite로 옮긴다. 넣은 행 수"""
+        with self._compact_lock:
+            store = self._get_store()
+            active = self._segment_path.name if self._handle is not None and self._segment_path else None
+            added = 0
+            for path in sorted(self.output_dir.glob(self._segment_glob())):
+                if path.name == active or not path.is_file() or store.is_compacted(path):
+                    continue
+                count = store.compact_segment(path)
+                added += count
+                self.stats["segments_compacted"] += 1
+                self.stats["records_compacted"] += count
+                logger.debug("cdr_segment_compacted", segment=path.name, records=count)
+            return added
+
+    def query(
+        self,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        extension: Optional[str] = None,
+        caller: Optional[str] = None,
+        callee: Optional[str] = None,
+        termination_reason: Optional[Union[TerminationReason, str]] = None,
+        call_id: Optional[str] = None,
+        limit: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """CDR 조회 (start_time 순 dict 목록)
+
+        Args:
+            start, end: start_time 범위 [start, end) (datetime 또는 ISO 문자열, CDR과 같은 UTC 기준)
+            extension: 발신·수신 어느 쪽이든 내선(SIP user) 일치
+            caller, callee: 내선 또는 SIP URI 일치
+            termination_reason: 종료 사유
+            call_id: Call ID
+            limit: 최대 건수
+        """
+        if isinstance(termination_reason, TerminationReason):
+            termination_reason = termination_reason.value
+        filters = {
+            "extension": extension,
+            "caller": caller,
+            "callee": callee,
+            "termination_reason": termination_reason,
+            "call_id": call_id,
+        }
+        if not self.compact_enabled:
+            # 압축 저장소 없이: 모든 세그먼트 직접 스캔
+            rows = [
+                r
+                for path in sorted(self.output_dir.glob(self._segment_glob()))
+                for r in iter_segment_records(path)
+                if record_matches(r, format_time_bound(start), format_time_bound(end), **filters)
+            ]
+            rows.sort(key=lambda r: str(r.get("start_time") or ""))
+            return rows[:limit]
+
+        self.compact()
+        with self._lock:
+            active = self._segment_path if self._handle is not None else None
+        exclude = [active.name] if active is not None else None
+        rows = self._get_store().query(start, end, limit=limit, exclude_segments=exclude, **filters)
+        if active is not None:
+            rows.extend(
+                r for r in iter_segment_records(active)
+                if record_matches(r, format_time_bound(start), format_time_bound(end), **filters)
+            )
+            rows.sort(key=lambda r: str(r.get("start_time") or ""))
+        return rows[:limit]
+
     def get_stats(self) -> dict:
         """통계 조회"""
         return self.stats.copy()
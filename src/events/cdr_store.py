@@ -0,0 +1,267 @@
+"""CDR 압축 저장소 (SQLite)
+
+CDRWriter가 닫은 세그먼트(cdr-YYYY-MM-DD[.N].jsonl)를 색인된 SQLite 테이블로 옮겨
+기간·내선·종료 사유 조회가 원본 JSON 줄을 다시 읽지 않도록 한다.
+
+- DB: <cdr_output_dir>/cdr_store.db
+    cdr_records(segment, seq, call_id, start_time, end_time, caller, callee, caller_user, callee_user,
+                duration, termination_reason, media_mode, has_recording, record(JSON))
+        — (segment, seq) 유일, start_time·call_id·caller_user·callee_user·termination_reason 인덱스
+    cdr_segments(segment, size, mtime_ns, records, compacted_at)
+- 원본 JSONL은 지우지 않는다 (감사용 원본·retention_days 정리는 기존 운영 절차)
+- 같은 세그먼트를 다시 압축하면 (크기·mtime이 바뀐 경우) 행을 지우고 다시 넣는다
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from src.common.logger import get_logger
+
+logger = get_logger(__name__)
+
+CDR_STORE_DB_NAME = "cdr_store.db"
+
+TimeBound = Union[datetime, str, None]
+
+
+def sip_user(uri: Optional[str]) -> str:
+    """sip:1001@10.0.0.1;transport=udp → 1001 (SIP URI가 아니면 그대로)."""
+    value = (uri or "").strip().strip("<>")
+    if ":" in value.split("@", 1)[0]:
+        value = value.split(":", 1)[1]
+    return value.split("@", 1)[0].split(";", 1)[0]
+
+
+def iter_segment_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """세그먼트의 CDR dict들 (JSONL·pretty_json 둘 다 — 공백으로 구분된 연속 JSON 객체로 읽음)."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return
+    decoder = json.JSONDecoder()
+    pos = 0
+    length = len(text)
+    while pos < length:
+        while pos < length and text[pos].isspace():
+            pos += 1
+        if pos >= length:
+            break
+        try:
+            obj, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            # 깨진 줄(비정상 종료로 잘린 기록)은 다음 줄부터
+            nl = text.find("\n", pos)
+            if nl < 0:
+                break
+            pos = nl + 1
+            continue
+        if isinstance(obj, dict):
+            yield obj
+
+
+def format_time_bound(value: TimeBound) -> Optional[str]:
+    """datetime 또는 ISO 문자열 → start_time과 비교할 ISO 문자열"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def record_matches(
+    record: Dict[str, Any],
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    extension: Optional[str] = None,
+    caller: Optional[str] = None,
+    callee: Optional[str] = None,
+    termination_reason: Optional[str] = None,
+    call_id: Optional[str] = None,
+) -> bool:
+    """query()와 같은 조건을 dict 하나에 적용 (아직 압축 안 된 현재 세그먼트용)."""
+    start_time = str(record.get("start_time") or "")
+    if start and start_time < start:
+        return False
+    if end and start_time >= end:
+        return False
+    caller_user = sip_user(record.get("caller"))
+    callee_user = sip_user(record.get("callee"))
+    if extension and extension not in (caller_user, callee_user):
+        return False
+    if caller and caller not in (caller_user, record.get("caller")):
+        return False
+    if callee and callee not in (callee_user, record.get("callee")):
+        return False
+    if termination_reason and record.get("termination_reason") != termination_reason:
+        return False
+    if call_id and record.get("call_id") != call_id:
+        return False
+    return True
+
+
+class CDRStore:
+    """압축된 CDR 세그먼트 SQLite 저장소"""
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=5.0)
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS cdr_records (
+                    segment TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    call_id TEXT NOT NULL,
+                    start_time TEXT NOT NULL DEFAULT '',
+                    end_time TEXT,
+                    caller TEXT,
+                    callee TEXT,
+                    caller_user TEXT,
+                    callee_user TEXT,
+                    duration REAL,
+                    termination_reason TEXT,
+                    media_mode TEXT,
+                    has_recording INTEGER NOT NULL DEFAULT 0,
+                    record TEXT NOT NULL,
+                    UNIQUE(segment, seq)
+                );
+                CREATE INDEX IF NOT EXISTS idx_cdr_start_time ON cdr_records(start_time);
+                CREATE INDEX IF NOT EXISTS idx_cdr_call_id ON cdr_records(call_id);
+                CREATE INDEX IF NOT EXISTS idx_cdr_caller_user ON cdr_records(caller_user, start_time);
+                CREATE INDEX IF NOT EXISTS idx_cdr_callee_user ON cdr_records(callee_user, start_time);
+                CREATE INDEX IF NOT EXISTS idx_cdr_reason ON cdr_records(termination_reason, start_time);
+                CREATE TABLE IF NOT EXISTS cdr_segments (
+                    segment TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    records INTEGER NOT NULL,
+                    compacted_at REAL NOT NULL
+                );
+                """
+            )
+
+    def is_compacted(self, path: Path) -> bool:
+        """세그먼트가 현재 크기·mtime 그대로 압축돼 있는지"""
+        try:
+            st = path.stat()
+        except OSError:
+            return True
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT size, mtime_ns FROM cdr_segments WHERE segment = ?", (path.name,)
+            ).fetchone()
+        return row is not None and (int(row[0]), int(row[1])) == (st.st_size, st.st_mtime_ns)
+
+    def compact_segment(self, path: Path) -> int:
+        """닫힌 세그먼트 하나를 테이블로 옮긴다. 넣은 행 수"""
+        st = path.stat()
+        rows = []
+        for seq, record in enumerate(iter_segment_records(path)):
+            rows.append(
+                (
+                    path.name,
+                    seq,
+                    str(record.get("call_id") or ""),
+                    str(record.get("start_time") or ""),
+                    record.get("end_time"),
+                    record.get("caller"),
+                    record.get("callee"),
+                    sip_user(record.get("caller")),
+                    sip_user(record.get("callee")),
+                    record.get("duration"),
+                    record.get("termination_reason"),
+                    record.get("media_mode"),
+                    1 if record.get("has_recording") else 0,
+                    json.dumps(record, ensure_ascii=False),
+                )
+            )
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM cdr_records WHERE segment = ?", (path.name,))
+            conn.executemany(
+                """
+                INSERT INTO cdr_records
+                    (segment, seq, call_id, start_time, end_time, caller, callee, caller_user, callee_user,
+                     duration, termination_reason, media_mode, has_recording, record)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO cdr_segments (segment, size, mtime_ns, records, compacted_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (path.name, st.st_size, st.st_mtime_ns, len(rows), time.time()),
+            )
+        return len(rows)
+
+    def query(
+        self,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        extension: Optional[str] = None,
+        caller: Optional[str] = None,
+        callee: Optional[str] = None,
+        termination_reason: Optional[str] = None,
+        call_id: Optional[str] = None,
+        limit: int = 1000,
+        exclude_segments: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """조건에 맞는 CDR dict (start_time 순, 최대 limit건)
+
+        Args:
+            start, end: start_time 범위 [start, end) (datetime 또는 ISO 문자열)
+            extension: 발신·수신 어느 쪽이든 SIP user(내선)가 일치
+            caller, callee: SIP user 또는 URI 전체 일치
+            termination_reason: normal | timeout | cancel | error | rejected
+            exclude_segments: 결과에서 뺄 세그먼트 (현재 기록 중인 세그먼트는 호출부가 직접 읽음)
+        """
+        where: List[str] = []
+        params: List[Any] = []
+        if start is not None:
+            where.append("start_time >= ?")
+            params.append(format_time_bound(start))
+        if end is not None:
+            where.append("start_time < ?")
+            params.append(format_time_bound(end))
+        if extension:
+            where.append("(caller_user = ? OR callee_user = ?)")
+            params.extend([extension, extension])
+        if caller:
+            where.append("(caller_user = ? OR caller = ?)")
+            params.extend([caller, caller])
+        if callee:
+            where.append("(callee_user = ? OR callee = ?)")
+            params.extend([callee, callee])
+        if termination_reason:
+            where.append("termination_reason = ?")
+            params.append(termination_reason)
+        if call_id:
+            where.append("call_id = ?")
+            params.append(call_id)
+        if exclude_segments:
+            where.append(f"segment NOT IN ({','.join('?' * len(exclude_segments))})")
+            params.extend(exclude_segments)
+        sql = "SELECT record FROM cdr_records"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY start_time, segment, seq LIMIT ?"
+        params.append(max(0, int(limit)))
+        with self._connect() as conn:
+            return [json.loads(row[0]) for row in conn.execute(sql, params)]
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._connect() as conn:
+            records = conn.execute("SELECT COUNT(*) FROM cdr_records").fetchone()[0]
+            segments = conn.execute("SELECT COUNT(*) FROM cdr_segments").fetchone()[0]
+        return {"records": int(records), "segments": int(segments)}
@@ -1,65 +1,214 @@
 """Event Store
 
 메모리 내 이벤트 저장소
+
+- 시간 버킷: created_at을 bucket_seconds 단위 정수 키로 묶어 오래된 순서로 보관.
+  만료는 보존 기간을 완전히 넘긴 버킷을 통째로 떼어 낸다 (버킷 단위 — 최대 bucket_seconds 늦게 만료)
+- 보조 인덱스: call_id·event_type·severity → {event_id} (삽입 순서 dict, 삭제 O(1))
+- 조회: 지정된 인덱스 중 가장 작은 후보 집합(없으면 시간 범위에 걸친 버킷만)에서 나머지 조건을 적용
+- 커서 조회: query_events()가 (created_at, 삽입 순번) 커서로 다음 페이지를 이어서 준다
+- 메모리 상한: max_events를 넘으면 가장 오래된 버킷부터 통째로 축출 (*_evicted 통계)
 """
 
 import threading
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from bisect import bisect_left, insort
 from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 
 from src.ai.event_models import AIEvent, EventType, SeverityLevel
 from src.common.logger import get_logger
 
 logger = get_logger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _epoch_seconds(dt: datetime) -> float:
+    """created_at(naive UTC, aware면 UTC로 변환) → epoch 초"""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - _EPOCH).total_seconds()
+
 
 class EventStore:
     """이벤트 저장소
-    
+
     Thread-safe 메모리 내 이벤트 저장 및 조회
     """
-    
-    def __init__(self, retention_hours: int = 24):
+
+    def __init__(
+        self,
+        retention_hours: int = 24,
+        bucket_seconds: int = 60,
+        max_events: int = 200_000,
+    ):
         """초기화
-        
+
         Args:
             retention_hours: 이벤트 보존 시간 (시간)
+            bucket_seconds: 시간 버킷 크기 (초) — 만료·시간 범위 조회 단위
+            max_events: 보관 이벤트 상한 (넘으면 가장 오래된 버킷 축출)
         """
         self.retention_hours = retention_hours
         self.retention_delta = timedelta(hours=retention_hours)
-        
+        self.bucket_seconds = max(1, int(bucket_seconds))
+        self.max_events = max(1, int(max_events))
+
         # 이벤트 저장소
         # Key: event_id, Value: AIEvent
         self._events: Dict[str, AIEvent] = {}
-        
+
+        # 이벤트별 (버킷 키, 정렬 키) — created_at이 add 이후 바뀌어도 같은 버킷에서 지운다
+        # 정렬 키: (created_at epoch 초, 삽입 순번)
+        self._locations: Dict[str, Tuple[int, Tuple[float, int]]] = {}
+        self._seq = 0
+
+        # 시간 버킷
+        # Key: bucket key (epoch 초 // bucket_seconds), Value: {event_id: None} (삽입 순서)
+        self._buckets: Dict[int, Dict[str, None]] = {}
+        self._bucket_keys: List[int] = []  # 오름차순
+
         # Call-ID별 인덱스
-        # Key: call_id, Value: List[event_id]
-        self._call_index: Dict[str, List[str]] = defaultdict(list)
-        
+        # Key: call_id, Value: {event_id: None}
+        self._call_index: Dict[str, Dict[str, None]] = {}
+
         # 이벤트 타입별 인덱스
-        # Key: event_type, Value: List[event_id]
-        self._type_index: Dict[EventType, List[str]] = defaultdict(list)
-        
+        # Key: event_type, Value: {event_id: None}
+        self._type_index: Dict[EventType, Dict[str, None]] = {}
+
+        # 심각도별 인덱스
+        # Key: severity, Value: {event_id: None}
+        self._severity_index: Dict[SeverityLevel, Dict[str, None]] = {}
+
         # Thread safety
         self._lock = threading.RLock()
-        
+
         # 통계
         self.stats = {
             "total_events": 0,
             "events_by_type": defaultdict(int),
             "events_by_severity": defaultdict(int),
             "events_cleaned": 0,
+            "buckets_expired": 0,
+            "events_evicted": 0,
+            "buckets_evicted": 0,
         }
-        
-        logger.info("event_store_initialized", retention_hours=retention_hours)
-    
+
+        logger.info("event_store_initialized",
+                   retention_hours=retention_hours,
+                   bucket_seconds=self.bucket_seconds,
+                   max_events=self.max_events)
+
+    # ── 내부: 버킷·인덱스 ──
+
+    @staticmethod
+    def _index_add(index: Dict[Any, Dict[str, None]], key: Any, event_id: str):
+        ids = index.get(key)
+        if ids is None:
+            ids = index[key] = {}
+        ids[event_id] = None
+
+    @staticmethod
+    def _index_remove(index: Dict[Any, Dict[str, None]], key: Any, event_id: str):
+        ids = index.get(key)
+        if ids is None:
+            return
+        ids.pop(event_id, None)
+        if not ids:
+            del index[key]
+
+    def _remove_locked(self, event_id: str, from_bucket: bool = True) -> Optional[AIEvent]:
+        event = self._events.pop(event_id, None)
+        if event is None:
+            return None
+        bucket_key, _ = self._locations.pop(event_id)
+        if from_bucket:
+            bucket = self._buckets.get(bucket_key)
+            if bucket is not None:
+                bucket.pop(event_id, None)
+                if not bucket:
+                    self._drop_bucket_locked(bucket_key)
+        self._index_remove(self._call_index, event.call_id, event_id)
+        self._index_remove(self._type_index, event.event_type, event_id)
+        self._index_remove(self._severity_index, event.severity, event_id)
+        return event
+
+    def _drop_bucket_locked(self, bucket_key: int) -> Dict[str, None]:
+        bucket = self._buckets.pop(bucket_key, {})
+        i = bisect_left(self._bucket_keys, bucket_key)
+        if i < len(self._bucket_keys) and self._bucket_keys[i] == bucket_key:
+            del self._bucket_keys[i]
+        return bucket
+
+    def _pop_oldest_bucket_locked(self) -> int:
+        """가장 오래된 버킷을 통째로 제거. 제거한 이벤트 수"""
+        bucket = self._drop_bucket_locked(self._bucket_keys[0])
+        for event_id in bucket:
+            self._remove_locked(event_id, from_bucket=False)
+        return len(bucket)
+
+    def _expire_locked(self, now: Optional[datetime] = None) -> int:
+        """보존 기간을 완전히 넘긴 버킷 제거 (가장 오래된 버킷 키만 비교 — 만료할 것이 없으면 O(1))"""
+        cutoff = (now or datetime.utcnow()) - self.retention_delta
+        # 버킷 끝(key+1)*bucket_seconds 가 cutoff 이하인 버킷만 — 경계 버킷은 다음 정리 때
+        cutoff_key = int(_epoch_seconds(cutoff) // self.bucket_seconds)
+        removed = 0
+        while self._bucket_keys and self._bucket_keys[0] < cutoff_key:
+            removed += self._pop_oldest_bucket_locked()
+            self.stats["buckets_expired"] += 1
+        if removed:
+            self.stats["events_cleaned"] += removed
+        return removed
+
+    def _sorted_locked(self, event_ids: Iterable[str]) -> List[AIEvent]:
+        ids = [eid for eid in event_ids if eid in self._events]
+        ids.sort(key=lambda eid: self._locations[eid][1])
+        return [self._events[eid] for eid in ids]
+
+    def _ids_in_range_locked(
+        self,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+    ) -> Iterable[str]:
+        """시간 범위에 걸친 버킷의 event_id (버킷 경계는 호출부가 created_at으로 다시 거른다)"""
+        keys = self._bucket_keys
+        lo = 0
+        hi = len(keys)
+        if start_time is not None:
+            lo = bisect_left(keys, int(_epoch_seconds(start_time) // self.bucket_seconds))
+        if end_time is not None:
+            hi = bisect_left(keys, int(_epoch_seconds(end_time) // self.bucket_seconds) + 1)
+        for key in keys[lo:hi]:
+            yield from self._buckets[key]
+
+    def _candidates_locked(
+        self,
+        call_id: Optional[str],
+        event_type: Optional[EventType],
+        severity: Optional[SeverityLevel],
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+    ) -> Iterable[str]:
+        indexed = []
+        if call_id:
+            indexed.append(self._call_index.get(call_id, {}))
+        if event_type:
+            indexed.append(self._type_index.get(event_type, {}))
+        if severity:
+            indexed.append(self._severity_index.get(severity, {}))
+        if indexed:
+            return min(indexed, key=len)
+        return self._ids_in_range_locked(start_time, end_time)
+
+    # ── 기록 ──
+
     def add_event(self, event: AIEvent) -> bool:
         """이벤트 추가
-        
+
         Args:
             event: AIEvent 객체
-            
+
         Returns:
             성공 여부
         """
@@ -68,113 +217,112 @@ class EventStore:
             if event.event_id in self._events:
                 logger.warning("duplicate_event_id", event_id=event.event_id)
                 return False
-            
+
             # 저장
+            epoch = _epoch_seconds(event.created_at)
+            bucket_key = int(epoch // self.bucket_seconds)
+            self._seq += 1
             self._events[event.event_id] = event
-            
+            self._locations[event.event_id] = (bucket_key, (epoch, self._seq))
+            bucket = self._buckets.get(bucket_key)
+            if bucket is None:
+                bucket = self._buckets[bucket_key] = {}
+                if self._bucket_keys and bucket_key < self._bucket_keys[-1]:
+                    insort(self._bucket_keys, bucket_key)  # 과거 시각 이벤트 (드묾)
+                else:
+                    self._bucket_keys.append(bucket_key)
+            bucket[event.event_id] = None
+
             # 인덱스 업데이트
-            self._call_index[event.call_id].append(event.event_id)
-            self._type_index[event.event_type].append(event.event_id)
-            
+            self._index_add(self._call_index, event.call_id, event.event_id)
+            self._index_add(self._type_index, event.event_type, event.event_id)
+            self._index_add(self._severity_index, event.severity, event.event_id)
+
             # 통계 업데이트
             self.stats["total_events"] += 1
             self.stats["events_by_type"][event.event_type.value] += 1
             self.stats["events_by_severity"][event.severity.value] += 1
-            
+
+            # 메모리 상한 (만료는 cleanup_old_events 주기 호출)
+            while len(self._events) > self.max_events and len(self._bucket_keys) > 1:
+                self.stats["events_evicted"] += self._pop_oldest_bucket_locked()
+                self.stats["buckets_evicted"] += 1
+
             logger.debug("event_added",
                         event_id=event.event_id,
                         call_id=event.call_id,
                         event_type=event.event_type.value)
-            
+
             return True
-    
+
+    # ── 조회 ──
+
     def get_event(self, event_id: str) -> Optional[AIEvent]:
         """이벤트 조회
-        
+
         Args:
             event_id: 이벤트 ID
-            
+
         Returns:
             AIEvent 또는 None
         """
         with self._lock:
             return self._events.get(event_id)
-    
+
     def get_events_by_call(self, call_id: str) -> List[AIEvent]:
         """Call-ID별 이벤트 조회
-        
+
         Args:
             call_id: Call ID
-            
+
         Returns:
             이벤트 리스트 (시간 순)
         """
         with self._lock:
-            event_ids = self._call_index.get(call_id, [])
-            events = [self._events[eid] for eid in event_ids if eid in self._events]
-            
-            # 시간 순 정렬
-            events.sort(key=lambda e: e.created_at)
-            
-            return events
-    
+            return self._sorted_locked(self._call_index.get(call_id, {}))
+
     def get_events_by_type(self, event_type: EventType) -> List[AIEvent]:
         """이벤트 타입별 조회
-        
+
         Args:
             event_type: 이벤트 타입
-            
+
         Returns:
             이벤트 리스트
         """
         with self._lock:
-            event_ids = self._type_index.get(event_type, [])
-            events = [self._events[eid] for eid in event_ids if eid in self._events]
-            
-            return events
-    
+            ids = self._type_index.get(event_type, {})
+            return [self._events[eid] for eid in ids]
+
     def get_events_by_time_range(
         self,
         start_time: datetime,
         end_time: datetime
     ) -> List[AIEvent]:
         """시간 범위별 이벤트 조회
-        
+
         Args:
             start_time: 시작 시간
             end_time: 종료 시간
-            
+
         Returns:
             이벤트 리스트
         """
-        with self._lock:
-            events = [
-                event for event in self._events.values()
-                if start_time <= event.created_at <= end_time
-            ]
-            
-            # 시간 순 정렬
-            events.sort(key=lambda e: e.created_at)
-            
-            return events
-    
+        return self.filter_events(start_time=start_time, end_time=end_time)
+
     def get_events_by_severity(self, severity: SeverityLevel) -> List[AIEvent]:
         """심각도별 이벤트 조회
-        
+
         Args:
             severity: 심각도 레벨
-            
+
         Returns:
             이벤트 리스트
         """
         with self._lock:
-            events = [
-                event for event in self._events.values()
-                if event.severity == severity
-            ]
-            
-            return events
-    
+            ids = self._severity_index.get(severity, {})
+            return [self._events[eid] for eid in ids]
+
     def filter_events(
         self,
         call_id: Optional[str] = None,
@@ -185,7 +333,7 @@ class EventStore:
         end_time: Optional[datetime] = None,
     ) -> List[AIEvent]:
         """이벤트 필터링
-        
+
         Args:
             call_id: Call ID
             event_type: 이벤트 타입
@@ -193,149 +341,153 @@ class EventStore:
             min_confidence: 최소 신뢰도
             start_time: 시작 시간
             end_time: 종료 시간
-            
+
         Returns:
-            필터링된 이벤트 리스트
+            필터링된 이벤트 리스트 (시간 순)
         """
+        events, _ = self.query_events(
+            call_id=call_id,
+            event_type=event_type,
+            severity=severity,
+            min_confidence=min_confidence,
+            start_time=start_time,
+            end_time=end_time,
+            limit=None,
+        )
+        return events
+
+    def query_events(
+        self,
+        call_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        severity: Optional[SeverityLevel] = None,
+        min_confidence: Optional[float] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = 100,
+    ) -> Tuple[List[AIEvent], Optional[str]]:
+        """커서 기반 이벤트 조회 (시간 순 페이지)
+
+        Args:
+            call_id, event_type, severity, min_confidence, start_time, end_time: filter_events와 동일
+            cursor: 이전 페이지가 돌려준 next_cursor (None이면 처음부터)
+            limit: 페이지 크기 (None이면 전부)
+
+        Returns:
+            (이벤트 리스트, next_cursor — 더 없으면 None)
+        """
+        after: Optional[Tuple[float, int]] = None
+        if cursor:
+            try:
+                epoch_str, seq_str = cursor.split(":", 1)
+                after = (float(epoch_str), int(seq_str))
+            except ValueError:
+                raise ValueError(f"invalid event cursor: {cursor!r}")
+
         with self._lock:
-            events = list(self._events.values())
-            
-            # 필터 적용
-            if call_id:
-                events = [e for e in events if e.call_id == call_id]
-            
-            if event_type:
-                events = [e for e in events if e.event_type == event_type]
-            
-            if severity:
-                events = [e for e in events if e.severity == severity]
-            
-            if min_confidence is not None:
-                events = [e for e in events if e.confidence >= min_confidence]
-            
-            if start_time:
-                events = [e for e in events if e.created_at >= start_time]
-            
-            if end_time:
-                events = [e for e in events if e.created_at <= end_time]
-            
-            # 시간 순 정렬
-            events.sort(key=lambda e: e.created_at)
-            
-            return events
-    
+            picked: List[Tuple[Tuple[float, int], str]] = []
+            for eid in self._candidates_locked(call_id, event_type, severity, start_time, end_time):
+                event = self._events.get(eid)
+                if event is None:
+                    continue
+                sort_key = self._locations[eid][1]
+                if after is not None and sort_key <= after:
+                    continue
+                if call_id and event.call_id != call_id:
+                    continue
+                if event_type and event.event_type != event_type:
+                    continue
+                if severity and event.severity != severity:
+                    continue
+                if min_confidence is not None and event.confidence < min_confidence:
+                    continue
+                if start_time and event.created_at < start_time:
+                    continue
+                if end_time and event.created_at > end_time:
+                    continue
+                picked.append((sort_key, eid))
+            picked.sort()
+            next_cursor = None
+            if limit is not None and len(picked) > limit:
+                picked = picked[:limit]
+                last = picked[-1][0]
+                next_cursor = f"{last[0]!r}:{last[1]}"
+            return [self._events[eid] for _, eid in picked], next_cursor
+
     def get_all_events(self) -> List[AIEvent]:
         """모든 이벤트 조회
-        
+
         Returns:
             모든 이벤트 리스트 (시간 순)
         """
         with self._lock:
-            events = list(self._events.values())
-            events.sort(key=lambda e: e.created_at)
-            
-            return events
-    
+            return self._sorted_locked(self._events)
+
+    # ── 정리 ──
+
     def cleanup_old_events(self) -> int:
-        """오래된 이벤트 정리
-        
+        """오래된 이벤트 정리 (보존 기간을 완전히 넘긴 시간 버킷 단위)
+
         Returns:
             정리된 이벤트 수
         """
         with self._lock:
-            cutoff_time = datetime.utcnow() - self.retention_delta
-            
-            # 오래된 이벤트 찾기
-            old_event_ids = [
-                event_id for event_id, event in self._events.items()
-                if event.created_at < cutoff_time
-            ]
-            
-            # 삭제
-            for event_id in old_event_ids:
-                event = self._events[event_id]
-                
-                # 저장소에서 삭제
-                del self._events[event_id]
-                
-                # 인덱스에서 삭제
-                if event.call_id in self._call_index:
-                    self._call_index[event.call_id].remove(event_id)
-                    
-                    # 빈 리스트 정리
-                    if not self._call_index[event.call_id]:
-                        del self._call_index[event.call_id]
-                
-                if event.event_type in self._type_index:
-                    self._type_index[event.event_type].remove(event_id)
-                    
-                    # 빈 리스트 정리
-                    if not self._type_index[event.event_type]:
-                        del self._type_index[event.event_type]
-            
-            cleaned_count = len(old_event_ids)
-            
+            cleaned_count = self._expire_locked()
+
             if cleaned_count > 0:
-                self.stats["events_cleaned"] += cleaned_count
                 logger.info("old_events_cleaned",
                            count=cleaned_count,
-                           cutoff_time=cutoff_time.isoformat())
-            
+                           cutoff_time=(datetime.utcnow() - self.retention_delta).isoformat())
+
             return cleaned_count
-    
+
     def delete_events_by_call(self, call_id: str) -> int:
         """Call-ID별 이벤트 삭제
-        
+
         Args:
             call_id: Call ID
-            
+
         Returns:
             삭제된 이벤트 수
         """
         with self._lock:
-            event_ids = self._call_index.get(call_id, []).copy()
-            
+            event_ids = list(self._call_index.get(call_id, {}))
+
             for event_id in event_ids:
-                if event_id in self._events:
-                    event = self._events[event_id]
-                    
-                    # 저장소에서 삭제
-                    del self._events[event_id]
-                    
-                    # 타입 인덱스에서 삭제
-                    if event.event_type in self._type_index:
-                        self._type_index[event.event_type].remove(event_id)
-            
-            # Call 인덱스에서 삭제
-            if call_id in self._call_index:
-                del self._call_index[call_id]
-            
+                self._remove_locked(event_id)
+
             logger.debug("events_deleted_by_call",
                         call_id=call_id,
                         count=len(event_ids))
-            
+
             return len(event_ids)
-    
+
     def get_event_count(self) -> int:
         """이벤트 개수 조회"""
         with self._lock:
             return len(self._events)
-    
+
     def get_stats(self) -> Dict[str, Any]:
         """통계 조회"""
         with self._lock:
             return {
                 "current_event_count": len(self._events),
                 "call_count": len(self._call_index),
+                "bucket_count": len(self._bucket_keys),
+                "max_events": self.max_events,
                 **self.stats,
             }
-    
+
     def clear_all(self):
         """모든 이벤트 삭제 (테스트용)"""
         with self._lock:
             self._events.clear()
+            self._locations.clear()
+            self._buckets.clear()
+            self._bucket_keys.clear()
             self._call_index.clear()
             self._type_index.clear()
-            
-            logger.warning("all_events_cleared")
+            self._severity_index.clear()
 
+            logger.warning("all_events_cleared")
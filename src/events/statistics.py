@@ -1,19 +1,58 @@
 """Statistics Collector
 
 실시간 통계 수집 및 제공
+
+- 분·시간 시계열, 통화 수(오늘/주/월)는 epoch 정수 버킷 원형 카운터(RingCounter)로 고정 크기
+- 키워드 빈도는 Space-Saving 상위 k 근사(SpaceSaving, KEYWORD_CAPACITY개만 추적)
+- 락 분리: 통화 통계(_call_lock)와 이벤트 통계(_event_lock)가 서로를 막지 않고,
+  조회는 락 안에서 고정 크기 상태만 복사한 뒤 락 밖에서 정렬·문자열 생성
+- STATISTICS_PERSIST_INTERVAL_SEC마다 STATISTICS_STATE_PATH(JSON)에 저장, 재시작 시 복원
+  (STATISTICS_PERSIST=0 이면 저장·복원 안 함)
 """
 
+import json
+import os
 import threading
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Any, Optional
 from collections import defaultdict, deque
 
 from src.ai.event_models import AIEvent
 from src.events.cdr import CDR
+from src.events.stream_counters import RingCounter, SpaceSaving
 from src.common.logger import get_logger
 
 logger = get_logger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
+
+MINUTE_SLOTS = 24 * 60  # 분 단위 24시간
+HOUR_SLOTS = 24 * 31  # 시간 단위 31일
+KEYWORD_CAPACITY = 1000
+STATE_VERSION = 1
+
+
+def _utc_epoch(dt: datetime) -> float:
+    return (dt - _EPOCH).total_seconds()
+
+
+@lru_cache(maxsize=4096)
+def _minute_label(minute_bucket: int) -> str:
+    """분 버킷 → "%Y-%m-%d %H:%M" (버킷당 한 번만 포맷)"""
+    return (_EPOCH + timedelta(minutes=minute_bucket)).strftime("%Y-%m-%d %H:%M")
+
+
+@lru_cache(maxsize=2048)
+def _hour_label(hour_bucket: int) -> str:
+    return (_EPOCH + timedelta(hours=hour_bucket)).strftime("%Y-%m-%d %H:00")
+
+
+def _persist_enabled() -> bool:
+    return os.environ.get("STATISTICS_PERSIST", "1").strip().lower() not in ("0", "false", "off", "no")
+
 
 class StatisticsCollector:
     """통계 수집기
@@ -40,15 +79,14 @@ class StatisticsCollector:
         
         self._initialized = True
         
-        # Thread safety
-        self._stats_lock = threading.RLock()
+        # Thread safety — 통화·이벤트 통계 락 분리
+        self._call_lock = threading.RLock()
+        self._event_lock = threading.RLock()
         
         # 통화 통계
         self.active_calls: Dict[str, datetime] = {}
-        self.total_calls_today = 0
-        self.total_calls_week = 0
-        self.total_calls_month = 0
         self.call_durations: deque = deque(maxlen=1000)  # 최근 1000개
+        self._call_hours = RingCounter(3600, HOUR_SLOTS)
         
         # 이벤트 통계
         self.event_counts = {
@@ -59,21 +97,33 @@ class StatisticsCollector:
         }
         
         # 시간대별 이벤트 (히트맵용)
-        # Key: (hour, day_of_week), Value: count
+        # Key: (hour, day_of_week), Value: count — 최대 24*7개
         self.hourly_events: Dict[tuple, int] = defaultdict(int)
         
-        # 키워드 빈도
-        # Key: keyword, Value: count
-        self.keyword_counts: Dict[str, int] = defaultdict(int)
+        # 키워드 빈도 (상위 k 근사)
+        self._keywords = SpaceSaving(KEYWORD_CAPACITY)
         
         # 최근 이벤트 (최대 1000개)
         self.recent_events: deque = deque(maxlen=1000)
         
-        # 시계열 데이터 (분 단위)
-        # Key: timestamp (minute), Value: count
-        self.minute_stats: Dict[str, int] = defaultdict(int)
+        # 시계열 데이터 (분·시간 버킷)
+        self._event_minutes = RingCounter(60, MINUTE_SLOTS)
+        self._event_hours = RingCounter(3600, HOUR_SLOTS)
         
-        logger.info("statistics_collector_initialized")
+        # 주기 저장
+        self.state_path = Path(os.environ.get("STATISTICS_STATE_PATH", "data/statistics_state.json"))
+        try:
+            self.persist_interval_sec = float(os.environ.get("STATISTICS_PERSIST_INTERVAL_SEC", "60"))
+        except ValueError:
+            self.persist_interval_sec = 60.0
+        self._last_persist = time.monotonic()
+        self._persist_running = False
+        if _persist_enabled():
+            self.load_state()
+        
+        logger.info("statistics_collector_initialized",
+                   persist=_persist_enabled(),
+                   state_path=str(self.state_path))
     
     # ===== 통화 통계 =====
     
@@ -83,13 +133,13 @@ class StatisticsCollector:
         Args:
             call_id: Call ID
         """
-        with self._stats_lock:
-            self.active_calls[call_id] = datetime.utcnow()
-            self.total_calls_today += 1
-            self.total_calls_week += 1
-            self.total_calls_month += 1
+        with self._call_lock:
+            now = datetime.utcnow()
+            self.active_calls[call_id] = now
+            self._call_hours.add(_utc_epoch(now))
             
             logger.debug("call_started_stats", call_id=call_id)
+        self._maybe_persist()
     
     def end_call(self, call_id: str, duration: float):
         """통화 종료 기록
@@ -98,7 +148,7 @@ class StatisticsCollector:
             call_id: Call ID
             duration: 통화 시간 (초)
         """
-        with self._stats_lock:
+        with self._call_lock:
             if call_id in self.active_calls:
                 del self.active_calls[call_id]
             
@@ -106,27 +156,50 @@ class StatisticsCollector:
             
             logger.debug("call_ended_stats", call_id=call_id, duration=duration)
     
+    def _calls_since(self, start: datetime) -> int:
+        with self._call_lock:
+            return self._call_hours.total_since(
+                self._call_hours.bucket_of(_utc_epoch(start)), _utc_epoch(datetime.utcnow())
+            )
+    
+    @property
+    def total_calls_today(self) -> int:
+        """오늘(UTC 0시 이후) 시작한 통화 수"""
+        now = datetime.utcnow()
+        return self._calls_since(now.replace(hour=0, minute=0, second=0, microsecond=0))
+    
+    @property
+    def total_calls_week(self) -> int:
+        """최근 7일 시작한 통화 수"""
+        return self._calls_since(datetime.utcnow() - timedelta(days=7))
+    
+    @property
+    def total_calls_month(self) -> int:
+        """최근 30일 시작한 통화 수"""
+        return self._calls_since(datetime.utcnow() - timedelta(days=30))
+    
     def get_active_call_count(self) -> int:
         """활성 통화 수 조회"""
-        with self._stats_lock:
+        with self._call_lock:
             return len(self.active_calls)
     
     def get_active_calls(self) -> List[Dict[str, Any]]:
         """활성 통화 리스트 조회"""
-        with self._stats_lock:
-            now = datetime.utcnow()
-            return [
-                {
-                    "call_id": call_id,
-                    "start_time": start_time.isoformat(),
-                    "duration_seconds": (now - start_time).total_seconds(),
-                }
-                for call_id, start_time in self.active_calls.items()
-            ]
+        with self._call_lock:
+            active = list(self.active_calls.items())
+        now = datetime.utcnow()
+        return [
+            {
+                "call_id": call_id,
+                "start_time": start_time.isoformat(),
+                "duration_seconds": (now - start_time).total_seconds(),
+            }
+            for call_id, start_time in active
+        ]
     
     def get_average_call_duration(self) -> float:
         """평균 통화 시간 조회 (초)"""
-        with self._stats_lock:
+        with self._call_lock:
             if not self.call_durations:
                 return 0.0
             
@@ -140,12 +213,22 @@ class StatisticsCollector:
         Args:
             event: AIEvent 객체
         """
-        with self._stats_lock:
+        now = datetime.utcnow()
+        epoch = _utc_epoch(now)
+        event_type = event.event_type.value.lower()
+        keywords = event.details.get("keywords", []) if "keywords" in event.details else []
+        recent = {
+            "event_id": event.event_id,
+            "call_id": event.call_id,
+            "event_type": event.event_type.value,
+            "severity": event.severity.value,
+            "confidence": event.confidence,
+            "timestamp": event.created_at.isoformat(),
+        }
+        with self._event_lock:
             # 이벤트 카운트
             self.event_counts["total"] += 1
             
-            event_type = event.event_type.value.lower()
-            
             if "profanity" in event_type:
                 self.event_counts["profanity"] += 1
             
@@ -156,39 +239,34 @@ class StatisticsCollector:
                 self.event_counts["threatening"] += 1
             
             # 시간대별 이벤트 (히트맵)
-            now = datetime.utcnow()
-            hour = now.hour
-            day_of_week = now.weekday()  # 0=Monday, 6=Sunday
-            self.hourly_events[(hour, day_of_week)] += 1
+            self.hourly_events[(now.hour, now.weekday())] += 1  # 0=Monday, 6=Sunday
             
-            # 키워드 추출 (details에서)
-            if "keywords" in event.details:
-                keywords = event.details.get("keywords", [])
-                if isinstance(keywords, list):
-                    for keyword in keywords:
-                        self.keyword_counts[str(keyword)] += 1
+            # 키워드 (details에서)
+            if isinstance(keywords, list):
+                for keyword in keywords:
+                    self._keywords.add(str(keyword))
             
             # 최근 이벤트 저장
-            self.recent_events.append({
-                "event_id": event.event_id,
-                "call_id": event.call_id,
-                "event_type": event.event_type.value,
-                "severity": event.severity.value,
-                "confidence": event.confidence,
-                "timestamp": event.created_at.isoformat(),
-            })
+            self.recent_events.append(recent)
             
-            # 분 단위 시계열
-            minute_key = now.strftime("%Y-%m-%d %H:%M")
-            self.minute_stats[minute_key] += 1
+            # 분·시간 단위 시계열
+            self._event_minutes.add(epoch)
+            self._event_hours.add(epoch)
             
-            logger.debug("event_recorded_stats", event_id=event.event_id)
+        logger.debug("event_recorded_stats", event_id=event.event_id)
+        self._maybe_persist()
     
     def get_event_counts(self) -> Dict[str, int]:
         """이벤트 카운트 조회"""
-        with self._stats_lock:
+        with self._event_lock:
             return self.event_counts.copy()
     
+    @property
+    def keyword_counts(self) -> Dict[str, int]:
+        """추적 중인 키워드 빈도 스냅샷 (최대 KEYWORD_CAPACITY개, 근사)"""
+        with self._event_lock:
+            return self._keywords.snapshot()
+    
     def get_top_keywords(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Top 키워드 조회
         
@@ -198,17 +276,11 @@ class StatisticsCollector:
         Returns:
             키워드 리스트 (빈도 순)
         """
-        with self._stats_lock:
-            sorted_keywords = sorted(
-                self.keyword_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:limit]
-            
-            return [
-                {"keyword": keyword, "count": count}
-                for keyword, count in sorted_keywords
-            ]
+        counts = self.keyword_counts
+        return [
+            {"keyword": keyword, "count": count}
+            for keyword, count in SpaceSaving.top_of(counts, limit)
+        ]
     
     def get_hourly_heatmap(self) -> Dict[str, Any]:
         """시간대별 히트맵 데이터 조회
@@ -216,20 +288,16 @@ class StatisticsCollector:
         Returns:
             히트맵 데이터 (hour, day_of_week, count)
         """
-        with self._stats_lock:
-            heatmap_data = []
-            
-            for (hour, day_of_week), count in self.hourly_events.items():
-                heatmap_data.append({
-                    "hour": hour,
-                    "day_of_week": day_of_week,
-                    "count": count,
-                })
-            
-            return {
-                "data": heatmap_data,
-                "day_names": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
-            }
+        with self._event_lock:
+            cells = list(self.hourly_events.items())
+        
+        return {
+            "data": [
+                {"hour": hour, "day_of_week": day_of_week, "count": count}
+                for (hour, day_of_week), count in cells
+            ],
+            "day_names": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
+        }
     
     def get_recent_events(self, limit: int = 100) -> List[Dict[str, Any]]:
         """최근 이벤트 조회
@@ -240,38 +308,42 @@ class StatisticsCollector:
         Returns:
             최근 이벤트 리스트
         """
-        with self._stats_lock:
+        with self._event_lock:
             # deque를 리스트로 변환하고 역순 (최신순)
             events = list(self.recent_events)
-            events.reverse()
-            
-            return events[:limit]
+        events.reverse()
+        
+        return events[:limit]
     
     def get_minute_timeseries(self, duration_minutes: int = 60) -> List[Dict[str, Any]]:
         """분 단위 시계열 데이터 조회
         
         Args:
-            duration_minutes: 조회할 기간 (분)
+            duration_minutes: 조회할 기간 (분, 최대 24시간)
             
         Returns:
             시계열 데이터
         """
-        with self._stats_lock:
-            now = datetime.utcnow()
-            timeseries = []
-            
-            for i in range(duration_minutes):
-                time_point = now - timedelta(minutes=duration_minutes - i - 1)
-                minute_key = time_point.strftime("%Y-%m-%d %H:%M")
-                
-                count = self.minute_stats.get(minute_key, 0)
-                
-                timeseries.append({
-                    "timestamp": minute_key,
-                    "count": count,
-                })
+        now_epoch = _utc_epoch(datetime.utcnow())
+        with self._event_lock:
+            series = self._event_minutes.series(now_epoch, duration_minutes)
+        
+        return [{"timestamp": _minute_label(bucket), "count": count} for bucket, count in series]
+    
+    def get_hourly_timeseries(self, duration_hours: int = 24) -> List[Dict[str, Any]]:
+        """시간 단위 시계열 데이터 조회
+        
+        Args:
+            duration_hours: 조회할 기간 (시간, 최대 31일)
             
-            return timeseries
+        Returns:
+            시계열 데이터
+        """
+        now_epoch = _utc_epoch(datetime.utcnow())
+        with self._event_lock:
+            series = self._event_hours.series(now_epoch, duration_hours)
+        
+        return [{"timestamp": _hour_label(bucket), "count": count} for bucket, count in series]
     
     # ===== 전체 통계 =====
     
@@ -281,28 +353,26 @@ class StatisticsCollector:
         Returns:
             전체 통계 데이터
         """
-        with self._stats_lock:
-            return {
-                "calls": {
-                    "active": len(self.active_calls),
-                    "today": self.total_calls_today,
-                    "week": self.total_calls_week,
-                    "month": self.total_calls_month,
-                    "average_duration": self.get_average_call_duration(),
-                },
-                "events": self.event_counts.copy(),
-                "top_keywords": self.get_top_keywords(10),
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+        return {
+            "calls": {
+                "active": self.get_active_call_count(),
+                "today": self.total_calls_today,
+                "week": self.total_calls_week,
+                "month": self.total_calls_month,
+                "average_duration": self.get_average_call_duration(),
+            },
+            "events": self.get_event_counts(),
+            "top_keywords": self.get_top_keywords(10),
+            "timestamp": datetime.utcnow().isoformat(),
+        }
     
     def reset_stats(self):
         """통계 초기화 (테스트용)"""
-        with self._stats_lock:
+        with self._call_lock:
             self.active_calls.clear()
-            self.total_calls_today = 0
-            self.total_calls_week = 0
-            self.total_calls_month = 0
             self.call_durations.clear()
+            self._call_hours.clear()
+        with self._event_lock:
             self.event_counts = {
                 "profanity": 0,
                 "anger": 0,
@@ -310,11 +380,87 @@ class StatisticsCollector:
                 "total": 0,
             }
             self.hourly_events.clear()
-            self.keyword_counts.clear()
+            self._keywords.clear()
             self.recent_events.clear()
-            self.minute_stats.clear()
+            self._event_minutes.clear()
+            self._event_hours.clear()
             
-            logger.warning("statistics_reset")
+        logger.warning("statistics_reset")
+    
+    # ===== 저장·복원 =====
+    
+    def _snapshot_state(self) -> Dict[str, Any]:
+        with self._call_lock:
+            calls = {
+                "call_hours": self._call_hours.to_state(),
+                "call_durations": list(self.call_durations),
+            }
+        with self._event_lock:
+            events = {
+                "event_counts": dict(self.event_counts),
+                "hourly_events": [[h, d, c] for (h, d), c in self.hourly_events.items()],
+                "keywords": self._keywords.to_state(),
+                "event_minutes": self._event_minutes.to_state(),
+                "event_hours": self._event_hours.to_state(),
+            }
+        return {"version": STATE_VERSION, "saved_at": datetime.utcnow().isoformat(), **calls, **events}
+    
+    def save_state(self) -> bool:
+        """현재 통계를 state_path에 저장 (임시 파일 → rename)"""
+        try:
+            state = self._snapshot_state()
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(tmp, self.state_path)
+            return True
+        except Exception as e:
+            logger.warning("statistics_state_save_failed", path=str(self.state_path), error=str(e))
+            return False
+    
+    def load_state(self) -> bool:
+        """state_path에서 통계 복원 (없거나 형식이 다르면 무시)"""
+        try:
+            if not self.state_path.is_file():
+                return False
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+                return False
+        except Exception as e:
+            logger.warning("statistics_state_load_failed", path=str(self.state_path), error=str(e))
+            return False
+        with self._call_lock:
+            self._call_hours.load_state(state.get("call_hours") or {})
+            self.call_durations.extend(float(d) for d in state.get("call_durations") or [])
+        with self._event_lock:
+            for key in self.event_counts:
+                self.event_counts[key] += int((state.get("event_counts") or {}).get(key, 0))
+            for hour, day, count in state.get("hourly_events") or []:
+                self.hourly_events[(int(hour), int(day))] += int(count)
+            self._keywords.load_state(state.get("keywords") or {})
+            self._event_minutes.load_state(state.get("event_minutes") or {})
+            self._event_hours.load_state(state.get("event_hours") or {})
+        logger.info("statistics_state_loaded", path=str(self.state_path), saved_at=state.get("saved_at"))
+        return True
+    
+    def _maybe_persist(self):
+        """persist_interval_sec가 지났으면 백그라운드 스레드로 저장 (기록 경로는 시각 비교만)"""
+        if self._persist_running or time.monotonic() - self._last_persist < self.persist_interval_sec:
+            return
+        if not _persist_enabled():
+            return
+        self._last_persist = time.monotonic()
+        self._persist_running = True
+        
+        def _run():
+            try:
+                self.save_state()
+            finally:
+                self._persist_running = False
+        
+        threading.Thread(target=_run, name="statistics-persist", daemon=True).start()
 
 
 # Singleton 인스턴스 가져오기
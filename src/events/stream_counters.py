@@ -0,0 +1,136 @@
+"""Streaming Counters
+
+대시보드 통계용 고정 크기 집계 자료구조 (장기 가동에도 메모리 일정)
+
+- RingCounter: epoch 정수 버킷(slot_seconds 단위) → 카운트 원형 배열. 오래된 슬롯은 같은 자리에 새 버킷이
+  들어올 때 덮어쓴다 (문자열 키·만료 정리 없음)
+- SpaceSaving: 상위 k 키워드 근사 (Metwally et al.). 최대 capacity개 키만 추적하고,
+  가득 차면 최솟값 키를 새 키로 교체 (count = 최솟값 + 1, error = 최솟값)
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class RingCounter:
+    """epoch 버킷 원형 카운터"""
+
+    def __init__(self, slot_seconds: int, slots: int):
+        self.slot_seconds = max(1, int(slot_seconds))
+        self.slots = max(1, int(slots))
+        self._keys: List[int] = [-1] * self.slots
+        self._counts: List[int] = [0] * self.slots
+
+    def bucket_of(self, epoch: float) -> int:
+        return int(epoch // self.slot_seconds)
+
+    def add(self, epoch: float, n: int = 1):
+        bucket = int(epoch // self.slot_seconds)
+        i = bucket % self.slots
+        if self._keys[i] != bucket:
+            if bucket < self._keys[i]:
+                return  # 원형 범위보다 오래된 값
+            self._keys[i] = bucket
+            self._counts[i] = 0
+        self._counts[i] += n
+
+    def get(self, bucket: int) -> int:
+        i = bucket % self.slots
+        return self._counts[i] if self._keys[i] == bucket else 0
+
+    def series(self, now_epoch: float, count: int) -> List[Tuple[int, int]]:
+        """최근 count개 버킷 [(bucket, count), ...] (오래된 순, 최대 slots개)"""
+        last = int(now_epoch // self.slot_seconds)
+        count = min(max(0, int(count)), self.slots)
+        return [(b, self.get(b)) for b in range(last - count + 1, last + 1)]
+
+    def total_since(self, start_bucket: int, now_epoch: float) -> int:
+        last = int(now_epoch // self.slot_seconds)
+        first = max(start_bucket, last - self.slots + 1)
+        return sum(self.get(b) for b in range(first, last + 1))
+
+    def clear(self):
+        self._keys = [-1] * self.slots
+        self._counts = [0] * self.slots
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"slot_seconds": self.slot_seconds, "keys": list(self._keys), "counts": list(self._counts)}
+
+    def load_state(self, state: Dict[str, Any]):
+        if int(state.get("slot_seconds", -1)) != self.slot_seconds:
+            return
+        keys = list(state.get("keys") or [])
+        counts = list(state.get("counts") or [])
+        if len(keys) != len(counts):
+            return
+        for bucket, value in zip(keys, counts):
+            if int(bucket) >= 0:
+                self.add(int(bucket) * self.slot_seconds, int(value))
+
+
+class SpaceSaving:
+    """Space-Saving 상위 k 빈도 근사"""
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = max(1, int(capacity))
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        # (count, key) 최소 힙 — 증가 시 새 항목을 넣고 낡은 항목은 꺼낼 때 버린다
+        self._heap: List[Tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, key: str, n: int = 1):
+        counts = self._counts
+        if key in counts:
+            counts[key] += n
+        elif len(counts) < self.capacity:
+            counts[key] = n
+            self._errors[key] = 0
+        else:
+            floor, victim = self._pop_min()
+            del counts[victim]
+            self._errors.pop(victim, None)
+            counts[key] = floor + n
+            self._errors[key] = floor
+        heapq.heappush(self._heap, (counts[key], key))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, k) for k, c in counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[int, str]:
+        while True:
+            count, key = heapq.heappop(self._heap)
+            if self._counts.get(key) == count:
+                return count, key
+
+    def snapshot(self) -> Dict[str, int]:
+        return dict(self._counts)
+
+    @staticmethod
+    def top_of(counts: Dict[str, int], k: int) -> List[Tuple[str, int]]:
+        return heapq.nlargest(max(0, int(k)), counts.items(), key=lambda kv: kv[1])
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        return self.top_of(self._counts, k)
+
+    def error(self, key: str) -> Optional[int]:
+        return self._errors.get(key)
+
+    def clear(self):
+        self._counts.clear()
+        self._errors.clear()
+        self._heap.clear()
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"counts": dict(self._counts), "errors": dict(self._errors)}
+
+    def load_state(self, state: Dict[str, Any]):
+        counts = {str(k): int(v) for k, v in (state.get("counts") or {}).items()}
+        errors = {str(k): int(v) for k, v in (state.get("errors") or {}).items()}
+        for key, count in self.top_of(counts, self.capacity):
+            self._counts[key] = count
+            self._errors[key] = errors.get(key, 0)
+        self._heap = [(c, k) for k, c in self._counts.items()]
+        heapq.heapify(self._heap)
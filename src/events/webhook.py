@@ -1,16 +1,18 @@
 """Webhook Notifier
 
 이벤트를 외부 시스템으로 전송하는 Webhook 통합
+
+- emit_event(): 큐에 넣고 즉시 반환 (전송·배치·재시도·서킷 브레이커는 WebhookDispatcher 워커)
+- send_event(): 결과가 필요한 호출부용 — 공유 세션으로 보내고 재시도까지 기다린다
 """
 
 import asyncio
-import aiohttp
-from typing import List, Optional
-from datetime import datetime
-import json
+from pathlib import Path
+from typing import List, Optional, Union
 
 from src.ai.event_models import AIEvent
 from src.common.logger import get_logger
+from src.events.webhook_delivery import WebhookDispatcher
 
 logger = get_logger(__name__)
 
@@ -27,6 +29,10 @@ class WebhookNotifier:
         timeout: float = 5.0,
         max_retries: int = 3,
         backoff_factor: float = 2.0,
+        batch_size: int = 1,
+        outbox_path: Optional[Union[str, Path]] = None,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
     ):
         """초기화
         
@@ -35,11 +41,24 @@ class WebhookNotifier:
             timeout: HTTP 요청 타임아웃 (초)
             max_retries: 최대 재시도 횟수
             backoff_factor: Exponential backoff 계수
+            batch_size: emit_event 경로의 POST당 최대 이벤트 수
+            outbox_path: 전송 대기 이벤트를 보존할 SQLite 경로 (None이면 메모리만)
+            failure_threshold: 서킷 브레이커를 여는 연속 실패 횟수
+            reset_timeout: 서킷 브레이커 open 유지 시간 (초)
         """
         self.webhook_urls = webhook_urls
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.dispatcher = WebhookDispatcher(
+            timeout=timeout,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            batch_size=batch_size,
+            outbox_path=outbox_path,
+            failure_threshold=failure_threshold,
+            reset_timeout=reset_timeout,
+        )
         
         # 통계
         self.stats = {
@@ -54,8 +73,33 @@ class WebhookNotifier:
                    timeout=timeout,
                    max_retries=max_retries)
     
+    def emit_event(self, event: AIEvent) -> bool:
+        """이벤트를 전송 큐에 넣고 즉시 반환 (fire-and-forget)
+        
+        Args:
+            event: AIEvent 객체
+            
+        Returns:
+            큐에 들어갔는지 여부 (닫힌 뒤에는 False)
+        """
+        if not self.webhook_urls:
+            return True
+        payload = self._create_payload(event)
+        accepted = all([self.dispatcher.emit(url, payload) for url in self.webhook_urls])
+        if accepted:
+            self.stats["total_sent"] += 1
+        return accepted
+    
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """emit_event로 넣은 이벤트가 모두 처리될 때까지 대기"""
+        return await self.dispatcher.flush(timeout)
+    
+    async def close(self):
+        """전송 워커·세션 정리 (못 보낸 이벤트는 outbox에 남는다)"""
+        await self.dispatcher.close()
+    
     async def send_event(self, event: AIEvent) -> bool:
-        """이벤트 전송
+        """이벤트 전송 (모든 재시도가 끝날 때까지 대기)
         
         Args:
             event: AIEvent 객체
@@ -107,55 +151,30 @@ class WebhookNotifier:
         """
         retry_count = 0
         last_error = None
+        breaker = self.dispatcher.breaker(url)
         
         while retry_count <= self.max_retries:
-            try:
-                async with aiohttp.ClientSession() as session:
-                    timeout = aiohttp.ClientTimeout(total=self.timeout)
-                    
-                    async with session.post(
-                        url,
-                        json=payload,
-                        timeout=timeout,
-                        headers={"Content-Type": "application/json"}
-                    ) as response:
-                        
-                        if response.status >= 200 and response.status < 300:
-                            logger.info("webhook_sent_successfully",
-                                       event_id=event_id,
-                                       url=url,
-                                       status=response.status)
-                            return True
-                        
-                        else:
-                            logger.warning("webhook_failed_http_error",
-                                          event_id=event_id,
-                                          url=url,
-                                          status=response.status)
-                            last_error = f"HTTP {response.status}"
-            
-            except asyncio.TimeoutError:
-                logger.warning("webhook_timeout",
+            if not breaker.allow():
+                logger.warning("webhook_circuit_open",
                               event_id=event_id,
-                              url=url,
-                              retry_count=retry_count)
-                last_error = "Timeout"
+                              url=url)
+                return False
             
-            except aiohttp.ClientError as e:
-                logger.warning("webhook_client_error",
-                              event_id=event_id,
-                              url=url,
-                              error=str(e),
-                              retry_count=retry_count)
-                last_error = str(e)
+            ok, error = await self.dispatcher.post(url, payload)
+            if ok:
+                breaker.record_success()
+                logger.info("webhook_sent_successfully",
+                           event_id=event_id,
+                           url=url)
+                return True
             
-            except Exception as e:
-                logger.error("webhook_unexpected_error",
-                            event_id=event_id,
-                            url=url,
-                            error=str(e),
-                            retry_count=retry_count)
-                last_error = str(e)
+            breaker.record_failure()
+            logger.warning("webhook_send_failed",
+                          event_id=event_id,
+                          url=url,
+                          error=error,
+                          retry_count=retry_count)
+            last_error = error
             
             # 재시도
             if retry_count < self.max_retries:
@@ -163,7 +182,7 @@ class WebhookNotifier:
                 self.stats["retries"] += 1
                 
                 # Exponential backoff
-                backoff_delay = self.backoff_factor ** retry_count
+                backoff_delay = self.dispatcher.backoff_delay(retry_count)
                 logger.debug("webhook_retry",
                             event_id=event_id,
                             url=url,
@@ -209,6 +228,7 @@ class WebhookNotifier:
         return {
             **self.stats,
             "webhook_urls_count": len(self.webhook_urls),
+            "delivery": self.dispatcher.get_stats(),
         }
     
     def add_webhook_url(self, url: str):
@@ -0,0 +1,474 @@
+"""Webhook Delivery
+
+Webhook 전송 하위 시스템 — 호출부는 emit()으로 큐에 넣고 바로 돌아가며, 전송·재시도는 백그라운드 워커가 한다.
+
+- 목적지(scheme://host:port)별 장수명 aiohttp.ClientSession (keep-alive 커넥션 풀 — 이벤트마다 DNS·TCP·TLS 재수립 없음)
+- 디스크 outbox (SQLite, 선택): 받은 이벤트를 URL별 행으로 기록하고 전송 성공·최종 실패 시 지운다.
+  재시작하면 남은 행을 다시 읽어 이어서 보낸다
+- 배치: batch_size > 1이면 한 POST에 최대 batch_size개 ({"events": [...], "count": n})
+- 재시도: 지수 백오프(backoff_factor ** attempts, backoff_max 상한) + 지터(0.5~1.0배), 워커 안에서만 대기
+- URL별 서킷 브레이커: 연속 실패 failure_threshold회면 open, reset_timeout 후 half-open 탐침 1회
+- get_stats(): 큐 길이·전송/실패/드롭 수·URL별 브레이커 상태와 평균 지연
+"""
+
+import asyncio
+import json
+import random
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from src.common.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CircuitBreaker:
+    """URL별 서킷 브레이커 (closed → open → half_open → closed)"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = max(0.0, float(reset_timeout))
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.opened_count = 0
+        self._probe_in_flight = False
+
+    def allow(self, now: Optional[float] = None) -> bool:
+        """요청을 보내도 되는지 (half-open에서는 탐침 1건만)"""
+        if self.state == self.CLOSED:
+            return True
+        now = time.monotonic() if now is None else now
+        if self.state == self.OPEN:
+            if now - self.opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def retry_at(self) -> float:
+        """open 상태가 풀리는 monotonic 시각"""
+        return self.opened_at + self.reset_timeout
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self, now: Optional[float] = None):
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.opened_count += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic() if now is None else now
+
+
+class WebhookOutbox:
+    """전송 대기 행 SQLite 저장소 (id, url, payload, attempts, created_at)"""
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS webhook_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def add_many(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[int]:
+        """(url, payload) 목록을 기록하고 행 id 목록 반환"""
+        now = time.time()
+        ids: List[int] = []
+        with self._lock:
+            cur = self._conn.cursor()
+            for url, payload in items:
+                cur.execute(
+                    "INSERT INTO webhook_outbox (url, payload, attempts, created_at) VALUES (?, ?, 0, ?)",
+                    (url, json.dumps(payload, ensure_ascii=False, default=str), now),
+                )
+                ids.append(int(cur.lastrowid))
+            self._conn.commit()
+        return ids
+
+    def remove(self, ids: List[int]):
+        if not ids:
+            return
+        with self._lock:
+            self._conn.executemany("DELETE FROM webhook_outbox WHERE id = ?", [(i,) for i in ids])
+            self._conn.commit()
+
+    def set_attempts(self, ids: List[int], attempts: int):
+        if not ids:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE webhook_outbox SET attempts = ? WHERE id = ?", [(attempts, i) for i in ids]
+            )
+            self._conn.commit()
+
+    def load(self) -> List[Tuple[int, str, Dict[str, Any], int]]:
+        """남은 행 (id, url, payload, attempts) — id 순"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, url, payload, attempts FROM webhook_outbox ORDER BY id"
+            ).fetchall()
+        result = []
+        for row_id, url, payload, attempts in rows:
+            try:
+                result.append((int(row_id), url, json.loads(payload), int(attempts)))
+            except ValueError:
+                continue
+        return result
+
+    def count(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM webhook_outbox").fetchone()[0])
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class _Delivery:
+    url: str
+    payload: Dict[str, Any]
+    attempts: int = 0
+    next_at: float = 0.0
+    outbox_id: Optional[int] = None
+
+
+@dataclass
+class _UrlStats:
+    sent: int = 0
+    failed: int = 0
+    batches: int = 0
+    latency_ms_total: float = 0.0
+    last_error: Optional[str] = None
+    pending: Deque[_Delivery] = field(default_factory=deque)
+
+
+class WebhookDispatcher:
+    """풀링된 세션 + 백그라운드 큐 기반 webhook 전송기 (payload dict 단위)"""
+
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        max_retries: int = 3,
+        backoff_factor: float = 2.0,
+        backoff_max: float = 60.0,
+        batch_size: int = 1,
+        queue_max: int = 10000,
+        outbox_path: Optional[Union[str, Path]] = None,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        pool_limit_per_host: int = 8,
+    ):
+        self.timeout = timeout
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.batch_size = max(1, int(batch_size))
+        self.queue_max = max(1, int(queue_max))
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.pool_limit_per_host = max(1, int(pool_limit_per_host))
+        self.outbox = WebhookOutbox(outbox_path) if outbox_path else None
+
+        self._incoming: Deque[Tuple[str, Dict[str, Any]]] = deque()
+        self._urls: Dict[str, _UrlStats] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._closed = False
+        self.stats = {"enqueued": 0, "delivered": 0, "failed": 0, "dropped": 0, "retries": 0, "batches": 0}
+
+        if self.outbox is not None:
+            for row_id, url, payload, attempts in self.outbox.load():
+                self._url(url).pending.append(_Delivery(url, payload, attempts, 0.0, row_id))
+
+    # ------------------------------------------------------------------ 세션 풀
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def session_for(self, url: str) -> aiohttp.ClientSession:
+        """목적지별 공유 세션 (다른 이벤트 루프에서 부르면 새로 만든다)"""
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            # 이전 루프의 세션은 그 루프와 함께 사라졌으므로 참조만 버린다
+            self._sessions = {}
+            self._session_loop = loop
+        origin = self._origin(url)
+        session = self._sessions.get(origin)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.pool_limit_per_host,
+                keepalive_timeout=30.0,
+                ttl_dns_cache=300,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                json_serialize=lambda obj: json.dumps(obj, ensure_ascii=False, default=str),
+            )
+            self._sessions[origin] = session
+        return session
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        breaker = self._breakers.get(url)
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            self._breakers[url] = breaker
+        return breaker
+
+    def _url(self, url: str) -> _UrlStats:
+        entry = self._urls.get(url)
+        if entry is None:
+            entry = _UrlStats()
+            self._urls[url] = entry
+        return entry
+
+    def backoff_delay(self, attempts: int) -> float:
+        """attempts번째 재시도 대기 (지터 0.5~1.0배)"""
+        base = min(self.backoff_max, self.backoff_factor ** max(1, attempts))
+        return base * random.uniform(0.5, 1.0)
+
+    async def post(self, url: str, body: Any) -> Tuple[bool, Optional[str]]:
+        """한 번 POST (재시도 없음). (성공 여부, 오류 문자열)"""
+        started = time.monotonic()
+        entry = self._url(url)
+        try:
+            session = self.session_for(url)
+            async with session.post(url, json=body) as response:
+                await response.read()
+                if 200 <= response.status < 300:
+                    entry.latency_ms_total += (time.monotonic() - started) * 1000.0
+                    return True, None
+                error = f"HTTP {response.status}"
+        except asyncio.TimeoutError:
+            error = "Timeout"
+        except aiohttp.ClientError as e:
+            error = str(e) or type(e).__name__
+        except Exception as e:
+            logger.error("webhook_unexpected_error", url=url, error=str(e))
+            error = str(e)
+        entry.last_error = error
+        return False, error
+
+    # ------------------------------------------------------------------ 큐
+
+    def emit(self, url: str, payload: Dict[str, Any]) -> bool:
+        """(url, payload)를 큐에 넣고 바로 반환. 큐가 가득 차면 가장 오래된 것을 버린다"""
+        if self._closed:
+            return False
+        if len(self._incoming) >= self.queue_max:
+            self._incoming.popleft()
+            self.stats["dropped"] += 1
+        self._incoming.append((url, payload))
+        self.stats["enqueued"] += 1
+        self._ensure_worker()
+        return True
+
+    def _ensure_worker(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None:
+            # 루프 밖(다른 스레드)에서 호출 — 워커가 돌고 있으면 그 루프에서 깨운다
+            if self._loop is not None and not self._loop.is_closed() and self._wakeup is not None:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+            return
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._idle = asyncio.Event()
+            self._worker = loop.create_task(self._run())
+        self._idle.clear()
+        self._wakeup.set()
+
+    def pending_count(self) -> int:
+        return len(self._incoming) + sum(len(e.pending) for e in self._urls.values())
+
+    async def _accept_incoming(self):
+        """들어온 항목을 outbox에 기록하고 URL별 대기열로 옮긴다"""
+        if not self._incoming:
+            return
+        items = list(self._incoming)
+        self._incoming.clear()
+        ids: List[Optional[int]] = [None] * len(items)
+        if self.outbox is not None:
+            try:
+                ids = await asyncio.to_thread(self.outbox.add_many, items)
+            except Exception as e:
+                logger.error("webhook_outbox_write_failed", error=str(e), count=len(items))
+        for (url, payload), row_id in zip(items, ids):
+            self._url(url).pending.append(_Delivery(url, payload, 0, 0.0, row_id))
+
+    def _take_batch(self, url: str, entry: _UrlStats, now: float) -> List[_Delivery]:
+        batch: List[_Delivery] = []
+        while entry.pending and len(batch) < self.batch_size and entry.pending[0].next_at <= now:
+            batch.append(entry.pending.popleft())
+        return batch
+
+    async def _deliver(self, url: str, batch: List[_Delivery]):
+        entry = self._url(url)
+        breaker = self.breaker(url)
+        if len(batch) == 1 and self.batch_size == 1:
+            body: Any = batch[0].payload
+        else:
+            body = {"events": [d.payload for d in batch], "count": len(batch)}
+        ok, error = await self.post(url, body)
+        ids = [d.outbox_id for d in batch if d.outbox_id is not None]
+        if ok:
+            breaker.record_success()
+            entry.sent += len(batch)
+            entry.batches += 1
+            self.stats["delivered"] += len(batch)
+            self.stats["batches"] += 1
+            if self.outbox is not None and ids:
+                await asyncio.to_thread(self.outbox.remove, ids)
+            return
+        breaker.record_failure()
+        attempts = batch[0].attempts + 1
+        if attempts > self.max_retries:
+            entry.failed += len(batch)
+            self.stats["failed"] += len(batch)
+            logger.error("webhook_delivery_dropped", url=url, count=len(batch), attempts=attempts, last_error=error)
+            if self.outbox is not None and ids:
+                await asyncio.to_thread(self.outbox.remove, ids)
+            return
+        self.stats["retries"] += 1
+        next_at = time.monotonic() + self.backoff_delay(attempts)
+        logger.debug("webhook_delivery_retry", url=url, count=len(batch), attempts=attempts, error=error)
+        for d in reversed(batch):
+            d.attempts = attempts
+            d.next_at = next_at
+            entry.pending.appendleft(d)
+        if self.outbox is not None and ids:
+            await asyncio.to_thread(self.outbox.set_attempts, ids, attempts)
+
+    async def _run(self):
+        while True:
+            await self._accept_incoming()
+            now = time.monotonic()
+            sends = []
+            next_due: Optional[float] = None
+            for url, entry in self._urls.items():
+                if not entry.pending:
+                    continue
+                breaker = self.breaker(url)
+                head_at = entry.pending[0].next_at
+                if head_at > now:
+                    next_due = head_at if next_due is None else min(next_due, head_at)
+                    continue
+                if not breaker.allow(now):
+                    wake_at = breaker.retry_at()
+                    next_due = wake_at if next_due is None else min(next_due, wake_at)
+                    continue
+                batch = self._take_batch(url, entry, now)
+                if batch:
+                    sends.append(self._deliver(url, batch))
+            if sends:
+                await asyncio.gather(*sends, return_exceptions=True)
+                continue
+            if not self._incoming and self.pending_count() == 0:
+                self._idle.set()
+                if self._closed:
+                    return
+            self._wakeup.clear()
+            if self._incoming:
+                continue
+            timeout = None if next_due is None else max(0.0, next_due - time.monotonic())
+            if self._closed and timeout is not None:
+                return  # 종료 중 — 남은 재시도 건은 outbox에 둔다
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """대기열이 빌 때까지 기다린다 (재시도 대기 중인 건 포함). 시간 내 비면 True"""
+        if self.pending_count() == 0:
+            return True
+        self._ensure_worker()
+        if self._idle is None:
+            return False
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def close(self, timeout: float = 5.0):
+        """워커를 정리하고 세션·outbox를 닫는다 (보내지 못한 건은 outbox에 남는다)"""
+        self._closed = True
+        if self._worker is not None and not self._worker.done():
+            self._wakeup.set()
+            try:
+                await asyncio.wait_for(self._worker, timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
+        for session in self._sessions.values():
+            if not session.closed:
+                await session.close()
+        self._sessions = {}
+        if self.outbox is not None:
+            self.outbox.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        per_url = {}
+        for url, entry in self._urls.items():
+            breaker = self.breaker(url)
+            per_url[url] = {
+                "pending": len(entry.pending),
+                "sent": entry.sent,
+                "failed": entry.failed,
+                "batches": entry.batches,
+                "avg_latency_ms": round(entry.latency_ms_total / entry.batches, 2) if entry.batches else None,
+                "breaker": breaker.state,
+                "breaker_opened": breaker.opened_count,
+                "last_error": entry.last_error,
+            }
+        return {
+            **self.stats,
+            "queued": self.pending_count(),
+            "outbox_rows": self.outbox.count() if self.outbox is not None else None,
+            "sessions": len(self._sessions),
+            "urls": per_url,
+        }
@@ -475,6 +475,23 @@ async def run_server(config: Config) -> int:
                 )
                 print_immediate(f"✅ [AI Background] Google STT/TTS Service 준비 완료 ({warmup_elapsed:.1f}s)")
 
+                # 공용 gRPC 채널 예열 (TLS·인증까지) + 백그라운드 인증 갱신 — 실패해도 첫 요청 시 연결
+                try:
+                    from src.ai_voicebot.ai_pipeline.google_client_pool import (
+                        get_google_client_pool,
+                        google_client_pool_enabled,
+                    )
+
+                    if google_client_pool_enabled():
+                        _pool = get_google_client_pool()
+                        _stt_region = stt_cfg.get("location") if isinstance(stt_cfg, dict) else None
+                        await asyncio.get_running_loop().run_in_executor(None, _pool.warm)
+                        await _pool.warm_async(kinds=("tts_async",))
+                        await _pool.warm_async(kinds=("stt_v2_async",), region=_stt_region)
+                        _pool.start_background_refresh()
+                except Exception as _pool_err:
+                    logger.warning("google_client_pool_warmup_failed", error=str(_pool_err))
+
                 # ✅ Pipecat Pipeline Builder — 선택 (실패해도 레거시 오케스트레이터 유지)
                 try:
                     from src.ai_voicebot.factory import create_pipecat_pipeline_builder
@@ -484,6 +501,18 @@ async def run_server(config: Config) -> int:
                         sip_endpoint.call_manager.set_pipecat_builder(pipecat_builder)
                         logger.info("pipecat_builder_connected_to_call_manager", engine="pipecat")
                         print_immediate("✅ [AI Background] Pipecat Pipeline Builder 연결 완료")
+
+                        # Smart Turn 공용 모델 사전 로드 — 첫 통화 파이프라인 생성 시 ONNX 로드 지연 제거
+                        try:
+                            from src.ai_voicebot.pipecat.smart_turn_inference import (
+                                get_smart_turn_inference_server,
+                            )
+
+                            await asyncio.get_running_loop().run_in_executor(
+                                None, get_smart_turn_inference_server
+                            )
+                        except Exception as smart_turn_err:
+                            logger.warning("smart_turn_shared_preload_failed", error=str(smart_turn_err))
                 except Exception as pipecat_err:
                     logger.info(
                         "pipecat_builder_not_available",
@@ -716,10 +745,20 @@ async def run_server(config: Config) -> int:
             # 🔥 Knowledge API용 embedder 설정
             try:
                 from src.api.knowledge_router import set_knowledge_embedder
-                from src.ai_voicebot.knowledge.embedder import get_text_embedder
-                _embedder = get_text_embedder()
+                from src.ai_voicebot.knowledge.embedder import get_text_embedder, warm_up_text_embedder
+                _emb_cfg = getattr(getattr(config, "ai_voicebot", None), "embedding", None) or {}
+                _emb_model = _emb_cfg.get("model") if isinstance(_emb_cfg, dict) else None
+                _emb_backend = _emb_cfg.get("backend") if isinstance(_emb_cfg, dict) else None
+                # 공유 임베더 로드 + 합성 배치 워밍업을 기동 시점에 끝내 첫 통화가 로드/컴파일 비용을 내지 않게 함
+                _emb_stats = await asyncio.to_thread(warm_up_text_embedder, _emb_model, _emb_backend)
+                _embedder = get_text_embedder(model_name=_emb_model, backend=_emb_backend, consumer="api")
                 set_knowledge_embedder(_embedder)
-                logger.info("knowledge_embedder_configured_for_api")
+                logger.info(
+                    "knowledge_embedder_configured_for_api",
+                    backend=_emb_stats.get("backend"),
+                    load_time_ms=_emb_stats.get("load_time_ms"),
+                    warmup_ms=_emb_stats.get("warmup_ms"),
+                )
             except Exception as emb_err:
                 if ai_voicebot_enabled:
                     logger.error(
@@ -838,6 +877,11 @@ async def run_server(config: Config) -> int:
                 except Exception:
                     pass
 
+                # owner별 help/capability 사전 계산 캐시 — 지식 변경 시 백그라운드 재계산
+                from src.ai_voicebot.knowledge.help_cache import get_help_cache
+
+                get_help_cache().configure(vector_db=_help_vector_db, llm=_help_llm)
+
                 # 등록된 모든 owner(테넌트)에 대해 help 캐시 구성
                 # owner 목록: config에 명시된 내선번호 또는 ChromaDB에서 조회
                 _help_owners: list = []
@@ -860,6 +904,8 @@ async def run_server(config: Config) -> int:
                                     llm=_help_llm,
                                     owner=_owner,
                                 )
+                                # 지문이 같으면(재기동 전과 지식 동일) SQLite 값 그대로 사용
+                                await get_help_cache().rebuild(_owner)
                             except Exception as _e:
                                 logger.warning(
                                     "help_cache_startup_owner_failed",
@@ -889,6 +935,40 @@ async def run_server(config: Config) -> int:
             except Exception as _he:
                 logger.warning("help_cache_startup_schedule_failed", error=str(_he))
 
+            # 고정 문구 TTS 캐시 예열 — 인사/종료/대기 멘트를 G.711 프레임으로 미리 합성 (디스크에 있으면 생략)
+            try:
+                import asyncio as _asyncio
+                from src.ai_voicebot.ai_pipeline.tts_phrase_cache import warm_tts_phrase_cache_on_startup
+
+                _tts_cfg = getattr(config, "tts", None)
+                _tts_warm_cfg = _tts_cfg.model_dump() if hasattr(_tts_cfg, "model_dump") else (
+                    dict(_tts_cfg) if _tts_cfg else {}
+                )
+                _hitl_msgs = []
+                _ai_cfg = getattr(config, "ai_voicebot", None)
+                _hitl_warm_cfg = getattr(_ai_cfg, "hitl", None) if _ai_cfg else None
+                if isinstance(_hitl_warm_cfg, dict):
+                    _hitl_msgs = [
+                        _hitl_warm_cfg.get(k)
+                        for k in ("hold_message", "away_message", "timeout_message")
+                        if _hitl_warm_cfg.get(k)
+                    ]
+                _tts_warm_owners = [
+                    str(ext) for ext in (getattr(getattr(config, "sip", None), "extensions", None) or []) if ext
+                ]
+
+                async def _warm_tts_phrase_cache():
+                    try:
+                        await warm_tts_phrase_cache_on_startup(
+                            _tts_warm_cfg, owners=_tts_warm_owners, extra_phrases=_hitl_msgs
+                        )
+                    except Exception as _te:
+                        logger.warning("tts_phrase_cache_warm_failed", error=str(_te))
+
+                _asyncio.ensure_future(_warm_tts_phrase_cache())
+            except Exception as _te:
+                logger.warning("tts_phrase_cache_warm_schedule_failed", error=str(_te))
+
         # WebSocket 서버 기동 (실시간 대화 STT/TTS 표시용)
         # 기본: 메인 루프 태스크(옵션 A). SIP_PBX_EMBEDDED_API=0 이면 레거시 전용 스레드.
         _ws_port = 8001
@@ -1075,6 +1155,22 @@ async def run_server(config: Config) -> int:
                 except Exception as e:
                     logger.error("sip_shutdown_async_failed", error=str(e))
 
+        # 통화 데이터 기록 writer 큐 비우기 (atexit에서도 호출되지만 종료 로그 전에 확정)
+        try:
+            from src.common.call_data_record_logger import close_call_data_record_log
+
+            await asyncio.to_thread(close_call_data_record_log)
+        except Exception as e:
+            print_immediate(f"Warning: Failed to close call data record log: {e}", file=sys.stderr)
+
+        # 공유 SQLite 풀 연결 닫기 (WAL 체크포인트 포함)
+        try:
+            from src.common.sqlite_pool import close_all_sqlite_pools
+
+            close_all_sqlite_pools()
+        except Exception as e:
+            print_immediate(f"Warning: Failed to close SQLite pools: {e}", file=sys.stderr)
+
         # 비동기 로깅 중지
         try:
             await stop_async_logging()
@@ -158,6 +158,7 @@ class RTPRelayWorker:
         self._rtp_packet_builder = None  # TTS -> RTP 변환용
         # TTS→RTP: PCM 큐 + 단일 발송 루프(20ms 패이싱)
         self._pipecat_pcm_queue: Optional[queue.Queue] = None  # thread-safe PCM 큐 (TTS → 송신 스레드)
+        self._pcm_discard_requested = threading.Event()  # 송신 스레드 내부 pcm_buffer 폐기 요청
         self._pipecat_outgoing_task: Optional[asyncio.Task] = None  # 레거시: 스레드 송신 시 None
         self._tts_sender_thread: Optional[threading.Thread] = None
         self._event_loop: Optional[asyncio.AbstractEventLoop] = None  # 스레드 → 루프 wake용
@@ -946,7 +947,13 @@ class RTPRelayWorker:
                    call_id=self.media_session.call_id,
                    ai_orchestrator=ai_orchestrator is not None)
     
-    def send_ai_audio(self, audio_data: bytes, *, ringback_early_media: bool = False):
+    def send_ai_audio(
+        self,
+        audio_data: bytes,
+        *,
+        ringback_early_media: bool = False,
+        g711_encoded: bool = False,
+    ):
         """
         AI에서 생성한 오디오(TTS PCM)를 RTP 패킷으로 변환하여 Caller에게 전송.
 
@@ -959,6 +966,8 @@ class RTPRelayWorker:
         Args:
             audio_data: TTS가 생성한 PCM 오디오 데이터 (16-bit, 16kHz)
             ringback_early_media: True면 링 단계 early media 용 송신(ai_mode 불필요)
+            g711_encoded: True면 audio_data가 이미 세션 코덱의 8kHz G.711
+                (TTS 문구 캐시 프레임) — 리샘플링·인코딩 없이 패킷화만 한다
         """
         if not self.ai_mode and not ringback_early_media:
             logger.warning("not_in_ai_mode",
@@ -1001,8 +1010,11 @@ class RTPRelayWorker:
                     note="발신 단말 묵음 시 SDP 180/183·caller leg 포트·ringback_settings 행을 함께 확인",
                 )
 
-            # PCM(16kHz) → G.711 → RTP 패킷들로 변환
-            rtp_packets = self._rtp_packet_builder.build_packets(audio_data, sample_rate=16000)
+            # PCM(16kHz) → G.711 → RTP 패킷들로 변환 (캐시 프레임은 패킷화만)
+            if g711_encoded:
+                rtp_packets = self._rtp_packet_builder.build_packets_from_g711(audio_data)
+            else:
+                rtp_packets = self._rtp_packet_builder.build_packets(audio_data, sample_rate=16000)
             
             for packet in rtp_packets:
                 try:
@@ -1550,6 +1562,11 @@ class RTPRelayWorker:
 
         while self._pipecat_pcm_queue is not None:
             try:
+                # 0) discard_pending_tts_audio() 요청 — 아직 송출하지 않은 버퍼 폐기
+                if self._pcm_discard_requested.is_set():
+                    self._pcm_discard_requested.clear()
+                    pcm_buffer.clear()
+
                 # 1) 큐에서 비블로킹으로 가능한 한 모두 가져와서 버퍼에 넣기
                 if not _session_ending:
                     while True:
@@ -2174,6 +2191,33 @@ class RTPRelayWorker:
                          error=str(e),
                          error_type=type(e).__name__)
 
+    def discard_pending_tts_audio(self) -> int:
+        """
+        아직 RTP로 나가지 않은 TTS PCM을 버린다 (PCM 큐 + 송신 스레드 내부 버퍼).
+        이미 송출된 오디오는 되돌릴 수 없다. 송신 스레드 종료 sentinel은 유지한다.
+
+        Returns:
+            버린 PCM 큐 청크 수 (송신 스레드 버퍼는 다음 20ms 슬롯에서 비운다)
+        """
+        pcm_q = self._pipecat_pcm_queue
+        if pcm_q is None:
+            return 0
+        dropped = 0
+        while True:
+            try:
+                item = pcm_q.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                try:
+                    pcm_q.put_nowait(None)
+                except queue.Full:
+                    pass
+                break
+            dropped += 1
+        self._pcm_discard_requested.set()
+        return dropped
+
     async def request_tts_flush(self):
         """
         (비활성화) 원래는 새 TTS 시작 시 PCM 큐를 비웠음. 현재는 순차 재생을 위해 no-op.
@@ -0,0 +1,320 @@
+"""
+예약 슬롯 가용성 인덱스.
+
+LLM 도구·API가 "그날 빈 시간", "이번 주 가능한 날", "가장 빠른 예약"을 물을 때마다 booking_slots를
+다시 조회하지 않도록 (owner, 날짜)별 슬롯 상태를 메모리에 둔다.
+
+- 일자 항목: 해당 날짜의 차단되지 않은 슬롯 (slot_time 순) — 남은 자리 = capacity - booked_count
+  범위 조회는 빠진 날짜만 한 번의 SQL로 채운다 (빈 날짜도 "슬롯 없음"으로 기록)
+- 예약 생성: 커밋 직후 apply_booking()으로 해당 슬롯 booked_count를 제자리 갱신 — 트랜잭션 안에서 읽은
+  값 + 1(절대값)을 단조 증가로만 반영하므로, 커밋 후 재적재와 겹쳐도 이중 반영되지 않는다
+- 취소·일정 변경·슬롯 CRUD: invalidate_day()/invalidate_owner()로 항목 폐기 (다음 조회 때 재적재)
+- owner별 쓰기 버전: 적재 중에 쓰기가 끼면 그 결과는 캐시에 넣지 않는다 (오래된 값 고착 방지)
+- 다른 프로세스(mcp_gateway 등)의 쓰기 대비 일자 항목 TTL (BOOKING_AVAILABILITY_TTL_SEC, 기본 5초)
+- "가장 빠른 가용 슬롯" 답은 짧게 캐시 (BOOKING_NEXT_AVAILABLE_TTL_SEC, 기본 2초, owner 쓰기 시 무효)
+- BOOKING_AVAILABILITY_MAX_DAYS(기본 62일)보다 긴 범위는 캐시하지 않고 한 번의 SQL 결과(슬롯 있는 날만)로
+  답한다 — "2026-01-01~2099-12-31" 같은 질의가 owner마다 수만 개의 빈 일자 항목을 만들지 않도록
+- 일자 항목이 BOOKING_AVAILABILITY_MAX_ENTRIES(기본 20000)를 넘으면 만료된 항목부터 정리
+- 날짜는 YYYY-MM-DD만 받는다 (parse_slot_date). 형식이 틀리면 예외 대신 "슬롯 없음"
+
+인덱스는 답변용이다. 정원 검사는 여전히 create_booking의 BEGIN IMMEDIATE 트랜잭션이 DB 기준으로 한다.
+BOOKING_AVAILABILITY_INDEX=0이면 매 조회 DB를 읽는다.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+from src.booking import database as _booking_db
+
+logger = structlog.get_logger(__name__)
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, str(default)))
+    except ValueError:
+        return default
+
+
+def parse_slot_date(value: Any) -> Optional[date]:
+    """slot_date 문자열(YYYY-MM-DD) → date. 형식이 틀리거나 없는 날짜면 None"""
+    if not isinstance(value, str) or not _DATE_RE.match(value):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+class _Day:
+    __slots__ = ("loaded_at", "slots")
+
+    def __init__(self, slots: List[Dict[str, Any]]):
+        self.loaded_at = time.monotonic()
+        self.slots = slots  # slot_time 순 (차단 슬롯 제외)
+
+
+class BookingAvailabilityIndex:
+    """(DB, owner, 날짜)별 슬롯 가용성 캐시"""
+
+    def __init__(
+        self,
+        ttl_sec: Optional[float] = None,
+        answer_ttl_sec: Optional[float] = None,
+        max_days: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.ttl_sec = ttl_sec if ttl_sec is not None else _env_float("BOOKING_AVAILABILITY_TTL_SEC", 5.0)
+        self.answer_ttl_sec = (
+            answer_ttl_sec if answer_ttl_sec is not None else _env_float("BOOKING_NEXT_AVAILABLE_TTL_SEC", 2.0)
+        )
+        self.max_days = max(1, max_days if max_days is not None else _env_int("BOOKING_AVAILABILITY_MAX_DAYS", 62))
+        self.max_entries = max(
+            1, max_entries if max_entries is not None else _env_int("BOOKING_AVAILABILITY_MAX_ENTRIES", 20000)
+        )
+        self._lock = threading.Lock()
+        self._days: Dict[Tuple[str, str, str], _Day] = {}
+        self._versions: Dict[Tuple[str, str], int] = {}
+        self._answers: Dict[Tuple[Any, ...], Tuple[float, int, List[Dict[str, Any]]]] = {}
+        self.stats = {
+            "hits": 0,
+            "loads": 0,
+            "uncached_loads": 0,
+            "applied": 0,
+            "invalidations": 0,
+            "answer_hits": 0,
+        }
+
+    # ------------------------------------------------------------------ 내부
+
+    @staticmethod
+    def _db() -> str:
+        return _booking_db._get_db_path()
+
+    def _version(self, db: str, owner: str) -> int:
+        return self._versions.get((db, owner), 0)
+
+    def _bump(self, db: str, owner: str):
+        self._versions[(db, owner)] = self._versions.get((db, owner), 0) + 1
+
+    def _fresh(self, day: Optional[_Day], now: float) -> bool:
+        return day is not None and now - day.loaded_at <= self.ttl_sec
+
+    def _load(self, owner: str, start: str, end: str) -> Dict[str, List[Dict[str, Any]]]:
+        with _booking_db.get_db() as conn:
+            rows = conn.execute(
+                """SELECT * FROM booking_slots
+                   WHERE owner = ? AND slot_date >= ? AND slot_date <= ? AND is_blocked = 0
+                   ORDER BY slot_date, slot_time""",
+                (owner, start, end),
+            ).fetchall()
+        by_day: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            item = _booking_db.row_to_dict(row)
+            by_day.setdefault(item["slot_date"], []).append(item)
+        return by_day
+
+    def _prune_locked(self, now: float):
+        """일자 항목 상한 초과 시 만료 항목 정리 (그래도 넘치면 오래 적재된 순으로)"""
+        if len(self._days) < self.max_entries:
+            return
+        self._days = {k: v for k, v in self._days.items() if self._fresh(v, now)}
+        overflow = len(self._days) - self.max_entries // 2
+        if overflow > 0:
+            oldest = sorted(self._days.items(), key=lambda kv: kv[1].loaded_at)[:overflow]
+            for key, _ in oldest:
+                del self._days[key]
+
+    def _days_in_range(self, owner: str, start: str, end: str) -> Dict[str, List[Dict[str, Any]]]:
+        """start~end 날짜별 슬롯 목록 (캐시에 없거나 만료된 날짜만 DB에서).
+
+        날짜 형식이 틀리면 빈 dict. max_days보다 긴 범위는 캐시를 거치지 않고 슬롯 있는 날만 돌려준다.
+        """
+        first, last = parse_slot_date(start), parse_slot_date(end)
+        if first is None or last is None or first > last:
+            return {}
+        if (last - first).days + 1 > self.max_days:
+            loaded = self._load(owner, start, end)
+            with self._lock:
+                self.stats["uncached_loads"] += 1
+            return loaded
+        db = self._db()
+        dates = _date_range(first, last)
+        now = time.monotonic()
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        missing: List[str] = []
+        with self._lock:
+            for d in dates:
+                day = self._days.get((db, owner, d))
+                if self._fresh(day, now):
+                    result[d] = day.slots
+                else:
+                    missing.append(d)
+            version = self._version(db, owner)
+            self.stats["hits"] += len(dates) - len(missing)
+        if not missing:
+            return result
+        loaded = self._load(owner, missing[0], missing[-1])
+        with self._lock:
+            self.stats["loads"] += 1
+            cache = self._version(db, owner) == version
+            if cache:
+                self._prune_locked(now)
+            for d in missing:
+                slots = loaded.get(d, [])
+                result[d] = slots
+                if cache:
+                    self._days[(db, owner, d)] = _Day(slots)
+        return result
+
+    # ------------------------------------------------------------------ 조회
+
+    def available_slots(self, owner: str, slot_date: str, party_size: int = 1) -> List[Dict[str, Any]]:
+        """남은 자리가 party_size 이상인 슬롯 (slot_time 순, available 포함 복사본)"""
+        slots = self._days_in_range(owner, slot_date, slot_date).get(slot_date, [])
+        out = []
+        for s in slots:
+            remaining = s["capacity"] - s["booked_count"]
+            if remaining >= party_size:
+                out.append({**s, "available": remaining})
+        return out
+
+    def day_summaries(self, owner: str, start_date: str, end_date: str, party_size: int = 1) -> List[Dict[str, Any]]:
+        """날짜별 {slot_date, slot_count, available_count} — 가용 슬롯이 있는 날만"""
+        days = self._days_in_range(owner, start_date, end_date)
+        out = []
+        for d in sorted(days):
+            slots = days[d]
+            available = sum(1 for s in slots if s["capacity"] - s["booked_count"] >= party_size)
+            if available > 0:
+                out.append({"slot_date": d, "slot_count": len(slots), "available_count": available})
+        return out
+
+    def next_available(
+        self, owner: str, from_date: str, party_size: int = 1, days: int = 14, limit: int = 3
+    ) -> List[Dict[str, Any]]:
+        """from_date부터 days일 안의 가장 빠른 가용 슬롯 최대 limit개 (짧은 TTL 캐시)"""
+        first = parse_slot_date(from_date)
+        if first is None:
+            return []
+        db = self._db()
+        key = (db, owner, from_date, party_size, days, limit)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._answers.get(key)
+            if cached is not None and cached[0] > now and cached[1] == self._version(db, owner):
+                self.stats["answer_hits"] += 1
+                return [dict(s) for s in cached[2]]
+            version = self._version(db, owner)
+        end = _range_end(first, days).isoformat()
+        found_days = self._days_in_range(owner, from_date, end)
+        found: List[Dict[str, Any]] = []
+        for d in sorted(found_days):
+            for s in found_days[d]:
+                remaining = s["capacity"] - s["booked_count"]
+                if remaining >= party_size:
+                    found.append({**s, "available": remaining})
+                    if len(found) >= limit:
+                        break
+            if len(found) >= limit:
+                break
+        with self._lock:
+            if self._version(db, owner) == version:
+                if len(self._answers) >= 1024:
+                    self._answers = {k: v for k, v in self._answers.items() if v[0] > now}
+                self._answers[key] = (now + self.answer_ttl_sec, version, found)
+        return [dict(s) for s in found]
+
+    # ------------------------------------------------------------------ 갱신
+
+    def apply_booking(self, owner: str, slot_date: str, slot_id: Optional[str], booked_count: int):
+        """커밋된 슬롯 booked_count(절대값)를 캐시된 일자에 반영 (기존 값보다 클 때만)"""
+        db = self._db()
+        with self._lock:
+            self._bump(db, owner)
+            self.stats["applied"] += 1
+            day = self._days.get((db, owner, slot_date))
+            if day is None or not slot_id:
+                return
+            for i, s in enumerate(day.slots):
+                if s["slot_id"] == slot_id:
+                    if booked_count > s["booked_count"]:
+                        # 반환된 dict를 호출부가 들고 있을 수 있으므로 교체
+                        day.slots = day.slots[:i] + [{**s, "booked_count": booked_count}] + day.slots[i + 1:]
+                    return
+            self._days.pop((db, owner, slot_date), None)  # 모르는 슬롯 — 재적재
+
+    def invalidate_day(self, owner: str, slot_date: Optional[str]):
+        db = self._db()
+        with self._lock:
+            self._bump(db, owner)
+            self.stats["invalidations"] += 1
+            if slot_date:
+                self._days.pop((db, owner, slot_date), None)
+
+    def invalidate_owner(self, owner: str):
+        db = self._db()
+        with self._lock:
+            self._bump(db, owner)
+            self.stats["invalidations"] += 1
+            for key in [k for k in self._days if k[0] == db and k[1] == owner]:
+                del self._days[key]
+
+    def clear(self):
+        with self._lock:
+            self._days.clear()
+            self._answers.clear()
+            self._versions.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "days": len(self._days), "answers": len(self._answers)}
+
+
+def _range_end(first: date, days: int) -> date:
+    """first부터 days일째 날짜 (date.max에서 멈춤)"""
+    try:
+        return first + timedelta(days=max(0, days - 1))
+    except OverflowError:
+        return date.max
+
+
+def _date_range(first: date, last: date) -> List[str]:
+    out = []
+    while first <= last:
+        out.append(first.isoformat())
+        first += timedelta(days=1)
+    return out
+
+
+def availability_index_enabled() -> bool:
+    return os.environ.get("BOOKING_AVAILABILITY_INDEX", "1") != "0"
+
+
+_index: Optional[BookingAvailabilityIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_booking_availability_index() -> BookingAvailabilityIndex:
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = BookingAvailabilityIndex()
+    return _index
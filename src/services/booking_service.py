@@ -18,6 +18,12 @@ from typing import Any, Dict, List, Optional, Tuple
 import structlog
 
 from src.booking.database import get_db, row_to_dict
+from src.services.booking_availability import (
+    BookingAvailabilityIndex,
+    availability_index_enabled,
+    get_booking_availability_index,
+    parse_slot_date,
+)
 from src.booking.models import (
     BookingCreate,
     BookingDomainCreate,
@@ -44,6 +50,22 @@ def _new_id(prefix: str = "") -> str:
     return f"{prefix}{uuid.uuid4().hex[:12]}"
 
 
+def _availability() -> Optional[BookingAvailabilityIndex]:
+    """가용성 인덱스 (BOOKING_AVAILABILITY_INDEX=0이면 None)."""
+    return get_booking_availability_index() if availability_index_enabled() else None
+
+
+def _invalidate_availability(owner: Optional[str], slot_date: Optional[str] = None) -> None:
+    """슬롯·예약 쓰기 후 인덱스 무효화 (slot_date 없으면 owner 전체)."""
+    index = _availability()
+    if index is None or not owner:
+        return
+    if slot_date:
+        index.invalidate_day(owner, slot_date)
+    else:
+        index.invalidate_owner(owner)
+
+
 # ──────────────────────────────────────────
 # booking_settings
 # ──────────────────────────────────────────
@@ -222,6 +244,7 @@ def bulk_create_slots(owner: str, req: BulkSlotCreateRequest) -> BulkSlotCreateR
             current += timedelta(days=1)
 
     total_generated = created + skipped
+    _invalidate_availability(owner)
     logger.info(
         "bulk_slots_created",
         owner=owner,
@@ -270,6 +293,7 @@ def create_slot(owner: str, data: BookingSlotCreate) -> Dict[str, Any]:
         ).fetchone()
     item = row_to_dict(row)
     item["available"] = max(0, item["capacity"] - item["booked_count"])
+    _invalidate_availability(owner, data.slot_date)
     logger.info("booking_slot_created", slot_id=slot_id, owner=owner,
                 date=data.slot_date, time=data.slot_time)
     return item
@@ -300,14 +324,20 @@ def update_slot(slot_id: str, data: BookingSlotUpdate) -> Optional[Dict[str, Any
         return None
     item = row_to_dict(row)
     item["available"] = max(0, item["capacity"] - item["booked_count"])
+    _invalidate_availability(item["owner"], item["slot_date"])
     return item
 
 
 def delete_slot(slot_id: str) -> bool:
     with get_db() as conn:
+        row = conn.execute(
+            "SELECT owner, slot_date FROM booking_slots WHERE slot_id = ?", (slot_id,)
+        ).fetchone()
         cur = conn.execute(
             "DELETE FROM booking_slots WHERE slot_id = ?", (slot_id,)
         )
+    if row:
+        _invalidate_availability(row["owner"], row["slot_date"])
     return cur.rowcount > 0
 
 
@@ -463,6 +493,10 @@ def create_booking(owner: str, data: BookingCreate) -> Dict[str, Any]:
             ),
         )
         conn.commit()
+        if slot_id:
+            index = _availability()
+            if index is not None:
+                index.apply_booking(owner, slot_row["slot_date"], slot_id, slot_row["booked_count"] + 1)
         row = conn.execute(
             "SELECT * FROM bookings WHERE booking_id = ?", (booking_id,)
         ).fetchone()
@@ -638,6 +672,8 @@ def cancel_booking(booking_id: str, owner: Optional[str] = None) -> Optional[Dic
                 (now, row["slot_id"]),
             )
         conn.commit()
+        if row["slot_id"]:
+            _invalidate_availability(row["owner"], row["slot_date"])
         updated = conn.execute(
             "SELECT * FROM bookings WHERE booking_id = ?", (booking_id,)
         ).fetchone()
@@ -814,6 +850,8 @@ def reschedule_booking(
             (new_slot_date, new_slot_time, new_slot_id, now, booking_id),
         )
         conn.commit()
+        _invalidate_availability(owner, old_slot_date)
+        _invalidate_availability(owner, new_slot_date)
 
         updated = conn.execute(
             "SELECT * FROM bookings WHERE booking_id = ?", (booking_id,)
@@ -871,8 +909,13 @@ def check_multi_date_slots(
         party_size: 예약 인원
 
     Returns:
-        날짜별 가용 슬롯 요약 목록
+        날짜별 가용 슬롯 요약 목록 (날짜 형식이 틀리면 빈 목록)
     """
+    if parse_slot_date(start_date) is None or parse_slot_date(end_date) is None:
+        return []
+    index = _availability()
+    if index is not None:
+        return index.day_summaries(owner, start_date, end_date, party_size)
     with get_db() as conn:
         rows = conn.execute(
             """
@@ -1173,7 +1216,12 @@ def delete_domain(owner: str, domain_id: str) -> bool:
 def get_available_slots_for_llm(
     owner: str, slot_date: str, party_size: int = 1
 ) -> List[Dict[str, Any]]:
-    """LLM 도구에서 사용. 인원 수용 가능한 가용 슬롯만 반환."""
+    """LLM 도구에서 사용. 인원 수용 가능한 가용 슬롯만 반환 (날짜 형식이 틀리면 빈 목록)."""
+    if parse_slot_date(slot_date) is None:
+        return []
+    index = _availability()
+    if index is not None:
+        return index.available_slots(owner, slot_date, party_size)
     with get_db() as conn:
         rows = conn.execute(
             """SELECT * FROM booking_slots
@@ -1187,3 +1235,33 @@ def get_available_slots_for_llm(
     for item in items:
         item["available"] = max(0, item["capacity"] - item["booked_count"])
     return items
+
+
+def find_next_available_slots(
+    owner: str, from_date: str, party_size: int = 1, days: int = 14, limit: int = 3
+) -> List[Dict[str, Any]]:
+    """from_date부터 days일 안에서 가장 빠른 가용 슬롯 최대 limit개 (LLM "언제 가능해요?" 응답용)."""
+    first = parse_slot_date(from_date)
+    if first is None:
+        return []
+    index = _availability()
+    if index is not None:
+        return index.next_available(owner, from_date, party_size, days, limit)
+    try:
+        end_date = (first + timedelta(days=max(0, days - 1))).isoformat()
+    except OverflowError:
+        end_date = date.max.isoformat()
+    with get_db() as conn:
+        rows = conn.execute(
+            """SELECT * FROM booking_slots
+               WHERE owner = ? AND slot_date >= ? AND slot_date <= ?
+                 AND is_blocked = 0
+                 AND (capacity - booked_count) >= ?
+               ORDER BY slot_date, slot_time
+               LIMIT ?""",
+            (owner, from_date, end_date, party_size, limit),
+        ).fetchall()
+    items = [row_to_dict(r) for r in rows]
+    for item in items:
+        item["available"] = max(0, item["capacity"] - item["booked_count"])
+    return items
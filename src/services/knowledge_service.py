@@ -4,12 +4,14 @@ Knowledge Service
 지식 베이스 CRUD 및 검색 서비스
 """
 
-import asyncio
 import json
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 import structlog
 
+from src.ai_voicebot.knowledge.help_cache import get_help_cache
+from src.ai_voicebot.knowledge.vector_store_gateway import get_vector_store_gateway
+
 logger = structlog.get_logger(__name__)
 
 _global_knowledge_service = None
@@ -71,14 +73,16 @@ class KnowledgeService:
             # ChromaDB 저장
             doc_id = f"kb_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
             
-            # 동기 메서드이므로 asyncio.to_thread 사용
-            await asyncio.to_thread(
+            # 동기 메서드이므로 VectorStoreGateway 전용 풀에서 실행
+            await get_vector_store_gateway().run(
+                "upsert",
                 self._vector_db.add,
                 ids=[doc_id],
                 embeddings=[embedding],
                 documents=[text],
                 metadatas=[meta],
             )
+            get_help_cache().notify_knowledge_changed(meta.get("owner"))
             
             logger.info("knowledge_added",
                        doc_id=doc_id,
@@ -195,7 +199,8 @@ class KnowledgeService:
         try:
             # ChromaDB get() 호출 (동기 메서드)
             where = {"category": {"$eq": category}} if category else None
-            results = await asyncio.to_thread(
+            results = await get_vector_store_gateway().run(
+                "get",
                 self._vector_db.get,
                 where=where,
                 limit=limit,
@@ -227,7 +232,7 @@ class KnowledgeService:
         지식 문서의 hit_count를 1 증가시킨다.
 
         ChromaDB 메타데이터를 읽어 hit_count를 올린 뒤 upsert로 덮어씌운다.
-        임베딩 재계산 없이 메타데이터만 교체하기 위해 collection.update()를 사용한다.
+        임베딩 재계산 없이 메타데이터만 교체하기 위해 vector_db.write("update")를 사용한다.
 
         Returns:
             갱신 후 hit_count (실패 시 -1)
@@ -245,10 +250,10 @@ class KnowledgeService:
                 meta = (res.get("metadatas") or [{}])[0] or {}
                 new_count = int(meta.get("hit_count") or 0) + 1
                 meta["hit_count"] = new_count
-                self._vector_db.collection.update(ids=[doc_id], metadatas=[meta])
+                self._vector_db.write("update", [doc_id], metadatas=[meta])
                 return new_count
 
-            new_count = await asyncio.to_thread(_run)
+            new_count = await get_vector_store_gateway().run("update", _run)
             if new_count >= 0:
                 logger.info(
                     "knowledge_hit_count_incremented",
@@ -271,7 +276,8 @@ class KnowledgeService:
             성공 여부
         """
         try:
-            await asyncio.to_thread(self._vector_db.delete, ids=[doc_id])
+            await get_vector_store_gateway().run("delete", self._vector_db.delete, ids=[doc_id])
+            get_help_cache().notify_knowledge_changed()
             logger.info("knowledge_deleted", doc_id=doc_id)
             return True
         except Exception as e:
@@ -294,10 +300,12 @@ class KnowledgeService:
             
             # source_file 일치하는 문서 찾기
             target_ids = []
+            owners = set()
             for doc in all_docs:
                 metadata = doc.get("metadata", {})
                 if metadata.get("source_file") == source_file:
                     target_ids.append(doc["id"])
+                    owners.add(metadata.get("owner") or "")
             
             if not target_ids:
                 logger.info("delete_by_source_file_none_found", 
@@ -306,7 +314,9 @@ class KnowledgeService:
                 return 0
             
             # 삭제
-            await asyncio.to_thread(self._vector_db.delete, ids=target_ids)
+            await get_vector_store_gateway().run("delete", self._vector_db.delete, ids=target_ids)
+            for owner in owners:
+                get_help_cache().notify_knowledge_changed(owner)
             
             logger.info("delete_by_source_file_complete",
                        source_file=source_file,
@@ -411,7 +421,8 @@ class KnowledgeService:
         """doc_type=capability 문서 목록 (priority 오름차순)."""
         where: Dict[str, Any] = {"doc_type": "capability"}
         try:
-            results = await asyncio.to_thread(
+            results = await get_vector_store_gateway().run(
+                "get",
                 self._vector_db.get,
                 where=where,
                 limit=5000,
@@ -502,13 +513,15 @@ class KnowledgeService:
         embed_text = f"{display_name}\n{text}".strip()
         embedding = await self._embedder.embed(embed_text)
 
-        await asyncio.to_thread(
+        await get_vector_store_gateway().run(
+            "upsert",
             self._vector_db.add,
             ids=[doc_id],
             embeddings=[embedding],
             documents=[text],
             metadatas=[meta],
         )
+        get_help_cache().notify_knowledge_changed(owner)
         logger.info(
             "capability_added",
             doc_id=doc_id,
@@ -530,7 +543,7 @@ class KnowledgeService:
                 include=["documents", "metadatas"],
             )
 
-        res = await asyncio.to_thread(_get)
+        res = await get_vector_store_gateway().run("get", _get)
         ids_out = res.get("ids") or []
         if not ids_out:
             return None
@@ -600,21 +613,23 @@ class KnowledgeService:
             )
 
             def _upd_full():
-                self._vector_db.collection.update(
-                    ids=[cap_id],
+                self._vector_db.write(
+                    "update",
+                    [cap_id],
                     embeddings=[new_embedding],
                     documents=[new_body],
                     metadatas=[meta],
                 )
 
-            await asyncio.to_thread(_upd_full)
+            await get_vector_store_gateway().run("update", _upd_full)
         else:
 
             def _upd_meta():
-                self._vector_db.collection.update(ids=[cap_id], metadatas=[meta])
+                self._vector_db.write("update", [cap_id], metadatas=[meta])
 
-            await asyncio.to_thread(_upd_meta)
+            await get_vector_store_gateway().run("update", _upd_meta)
 
+        get_help_cache().notify_knowledge_changed(meta.get("owner"))
         return self._capability_chroma_to_dict(cap_id, new_body, meta)
 
     async def toggle_capability(self, cap_id: str) -> Optional[Dict[str, Any]]:
@@ -624,7 +639,7 @@ class KnowledgeService:
                 include=["documents", "metadatas"],
             )
 
-        res = await asyncio.to_thread(_get)
+        res = await get_vector_store_gateway().run("get", _get)
         if not (res.get("ids") or []):
             return None
         doc_text = (res.get("documents") or [""])[0] or ""
@@ -635,9 +650,10 @@ class KnowledgeService:
         meta["updated_at"] = datetime.now().isoformat()
 
         def _upd():
-            self._vector_db.collection.update(ids=[cap_id], metadatas=[meta])
+            self._vector_db.write("update", [cap_id], metadatas=[meta])
 
-        await asyncio.to_thread(_upd)
+        await get_vector_store_gateway().run("update", _upd)
+        get_help_cache().notify_knowledge_changed(meta.get("owner"))
         return self._capability_chroma_to_dict(cap_id, doc_text, meta)
 
     async def reorder_capabilities(self, ordered_ids: List[str]) -> bool:
@@ -395,9 +395,10 @@ async def seed_initial_data(knowledge_service) -> Dict[str, int]:
                     "source": "seed",
                     "created_at": datetime.now().isoformat(),
                 }
-                # ChromaDB collection에 직접 upsert (async 아님)
-                knowledge_service.vector_db.collection.upsert(
-                    ids=[doc_id],
+                # 지식 컬렉션 upsert (BM25 인덱스 통지 포함, async 아님)
+                knowledge_service.vector_db.write(
+                    "upsert",
+                    [doc_id],
                     embeddings=[embedding],
                     documents=[kb["text"]],
                     metadatas=[metadata],
@@ -418,9 +419,10 @@ async def seed_initial_data(knowledge_service) -> Dict[str, int]:
                     "source": "seed",
                     "created_at": datetime.now().isoformat(),
                 }
-                # ChromaDB collection에 직접 upsert
-                knowledge_service.vector_db.collection.upsert(
-                    ids=[doc_id],
+                # 지식 컬렉션 upsert (BM25 인덱스 통지 포함)
+                knowledge_service.vector_db.write(
+                    "upsert",
+                    [doc_id],
                     embeddings=[embedding],
                     documents=[faq_text],
                     metadatas=[metadata],
@@ -495,9 +497,10 @@ async def _create_tenant_config(knowledge_service, owner: str, config: Dict) ->
     for key, value in config.items():
         metadata[key] = str(value) if not isinstance(value, str) else value
 
-    # ChromaDB collection에 직접 upsert
-    knowledge_service.vector_db.collection.upsert(
-        ids=[doc_id],
+    # 지식 컬렉션 upsert (BM25 인덱스 통지 포함)
+    knowledge_service.vector_db.write(
+        "upsert",
+        [doc_id],
         embeddings=[embedding],
         documents=[text],
         metadatas=[metadata],
@@ -527,9 +530,10 @@ async def update_tenant_config_templates(knowledge_service) -> Dict[str, bool]:
             meta["greeting_templates"] = config.get("greeting_templates", meta.get("greeting_templates", "[]"))
             meta["closing_templates"] = config.get("closing_templates", meta.get("closing_templates", "[]"))
             embedding = knowledge_service.embedder.embed_text(text)
-            # ChromaDB collection에 직접 upsert
-            knowledge_service.vector_db.collection.upsert(
-                ids=[doc_id],
+            # 지식 컬렉션 upsert (BM25 인덱스 통지 포함)
+            knowledge_service.vector_db.write(
+                "upsert",
+                [doc_id],
                 embeddings=[embedding],
                 documents=[text],
                 metadatas=[meta],
@@ -579,7 +583,7 @@ async def cleanup_legacy_data(knowledge_service) -> int:
         if ids_to_delete:
             await loop.run_in_executor(
                 None,
-                lambda: knowledge_service.vector_db.collection.delete(ids=ids_to_delete),
+                lambda: knowledge_service.vector_db.write("delete", ids_to_delete),
             )
             logger.info("legacy_data_cleaned",
                        deleted_count=len(ids_to_delete),
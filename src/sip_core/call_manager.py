@@ -206,7 +206,7 @@ class CallManager:
                             create_google_stt_service_per_pipeline,
                             create_google_tts_service_per_pipeline,
                         )
-                        _stt_pipecat = await create_google_stt_service_per_pipeline()
+                        _stt_pipecat = await create_google_stt_service_per_pipeline(call_id=call_id)
                         _tts_pipecat = await create_google_tts_service_per_pipeline(call_id=call_id)
                     except Exception as svc_err:
                         logger.error("outbound_pipecat_stt_tts_failed",
@@ -902,7 +902,7 @@ class CallManager:
                                 create_google_tts_service_per_pipeline,
                             )
 
-                            _stt_pipecat = await create_google_stt_service_per_pipeline()
+                            _stt_pipecat = await create_google_stt_service_per_pipeline(call_id=call_id)
                             if _stt_pipecat:
                                 logger.info(
                                     "google_stt_service_per_pipeline_for_call",
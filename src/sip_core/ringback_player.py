@@ -63,11 +63,12 @@ class RingbackPlayer:
 
     async def _run(self, rtp_worker: "RTPRelayWorker", owner: str, call_id: str) -> None:
         try:
+            from src.common.sqlite_pool import to_thread as _db_to_thread
             from src.services.ringback_service import (
                 get_effective_ringback_settings_for_player,
                 resolve_ringback_segment,
             )
-            settings = get_effective_ringback_settings_for_player(owner)
+            settings = await _db_to_thread(get_effective_ringback_settings_for_player, owner)
             if not settings:
                 logger.info("ringback_no_settings", owner=owner)
                 return
@@ -75,7 +76,7 @@ class RingbackPlayer:
             enabled_greeting = bool(settings.get("enabled_greeting"))
             enabled_ringback = bool(settings.get("enabled_ringback"))
             greeting_text = settings.get("greeting_text", "")
-            seg = resolve_ringback_segment(owner)
+            seg = await _db_to_thread(resolve_ringback_segment, owner)
 
             if not enabled_greeting and not enabled_ringback:
                 logger.info("ringback_disabled", owner=owner)
@@ -112,7 +113,7 @@ class RingbackPlayer:
     # ── 인사말 TTS ────────────────────────────────────────────────────────────
 
     async def _play_tts(self, rtp_worker: "RTPRelayWorker", text: str, call_id: str) -> None:
-        """텍스트를 Google TTS로 합성하여 RTP로 전송한다."""
+        """텍스트를 Google TTS로 합성하여 RTP로 전송한다 (문구 캐시에 있으면 G.711 프레임 직송)."""
         try:
             from src.ai_voicebot.ai_pipeline.tts_client import TTSClient
             from src.config.config_loader import load_config
@@ -123,6 +124,9 @@ class RingbackPlayer:
                 dict(tts_cfg) if tts_cfg else {}
             )
 
+            if await self._play_cached_tts(rtp_worker, text, call_id, tts_dict):
+                return
+
             tts = TTSClient(tts_dict)
             loop = asyncio.get_event_loop()
 
@@ -141,6 +145,39 @@ class RingbackPlayer:
         except Exception as e:
             logger.error("ringback_tts_error", call_id=call_id, error=str(e), exc_info=True)
 
+    async def _play_cached_tts(
+        self, rtp_worker: "RTPRelayWorker", text: str, call_id: str, tts_dict: dict
+    ) -> bool:
+        """문구 캐시의 세션 코덱 G.711 프레임을 20ms 간격으로 직송. 캐시에 없으면 False."""
+        from src.ai_voicebot.ai_pipeline.tts_client import tts_cache_identity
+        from src.ai_voicebot.ai_pipeline.tts_phrase_cache import get_tts_phrase_cache
+
+        voice, language, speaking_rate = tts_cache_identity(tts_dict)
+        codec = getattr(getattr(rtp_worker, "media_session", None), "codec", None) or "PCMU"
+        cached = get_tts_phrase_cache().get(
+            text, voice=voice, language=language, speaking_rate=speaking_rate, codec=codec
+        )
+        if cached is None:
+            return False
+
+        logger.info(
+            "ringback_tts_cache_hit",
+            call_id=call_id,
+            codec=codec,
+            duration_ms=cached.duration_ms,
+        )
+        loop = asyncio.get_event_loop()
+        for frame in cached.frames:
+            if self._stop_event.is_set():
+                break
+            await loop.run_in_executor(
+                None,
+                lambda f=frame: rtp_worker.send_ai_audio(f, ringback_early_media=True, g711_encoded=True),
+            )
+            await asyncio.sleep(_CHUNK_DURATION_S)
+        logger.info("ringback_tts_done", call_id=call_id, source="phrase_cache")
+        return True
+
     # ── 연결음 MP3 루프 ───────────────────────────────────────────────────────
 
     async def _play_mp3_loop(self, rtp_worker: "RTPRelayWorker", mp3_path: str, call_id: str) -> None:
@@ -17,6 +17,8 @@ from datetime import datetime
 import json
 import structlog
 
+from src.common.recordings_catalog import record_finalized_recording
+
 logger = structlog.get_logger(__name__)
 
 # RTP 녹음: 패킷당 create_task 대신 단일 워커 + 배치 drain (이벤트 루프 부하 완화)
@@ -639,6 +641,9 @@ class SIPCallRecorder:
         # 메타데이터 저장
         with open(metadata_path, "w") as f:
             json.dump(metadata, f, indent=2)
+
+        # 녹음 카탈로그 반영 (재생·이력 조회가 metadata.json 스캔 없이 call_id로 바로 찾음)
+        record_finalized_recording(self.output_dir, call_dir)
         
         logger.info("SIP call recording stopped", 
                    call_id=call_id,
@@ -42,6 +42,13 @@ def _sanitize_sip_text_for_utf8_io(text: str) -> str:
     return _SURROGATE_RANGE_RE.sub("\ufffd", text)
 
 
+def _config_value(section: Any, key: str, default: Any = None) -> Any:
+    """dict 또는 속성 객체인 설정 섹션에서 key 조회 (섹션이 없으면 default)."""
+    if isinstance(section, dict):
+        return section.get(key, default)
+    return getattr(section, key, default) if section else default
+
+
 class SIPEndpoint:
     """Mock SIP Endpoint (개발/테스트용)
     
@@ -166,7 +173,7 @@ class SIPEndpoint:
                     logger.info(f"✅ [Knowledge Import] Step 2/4 completed ({step2_time:.3f}s)")
                     
                     logger.info("🔄 [Knowledge Import] Step 3/4: Importing TextEmbedder...")
-                    from src.ai_voicebot.knowledge.embedder import TextEmbedder
+                    from src.ai_voicebot.knowledge.embedder import get_text_embedder
                     step3_time = time.time() - import_start - step1_time - step2_time
                     logger.info(f"✅ [Knowledge Import] Step 3/4 completed ({step3_time:.3f}s)")
                     
@@ -214,19 +221,14 @@ class SIPEndpoint:
                     # Embedder 초기화
                     logger.info("🔧 [Knowledge Extraction] Initializing Embedder...")
                     embedding_config = getattr(config.ai_voicebot, 'embedding', None)
-                    # embedding도 dict일 수 있음
-                    if isinstance(embedding_config, dict):
-                        embedder = TextEmbedder(
-                            model_name=embedding_config.get('model', 'paraphrase-multilingual-mpnet-base-v2'),
-                            dimension=embedding_config.get('dimension', 768),
-                            batch_size=embedding_config.get('batch_size', 32)
-                        )
-                    else:
-                        embedder = TextEmbedder(
-                            model_name=getattr(embedding_config, 'model', 'paraphrase-multilingual-mpnet-base-v2') if embedding_config else 'paraphrase-multilingual-mpnet-base-v2',
-                            dimension=getattr(embedding_config, 'dimension', 768) if embedding_config else 768,
-                            batch_size=getattr(embedding_config, 'batch_size', 32) if embedding_config else 32
-                        )
+                    # embedding도 dict일 수 있음 — 모델은 API·AI 파이프라인과 같은 공유 인스턴스 사용
+                    embedder = get_text_embedder(
+                        model_name=_config_value(embedding_config, 'model', 'paraphrase-multilingual-mpnet-base-v2'),
+                        backend=_config_value(embedding_config, 'backend'),
+                        consumer="knowledge_extraction",
+                        batch_size=_config_value(embedding_config, 'batch_size', 32),
+                        dimension=_config_value(embedding_config, 'dimension', 768),
+                    )
                     logger.info("🔧 [Knowledge Extraction] Embedder initialized")
                     
                     # VectorDB 초기화 (단일 클라이언트: get_vector_db()가 동기 초기화 수행)
@@ -254,7 +256,8 @@ class SIPEndpoint:
                         ke_config_dict = {}
                         for attr in ['min_confidence', 'chunk_size', 'chunk_overlap', 'version',
                                      'steps', 'quality', 'auto_approve', 'min_text_length',
-                                     'max_llm_calls_per_extraction', 'skip_short_calls_seconds']:
+                                     'max_llm_calls_per_extraction', 'skip_short_calls_seconds',
+                                     'max_concurrent_extractions']:
                             val = getattr(knowledge_extraction_config, attr, None)
                             if val is not None:
                                 ke_config_dict[attr] = val
@@ -418,6 +421,9 @@ class SIPEndpoint:
         self._cdr_writer = CDRWriter(
             output_dir=cdr_output_dir,
             pretty_json=cdr_pretty_json,
+            max_file_mb=getattr(config.cdr, "max_file_mb", 64.0),
+            fsync_every=getattr(config.cdr, "fsync_every", 32),
+            compact=getattr(config.cdr, "compact", True),
         )
         logger.info(
             "CDR writer initialized for SIP Endpoint",
@@ -2615,7 +2621,7 @@ class SIPEndpoint:
                     error=str(_cre),
                 )
             
-            cdr_path = self._cdr_writer.output_dir / datetime.now().strftime(self._cdr_writer.filename_pattern)
+            cdr_path = self._cdr_writer.current_path
             logger.info("cdr_flow_step_2_cdr_written_successfully",
                        call_id=original_call_id,
                        cdr_file=cdr_path.as_posix(),
@@ -3003,8 +3009,8 @@ class SIPEndpoint:
             from src.call_control.models import RoutingAction
             from src.sip_core.operator_status import get_operator_status_manager
 
-            # 1단계: 발신자 필터 체크 (VIP/차단 등)
-            _caller_filter = _routing_engine.resolve_caller_filter(callee_username, caller_username or "")
+            # 1단계: 발신자 필터 체크 (VIP/차단 등) — 스냅샷 재빌드 시 DB 읽기는 sqlite executor에서
+            _caller_filter = await _routing_engine.aresolve_caller_filter(callee_username, caller_username or "")
             if _caller_filter:
                 logger.info(
                     "call_control_caller_filter_matched",
@@ -3017,7 +3023,7 @@ class SIPEndpoint:
                 _routing_result = {"rule": _caller_filter, "schedule": None, "is_schedule_active": True}
             else:
                 # 2단계: 시간 스케줄 기반 규칙
-                _routing_result = _routing_engine.resolve_rule(callee_username)
+                _routing_result = await _routing_engine.aresolve_rule(callee_username)
 
             _routing_action: str = "direct"
             _effective_no_answer_timeout: int = self.config.sip.timers.no_answer_timeout
@@ -5050,6 +5056,8 @@ class SIPEndpoint:
             self._listen_task = None
 
         self._close_sip_traffic_log_file()
+        if getattr(self, "_cdr_writer", None) is not None:
+            self._cdr_writer.close()
         logger.info("sip_server_stopped")
     
     # =========================================================================
@@ -6071,10 +6079,11 @@ class SIPEndpoint:
     async def _start_ringback_player(self, call_id: str, owner: str) -> None:
         """ringback_settings를 확인하고 활성화된 경우 RingbackPlayer를 시작한다."""
         try:
+            from src.common.sqlite_pool import to_thread as _db_to_thread
             from src.services.ringback_service import get_effective_ringback_settings_for_player
             from src.sip_core.ringback_player import RingbackPlayer
 
-            settings = get_effective_ringback_settings_for_player(owner)
+            settings = await _db_to_thread(get_effective_ringback_settings_for_player, owner)
             if not settings:
                 logger.info(
                     "ringback_start_skipped",
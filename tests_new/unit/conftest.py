@@ -10,6 +10,9 @@ Epic 2 Story 2.2에서 `settings_catalog.py`가 DB(Story 2.1) 활성 버전을 
 
 DB 동적 로딩 자체를 검증하는 테스트는 이 오토유즈 픽스처를
 `monkeypatch.setattr(catalog_config_loader, "get_cached_config", ...)`로 개별 재정의한다.
+
+`log_call_data`를 거치는 테스트가 저장소의 `logs/`에 CDR 로그·색인을 남기지 않도록 call_data_record_logger의
+로그 디렉터리(`_log_dir`, 색인은 이 디렉터리 기준으로 열린다)를 테스트별 tmp_path로 돌린다.
 """
 
 import pytest
@@ -21,3 +24,15 @@ def _isolate_dynamic_catalog_loader(monkeypatch):
 
     monkeypatch.setattr(catalog_config_loader, "get_cached_config", lambda config_kind, owner="": None)
     yield
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolate_call_data_record_log(tmp_path_factory):
+    from src.common import call_data_record_logger as cdr_logger
+
+    # writer 스레드가 테스트 경계 밖에서도 쓰므로 세션 전체에 걸쳐 돌려 둔다
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cdr_logger, "_log_dir", tmp_path_factory.mktemp("cdr_logs"))
+        mp.setattr(cdr_logger, "_current_date", None)
+        yield
+        cdr_logger.close_call_data_record_log()
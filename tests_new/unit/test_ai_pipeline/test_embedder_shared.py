@@ -0,0 +1,127 @@
+"""
+AI Pipeline Unit Tests - 공유 TextEmbedder (단일 로드 / consumer별 지연 / 배치 / 워밍업)
+
+실제 SentenceTransformer 대신 encode만 흉내내는 가짜 모델을 주입해, 여러 스레드가 동시에
+get_text_embedder()를 불러도 모델이 1회만 로드되는지와 consumer별 통계를 검증한다.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from src.ai_voicebot.knowledge import embedder as embedder_mod
+from src.ai_voicebot.knowledge.embedder import TextEmbedder
+
+
+class _FakeModel:
+    def __init__(self):
+        self.encode_calls = []
+
+    def get_sentence_embedding_dimension(self):
+        return 4
+
+    def encode(self, sentences, convert_to_numpy=True, **kwargs):
+        self.encode_calls.append(sentences)
+        if isinstance(sentences, str):
+            return np.array([float(len(sentences)), 0.0, 0.0, 1.0])
+        return np.array([[float(len(s)), 0.0, 0.0, 1.0] for s in sentences])
+
+
+@pytest.fixture
+def fresh_registry(monkeypatch):
+    monkeypatch.setattr(embedder_mod, "_embedder_instances", {})
+    monkeypatch.setattr(embedder_mod, "_embedder_instance", None)
+    created = []
+
+    def _factory(model_name=None, backend=None, **kwargs):
+        inst = TextEmbedder(model=_FakeModel(), model_name=model_name)
+        created.append(inst)
+        return inst
+
+    monkeypatch.setattr(embedder_mod, "TextEmbedder", _factory)
+    return created
+
+
+class TestSharedInstance:
+    def test_concurrent_callers_load_once(self, fresh_registry):
+        results = []
+
+        def _worker():
+            results.append(embedder_mod.get_text_embedder())
+
+        threads = [threading.Thread(target=_worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(fresh_registry) == 1
+        assert all(r is results[0] for r in results)
+
+    def test_backend_none_reuses_loaded_model(self, fresh_registry):
+        first = embedder_mod.get_text_embedder(backend="torch")
+        again = embedder_mod.get_text_embedder()
+        assert first is again
+        assert len(fresh_registry) == 1
+
+    def test_consumer_proxy_shares_model_and_splits_stats(self, fresh_registry):
+        api = embedder_mod.get_text_embedder(consumer="api")
+        pipe = embedder_mod.get_text_embedder(consumer="ai_pipeline")
+        api.embed_text("안녕")
+        pipe.embed_text("영업시간")
+        pipe.embed_text("주차")
+        assert len(fresh_registry) == 1
+        consumers = api.get_stats()["consumers"]
+        assert consumers["api"]["calls"] == 1
+        assert consumers["ai_pipeline"]["calls"] == 2
+
+    def test_configured_batch_size_applies_per_consumer(self, fresh_registry):
+        pipe = embedder_mod.get_text_embedder(consumer="ai_pipeline", batch_size=2)
+        api = embedder_mod.get_text_embedder(consumer="api")
+        seen = []
+        model = fresh_registry[0]._model
+        original = model.encode
+        model.encode = lambda sentences, **kw: (seen.append(kw.get("batch_size")), original(sentences, **kw))[1]
+        pipe.embed_texts(["a", "b", "c"])
+        api.embed_texts(["a"])
+        assert seen == [2, 32]
+
+    def test_dimension_mismatch_is_logged(self, fresh_registry, caplog):
+        embedder_mod.get_text_embedder(consumer="ai_pipeline", dimension=4)
+        assert "configured dimension differs" not in caplog.text
+        embedder_mod.get_text_embedder(consumer="knowledge_service", dimension=768)
+        assert "configured dimension differs" in caplog.text
+
+
+class TestBatchAndWarmup:
+    def test_embed_texts_single_encode_and_order(self):
+        model = _FakeModel()
+        emb = TextEmbedder(model=model)
+        out = emb.embed_texts(["ab", "", "abcd"])
+        assert [v[0] for v in out] == [2.0, 0.0, 4.0]
+        # 빈 문자열은 encode에 보내지 않고 제로 벡터
+        assert out[1] == [0.0, 0.0, 0.0, 0.0]
+        assert len(model.encode_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_async(self):
+        emb = TextEmbedder(model=_FakeModel())
+        out = await emb.embed_batch(["a", "bb"])
+        assert [v[0] for v in out] == [1.0, 2.0]
+
+    def test_warm_up_records_time_and_stats(self):
+        emb = TextEmbedder(model=_FakeModel())
+        ms = emb.warm_up()
+        stats = emb.get_stats()
+        assert ms >= 0.0
+        assert stats["warmup_ms"] == ms
+        assert stats["consumers"]["warmup"]["texts"] >= len(embedder_mod._WARMUP_TEXTS)
+
+
+class TestBackendResolution:
+    def test_unknown_backend_falls_back_to_torch(self):
+        assert embedder_mod._resolve_backend("tpu") == "torch"
+
+    def test_env_backend(self, monkeypatch):
+        monkeypatch.setenv("EMBEDDING_BACKEND", "onnx-int8")
+        assert embedder_mod._resolve_backend(None) == "onnx-int8"
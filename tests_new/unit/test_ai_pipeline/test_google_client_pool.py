@@ -0,0 +1,149 @@
+"""
+AI Pipeline Unit Tests - Google STT/TTS gRPC 클라이언트 풀
+
+로컬 가짜 TextToSpeech gRPC 서버(insecure)에 channel_factory로 연결해, 통화 간 클라이언트 공유,
+기동 예열(channel_ready), 요청 동시성·오류 집계, 만료 임박 자격증명 갱신, Pipecat 서비스 클라이언트 채택을 검증한다.
+"""
+
+import time
+from concurrent import futures
+
+import grpc
+import pytest
+from google.cloud import texttospeech
+
+from src.ai_voicebot.ai_pipeline import google_client_pool as pool_module
+from src.ai_voicebot.ai_pipeline.google_client_pool import (
+    GoogleClientPool,
+    adopt_pooled_client,
+    regional_host,
+)
+
+_SERVICE = "google.cloud.texttospeech.v1.TextToSpeech"
+
+
+@pytest.fixture
+def fake_server():
+    calls = []
+
+    def list_voices(request, context):
+        calls.append(request.language_code)
+        if request.language_code == "xx-XX":
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "bad language")
+        return texttospeech.ListVoicesResponse(
+            voices=[texttospeech.Voice(name="ko-KR-Chirp3-HD-Kore", language_codes=["ko-KR"])]
+        )
+
+    handler = grpc.method_handlers_generic_handler(
+        _SERVICE,
+        {
+            "ListVoices": grpc.unary_unary_rpc_method_handler(
+                list_voices,
+                request_deserializer=texttospeech.ListVoicesRequest.deserialize,
+                response_serializer=texttospeech.ListVoicesResponse.serialize,
+            )
+        },
+    )
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    yield port, calls
+    server.stop(None)
+
+
+@pytest.fixture
+def pool(fake_server):
+    port, _calls = fake_server
+    created = []
+
+    def factory(kind, host, options):
+        created.append((kind, host, dict(options)))
+        return grpc.insecure_channel(f"localhost:{port}", options=options)
+
+    p = GoogleClientPool(channel_factory=factory)
+    p.created = created
+    yield p
+    p.close()
+
+
+class TestSharing:
+    def test_same_client_across_calls(self, pool):
+        assert pool.tts_client() is pool.tts_client()
+        assert len(pool.created) == 1
+        kind, host, options = pool.created[0]
+        assert (kind, host) == ("tts", "texttospeech.googleapis.com")
+        assert options["grpc.keepalive_permit_without_calls"] == 1
+
+    def test_region_gets_own_channel(self, pool):
+        assert pool.tts_client() is not pool.tts_client(region="asia-northeast3")
+        assert pool.created[1][1] == "asia-northeast3-texttospeech.googleapis.com"
+
+    def test_regional_host(self):
+        assert regional_host("speech.googleapis.com", None) == "speech.googleapis.com"
+        assert regional_host("speech.googleapis.com", "global") == "speech.googleapis.com"
+        assert regional_host("speech.googleapis.com", "us") == "us-speech.googleapis.com"
+
+
+class TestRequests:
+    def test_warm_then_round_trip_tracked(self, pool, fake_server):
+        _port, calls = fake_server
+        assert pool.warm(kinds=("tts",), timeout=5.0) == {"tts": True}
+        with pool.track("tts"):
+            resp = pool.tts_client().list_voices(language_code="ko-KR")
+        assert resp.voices[0].name == "ko-KR-Chirp3-HD-Kore"
+        assert calls == ["ko-KR"]
+        channel = pool.get_stats()["channels"][0]
+        assert channel["ready"] is True and channel["warm_ms"] is not None
+        assert channel["requests"] == 1 and channel["in_flight"] == 0 and channel["max_in_flight"] == 1
+
+    def test_errors_counted(self, pool):
+        with pytest.raises(Exception):
+            with pool.track("tts"):
+                pool.tts_client().list_voices(language_code="xx-XX")
+        channel = pool.get_stats()["channels"][0]
+        assert channel["errors"] == 1 and "bad language" in channel["last_error"]
+
+
+class _Creds:
+    def __init__(self, expires_in):
+        self.valid = True
+        self.expiry = time.time() + expires_in
+        self.refreshed = 0
+
+    def refresh(self, request):
+        self.refreshed += 1
+        self.expiry = time.time() + 3600
+
+
+class TestAuthRefresh:
+    def test_refresh_only_when_expiring(self):
+        fresh = _Creds(3600)
+        assert not GoogleClientPool(credentials=fresh).refresh_credentials_if_needed()
+        expiring = _Creds(30)
+        p = GoogleClientPool(credentials=expiring)
+        assert p.refresh_credentials_if_needed()
+        assert expiring.refreshed == 1 and p.get_stats()["auth_refreshes"] == 1
+
+
+class TestAdopt:
+    def test_adopt_only_same_client_type(self, pool, monkeypatch):
+        class _Svc:
+            pass
+
+        monkeypatch.setattr(pool_module, "_google_client_pool", pool)
+        svc = _Svc()
+        svc._client = object()
+        assert not adopt_pooled_client(svc, "tts")
+
+        svc._client = texttospeech.TextToSpeechClient(
+            transport="grpc", credentials=_anon_credentials()
+        )
+        assert adopt_pooled_client(svc, "tts")
+        assert svc._client is pool.tts_client()
+
+
+def _anon_credentials():
+    from google.auth.credentials import AnonymousCredentials
+
+    return AnonymousCredentials()
@@ -0,0 +1,306 @@
+"""
+AI Pipeline Unit Tests - BM25 어휘 인덱스 / RAGEngine 하이브리드 융합
+
+owner별 문자 bigram BM25 인덱스의 증분 갱신과, RAGEngine.search가 벡터 풀 밖의 어휘 매칭
+문서를 보충하고, similarity_threshold 컷 뒤에 벡터 점수에 가산 융합하는지 검증한다(실제 Chroma/임베딩 모델 없이).
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.ai_voicebot.ai_pipeline.lexical_index import (
+    BM25Index,
+    LexicalIndexRegistry,
+    get_lexical_index_registry,
+    metadata_matches_where,
+    tokenize_for_lexical,
+)
+from src.ai_voicebot.ai_pipeline.rag_engine import RAGEngine
+from src.ai_voicebot.knowledge.chromadb_client import _VectorDbWrapper
+
+
+class TestTokenize:
+    def test_korean_particles_share_bigrams(self):
+        assert "예약" in tokenize_for_lexical("예약은")
+        assert "예약" in tokenize_for_lexical("예약을 취소")
+
+    def test_short_words_kept_whole(self):
+        assert tokenize_for_lexical("길 몇 시") == ["길", "몇", "시"]
+
+    def test_punctuation_and_case_normalized(self):
+        assert tokenize_for_lexical("Wi-Fi!") == ["wi", "fi"]
+
+
+class TestBM25Index:
+    def test_upsert_and_score_ranks_matching_doc_first(self):
+        idx = BM25Index()
+        idx.upsert("a", "주차장은 지하 2층입니다", {"category": "question"})
+        idx.upsert("b", "영업시간은 오전 9시부터", {"category": "question"})
+        ranked = idx.score("주차 어디", top_n=5)
+        assert ranked[0][0] == "a"
+        assert all(doc_id != "b" for doc_id, _ in ranked)
+
+    def test_upsert_replaces_previous_text(self):
+        idx = BM25Index()
+        idx.upsert("a", "주차 안내")
+        idx.upsert("a", "영업 시간 안내")
+        assert idx.score("주차", top_n=5) == []
+        assert len(idx) == 1
+
+    def test_remove_drops_postings(self):
+        idx = BM25Index()
+        idx.upsert("a", "주차 안내")
+        idx.remove("a")
+        assert len(idx) == 0
+        assert idx.score("주차") == []
+
+    def test_where_filter_applied(self):
+        idx = BM25Index()
+        idx.upsert("a", "가격 안내", {"category": "menu"})
+        idx.upsert("b", "가격 문의", {"category": "question"})
+        ranked = idx.score("가격", where={"category": {"$in": ["menu"]}})
+        assert [d for d, _ in ranked] == ["a"]
+
+
+class TestMetadataWhere:
+    def test_and_in_eq(self):
+        where = {"$and": [{"owner": "1004"}, {"doc_type": {"$in": ["x", "y"]}}]}
+        assert metadata_matches_where({"owner": "1004", "doc_type": "y"}, where)
+        assert not metadata_matches_where({"owner": "1004", "doc_type": "z"}, where)
+        assert not metadata_matches_where({"owner": "1005", "doc_type": "x"}, where)
+
+
+class TestRegistry:
+    def test_ensure_loaded_calls_loader_once(self):
+        calls = []
+
+        def loader(owner):
+            calls.append(owner)
+            return {"ids": ["a"], "documents": ["주차 안내"], "metadatas": [{"owner": owner}]}
+
+        reg = LexicalIndexRegistry()
+        assert len(reg.ensure_loaded("sip:1004@10.0.0.1", loader)) == 1
+        reg.ensure_loaded("1004", loader)
+        assert calls == ["1004"]
+
+    def test_on_upsert_updates_loaded_owner_only(self):
+        reg = LexicalIndexRegistry()
+        reg.ensure_loaded("1004", lambda o: {})
+        reg.on_upsert(["a", "b"], ["주차 안내", "영업 안내"], [{"owner": "1004"}, {"owner": "2000"}])
+        assert "a" in reg.get("1004")
+        assert reg.get("2000") is None
+
+    def test_on_delete_by_ids_and_where(self):
+        reg = LexicalIndexRegistry()
+        reg.ensure_loaded("1004", lambda o: {"ids": ["a"], "documents": ["주차"], "metadatas": [{"owner": o}]})
+        reg.on_delete(ids=["a"])
+        assert len(reg.get("1004")) == 0
+        reg.on_delete(where={"owner": "1004"})
+        assert reg.get("1004") is None
+
+    def test_metadata_only_update_keeps_text(self):
+        reg = LexicalIndexRegistry()
+        reg.ensure_loaded("1004", lambda o: {"ids": ["a"], "documents": ["주차 안내"], "metadatas": [{"owner": o}]})
+        reg.on_upsert(["a"], None, [{"owner": "1004", "category": "faq"}])
+        index = reg.get("1004")
+        assert index.score("주차", where={"category": "faq"})[0][0] == "a"
+
+    def test_expired_index_is_reloaded(self):
+        calls = []
+
+        def loader(owner):
+            calls.append(owner)
+            return {"ids": ["a"], "documents": ["주차 안내"], "metadatas": [{"owner": owner}]}
+
+        reg = LexicalIndexRegistry(ttl_sec=0.05)
+        reg.ensure_loaded("1004", loader)
+        time.sleep(0.06)
+        assert reg.get("1004") is None
+        reg.ensure_loaded("1004", loader)
+        assert calls == ["1004", "1004"]
+
+    def test_write_during_load_marks_index_stale(self):
+        reg = LexicalIndexRegistry()
+
+        def loader(owner):
+            reg.on_delete(ids=["a"])  # 적재 중 다른 스레드의 삭제
+            return {"ids": ["a"], "documents": ["주차"], "metadatas": [{"owner": owner}]}
+
+        assert reg.ensure_loaded("1004", loader) is not None
+        assert reg.get("1004") is None
+
+    def test_loader_runs_outside_global_lock(self):
+        reg = LexicalIndexRegistry()
+        reg.ensure_loaded("2000", lambda o: {"ids": ["b"], "documents": ["영업 안내"], "metadatas": [{"owner": o}]})
+
+        def loader(owner):
+            assert not reg._lock.locked()
+            reg.on_upsert(["b2"], ["휴무 안내"], [{"owner": "2000"}])  # 다른 owner 쓰기 통지가 막히지 않는다
+            return {"ids": ["a"], "documents": ["주차"], "metadatas": [{"owner": owner}]}
+
+        assert reg.ensure_loaded("1004", loader) is not None
+        assert "b2" in reg.get("2000")
+
+    def test_concurrent_loads_are_single_flight(self):
+        calls = []
+        reg = LexicalIndexRegistry()
+
+        def loader(owner):
+            calls.append(owner)
+            time.sleep(0.05)
+            return {"ids": ["a"], "documents": ["주차"], "metadatas": [{"owner": owner}]}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(reg.ensure_loaded("1004", loader)))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert calls == ["1004"]
+        assert len({id(r) for r in results}) == 1
+
+
+class _FakeCollection:
+    def __init__(self):
+        self.calls = []
+
+    def upsert(self, **kwargs):
+        self.calls.append(("upsert", kwargs))
+
+    def update(self, **kwargs):
+        self.calls.append(("update", kwargs))
+
+    def delete(self, **kwargs):
+        self.calls.append(("delete", kwargs))
+
+
+class TestVectorDbWrapperWrite:
+    @pytest.fixture(autouse=True)
+    def _clean_registry(self):
+        get_lexical_index_registry().invalidate()
+        yield
+        get_lexical_index_registry().invalidate()
+
+    def test_update_and_delete_reach_lexical_index(self):
+        reg = get_lexical_index_registry()
+        reg.ensure_loaded("1004", lambda o: {"ids": ["a"], "documents": ["주차 안내"], "metadatas": [{"owner": o}]})
+        wrapper = _VectorDbWrapper(_FakeCollection())
+        wrapper.write("update", ["a"], documents=["영업시간 안내"], metadatas=[{"owner": "1004"}])
+        assert reg.get("1004").score("주차") == []
+        assert reg.get("1004").score("영업시간")[0][0] == "a"
+        wrapper.write("delete", ["a"])
+        assert "a" not in reg.get("1004")
+        assert [c[0] for c in wrapper.collection.calls] == ["update", "delete"]
+
+
+class _FakeEmbedder:
+    def embed_text(self, text):
+        return [0.1, 0.2]
+
+
+class _FakeVectorDb:
+    """벡터 검색은 doc-vec 하나만 반환, get은 owner 전체 지식 반환."""
+
+    def __init__(self):
+        self.query_n_results = None
+        self.rows = {
+            "doc-vec": ("영업시간 안내입니다", {"owner": "1004", "category": "question"}),
+            "doc-lex": ("주차장은 지하 2층, 2시간 무료 주차", {"owner": "1004", "category": "question"}),
+        }
+
+    def get(self, where=None, limit=1000, ids=None, **kwargs):
+        keys = [k for k in self.rows if ids is None or k in ids]
+        return {
+            "ids": keys,
+            "documents": [self.rows[k][0] for k in keys],
+            "metadatas": [self.rows[k][1] for k in keys],
+        }
+
+    def query(self, query_embeddings, n_results=10, where=None, **kwargs):
+        self.query_n_results = n_results
+        return {
+            "ids": [["doc-vec"]],
+            "documents": [["영업시간 안내입니다"]],
+            "metadatas": [[{"owner": "1004", "category": "question"}]],
+            "distances": [[0.5]],
+        }
+
+
+class TestRAGEngineHybrid:
+    @pytest.mark.asyncio
+    async def test_lexical_only_doc_added_and_ranked(self):
+        vdb = _FakeVectorDb()
+        engine = RAGEngine(
+            vector_db=vdb,
+            embedder=_FakeEmbedder(),
+            top_k=3,
+            similarity_threshold=0.0,
+            lexical_registry=LexicalIndexRegistry(),
+        )
+        result = await engine.search("주차 무료인가요", owner_filter="1004", intent="question")
+        ids = [d.id for d in result.documents]
+        assert "doc-lex" in ids
+        assert result.trace["lexical_fusion_applied"] is True
+        assert result.trace["lexical_only_added"] == 1
+        # BM25 인덱스 사용 시 Chroma 후보 풀 축소
+        assert vdb.query_n_results == 16
+
+    @pytest.mark.asyncio
+    async def test_weight_zero_disables_fusion(self):
+        vdb = _FakeVectorDb()
+        engine = RAGEngine(
+            vector_db=vdb,
+            embedder=_FakeEmbedder(),
+            top_k=3,
+            similarity_threshold=0.0,
+            hybrid_lexical_weight=0.0,
+            lexical_registry=LexicalIndexRegistry(),
+        )
+        result = await engine.search("주차 무료인가요", owner_filter="1004", intent="question")
+        assert [d.id for d in result.documents] == ["doc-vec"]
+        assert result.trace["lexical_fusion_applied"] is False
+        assert vdb.query_n_results == 32
+
+    @pytest.mark.asyncio
+    async def test_lexical_only_hit_uses_chroma_text_and_drops_deleted(self):
+        vdb = _FakeVectorDb()
+        engine = RAGEngine(
+            vector_db=vdb,
+            embedder=_FakeEmbedder(),
+            top_k=3,
+            similarity_threshold=0.0,
+            lexical_registry=LexicalIndexRegistry(),
+        )
+        await engine.search("주차 무료인가요", owner_filter="1004", intent="question")
+        # 다른 프로세스가 본문을 고친 뒤 → 인덱스 사본이 아니라 Chroma 본문이 나간다
+        vdb.rows["doc-lex"] = ("주차는 유료로 바뀌었습니다 무료 주차 종료", vdb.rows["doc-lex"][1])
+        result = await engine.search("주차 무료인가요", owner_filter="1004", intent="question")
+        lex = [d for d in result.documents if d.id == "doc-lex"]
+        assert lex and lex[0].text.startswith("주차는 유료로")
+        # 삭제된 뒤 → 인덱스에 남아 있어도 버린다
+        del vdb.rows["doc-lex"]
+        result = await engine.search("주차 무료인가요", owner_filter="1004", intent="question")
+        assert "doc-lex" not in [d.id for d in result.documents]
+        assert result.trace["lexical_dropped_stale"] == 1
+
+    @pytest.mark.asyncio
+    async def test_threshold_uses_raw_vector_score(self):
+        vdb = _FakeVectorDb()
+        engine = RAGEngine(
+            vector_db=vdb,
+            embedder=_FakeEmbedder(),
+            top_k=3,
+            similarity_threshold=0.7,  # doc-vec 원점수 1/(1+0.5) ≈ 0.667 < 0.7 < 가산 후 점수
+            lexical_registry=LexicalIndexRegistry(),
+        )
+        result = await engine.search("영업시간 안내", owner_filter="1004", intent="question")
+        assert result.trace["after_strict_similarity_threshold_count"] == 0
+        assert result.trace["soft_fallback_applied"] is True
+        # 가산은 컷 뒤 순위에만 반영
+        assert result.documents[0].id == "doc-vec"
+        assert result.documents[0].score > 1.0 / 1.5
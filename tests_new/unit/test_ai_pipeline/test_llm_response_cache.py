@@ -0,0 +1,180 @@
+"""
+AI Pipeline Unit Tests - LLM 호출 결과 캐시
+
+키(공백 정규화·설정·지식 버전), LRU·TTL, SQLite 영속화와 지식 변경 시 무효화, 같은 키 동시 요청의
+single-flight, 폴백 문구 미저장, LLMClient 내부 호출(update_history=False)의 캐시 경유를 검증한다.
+"""
+
+import asyncio
+
+import pytest
+
+from src.ai_voicebot.ai_pipeline import llm_response_cache as cache_module
+from src.ai_voicebot.ai_pipeline.llm_client import LLMClient
+from src.ai_voicebot.ai_pipeline.llm_response_cache import LLMResponseCache
+
+
+class _Clock:
+    def __init__(self):
+        self.t = 1000.0
+
+    def __call__(self):
+        return self.t
+
+
+def _key(cache, prompt="오늘 영업해요?", **kw):
+    return cache.make_key(model="gemini-2.5-flash-lite", prompt=prompt, temperature=0.7, **kw)
+
+
+class TestKeys:
+    def test_whitespace_normalized_and_settings_distinguish(self):
+        cache = LLMResponseCache()
+        assert _key(cache, "오늘  영업해요? \n") == _key(cache)
+        assert _key(cache) != _key(cache, system_prompt="쿼리 변환기")
+        assert _key(cache) != _key(cache, max_output_tokens=256)
+
+    def test_knowledge_version_changes_key(self):
+        cache = LLMResponseCache()
+        before = _key(cache)
+        cache.bump_knowledge_version()
+        assert _key(cache) != before
+
+
+class TestStore:
+    def test_lru_and_ttl(self):
+        clock = _Clock()
+        cache = LLMResponseCache(max_entries=2, ttl_sec=60, clock=clock)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        assert cache.get("a") == "A"  # a가 최근 사용
+        cache.put("c", "C")
+        assert cache.get("b") is None and cache.get("a") == "A"
+        clock.t += 61
+        assert cache.get("a") is None
+        assert cache.get_stats()["evictions"] == 1 and cache.get_stats()["expired"] == 1
+
+    def test_sqlite_tier_survives_restart_until_knowledge_changes(self, tmp_path):
+        db = str(tmp_path / "llm_cache.db")
+        first = LLMResponseCache(db_path=db)
+        key = _key(first)
+        first.put(key, "네, 영업합니다.", call_site="rewrite_query")
+
+        restarted = LLMResponseCache(db_path=db)
+        assert restarted.get(_key(restarted), "rewrite_query") == "네, 영업합니다."
+        assert restarted.get_stats()["disk_hits"] == 1
+
+        restarted.bump_knowledge_version()
+        again = LLMResponseCache(db_path=db)
+        assert again.knowledge_version == 1
+        assert again.get(key) is None
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_call_once(self):
+        cache = LLMResponseCache()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "검색어"
+
+        results = await asyncio.gather(*[cache.get_or_compute("rewrite_query", "k", compute) for _ in range(3)])
+        assert results == ["검색어"] * 3 and len(calls) == 1
+        assert await cache.get_or_compute("rewrite_query", "k", compute) == "검색어"
+        site = cache.get_stats()["call_sites"]["rewrite_query"]
+        assert (site["misses"], site["coalesced"], site["hits"]) == (1, 2, 1)
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_result_not_stored(self):
+        cache = LLMResponseCache()
+
+        async def compute():
+            return ""
+
+        assert await cache.get_or_compute("call_summary", "k", compute) == ""
+        assert cache.get("k") is None
+        assert cache.get_stats()["call_sites"]["call_summary"]["uncacheable"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_waiters(self):
+        cache = LLMResponseCache()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "검색어"
+
+        leader = asyncio.create_task(cache.get_or_compute("rewrite_query", "k", compute))
+        await asyncio.sleep(0.01)
+        waiters = [asyncio.create_task(cache.get_or_compute("rewrite_query", "k", compute)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        leader.cancel()  # 계산하던 통화의 barge-in
+        assert await asyncio.gather(*waiters) == ["검색어", "검색어"]
+        assert leader.cancelled()
+        assert len(calls) == 2  # 기다리던 요청 중 하나만 다시 계산
+
+    @pytest.mark.asyncio
+    async def test_leader_error_is_forwarded_to_waiters(self):
+        cache = LLMResponseCache()
+
+        async def compute():
+            await asyncio.sleep(0.02)
+            raise RuntimeError("quota")
+
+        results = await asyncio.gather(
+            *[cache.get_or_compute("rewrite_query", "k", compute) for _ in range(2)], return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
+class _Response:
+    def __init__(self, text):
+        self.text = text
+        self.candidates = []
+
+
+class _Model:
+    def __init__(self, text):
+        self.text = text
+        self.calls = 0
+
+    def generate_content(self, contents, generation_config=None, stream=False):
+        self.calls += 1
+        return _Response(self.text)
+
+
+class TestLLMClientIntegration:
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setattr(cache_module, "_llm_response_cache", LLMResponseCache())
+        return LLMClient(config={"model": "gemini-2.5-flash-lite"}, api_key="test-key")
+
+    @pytest.mark.asyncio
+    async def test_internal_call_cached_per_site(self, client):
+        client.model = _Model("영업시간 문의")
+        kwargs = dict(context_docs=[], system_prompt="쿼리 변환기", update_history=False, cache_site="rewrite_query")
+        first = await client.generate_response("영업 해요?", **kwargs)
+        second = await client.generate_response("영업  해요?", **kwargs)
+        assert first == second == "영업시간 문의"
+        assert client.model.calls == 1
+        # 히스토리를 남기는 일반 응답은 캐시를 거치지 않는다
+        await client.generate_response("영업 해요?", context_docs=[], cache_site="rewrite_query")
+        assert client.model.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_error_fallback_not_cached(self, client):
+        class _Broken:
+            calls = 0
+
+            def generate_content(self, *a, **k):
+                _Broken.calls += 1
+                raise RuntimeError("quota")
+
+        client.model = _Broken()
+        kwargs = dict(context_docs=[], update_history=False, cache_site="classify_intent")
+        await client.generate_response("안녕하세요", **kwargs)
+        await client.generate_response("안녕하세요", **kwargs)
+        assert _Broken.calls == 2
@@ -0,0 +1,149 @@
+"""
+AI Pipeline Unit Tests - LLMClient 비동기 스트리밍 (첫 토큰/청크 타임아웃, 취소)
+
+실제 Gemini 대신 비동기 스트림/동기 스트림을 흉내내는 가짜 모델로, 문장 단위 분할과
+청크 대기 중 이벤트 루프가 막히지 않는지, 타임아웃·cancel_event 처리를 검증한다.
+generate_response 노드가 턴 중단 신호(call_context)를 스트리밍 호출에 넘기는지도 확인한다.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.ai_voicebot.ai_pipeline.llm_client import LLMClient
+from src.ai_voicebot.langgraph.call_context import clear_call_context, set_call_context
+from src.ai_voicebot.langgraph.nodes.generate_response import generate_response_node
+
+
+class _Chunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class _AsyncModel:
+    """generate_content_stream_async 경로 (google-genai client.aio 대응)."""
+
+    def __init__(self, texts, delays=None):
+        self._texts = texts
+        self._delays = delays or [0.0] * len(texts)
+        self.closed = False
+
+    async def generate_content_stream_async(self, contents, generation_config=None):
+        async def _gen():
+            try:
+                for text, delay in zip(self._texts, self._delays):
+                    if delay:
+                        await asyncio.sleep(delay)
+                    yield _Chunk(text)
+            finally:
+                self.closed = True
+
+        return _gen()
+
+
+class _SyncModel:
+    """비동기 경로가 없는 모델 — 리더 스레드 폴백 경로."""
+
+    def __init__(self, texts, delay=0.0):
+        self._texts = texts
+        self._delay = delay
+
+    def generate_content(self, contents, generation_config=None, stream=False):
+        def _gen():
+            for text in self._texts:
+                time.sleep(self._delay)
+                yield _Chunk(text)
+
+        return _gen()
+
+
+@pytest.fixture
+def client():
+    return LLMClient(config={"model": "gemini-2.5-flash-lite"}, api_key="test-key")
+
+
+async def _collect(client, **kwargs):
+    return [s async for s in client.generate_response_streaming("질문", [], **kwargs)]
+
+
+class TestAsyncStreaming:
+    @pytest.mark.asyncio
+    async def test_sentences_split_across_chunks(self, client):
+        client.model = _AsyncModel(["안녕하세요. 반갑", "습니다! 무엇을", " 도와드릴까요"])
+        out = await _collect(client)
+        assert out == ["안녕하세요.", "반갑습니다!", "무엇을 도와드릴까요"]
+        assert client.model.closed
+        assert client.get_stats()["last_stream_first_token_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_first_token_timeout_yields_fallback(self, client):
+        client.model = _AsyncModel(["늦은 응답."], delays=[1.0])
+        out = await _collect(client, first_token_timeout=0.05)
+        assert out == ["죄송합니다. 일시적으로 처리가 지연되고 있습니다."]
+        assert client.stream_timeouts == 1
+
+    @pytest.mark.asyncio
+    async def test_chunk_timeout_keeps_partial_text(self, client):
+        client.model = _AsyncModel(["첫 문장입니다. 둘째", " 문장"], delays=[0.0, 1.0])
+        out = await _collect(client, chunk_timeout=0.05)
+        assert out == ["첫 문장입니다.", "둘째"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_event_stops_stream(self, client):
+        client.model = _AsyncModel(["첫 문장입니다.", "버려질 문장."], delays=[0.0, 5.0])
+        cancel = asyncio.Event()
+        out = []
+        started = time.perf_counter()
+        async for sentence in client.generate_response_streaming("질문", [], cancel_event=cancel):
+            out.append(sentence)
+            cancel.set()
+        assert out == ["첫 문장입니다."]
+        assert time.perf_counter() - started < 1.0
+        assert client.model.closed
+        assert client.stream_cancellations == 1
+
+
+class TestReaderThreadFallback:
+    @pytest.mark.asyncio
+    async def test_sync_stream_does_not_block_loop(self, client):
+        client.model = _SyncModel(["하나. ", "둘. ", "셋."], delay=0.05)
+        ticks = 0
+
+        async def _ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(_ticker())
+        try:
+            out = await _collect(client)
+        finally:
+            ticker.cancel()
+        assert out == ["하나.", "둘.", "셋."]
+        # 청크 대기(총 ~150ms) 동안 루프가 계속 돌아야 함
+        assert ticks >= 5
+
+
+class _RecordingLLM:
+    def __init__(self):
+        self.cancel_event = None
+
+    async def generate_response_streaming(self, user_text, context_docs, system_prompt=None, cancel_event=None):
+        self.cancel_event = cancel_event
+        yield "네, 안내해 드릴게요."
+
+
+class TestGenerateResponseNodeCancelEvent:
+    @pytest.mark.asyncio
+    async def test_turn_cancel_event_reaches_streaming_call(self):
+        llm = _RecordingLLM()
+        cancel = asyncio.Event()
+        set_call_context(llm_client=llm, turn_cancel_event=cancel)
+        try:
+            out = await generate_response_node({"user_query": "안녕하세요", "intent": "greeting", "messages": []})
+        finally:
+            clear_call_context()
+        assert llm.cancel_event is cancel
+        assert out["response"] == "네, 안내해 드릴게요."
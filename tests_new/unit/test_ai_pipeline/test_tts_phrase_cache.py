@@ -0,0 +1,108 @@
+"""
+AI Pipeline Unit Tests - 고정 문구 TTS 캐시 (G.711 20ms 프레임)
+
+등록된 문구만 저장되는지, 코덱·voice·speaking_rate별로 키가 갈리는지, 디스크에서 새 인스턴스로
+복원되는지, 바이트 상한 LRU 축출과 기동 예열(이미 있는 문구는 재합성 안 함)을 검증한다.
+"""
+
+import math
+import struct
+
+import pytest
+
+from src.ai_voicebot.ai_pipeline.tts_phrase_cache import (
+    G711_FRAME_BYTES,
+    TTSPhraseCache,
+    phrase_key,
+    strip_wav_header,
+)
+from src.ai_voicebot.pipecat.audio_utils import RTPPacketBuilder
+
+VOICE = {"voice": "ko-KR-Chirp3-HD-Kore", "language": "ko-KR", "speaking_rate": 1.0}
+
+
+def _tone(ms=500, rate=16000):
+    n = rate * ms // 1000
+    return b"".join(struct.pack("<h", int(8000 * math.sin(i / 8))) for i in range(n))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = TTSPhraseCache(cache_dir=str(tmp_path / "tts"))
+    c.register(["무엇을 도와드릴까요?"])
+    return c
+
+
+class TestKeys:
+    def test_whitespace_normalized_and_rate_default(self):
+        a = phrase_key("무엇을  도와드릴까요? ", codec="PCMU", **VOICE)
+        b = phrase_key("무엇을 도와드릴까요?", voice=VOICE["voice"], language="KO-KR",
+                       speaking_rate=None, codec="pcmu")
+        assert a == b
+        assert a != phrase_key("무엇을 도와드릴까요?", codec="PCMA", **VOICE)
+        assert a != phrase_key("무엇을 도와드릴까요?", voice="ko-KR-Chirp3-HD-Aoede",
+                               language="ko-KR", speaking_rate=1.0, codec="PCMU")
+
+
+class TestStore:
+    def test_only_registered_phrases_stored(self, cache):
+        assert not cache.put_pcm("LLM이 만든 응답입니다.", _tone(), 16000, **VOICE)
+        assert cache.put_pcm("무엇을 도와드릴까요?", _tone(), 16000, **VOICE)
+        assert cache.get("LLM이 만든 응답입니다.", **VOICE) is None
+
+    def test_frames_are_20ms_g711_per_codec(self, cache):
+        cache.put_pcm("무엇을 도와드릴까요?", _tone(510), 16000, **VOICE)
+        ulaw = cache.get("무엇을 도와드릴까요?", codec="PCMU", **VOICE)
+        alaw = cache.get("무엇을 도와드릴까요?", codec="PCMA", **VOICE)
+        assert len(ulaw.frames) == 26  # 510ms → 25.5 프레임, 마지막은 무음 패딩
+        assert all(len(f) == G711_FRAME_BYTES for f in ulaw.frames)
+        assert ulaw.frames != alaw.frames
+        # 8kHz → 16kHz 리샘플 (ratecv 필터 지연으로 몇 샘플 오차)
+        assert abs(len(cache.get_pcm("무엇을 도와드릴까요?", **VOICE)) - 26 * 640) <= 8
+
+    def test_wav_header_stripped(self):
+        pcm = _tone(100)
+        wav = b"RIFF" + b"\x00" * 4 + b"WAVEfmt " + b"\x00" * 20 + b"data" + b"\x00" * 4 + pcm
+        assert strip_wav_header(wav) == pcm
+
+    def test_disk_backing_survives_new_instance(self, cache, tmp_path):
+        cache.put_pcm("무엇을 도와드릴까요?", _tone(), 16000, **VOICE)
+        fresh = TTSPhraseCache(cache_dir=str(tmp_path / "tts"))
+        entry = fresh.get("무엇을 도와드릴까요?", codec="PCMA", **VOICE)
+        assert entry is not None and entry.codec == "PCMA"
+        assert fresh.get_stats()["disk_hits"] == 1
+
+    def test_lru_evicts_by_bytes(self, tmp_path):
+        c = TTSPhraseCache(cache_dir=str(tmp_path / "tts"), max_bytes=4000)
+        c.register(["하나", "둘"])
+        c.put_pcm("하나", _tone(300), 16000, codecs=("PCMU",), **VOICE)
+        c.put_pcm("둘", _tone(300), 16000, codecs=("PCMU",), **VOICE)
+        stats = c.get_stats()
+        assert stats["entries"] == 1 and stats["evictions"] == 1
+
+
+class TestWarm:
+    @pytest.mark.asyncio
+    async def test_warm_synthesizes_missing_only(self, cache):
+        calls = []
+
+        async def synth(text):
+            calls.append(text)
+            return _tone(200)
+
+        cache.put_pcm("무엇을 도와드릴까요?", _tone(), 16000, **VOICE)
+        n = await cache.warm(["무엇을 도와드릴까요?", "감사합니다.", ""], synth, **VOICE)
+        assert n == 1
+        assert calls == ["감사합니다."]
+        assert cache.get("감사합니다.", **VOICE) is not None
+
+
+class TestRtpPacketize:
+    def test_cached_frames_packetized_without_reencoding(self, cache):
+        cache.put_pcm("무엇을 도와드릴까요?", _tone(100), 16000, **VOICE)
+        entry = cache.get("무엇을 도와드릴까요?", codec="PCMA", **VOICE)
+        builder = RTPPacketBuilder(codec="PCMA")
+        packets = builder.build_packets_from_g711(b"".join(entry.frames))
+        assert len(packets) == len(entry.frames)
+        assert packets[0][12:] == entry.frames[0]
+        assert packets[0][1] & 0x7F == 8
@@ -0,0 +1,94 @@
+"""
+AI Pipeline Unit Tests - VectorStoreGateway (전용 스레드 풀 / 동시 질의 묶음 / 타임아웃)
+
+실제 Chroma 대신 query/get만 흉내내는 가짜 컬렉션으로, 같은 컬렉션·필터의 동시 질의가
+query_embeddings 1회 호출로 묶여 행 단위로 분배되는지와 타임아웃·통계를 검증한다.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.ai_voicebot.knowledge.vector_store_gateway import VectorStoreGateway
+
+
+class _FakeCollection:
+    def __init__(self, delay=0.0):
+        self.query_calls = []
+        self.threads = []
+        self._delay = delay
+
+    def query(self, query_embeddings, n_results=10, where=None, include=None):
+        self.query_calls.append((list(query_embeddings), where))
+        self.threads.append(threading.current_thread().name)
+        if self._delay:
+            time.sleep(self._delay)
+        return {
+            "ids": [[f"doc-{int(e[0])}"] for e in query_embeddings],
+            "distances": [[e[0] / 10.0] for e in query_embeddings],
+            "included": ["distances"],
+        }
+
+
+@pytest.fixture
+def gateway():
+    gw = VectorStoreGateway(max_workers=2, batch_window_ms=5)
+    yield gw
+    gw.shutdown()
+
+
+class TestQueryBatching:
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_coalesced_and_split(self, gateway):
+        coll = _FakeCollection()
+        results = await asyncio.gather(
+            *(gateway.query(coll, [[float(i)]], n_results=1, where={"owner": "1004"}) for i in range(3))
+        )
+        assert len(coll.query_calls) == 1
+        assert len(coll.query_calls[0][0]) == 3
+        assert [r["ids"] for r in results] == [[["doc-0"]], [["doc-1"]], [["doc-2"]]]
+        assert results[0]["included"] == ["distances"]
+        stats = gateway.get_stats()
+        assert stats["batch_calls"] == 1
+        assert stats["batched_queries"] == 3
+
+    @pytest.mark.asyncio
+    async def test_different_filters_not_merged(self, gateway):
+        coll = _FakeCollection()
+        await asyncio.gather(
+            gateway.query(coll, [[1.0]], where={"owner": "1004"}),
+            gateway.query(coll, [[2.0]], where={"owner": "2000"}),
+        )
+        assert len(coll.query_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_runs_on_dedicated_pool(self, gateway):
+        coll = _FakeCollection()
+        await gateway.query(coll, [[1.0]])
+        assert coll.threads[0].startswith("vector-store")
+
+
+class TestRunTimeoutAndStats:
+    @pytest.mark.asyncio
+    async def test_timeout_raises_and_counts(self, gateway):
+        with pytest.raises(asyncio.TimeoutError):
+            await gateway.run("get", time.sleep, 0.3, timeout=0.05)
+        assert gateway.get_stats()["ops"]["get"]["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_recovers_after_cancelled_jobs(self):
+        gw = VectorStoreGateway(max_workers=1)
+        try:
+            blocker = asyncio.ensure_future(gw.run("get", time.sleep, 0.2, timeout=0))
+            await asyncio.sleep(0.01)
+            with pytest.raises(asyncio.TimeoutError):
+                await gw.run("get", time.sleep, 0.0, timeout=0.02)
+            await blocker
+            stats = gw.get_stats()
+            assert stats["queue_depth"] == 0
+            assert stats["in_flight"] == 0
+            assert stats["max_queue_depth"] >= 1
+        finally:
+            gw.shutdown()
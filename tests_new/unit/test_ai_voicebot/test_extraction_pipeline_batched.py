@@ -0,0 +1,163 @@
+"""
+Knowledge Extraction Pipeline v2 - 배치 처리 / 추출 대기열
+
+통화 1건의 항목이 한 번에 임베딩되고(전사 임베딩 1회), 중복 검사는 다중 벡터 질의 1회,
+저장은 bulk upsert 1회로 처리되는지와 동시 추출 통화 수 제한을 가짜 embedder/vector_db/LLM으로 검증한다.
+"""
+
+import asyncio
+
+import pytest
+
+from src.ai_voicebot.knowledge import extraction_pipeline as pipeline_mod
+from src.ai_voicebot.knowledge.extraction_pipeline import ExtractionPipeline
+from src.ai_voicebot.knowledge.semantic_deduplicator import SemanticDeduplicator
+from src.ai_voicebot.knowledge.vector_db import Document
+
+_TRANSCRIPT = (
+    "발신자: 주차장은 어디에 있나요?\n"
+    "착신자: 주차장은 건물 지하 2층에 있고 2시간 무료입니다.\n"
+    "발신자: 영업시간은 어떻게 되나요?\n"
+    "착신자: 영업시간은 오전 9시부터 오후 6시까지입니다.\n"
+)
+
+
+class _FakeEmbedder:
+    def __init__(self):
+        self.batch_calls = []
+        self.single_calls = []
+
+    async def embed(self, text):
+        self.single_calls.append(text)
+        return [1.0, 0.0, float(len(text))]
+
+    async def embed_batch(self, texts):
+        self.batch_calls.append(list(texts))
+        return [[1.0, 0.0, float(len(t))] for t in texts]
+
+
+class _FakeVectorDb:
+    def __init__(self, duplicate_texts=()):
+        self.search_many_calls = 0
+        self.upsert_many_calls = []
+        self.single_upserts = 0
+        self._duplicate_lengths = {float(len(t)) for t in duplicate_texts}
+
+    async def search_many(self, vectors, top_k=5, filter=None):
+        self.search_many_calls += 1
+        rows = []
+        for v in vectors:
+            if v and v[2] in self._duplicate_lengths:
+                rows.append([Document(id="existing", text="", score=0.95, metadata={})])
+            else:
+                rows.append([])
+        return rows
+
+    async def upsert_many(self, ids, embeddings, texts, metadatas):
+        self.upsert_many_calls.append(list(ids))
+
+    async def upsert(self, doc_id, embedding, text, metadata):
+        self.single_upserts += 1
+
+
+class _FakeLLM:
+    def __init__(self, infos, delay=0.0):
+        self._infos = infos
+        self._delay = delay
+
+    async def judge_usefulness(self, transcript, speaker, call_id=None):
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return {"is_useful": True, "confidence": 0.95, "extracted_info": self._infos}
+
+
+_INFOS = [
+    {"text": "주차장은 건물 지하 2층에 있고 2시간 무료입니다", "category": "주차"},
+    {"text": "영업시간은 오전 9시부터 오후 6시까지입니다", "category": "영업시간"},
+]
+
+
+@pytest.fixture(autouse=True)
+def _silence_call_data(monkeypatch):
+    monkeypatch.setattr(pipeline_mod, "log_call_data", lambda *a, **k: None)
+
+
+def _make_pipeline(tmp_path, vdb, embedder, llm, **config):
+    cfg = {"steps": {"summarize": False, "entity_extract": False}}
+    cfg.update(config)
+    pipe = ExtractionPipeline(llm_client=llm, embedder=embedder, vector_db=vdb, config=cfg)
+    path = tmp_path / "transcript.txt"
+    path.write_text(_TRANSCRIPT, encoding="utf-8")
+    return pipe, str(path)
+
+
+class TestBatchedStages:
+    @pytest.mark.asyncio
+    async def test_single_batch_embed_query_and_bulk_upsert(self, tmp_path):
+        embedder, vdb = _FakeEmbedder(), _FakeVectorDb()
+        pipe, path = _make_pipeline(tmp_path, vdb, embedder, _FakeLLM(_INFOS))
+        result = await pipe.extract_from_call("call-1", path, "1004")
+
+        assert result.success and result.stored_count == 2
+        # 항목 임베딩은 배치 1회, 단건 embed는 전사 임베딩 1회뿐
+        assert len(embedder.batch_calls) == 1
+        assert len(embedder.single_calls) == 1
+        assert vdb.search_many_calls == 1
+        assert vdb.upsert_many_calls == [["call-1_knowledge_0", "call-1_knowledge_1"]]
+        assert vdb.single_upserts == 0
+
+    @pytest.mark.asyncio
+    async def test_duplicate_item_skipped(self, tmp_path):
+        from src.ai_voicebot.knowledge.rag_knowledge_text import apply_rag_knowledge_prefix
+
+        embedder = _FakeEmbedder()
+        vdb = _FakeVectorDb(duplicate_texts=[apply_rag_knowledge_prefix(_INFOS[0]["text"])])
+        pipe, path = _make_pipeline(tmp_path, vdb, embedder, _FakeLLM(_INFOS))
+        result = await pipe.extract_from_call("call-2", path, "1004")
+        assert result.skipped_duplicate == 1
+        assert result.stored_count == 1
+
+
+class TestExtractionQueue:
+    @pytest.mark.asyncio
+    async def test_concurrent_extractions_bounded(self, tmp_path):
+        pipe, path = _make_pipeline(
+            tmp_path,
+            _FakeVectorDb(),
+            _FakeEmbedder(),
+            _FakeLLM(_INFOS, delay=0.05),
+            max_concurrent_extractions=1,
+        )
+        peak = 0
+        original = pipe._run_extraction
+
+        async def _tracked(*args, **kwargs):
+            nonlocal peak
+            peak = max(peak, pipe._active_extractions)
+            return await original(*args, **kwargs)
+
+        pipe._run_extraction = _tracked
+        results = await asyncio.gather(
+            *(pipe.extract_from_call(f"call-{i}", path, "1004") for i in range(3))
+        )
+        assert all(r.success for r in results)
+        assert peak == 1
+        assert pipe.get_stats()["queued_extractions"] == 0
+
+
+class TestDeduplicatorCheckMany:
+    @pytest.mark.asyncio
+    async def test_falls_back_to_search_when_no_search_many(self):
+        class _SearchOnly:
+            def __init__(self):
+                self.calls = 0
+
+            async def search(self, vector, top_k=5, filter=None):
+                self.calls += 1
+                return [Document(id="d", text="", score=0.9, metadata={})]
+
+        vdb = _SearchOnly()
+        dedup = SemanticDeduplicator(vdb, embedder=None)
+        out = await dedup.check_many(["a", "b", "c"], [[1.0], None, [0.5]], owner_filter="1004")
+        assert [r.status for r in out] == ["duplicate", "unique", "duplicate"]
+        assert vdb.calls == 2
@@ -0,0 +1,151 @@
+"""
+Help / Capability 사전 계산 캐시 (HelpCacheService)
+
+owner 지식 집합 지문이 같으면 재계산을 건너뛰고, 지식 변경 알림 후에는 dirty → 재계산되며,
+SQLite에 저장된 값이 새 인스턴스에서 바로 조회되는지와 help 노드가 LLM 없이 캐시로 응답하는지를
+가짜 vector_db/LLM으로 검증한다.
+"""
+
+import asyncio
+
+import pytest
+
+from src.ai_voicebot.knowledge import help_cache as help_cache_mod
+from src.ai_voicebot.knowledge.help_cache import HelpCacheService, knowledge_fingerprint
+from src.ai_voicebot.langgraph.nodes import response_shortcuts
+
+
+class _FakeVectorDb:
+    def __init__(self, rows):
+        self.rows = rows
+        self.get_calls = 0
+
+    def get(self, where=None, limit=1000, **kwargs):
+        self.get_calls += 1
+        owner = (where or {}).get("owner")
+        picked = [r for r in self.rows if r[2].get("owner") == owner]
+        return {
+            "ids": [r[0] for r in picked],
+            "documents": [r[1] for r in picked],
+            "metadatas": [r[2] for r in picked],
+        }
+
+
+class _FakeLLM:
+    def __init__(self):
+        self.help_calls = 0
+        self.guide_calls = 0
+
+    async def generate_help_items_json(self, prompt, max_tokens=None, timeout_seconds=None):
+        self.help_calls += 1
+        return '{"items":["주차 안내","영업시간 안내"]}', True
+
+    async def generate_response(self, user_text, context_docs, system_prompt=None, **kwargs):
+        self.guide_calls += 1
+        return "저는 예약과 주차 안내를 도와드릴 수 있어요."
+
+
+def _rows():
+    return [
+        ("kb_1", "주차장은 지하 2층입니다", {"owner": "1004", "category": "question"}),
+        ("kb_2", "영업시간은 9시부터 6시입니다", {"owner": "1004", "category": "question", "hit_count": 3}),
+        ("kb_3", "무엇을 도와드릴까요? 예약과 주차를 안내합니다", {"owner": "1004", "category": "greeting_phase2"}),
+        ("cap_1", "예약 접수", {"owner": "1004", "doc_type": "capability", "display_name": "예약", "priority": 10}),
+        ("cap_2", "꺼진 항목", {"owner": "1004", "doc_type": "capability", "display_name": "꺼짐", "is_active": False}),
+        ("kb_9", "다른 테넌트", {"owner": "2000", "category": "question"}),
+    ]
+
+
+@pytest.fixture
+def service(tmp_path):
+    svc = HelpCacheService(db_path=str(tmp_path / "help_cache.db"), rebuild_delay_sec=0)
+    svc.configure(vector_db=_FakeVectorDb(_rows()), llm=_FakeLLM())
+    return svc
+
+
+class TestFingerprint:
+    def test_order_independent_and_ignores_usage_meta(self):
+        rows = _rows()
+        ids, docs, metas = zip(*rows)
+        fp = knowledge_fingerprint(list(ids), list(docs), list(metas))
+        bumped = [dict(m, hit_count=99) for m in metas]
+        assert knowledge_fingerprint(list(reversed(ids)), list(reversed(docs)), list(reversed(metas))) == fp
+        assert knowledge_fingerprint(list(ids), list(docs), bumped) == fp
+        assert knowledge_fingerprint(list(ids), [d + "!" for d in docs], list(metas)) != fp
+
+
+class TestRebuild:
+    @pytest.mark.asyncio
+    async def test_builds_help_guide_and_greeting(self, service):
+        entry = await service.rebuild("1004")
+        assert entry.help_items == ["주차 안내", "영업시간 안내"]
+        assert entry.help_response.startswith("저는 주차 안내, 영업시간 안내")
+        assert entry.capability_names == ["예약"]
+        assert entry.capability_guide == "저는 예약과 주차 안내를 도와드릴 수 있어요."
+        assert entry.greeting_phase2.startswith("무엇을 도와드릴까요")
+        assert service.get("1004") is entry
+
+    @pytest.mark.asyncio
+    async def test_unchanged_fingerprint_skips_llm(self, service):
+        await service.rebuild("1004")
+        llm = service._llm
+        await service.rebuild("1004")
+        assert llm.help_calls == 1
+        assert service.get_stats()["unchanged"] == 1
+
+    @pytest.mark.asyncio
+    async def test_notify_marks_dirty_until_rebuilt(self, service):
+        await service.rebuild("1004")
+        service._vector_db.rows.append(
+            ("kb_4", "택배 보관 안내", {"owner": "1004", "category": "question"})
+        )
+        service.notify_knowledge_changed("1004")
+        assert service.get("1004") is None
+        await service._tasks["1004"]
+        assert service.get("1004") is not None
+        assert service._llm.help_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_persisted_entry_served_by_new_instance(self, service, tmp_path):
+        await service.rebuild("1004")
+        fresh = HelpCacheService(db_path=str(tmp_path / "help_cache.db"))
+        fresh.configure(vector_db=_FakeVectorDb(_rows()))
+        entry = fresh.get("1004")
+        assert entry is not None
+        assert entry.help_items == ["주차 안내", "영업시간 안내"]
+
+    @pytest.mark.asyncio
+    async def test_persist_uses_pool_writer_and_drops_owner_locks(self, service, tmp_path):
+        from src.common.sqlite_pool import get_sqlite_pool
+
+        await asyncio.gather(service.rebuild("1004"), service.rebuild("1004", force=True))
+        assert service._owner_locks == {}
+        assert get_sqlite_pool(tmp_path / "help_cache.db").get_stats()["writer_acquired"] >= 2
+
+    def test_rebuild_from_separate_event_loops(self, service):
+        # 같은 owner를 다른 루프(asyncio.run 두 번)에서 재계산해도 루프 간 락 공유 오류가 없다
+        asyncio.run(service.rebuild("1004"))
+        asyncio.run(service.rebuild("1004", force=True))
+        assert service.get_stats()["rebuilds"] == 2
+        assert service._owner_locks == {}
+
+    def test_unconfigured_service_disabled(self, tmp_path):
+        svc = HelpCacheService(db_path=str(tmp_path / "help_cache.db"))
+        assert svc.get("1004") is None
+
+
+class TestHelpNodeUsesCache:
+    @pytest.mark.asyncio
+    async def test_help_node_served_without_rag_or_llm(self, service, monkeypatch):
+        await service.rebuild("1004")
+        monkeypatch.setattr(help_cache_mod, "_help_cache", service)
+
+        class _NoLLM:
+            async def generate_help_items_json(self, *a, **k):
+                raise AssertionError("LLM must not be called on cache hit")
+
+        out = await response_shortcuts.help_response_node(
+            {"_owner": "1004", "user_query": "뭘 할 수 있어요?", "_llm_client": _NoLLM()}
+        )
+        assert out["llm_rag_context_source"] == "help_cache"
+        assert out["response"] == service.get("1004").help_response
@@ -0,0 +1,109 @@
+"""
+AI Voicebot Unit Tests - 토큰 예산 프롬프트 조립기
+
+토큰 근사, 구역 예산(오래된 발화·낮은 점수 청크부터 제거), 전체 예산 초과 시 우선순위 순 축소,
+고정 접두사(시스템·기관·페르소나)가 턴이 바뀌어도 바이트 단위로 같은지, generate_response 노드가
+긴 통화에서도 예산 안의 프롬프트를 쓰는지 검증한다.
+"""
+
+import pytest
+
+from src.ai_voicebot.langgraph.call_context import set_call_context
+from src.ai_voicebot.langgraph.nodes.generate_response import generate_response_node
+from src.ai_voicebot.langgraph.prompt_assembler import (
+    PromptSection,
+    assemble_prompt,
+    estimate_tokens,
+)
+
+
+def test_estimate_tokens_korean_and_ascii():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("안녕하세요") == 5
+    assert estimate_tokens("parking lot") == 3  # 공백 제외 10글자 → 3
+
+
+class TestSectionBudgets:
+    def test_history_drops_oldest_first(self):
+        history = PromptSection("history", items=[f"사용자: 발화{i}" for i in range(10)], budget=30, priority=3)
+        result = assemble_prompt([history], total_budget=1000)
+        assert history.items[-1] == "사용자: 발화9"
+        assert history.items[0] != "사용자: 발화0"
+        assert result.section_tokens["history"] <= 30
+        assert result.dropped["history"] == 10 - len(history.items)
+
+    def test_rag_drops_lowest_score_and_keeps_order(self):
+        rag = PromptSection(
+            "rag",
+            items=["가" * 20, "나" * 20, "다" * 20],
+            scores=[0.9, 0.2, 0.7],
+            budget=50,
+            numbered=True,
+            priority=1,
+        )
+        assemble_prompt([rag], total_budget=1000)
+        assert rag.items == ["가" * 20, "다" * 20]
+        assert rag.render().startswith("[1] 가") and "[2] 다" in rag.render()
+
+    def test_total_budget_shrinks_lowest_priority_first(self):
+        sections = [
+            PromptSection("rules", text="규" * 50, static=True),
+            PromptSection("rag", items=["참" * 40, "고" * 40], scores=[0.9, 0.5], priority=1),
+            PromptSection("history", items=["대" * 40, "화" * 40], priority=3),
+        ]
+        result = assemble_prompt(sections, total_budget=150)
+        assert result.total_tokens <= 150
+        assert result.dropped == {"history": 2}
+        assert result.section_tokens["rules"] == 50
+
+
+class TestStaticPrefix:
+    def _assemble(self, history_lines, rag_items):
+        return assemble_prompt(
+            [
+                PromptSection("system", text="당신은 AI 통화 비서입니다.", static=True),
+                PromptSection("org", text="기관명: 테스트센터", budget=50, static=True),
+                PromptSection("history", items=history_lines, priority=3, budget=40),
+                PromptSection("rag", items=rag_items, scores=[1.0] * len(rag_items), priority=1),
+            ],
+            total_budget=200,
+        )
+
+    def test_prefix_identical_across_turns(self):
+        first = self._assemble(["사용자: 안녕하세요"], ["주차장은 지하 2층입니다."])
+        later = self._assemble([f"사용자: 질문 {i}" for i in range(30)], ["영업시간은 9시부터입니다."] * 4)
+        assert first.static_prefix == later.static_prefix
+        assert first.prefix_hash == later.prefix_hash
+        assert later.text.startswith(later.static_prefix)
+        assert later.total_tokens <= 200
+
+
+@pytest.mark.asyncio
+async def test_generate_response_prompt_stays_within_budget(monkeypatch):
+    monkeypatch.setenv("PROMPT_TOKEN_BUDGET", "900")
+    prompts = []
+
+    class _LLM:
+        async def generate_response(self, **kwargs):
+            prompts.append(kwargs)
+            return "주차장은 지하 2층에 있습니다."
+
+    set_call_context(llm_client=_LLM())
+    base = {
+        "user_query": "주차 되나요?",
+        "intent": "question",
+        "org_context": "기관명: 테스트센터",
+        "rag_results": [{"text": "주차장은 지하 2층입니다. " * 30, "score": 0.8}],
+    }
+    short = await generate_response_node({**base, "messages": []})
+    long_messages = [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": "긴 발화입니다. " * 40} for i in range(40)
+    ]
+    await generate_response_node({**base, "messages": long_messages})
+
+    assert short["response"].startswith("주차장은")
+    first, second = prompts
+    assert first["context_docs"] == [] and second["context_docs"] == []
+    assert estimate_tokens(second["system_prompt"]) <= 900
+    prefix = first["system_prompt"].split("현재 대화 단계")[0]
+    assert second["system_prompt"].startswith(prefix)
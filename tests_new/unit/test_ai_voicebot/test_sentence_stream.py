@@ -0,0 +1,179 @@
+"""
+AI Voicebot Unit Tests - LangGraph → TTS 문장 스트리밍 채널 (SentenceStream)
+
+문장 단위 검증(JSON 조각/“모르는 내용” 패턴)에 따른 롤백, 최종 응답과의 대조(reconcile),
+그리고 ConversationAgent가 call_context로 채널을 노드에 넘기고 update_state 직행 노드의
+응답을 노드 완료 즉시 흘려보내는지를 가짜 그래프로 검증한다.
+"""
+
+import pytest
+
+from src.ai_voicebot.langgraph.agent import ConversationAgent
+from src.ai_voicebot.langgraph.call_context import get_sentence_stream
+from src.ai_voicebot.langgraph.sentence_stream import SentenceStream
+
+
+def _collector():
+    pushed = []
+
+    async def on_sentence(text):
+        pushed.append(text)
+
+    return pushed, on_sentence
+
+
+class TestSentenceStreamValidation:
+    @pytest.mark.asyncio
+    async def test_forwards_valid_sentences(self):
+        pushed, cb = _collector()
+        stream = SentenceStream(cb)
+        assert await stream.offer("주차장은 지하 2층입니다.")
+        assert await stream.offer(" 영업시간은 9시부터예요. ")
+        assert pushed == ["주차장은 지하 2층입니다.", "영업시간은 9시부터예요."]
+        assert stream.streamed_text == "주차장은 지하 2층입니다. 영업시간은 9시부터예요."
+
+    @pytest.mark.asyncio
+    async def test_json_fragment_rolls_back_and_stops(self):
+        pushed, cb = _collector()
+        stream = SentenceStream(cb)
+        await stream.offer("안내해 드릴게요.")
+        assert not await stream.offer('{"intent": "chitchat"}')
+        assert not await stream.offer("이후 문장은 보내지 않습니다.")
+        assert pushed == ["안내해 드릴게요."]
+        assert stream.rolled_back
+        assert stream.rollback_reason == "json_or_markdown_fragment"
+
+    @pytest.mark.asyncio
+    async def test_unknown_content_only_checked_when_requested(self):
+        unknown = "죄송합니다. 알지 못하는 내용입니다."
+        pushed, cb = _collector()
+        stream = SentenceStream(cb)
+        assert not await stream.offer(unknown)
+        assert stream.rollback_reason == "unknown_content"
+
+        social = SentenceStream(cb)
+        assert await social.offer(unknown, check_unknown=False)
+
+    @pytest.mark.asyncio
+    async def test_consumer_error_rolls_back(self):
+        async def broken(text):
+            raise RuntimeError("pipeline gone")
+
+        stream = SentenceStream(broken)
+        assert not await stream.offer("첫 문장입니다.")
+        assert stream.rollback_reason == "consumer_error"
+        assert not stream.has_streamed
+
+
+class TestReconcile:
+    @pytest.mark.asyncio
+    async def test_prefix_match_returns_remaining_sentences(self):
+        _pushed, cb = _collector()
+        stream = SentenceStream(cb)
+        await stream.offer("첫 문장입니다.")
+        remaining = stream.reconcile("첫 문장입니다.  둘째 문장이에요. 셋째?")
+        assert remaining == ["둘째 문장이에요.", "셋째?"]
+        assert not stream.rolled_back
+        assert not await stream.offer("닫힌 뒤 문장.")
+
+    @pytest.mark.asyncio
+    async def test_hitl_override_mismatch_rolls_back(self):
+        _pushed, cb = _collector()
+        stream = SentenceStream(cb)
+        await stream.offer("확인해 보니")
+        assert stream.reconcile("담당자에게 연결해 드리겠습니다.") is None
+        assert stream.rollback_reason == "final_response_mismatch"
+        assert stream.replay_sentences == ["담당자에게 연결해 드리겠습니다."]
+
+    @pytest.mark.asyncio
+    async def test_mismatch_replays_only_after_matching_prefix(self):
+        _pushed, cb = _collector()
+        stream = SentenceStream(cb)
+        await stream.offer("주차장은 지하 2층입니다.")
+        await stream.offer("2시간 무료예요.")
+        final = "주차장은 지하 2층입니다. 1시간 무료입니다. 더 궁금하신 점 있으세요?"
+        assert stream.reconcile(final) is None
+        # 이미 재생된 첫 문장은 다시 말하지 않는다
+        assert stream.kept_count == 1
+        assert stream.replay_sentences == ["1시간 무료입니다.", "더 궁금하신 점 있으세요?"]
+
+
+class _FakeGraph:
+    def __init__(self, packets, on_run=None):
+        self._packets = packets
+        self._on_run = on_run
+
+    async def astream(self, invoke_state, **kwargs):
+        if self._on_run is not None:
+            await self._on_run()
+        for packet in self._packets:
+            yield packet
+
+
+@pytest.fixture
+def agent():
+    return ConversationAgent(llm_client=None, owner="1004")
+
+
+class TestAgentWiring:
+    @pytest.mark.asyncio
+    async def test_terminal_node_response_streamed_before_update_state(self, agent):
+        pushed, cb = _collector()
+        order = []
+
+        async def on_sentence(text):
+            order.append(("sentence", text))
+            await cb(text)
+
+        class _Graph(_FakeGraph):
+            async def astream(self, invoke_state, **kwargs):
+                yield ("updates", {"help_response": {
+                    "response": "주차와 예약을 도와드려요. 무엇이 궁금하세요?",
+                    "response_chunks": [],
+                }})
+                order.append(("node", "update_state"))
+                yield ("updates", {"update_state": {}})
+                yield ("values", {"response": "주차와 예약을 도와드려요. 무엇이 궁금하세요?"})
+
+        agent.graph = _Graph([])
+        stream = SentenceStream(on_sentence)
+        result = await agent.process_utterance("뭐 할 수 있어?", call_id="c1", sentence_stream=stream)
+
+        assert pushed == ["주차와 예약을 도와드려요.", "무엇이 궁금하세요?"]
+        assert order[-1] == ("node", "update_state")
+        assert stream.reconcile(result["response"]) == []
+
+    @pytest.mark.asyncio
+    async def test_nodes_see_stream_via_call_context(self, agent):
+        pushed, cb = _collector()
+
+        async def node_like():
+            await get_sentence_stream().offer("노드에서 바로 보낸 문장입니다.")
+
+        agent.graph = _FakeGraph(
+            [("values", {"response": "노드에서 바로 보낸 문장입니다."})], on_run=node_like
+        )
+        stream = SentenceStream(cb)
+        await agent.process_utterance("안녕", call_id="c2", sentence_stream=stream)
+        assert pushed == ["노드에서 바로 보낸 문장입니다."]
+
+    @pytest.mark.asyncio
+    async def test_outbound_session_not_streamed(self, agent):
+        pushed, cb = _collector()
+        seen = []
+
+        async def node_like():
+            seen.append(get_sentence_stream())
+
+        agent.graph = _FakeGraph(
+            [("updates", {"help_response": {"response": "안내입니다."}}),
+             ("values", {"response": "안내입니다."})],
+            on_run=node_like,
+        )
+        stream = SentenceStream(cb)
+        await agent.process_utterance(
+            "네", call_id="c3", sentence_stream=stream,
+            outbound_purpose="만족도 조사", outbound_questions=["만족하셨나요?"],
+        )
+        assert seen == [None]
+        assert pushed == []
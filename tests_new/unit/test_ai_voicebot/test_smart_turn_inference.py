@@ -0,0 +1,137 @@
+"""
+AI Voicebot Unit Tests - Smart Turn 공용 추론 서버 (마이크로 배치)
+
+가짜 predict_batch로 동시 요청이 한 배치로 묶이는지, 워커가 바쁠 때 대기 요청이 다음 배치로 합쳐지는지,
+대기열 포화·지연·추론 오류 시 SmartTurnUnavailable(VAD 폴백)로 끝나는지와 요청별 지연 보고를 검증한다.
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.ai_voicebot.pipecat.smart_turn_inference import (
+    SmartTurnInferenceServer,
+    SmartTurnUnavailable,
+    _fit_window,
+)
+
+
+def _audio(level):
+    return np.full(1600, level, dtype=np.float32)
+
+
+class _Model:
+    """오디오 첫 샘플을 확률로 돌려주는 가짜 모델 (호출마다 배치 크기 기록)."""
+
+    def __init__(self, delay=0.0, gate=None, fail=False):
+        self.batches = []
+        self.delay = delay
+        self.gate = gate
+        self.fail = fail
+
+    def __call__(self, audios):
+        self.batches.append(len(audios))
+        if self.gate is not None:
+            self.gate.wait(2.0)
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("onnx failure")
+        return [float(a[0]) for a in audios]
+
+
+def _predict_concurrently(server, levels):
+    results = [None] * len(levels)
+
+    def worker(i):
+        try:
+            results[i] = server.predict(_audio(levels[i]), call_id=f"call-{i}")
+        except SmartTurnUnavailable as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(levels))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(3.0)
+    return results
+
+
+@pytest.fixture
+def make_server():
+    servers = []
+
+    def _make(model, **kwargs):
+        kwargs.setdefault("timeout_ms", 2000)
+        server = SmartTurnInferenceServer(model, **kwargs)
+        servers.append(server)
+        return server
+
+    yield _make
+    for s in servers:
+        s.close()
+
+
+class TestBatching:
+    def test_concurrent_requests_share_one_batch(self, make_server):
+        model = _Model()
+        server = make_server(model, batch_window_ms=200, max_batch=4, workers=1)
+        results = _predict_concurrently(server, [0.9, 0.1, 0.7, 0.2])
+        assert model.batches == [4]
+        assert [r["prediction"] for r in results] == [1, 0, 1, 0]
+        assert results[0]["probability"] == pytest.approx(0.9)
+        assert all(r["batch_size"] == 4 and r["latency_ms"] >= r["queue_ms"] for r in results)
+        stats = server.get_stats()
+        assert stats["completed"] == 4 and stats["batches"] == 1 and stats["avg_batch_size"] == 4.0
+
+    def test_requests_queue_into_next_batch_while_worker_busy(self, make_server):
+        gate = threading.Event()
+        model = _Model(gate=gate)
+        server = make_server(model, batch_window_ms=0, max_batch=8, workers=1)
+        first = threading.Thread(target=server.predict, args=(_audio(0.9),))
+        first.start()
+        deadline = time.time() + 2.0
+        while not model.batches and time.time() < deadline:
+            time.sleep(0.005)
+        # 워커가 첫 배치로 막혀 있는 동안 들어온 3건은 다음 배치 하나로 합쳐진다
+        threading.Timer(0.2, gate.set).start()
+        results = _predict_concurrently(server, [0.6, 0.6, 0.6])
+        first.join(2.0)
+        assert model.batches == [1, 3]
+        assert all(r["prediction"] == 1 for r in results)
+
+
+class TestFallback:
+    def test_queue_full_falls_back_immediately(self, make_server):
+        gate = threading.Event()
+        server = make_server(_Model(gate=gate), batch_window_ms=0, max_batch=1, workers=1, max_queue=1)
+        results = _predict_concurrently_with_release(server, gate, [0.9, 0.9, 0.9, 0.9])
+        reasons = [r.reason for r in results if isinstance(r, SmartTurnUnavailable)]
+        assert "queue_full" in reasons
+        assert server.get_stats()["vad_fallbacks"]["queue_full"] == len(reasons)
+
+    def test_timeout_and_error_fall_back(self, make_server):
+        slow = make_server(_Model(delay=0.3), batch_window_ms=0, timeout_ms=50)
+        with pytest.raises(SmartTurnUnavailable) as exc:
+            slow.predict(_audio(0.9))
+        assert exc.value.reason == "timeout"
+
+        broken = make_server(_Model(fail=True), batch_window_ms=0)
+        with pytest.raises(SmartTurnUnavailable) as exc:
+            broken.predict(_audio(0.9))
+        assert exc.value.reason == "error"
+        assert broken.get_stats()["vad_fallbacks"]["error"] == 1
+
+
+def _predict_concurrently_with_release(server, gate, levels):
+    threading.Timer(0.3, gate.set).start()
+    return _predict_concurrently(server, levels)
+
+
+def test_fit_window_keeps_last_8_seconds():
+    long = np.arange(9 * 16000, dtype=np.float32)
+    assert _fit_window(long)[0] == 16000
+    short = _fit_window(np.ones(100, dtype=np.float32))
+    assert len(short) == 8 * 16000 and short[0] == 0 and short[-1] == 1
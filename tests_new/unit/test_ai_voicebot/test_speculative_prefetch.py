@@ -0,0 +1,124 @@
+"""
+AI Voicebot Unit Tests - 의도 분류와 병행하는 추측 선행 조회 (SpeculativePrefetch)
+
+같은 쿼리/조건이면 check_cache·adaptive_rag가 선행 임베딩·검색 결과를 재사용(hit)하고,
+의도 필터가 다르거나 쿼리가 바뀌면 버리는지(mismatch), 소비되지 않으면 unused로
+집계되는지를 가짜 임베더/RAG 엔진으로 검증한다.
+"""
+
+import asyncio
+
+import pytest
+
+from src.ai_voicebot.ai_pipeline.rag_engine import Document, RAGSearchResult
+from src.ai_voicebot.langgraph.speculative_prefetch import (
+    NODE_ADAPTIVE_RAG,
+    NODE_CHECK_CACHE,
+    SpeculativePrefetch,
+    SpeculativeStats,
+)
+
+
+class _FakeEmbedder:
+    def __init__(self):
+        self.calls = []
+
+    def embed_text(self, text):
+        self.calls.append(text)
+        return [0.1, 0.2, 0.3]
+
+
+class _FakeRagEngine:
+    def __init__(self):
+        self.search_calls = []
+        self.logged = []
+
+    async def search(self, query, owner_filter=None, call_id=None, top_k_override=None,
+                     intent=None, query_embedding=None):
+        self.search_calls.append(
+            {"query": query, "owner": owner_filter, "call_id": call_id, "intent": intent,
+             "query_embedding": query_embedding}
+        )
+        return RAGSearchResult(
+            documents=[Document(id="kb_1", text="주차장은 지하 2층입니다", metadata={}, score=0.8)],
+            trace={"intent_classified": intent, "search_intent_used": intent},
+        )
+
+    def log_search_to_db(self, call_id, query, documents, search_latency_ms):
+        self.logged.append((call_id, query, len(documents)))
+
+
+def _prefetch(stats, query="주차 어디예요?", search_query=None):
+    return SpeculativePrefetch(
+        query=query,
+        search_query=search_query or query,
+        owner="1004",
+        embedder=_FakeEmbedder(),
+        rag_engine=_FakeRagEngine(),
+        top_k=5,
+        call_id="c1",
+        stats=stats,
+    ).start()
+
+
+class TestReuse:
+    @pytest.mark.asyncio
+    async def test_embedding_reused_by_search_and_cache(self):
+        stats = SpeculativeStats()
+        pf = _prefetch(stats)
+        emb = await pf.take_embedding("주차 어디예요?")
+        assert emb == [0.1, 0.2, 0.3]
+        result = await pf.take_search(
+            "주차 어디예요?", owner="1004", intent="chitchat", top_k=5, call_id="c1"
+        )
+        assert result.trace["speculative_prefetch"] is True
+        assert result.trace["intent_classified"] == "chitchat"
+        engine = pf._rag_engine
+        assert engine.search_calls[0]["call_id"] is None
+        assert engine.search_calls[0]["query_embedding"] == emb
+        assert pf._embedder.calls == ["주차 어디예요?"]
+        # 채택 시점에만 DB 로깅
+        assert engine.logged == [("c1", "주차 어디예요?", 1)]
+        assert pf.finish() == {NODE_CHECK_CACHE: "hit", NODE_ADAPTIVE_RAG: "hit"}
+
+    @pytest.mark.asyncio
+    async def test_category_filtered_intent_is_mismatch(self):
+        stats = SpeculativeStats()
+        pf = _prefetch(stats)
+        assert await pf.take_search("주차 어디예요?", owner="1004", intent="complaint", top_k=5) is None
+        assert await pf.take_search("주차 어디예요?", owner="1004", intent="help", top_k=5) is None
+        assert pf.finish()[NODE_ADAPTIVE_RAG] == "mismatch"
+
+    @pytest.mark.asyncio
+    async def test_rewritten_query_is_mismatch(self):
+        stats = SpeculativeStats()
+        pf = _prefetch(stats)
+        assert await pf.take_search("주차장 위치 안내", owner="1004", intent="question", top_k=5) is None
+        assert await pf.take_embedding("다른 문장") is None
+        assert pf.finish() == {NODE_CHECK_CACHE: "mismatch", NODE_ADAPTIVE_RAG: "mismatch"}
+
+
+class TestStats:
+    @pytest.mark.asyncio
+    async def test_unused_counted_as_waste_and_tasks_cancelled(self):
+        stats = SpeculativeStats()
+        pf = _prefetch(stats)
+        pf.finish()
+        await asyncio.sleep(0)
+        pf2 = _prefetch(stats)
+        await pf2.take_embedding("주차 어디예요?")
+        pf2.finish()
+
+        out = stats.get_stats()
+        assert out[NODE_CHECK_CACHE]["started"] == 2
+        assert out[NODE_CHECK_CACHE]["hit_rate"] == 0.5
+        assert out[NODE_ADAPTIVE_RAG]["unused"] == 2
+        assert out[NODE_ADAPTIVE_RAG]["waste_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_finish_is_idempotent(self):
+        stats = SpeculativeStats()
+        pf = _prefetch(stats)
+        pf.finish()
+        assert pf.finish() == {}
+        assert stats.get_stats()[NODE_CHECK_CACHE]["started"] == 1
@@ -0,0 +1,183 @@
+"""
+AI Voicebot Unit Tests - Google STT 스트림 사전 연결·회전 관리자
+
+가짜 streaming_recognize로 대기 스트림 풀(즉시 확보·재충전·만료), 통화 시작 시 오디오 없이 사전 연결,
+스트림 종료 직후 교체, 한도 전 회전과 overlap 오디오 재전송, 턴별 설정 대기 보고를 검증한다.
+"""
+
+import asyncio
+
+from src.ai_voicebot.pipecat.stt_stream_manager import (
+    SttStreamManager,
+    SttStreamSession,
+    SttStreamSpec,
+)
+
+
+class _Call:
+    """응답 iterator 겸 요청 소비자. end()로 서버 측 종료(무음 Aborted 등)를 흉내 낸다."""
+
+    def __init__(self, requests, first):
+        self.requests = [first]
+        self.cancelled = False
+        self.half_closed = False
+        self._ended = asyncio.Event()
+        self._reader = asyncio.ensure_future(self._read(requests))
+
+    async def _read(self, requests):
+        async for req in requests:
+            self.requests.append(req)
+        self.half_closed = True
+        self._ended.set()
+
+    def end(self):
+        self._ended.set()
+
+    def cancel(self):
+        self.cancelled = True
+        self._ended.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await self._ended.wait()
+        raise StopAsyncIteration
+
+    @property
+    def audio(self):
+        return [r for r in self.requests if r != "config"]
+
+
+class _Client:
+    def __init__(self, setup_sec=0.0):
+        self.setup_sec = setup_sec
+        self.calls = []
+
+    async def streaming_recognize(self, requests):
+        first = await requests.__anext__()  # 연결 시 설정 요청 전송
+        await asyncio.sleep(self.setup_sec)
+        call = _Call(requests, first)
+        self.calls.append(call)
+        return call
+
+
+def _spec(client, key="ko-KR:test"):
+    return SttStreamSpec(
+        key=key,
+        open_call=lambda reqs: client.streaming_recognize(reqs),
+        first_request="config",
+        audio_request=lambda audio: audio,
+    )
+
+
+async def _consume(responses):
+    async for _ in responses:
+        pass
+
+
+async def _until(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met"
+        await asyncio.sleep(0.01)
+
+
+class TestManagerPool:
+    async def test_registered_key_keeps_standby_ready(self):
+        client = _Client(setup_sec=0.05)
+        manager = SttStreamManager(pool_size=1, standby_ttl_sec=5)
+        spec = _spec(client)
+        manager.register(spec)
+        await _until(lambda: manager.get_stats()["standby"] == 1)
+
+        stream = await manager.acquire(spec)
+        assert stream.prewarmed and manager.pool_hits == 1
+        assert client.calls[0].requests == ["config"]  # 설정 요청은 오디오 전에 이미 전송
+        await _until(lambda: manager.get_stats()["standby"] == 1)  # 재충전
+
+        manager.unregister(spec.key)
+        assert manager.get_stats()["standby"] == 0 and client.calls[-1].cancelled
+
+    async def test_standby_expires_before_provider_idle_abort(self):
+        client = _Client()
+        manager = SttStreamManager(pool_size=1, standby_ttl_sec=0.05)
+        manager.register(_spec(client))
+        await _until(lambda: manager.expired_standby >= 1 and manager.get_stats()["standby"] == 1)
+        assert client.calls[0].cancelled
+        manager.unregister("ko-KR:test")
+
+
+class TestSession:
+    def _session(self, manager, client, queue, **kwargs):
+        kwargs.setdefault("max_stream_sec", 60)
+        kwargs.setdefault("rotate_margin_sec", 10)
+        kwargs.setdefault("overlap_ms", 1)  # 16kHz 16bit → 32바이트
+        return SttStreamSession(manager, _spec(client), queue, _consume, sample_rate=16000, **kwargs)
+
+    async def test_opens_before_audio_and_replaces_ended_stream(self):
+        client = _Client()
+        manager = SttStreamManager(pool_size=1, standby_ttl_sec=5)
+        queue = asyncio.Queue()
+        session = self._session(manager, client, queue)
+        task = asyncio.ensure_future(session.run())
+        try:
+            await _until(lambda: session.current is not None)
+            assert client.calls and queue.empty()  # 오디오 전에 이미 스트림 준비
+
+            first = session.current
+            client.calls[0].end()  # 무음 Aborted 등
+            await _until(lambda: session.current is not first)
+            assert session.stream_ends == 1 and session.current.prewarmed
+
+            queue.put_nowait(b"\x01" * 16)
+            await _until(lambda: any(c.audio for c in client.calls))
+            report = session.report_turn()
+            assert report["prewarmed"] and report["stream_ends"] == 1
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        assert manager.get_stats()["active_keys"] == 0
+
+    async def test_rotates_before_limit_with_overlap(self):
+        client = _Client()
+        manager = SttStreamManager(pool_size=1, standby_ttl_sec=5)
+        queue = asyncio.Queue()
+        session = self._session(manager, client, queue, max_stream_sec=0.6, rotate_margin_sec=0.4)
+        task = asyncio.ensure_future(session.run())
+        try:
+            await _until(lambda: session.current is not None)
+            first = session.current
+            old_call = client.calls[0]
+            for i in range(4):
+                queue.put_nowait(bytes([i]) * 16)
+            await _until(lambda: len(old_call.audio) == 4)
+            await _until(lambda: session.rotations == 1, timeout=3.0)
+            # 새 스트림의 요청 소비(overlap 재전송)는 비동기 — 도착할 때까지 대기
+            await _until(lambda: any(c is not old_call and c.audio for c in client.calls))
+
+            new_call = next(c for c in client.calls if c is not old_call and c.audio)
+            assert session.current is not first
+            assert new_call.audio == [bytes([2]) * 16, bytes([3]) * 16]  # 마지막 32바이트 재전송
+            await _until(lambda: old_call.half_closed)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def test_reports_audio_wait_when_stream_not_prewarmed(self):
+        client = _Client(setup_sec=0.05)
+        manager = SttStreamManager(pool_size=0)
+        queue = asyncio.Queue()
+        queue.put_nowait(b"\x00" * 16)
+        session = self._session(manager, client, queue)
+        task = asyncio.ensure_future(session.run())
+        try:
+            await _until(lambda: session.current is not None)
+            report = session.report_turn()
+            assert not report["prewarmed"]
+            assert report["audio_wait_ms"] >= 40 and report["stream_setup_ms"] >= 40
+            assert session.report_turn()["audio_wait_ms"] == 0.0  # 다음 턴은 대기 없음
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        assert manager.get_stats()["setup_ms_p50"] >= 40
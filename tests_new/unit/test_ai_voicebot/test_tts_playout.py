@@ -0,0 +1,79 @@
+"""
+AI Voicebot Unit Tests - TTS 적응형 플레이아웃 버퍼 (pre-roll)
+
+합성이 실시간보다 빠르면 pre-roll만큼 쌓인 뒤 바로 방출을 시작하고, 느리면 남은 예상 길이를
+받는 동안 재생이 끊기지 않을 만큼 모일 때까지(또는 끝까지) 계속 모으는지 가짜 시계로 검증한다.
+"""
+
+from src.ai_voicebot.pipecat.services.tts_playout import TTSPlayoutBuffer, estimate_speech_ms
+
+RATE = 16000
+
+
+class _Frame:
+    def __init__(self, ms=0, tag=""):
+        self.audio = b"\x00\x00" * (RATE * ms // 1000) if ms else None
+        self.sample_rate = RATE
+        self.tag = tag
+
+
+class _Clock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+def _feed(buf, clock, chunks, step_sec):
+    """chunks(ms 목록)를 step_sec 간격으로 넣고, 각 시점에 방출된 프레임 수를 기록."""
+    emitted = []
+    for ms in chunks:
+        clock.t += step_sec
+        emitted.append(len(buf.push(_Frame(ms))))
+    return emitted
+
+
+class TestRelease:
+    def test_fast_stream_releases_after_preroll(self):
+        clock = _Clock()
+        buf = TTSPlayoutBuffer(sample_rate=RATE, preroll_ms=250, expected_ms=3000, clock=clock)
+        assert buf.push(_Frame(tag="started")) == []
+        # 100ms 오디오를 50ms마다 → 2배속
+        emitted = _feed(buf, clock, [100, 100, 100, 100], 0.05)
+        assert emitted == [0, 0, 4, 1]  # started + 3청크 방출, 이후 즉시 통과
+        assert buf.release_reason == "realtime"
+        assert buf.release_buffered_ms == 300
+
+    def test_slow_stream_keeps_collecting_without_estimate(self):
+        clock = _Clock()
+        buf = TTSPlayoutBuffer(sample_rate=RATE, preroll_ms=250, expected_ms=0, clock=clock)
+        # 100ms 오디오를 200ms마다 → 0.5배속
+        assert _feed(buf, clock, [100] * 6, 0.2) == [0] * 6
+        assert len(buf.flush()) == 6
+        assert buf.release_reason == "stream_end"
+
+    def test_slow_stream_released_once_buffer_covers_remaining(self):
+        clock = _Clock()
+        # 예상 1000ms (여유 1.2배 → 1200ms), 0.8배속: 남은 R에 대해 R*(1/0.8-1)=R/4 <= 받은 양
+        buf = TTSPlayoutBuffer(sample_rate=RATE, preroll_ms=200, expected_ms=1000, clock=clock)
+        emitted = _feed(buf, clock, [100] * 4, 0.125)
+        assert emitted[:2] == [0, 0]
+        assert buf.released and buf.release_reason == "buffered_for_slow_stream"
+
+    def test_negative_preroll_collects_everything(self):
+        clock = _Clock()
+        buf = TTSPlayoutBuffer(sample_rate=RATE, preroll_ms=-1, expected_ms=1000, clock=clock)
+        assert _feed(buf, clock, [100] * 5, 0.01) == [0] * 5
+        frames = buf.flush()
+        assert len(frames) == 5 and not buf.released
+
+    def test_short_sentence_flushed_at_end(self):
+        clock = _Clock()
+        buf = TTSPlayoutBuffer(sample_rate=RATE, preroll_ms=250, expected_ms=200, clock=clock)
+        _feed(buf, clock, [80, 80], 0.01)
+        assert len(buf.flush()) == 2
+
+
+def test_estimate_ignores_spaces():
+    assert estimate_speech_ms("안녕 하세요", ms_per_char=100) == 500
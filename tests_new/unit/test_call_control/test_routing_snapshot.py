@@ -0,0 +1,143 @@
+"""
+라우팅 스냅샷 단위 테스트.
+
+스냅샷이 호출 간 DB를 다시 읽지 않는지, CRUD 쓰기(버전 증가) 후 새 규칙이 바로 반영되는지,
+발신자 패턴 trie가 선형 평가와 같은 필터를 고르는지, 공휴일 집합이 (국가, 연도)별로 한 번만 만들어지는지,
+ROUTING_SNAPSHOT=0이면 매 호출 DB를 읽는지를 검증한다.
+"""
+
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+from src.call_control import db as _db
+from src.call_control import routing_engine as engine
+
+
+@pytest.fixture(autouse=True)
+def call_control_db(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALL_CONTROL_DB_PATH", str(tmp_path / "call_control.db"))
+    monkeypatch.delenv("ROUTING_SNAPSHOT", raising=False)
+    _db.init_db()
+    engine.invalidate_routing_snapshots()
+    yield
+    engine.invalidate_routing_snapshots()
+
+
+def _rule(rule_id, priority, schedule_id=None, action="direct"):
+    return _db.create_rule(
+        {"id": rule_id, "owner": "1001", "name": rule_id, "priority": priority,
+         "action": action, "schedule_id": schedule_id}
+    )
+
+
+def _count_reads(monkeypatch):
+    calls = {"n": 0}
+    original = _db.list_rules
+
+    def counting(owner):
+        calls["n"] += 1
+        return original(owner)
+
+    monkeypatch.setattr(_db, "list_rules", counting)
+    return calls
+
+
+def test_snapshot_is_reused_and_rebuilt_on_write(monkeypatch):
+    _db.create_schedule(
+        {"id": "biz", "owner": "1001", "name": "업무", "days": ["mon", "tue", "wed", "thu", "fri"],
+         "time_ranges": [{"start": "09:00", "end": "18:00"}], "timezone": "Asia/Seoul"}
+    )
+    _rule("r-biz", 10, schedule_id="biz", action="direct")
+    _rule("r-ai", 20, action="ai_only")
+    reads = _count_reads(monkeypatch)
+    monday_10_kst = datetime(2026, 1, 5, 1, 0, tzinfo=timezone.utc)
+    monday_20_kst = datetime(2026, 1, 5, 11, 0, tzinfo=timezone.utc)
+
+    assert engine.resolve_rule("1001", now=monday_10_kst)["rule"]["id"] == "r-biz"
+    night = engine.resolve_rule("1001", now=monday_20_kst)
+    assert night["rule"]["id"] == "r-ai" and night["schedule"] is None
+    assert reads["n"] == 1
+
+    _rule("r-first", 1, action="no_answer_ai")
+    assert engine.resolve_rule("1001", now=monday_10_kst)["rule"]["id"] == "r-first"
+    assert reads["n"] == 2
+
+    _db.update_rule("r-first", {"enabled": False})
+    assert engine.resolve_rule("1001", now=monday_10_kst)["rule"]["id"] == "r-biz"
+
+
+def test_returned_dicts_do_not_alias_snapshot():
+    _rule("r-ai", 20, action="ai_only")
+    first = engine.resolve_rule("1001")
+    first["rule"]["action"] = "mutated"
+    assert engine.resolve_rule("1001")["rule"]["action"] == "ai_only"
+
+
+def test_caller_index_matches_linear_scan():
+    rng = random.Random(7)
+    prefixes = ["010", "0101", "+82", "+8210", "02", ""]
+    filters = []
+    for i in range(40):
+        base = rng.choice(prefixes) + "".join(rng.choice("0123456789") for _ in range(rng.randint(0, 4)))
+        filters.append({"id": f"f{i}", "pattern": base + ("*" if rng.random() < 0.6 else "")})
+    index = engine.CallerPatternIndex(filters)
+    for _ in range(500):
+        caller = rng.choice(prefixes) + "".join(rng.choice("0123456789") for _ in range(rng.randint(0, 8)))
+        expected = next((f for f in filters if engine._pattern_matches(f["pattern"], caller)), None)
+        assert index.match(caller) is expected
+
+
+def test_holiday_set_is_memoized(monkeypatch):
+    calls = []
+
+    class _FakeHolidays:
+        @staticmethod
+        def country_holidays(country, years):
+            calls.append((country, years))
+            return {datetime(years, 1, 1).date(): "New Year"}
+
+    monkeypatch.setattr(engine, "_holidays_lib", _FakeHolidays, raising=False)
+    monkeypatch.setattr(engine, "_HOLIDAYS_AVAILABLE", True)
+    monkeypatch.setattr(engine, "_holiday_cache", {})
+    schedule = engine.CompiledSchedule(
+        {"days": ["mon"], "time_ranges": [], "include_holidays": True, "holiday_country": "KR", "timezone": "Asia/Seoul"}
+    )
+    new_year_thursday = datetime(2026, 1, 1, 3, 0, tzinfo=timezone.utc)
+    friday = datetime(2026, 1, 2, 3, 0, tzinfo=timezone.utc)
+    for _ in range(5):
+        assert schedule.matches(new_year_thursday)
+        assert not schedule.matches(friday)
+    assert calls == [("KR", 2026)]
+
+
+def test_snapshot_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("ROUTING_SNAPSHOT", "0")
+    _rule("r-ai", 20, action="ai_only")
+    reads = _count_reads(monkeypatch)
+    for _ in range(3):
+        assert engine.resolve_rule("1001")["rule"]["id"] == "r-ai"
+    assert reads["n"] == 3
+
+
+async def test_async_resolve_builds_off_the_loop_and_reuses_snapshot(monkeypatch):
+    import threading
+
+    _rule("r-ai", 20, action="ai_only")
+    _db.create_caller_filter(
+        {"id": "vip", "owner": "1001", "name": "vip", "pattern": "0101234*", "action": "direct", "priority": 1}
+    )
+    loop_thread = threading.get_ident()
+    build_threads = []
+    original = engine.RoutingSnapshot.build
+
+    def tracking(owner):
+        build_threads.append(threading.get_ident())
+        return original(owner)
+
+    monkeypatch.setattr(engine.RoutingSnapshot, "build", staticmethod(tracking))
+
+    assert (await engine.aresolve_caller_filter("1001", "01012345678"))["id"] == "vip"
+    assert (await engine.aresolve_rule("1001"))["rule"]["id"] == "r-ai"
+    assert len(build_threads) == 1 and build_threads[0] != loop_thread
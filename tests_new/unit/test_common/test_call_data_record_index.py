@@ -0,0 +1,116 @@
+"""
+call_data_record call_id 색인 단위 테스트.
+
+log_call_data가 기록한 줄의 바이트 오프셋이 색인과 일치하는지, 색인 도입 전 로그·외부 추가분의 꼬리 보충,
+삭제·재작성된 파일 정리, 색인 안 된 앞 구간이 있을 때 기록 측 flush가 indexed_bytes를 건너뛰지 않는지,
+재구축 도구와 CDR_INDEX=0 전체 스캔 폴백을 검증한다.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.common import call_data_record_logger as cdr_logger
+from src.common.call_data_record_index import (
+    CallDataRecordIndex,
+    main,
+    read_call_data_records,
+)
+
+
+def _line(call_id: str, ts: str, event: str = "stt_final", **extra) -> str:
+    return json.dumps({"ts": ts, "call_id": call_id, "category": "stt", "event": event, **extra}, ensure_ascii=False) + "\n"
+
+
+@pytest.fixture
+def isolated_logger(tmp_path, monkeypatch):
+    """call_data_record_logger를 tmp_path 로그 디렉터리로 격리."""
+    cdr_logger.close_call_data_record_log()
+    monkeypatch.setattr(cdr_logger, "_log_dir", tmp_path)
+    monkeypatch.setattr(cdr_logger, "_current_date", None)
+    monkeypatch.setattr(cdr_logger, "_broadcast_call_debug_trace", lambda payload: None)
+    yield tmp_path
+    cdr_logger.close_call_data_record_log()
+
+
+class TestLoggerIntegration:
+    def test_logged_lines_are_found_by_offset(self, isolated_logger):
+        cdr_logger.log_call_data("call-a", "stt", "stt_final", text="주차 되나요?")
+        cdr_logger.log_call_data("call-b", "llm", "llm_response", text="네")
+        cdr_logger.log_call_data("call-a", "tts", "tts_started", text="주차장은 지하 2층입니다.")
+        cdr_logger.flush_call_data_record_log()
+
+        rows, truncated = read_call_data_records(isolated_logger, "call-a")
+        assert not truncated
+        assert [r["event"] for r in rows] == ["stt_final", "tts_started"]
+        assert rows[1]["text"] == "주차장은 지하 2층입니다."
+
+        index = CallDataRecordIndex(isolated_logger)
+        log_file = next(isolated_logger.glob("call_data_record_*.log"))
+        assert index.get_stats()["entries"] == 3
+        # 기록 측 색인이 파일 끝까지 덮었으므로 sync가 다시 읽을 것이 없다
+        assert index.sync() == 0
+        with index._connect() as conn:
+            indexed = conn.execute("SELECT indexed_bytes FROM cdr_files WHERE file = ?", (log_file.name,)).fetchone()[0]
+        assert indexed == log_file.stat().st_size
+
+
+class TestBackfill:
+    def test_existing_and_appended_logs_are_synced(self, tmp_path):
+        path = tmp_path / "call_data_record_20260101.log"
+        path.write_text(_line("old-call", "2026-01-01T10:00:00.000") + "not json\n", encoding="utf-8")
+        index = CallDataRecordIndex(tmp_path)
+
+        rows, _ = index.read_records("old-call")
+        assert len(rows) == 1
+
+        with open(path, "a", encoding="utf-8", newline="") as f:
+            f.write(_line("old-call", "2026-01-01T10:00:05.000", event="call_ended"))
+            f.write('{"call_id": "old-call", "ts": "partial')  # 기록 중인 줄은 아직 색인하지 않음
+        rows, _ = index.read_records("old-call")
+        assert [r["event"] for r in rows] == ["stt_final", "call_ended"]
+
+        path.unlink()
+        assert index.read_records("old-call") == ([], False)
+        assert index.get_stats() == {"entries": 0, "files": 0, "pending": 0}
+
+    def test_rewritten_file_is_reindexed(self, tmp_path):
+        path = tmp_path / "call_data_record_20260101.log"
+        path.write_text(_line("c1", "t1") + _line("c1", "t2"), encoding="utf-8")
+        index = CallDataRecordIndex(tmp_path)
+        assert len(index.read_records("c1")[0]) == 2
+        path.write_text(_line("c2", "t3"), encoding="utf-8")
+        assert index.read_records("c1") == ([], False)
+        assert len(index.read_records("c2")[0]) == 1
+
+    def test_writer_flush_does_not_skip_unindexed_prefix(self, tmp_path):
+        path = tmp_path / "call_data_record_20260101.log"
+        before = _line("c1", "t1")
+        after = _line("c1", "t2")
+        path.write_text(before + after, encoding="utf-8")
+        index = CallDataRecordIndex(tmp_path, flush_every=1)
+        # 기록 측은 두 번째 줄만 알고 있다 (첫 줄은 색인 도입 전)
+        index.add("c1", "t2", path.name, len(before.encode()), len(after.encode()))
+        rows, _ = index.read_records("c1")
+        assert [r["ts"] for r in rows] == ["t1", "t2"]
+        assert index.get_stats()["entries"] == 2  # 중복 없음
+
+
+def test_truncated_when_more_rows_than_limit(tmp_path):
+    (tmp_path / "call_data_record_20260101.log").write_text(
+        "".join(_line("c1", f"t{i}") for i in range(5)), encoding="utf-8"
+    )
+    rows, truncated = read_call_data_records(tmp_path, "c1", max_items=3)
+    assert truncated and [r["ts"] for r in rows] == ["t0", "t1", "t2"]
+
+
+def test_rebuild_tool_and_scan_fallback(tmp_path, monkeypatch, capsys):
+    (tmp_path / "call_data_record_20260101.log").write_text(_line("c1", "t1") + _line("c2", "t2"), encoding="utf-8")
+    assert main(["--log-dir", str(tmp_path), "--rebuild"]) == 0
+    assert "2 entries / 1 files" in capsys.readouterr().out
+
+    monkeypatch.setenv("CDR_INDEX", "0")
+    rows, truncated = read_call_data_records(tmp_path, "c2")
+    assert [r["ts"] for r in rows] == ["t2"] and not truncated
@@ -0,0 +1,108 @@
+"""
+call_data_record 백그라운드 writer 단위 테스트.
+
+log_call_data가 호출 스레드에서 파일을 쓰지 않고 큐에 넣는지(호출 시점 스냅샷), 배치 기록·브로드캐스트 순서,
+큐 한도 초과 시 드롭 집계, 크기 회전(.1.log)과 회전분을 포함한 일자별 경로 조회,
+close 시 큐 비우기와 CDR_ASYNC_WRITER=0 즉시 기록을 검증한다.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.common import call_data_record_logger as cdr_logger
+from src.common.call_data_record_index import read_call_data_records
+from src.common.call_history_reader import get_call_data_record_log_paths
+
+
+@pytest.fixture
+def writer(tmp_path, monkeypatch):
+    """writer를 tmp_path 로그 디렉터리로 격리하고 브로드캐스트를 수집."""
+    cdr_logger.close_call_data_record_log()
+    broadcasts = []
+    monkeypatch.setattr(cdr_logger, "_log_dir", tmp_path)
+    monkeypatch.setattr(cdr_logger, "_current_date", None)
+    monkeypatch.setattr(cdr_logger, "_broadcast_call_debug_trace", broadcasts.append)
+    monkeypatch.setattr(cdr_logger, "_stats", dict.fromkeys(cdr_logger._stats, 0))
+    monkeypatch.setenv("CDR_FLUSH_INTERVAL_MS", "60000")  # 테스트가 flush 시점을 정한다
+    monkeypatch.setenv("CDR_BATCH_SIZE", "1000")
+    yield tmp_path, broadcasts
+    cdr_logger.close_call_data_record_log()
+
+
+def _lines(paths):
+    return [json.loads(line) for p in paths for line in p.read_text(encoding="utf-8").splitlines()]
+
+
+def test_records_are_queued_then_written_in_one_batch(writer):
+    log_dir, broadcasts = writer
+    for i in range(3):
+        cdr_logger.log_call_data("call-a", "stt", "stt_final", seq=i)
+    assert not list(log_dir.glob("call_data_record_*.log"))  # 호출 스레드는 파일을 쓰지 않음
+    assert cdr_logger.get_call_data_record_writer_stats()["queue_depth"] == 3
+
+    assert cdr_logger.flush_call_data_record_log() == 3
+    stats = cdr_logger.get_call_data_record_writer_stats()
+    assert stats["written"] == 3 and stats["batches"] == 1 and stats["queue_depth"] == 0
+    assert [b["seq"] for b in broadcasts] == [0, 1, 2]
+    rows, _ = read_call_data_records(log_dir, "call-a")
+    assert [r["seq"] for r in rows] == [0, 1, 2]
+
+
+def test_record_is_snapshot_at_call_time(writer):
+    log_dir, broadcasts = writer
+    hits = [{"doc_id": "a", "score": 0.9}]
+    trace = {"where": {"owner": "1004"}}
+    cdr_logger.log_call_data("call-a", "rag", "rag_search_done", rag_hits=hits, rag_search_trace=trace)
+    hits.append({"doc_id": "b"})  # 호출부가 이후에 값을 고쳐도
+    hits[0]["score"] = 0.1
+    trace["where"]["owner"] = "9999"
+    cdr_logger.flush_call_data_record_log()
+    rows, _ = read_call_data_records(log_dir, "call-a")
+    assert rows[0]["rag_hits"] == [{"doc_id": "a", "score": 0.9}]
+    assert rows[0]["rag_search_trace"] == {"where": {"owner": "1004"}}
+    assert broadcasts[0]["rag_hits"] == [{"doc_id": "a", "score": 0.9}]
+
+
+def test_full_queue_drops_new_records(writer, monkeypatch):
+    monkeypatch.setenv("CDR_QUEUE_MAX", "2")
+    for i in range(5):
+        cdr_logger.log_call_data("call-a", "stt", "stt_partial", seq=i)
+    stats = cdr_logger.get_call_data_record_writer_stats()
+    assert stats["dropped"] == 3 and stats["queue_depth"] == 2
+    cdr_logger.close_call_data_record_log()  # close가 남은 큐를 기록
+    log_dir, _ = writer
+    assert [r["seq"] for r in _lines(log_dir.glob("call_data_record_*.log"))] == [0, 1]
+
+
+def test_size_rotation_and_dated_paths(writer, monkeypatch):
+    log_dir, _ = writer
+    monkeypatch.setenv("CDR_LOG_MAX_MB", str(300 / (1024 * 1024)))  # 약 300바이트
+    for i in range(6):
+        cdr_logger.log_call_data(f"call-{i % 2}", "llm", "llm_response", text="가" * 40, seq=i)
+    cdr_logger.flush_call_data_record_log()
+
+    day = cdr_logger._current_date
+    paths = cdr_logger.call_data_record_log_paths(log_dir, day)
+    assert [p.name for p in paths][:2] == [f"call_data_record_{day}.log", f"call_data_record_{day}.1.log"]
+    assert cdr_logger.get_call_data_record_writer_stats()["rotations"] >= 1
+    assert [r["seq"] for r in _lines(paths)] == list(range(6))
+    assert get_call_data_record_log_paths(log_dir, day, day) == paths
+    rows, _ = read_call_data_records(log_dir, "call-1")  # 색인은 회전된 파일 오프셋도 가리킨다
+    assert [r["seq"] for r in rows] == [1, 3, 5]
+
+
+def test_sync_mode_writes_on_caller_thread(writer, monkeypatch):
+    log_dir, broadcasts = writer
+    monkeypatch.setenv("CDR_ASYNC_WRITER", "0")
+    cdr_logger.log_call_data("call-a", "call_event", "call_ended")
+    assert [r["event"] for r in _lines(log_dir.glob("call_data_record_*.log"))] == ["call_ended"]
+    assert len(broadcasts) == 1 and not cdr_logger.get_call_data_record_writer_stats()["running"]
+
+
+def test_parse_call_data_record_name():
+    assert cdr_logger.parse_call_data_record_name("call_data_record_20260314.log") == ("20260314", 0)
+    assert cdr_logger.parse_call_data_record_name("call_data_record_20260314.12.log") == ("20260314", 12)
+    assert cdr_logger.parse_call_data_record_name("call_data_record_index.db") is None
@@ -0,0 +1,91 @@
+"""
+녹음 디렉터리 카탈로그 단위 테스트.
+
+녹음기 upsert 후 PK 조회, refresh가 새·바뀐 디렉터리만 읽고 사라진 디렉터리를 지우는지, miss refresh 간격,
+통화 이력용 metadata_rows, recording_paths 연동과 RECORDINGS_CATALOG=0 디렉터리 스캔 폴백을 검증한다.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+
+from src.api.utils import recording_paths
+from src.common import recordings_catalog as rc
+from src.common.recordings_catalog import RecordingsCatalog, record_finalized_recording
+
+
+def _make_session(root, name, call_id, **meta):
+    d = root / name
+    d.mkdir()
+    (d / "mixed.wav").write_bytes(b"RIFF" + b"\x00" * 40)
+    (d / "notes.txt").write_text("x", encoding="utf-8")
+    (d / "metadata.json").write_text(
+        json.dumps({"call_id": call_id, "duration": 12.5, **meta}), encoding="utf-8"
+    )
+    return d
+
+
+def test_upsert_then_lookup_returns_files_and_duration(tmp_path):
+    catalog = RecordingsCatalog(tmp_path)
+    catalog.refresh(force=True)
+    d = _make_session(tmp_path, "20260101_100000_a", "call-a")
+    assert catalog.upsert_directory(d) == "call-a"
+
+    entry = catalog.get("call-a")
+    assert entry["directory"] == d and entry["duration"] == 12.5
+    assert entry["files"] == [{"name": "mixed.wav", "size_bytes": 44, "mime": "audio/wav"}]
+    assert catalog.get_stats()["entries"] == 1
+
+
+def test_refresh_reads_only_changed_and_drops_removed(tmp_path):
+    _make_session(tmp_path, "s1", "c1")
+    d2 = _make_session(tmp_path, "s2", "c2")
+    (tmp_path / ".hidden").mkdir()
+    catalog = RecordingsCatalog(tmp_path)
+    assert catalog.refresh(force=True) == {"scanned": 2, "updated": 2, "removed": 0}
+    assert catalog.refresh(force=True)["updated"] == 0  # mtime 그대로면 다시 읽지 않음
+
+    shutil.rmtree(d2)
+    _make_session(tmp_path, "s3", "c3")
+    assert catalog.refresh(force=True) == {"scanned": 2, "updated": 1, "removed": 1}
+    assert catalog.get("c2") is None
+    assert catalog.find_call_dir("c3") == tmp_path / "s3"
+
+
+def test_miss_refresh_is_throttled(tmp_path):
+    catalog = RecordingsCatalog(tmp_path, refresh_interval_sec=3600, miss_refresh_sec=3600)
+    assert catalog.get("late") is None  # 첫 miss → refresh (빈 루트)
+    catalog._root_mtime_ns = 0
+    catalog._last_refresh = 0.0
+    _make_session(tmp_path, "s1", "late")
+    before = catalog.refreshes
+    assert catalog.get("late") is None  # 간격 안의 miss는 refresh하지 않음
+    assert catalog.refreshes == before
+
+    catalog._last_miss_refresh = 0.0
+    assert catalog.get("late")["directory"] == tmp_path / "s1"
+
+
+def test_metadata_rows_include_call_dir(tmp_path):
+    d = _make_session(tmp_path, "s1", "c1", caller_id="1001")
+    rows = RecordingsCatalog(tmp_path).metadata_rows()
+    assert rows == [{"call_id": "c1", "duration": 12.5, "caller_id": "1001", "_call_dir": str(d)}]
+
+
+def test_recording_paths_use_catalog_and_scan_fallback(tmp_path, monkeypatch):
+    monkeypatch.setattr(rc, "_catalogs", {})
+    d = _make_session(tmp_path, "s1", "c1")
+    record_finalized_recording(tmp_path, d)
+    catalog = rc.get_recordings_catalog(tmp_path)
+    assert catalog is not None and catalog.get_stats()["entries"] == 1
+
+    assert recording_paths.find_call_directory("c1", str(tmp_path)) == d.resolve()
+    entry = recording_paths.get_call_recording_entry("c1", str(tmp_path))
+    assert [f["name"] for f in entry["files"]] == ["mixed.wav"]
+
+    monkeypatch.setenv("RECORDINGS_CATALOG", "0")
+    assert rc.get_recordings_catalog(tmp_path) is None
+    assert recording_paths.find_call_directory("c1", str(tmp_path)) == tmp_path / "s1"
+    entry = recording_paths.get_call_recording_entry("c1", str(tmp_path))
+    assert entry["directory"] == tmp_path / "s1" and entry["files"][0]["mime"] == "audio/wav"
@@ -0,0 +1,208 @@
+"""
+공유 SQLite 풀 단위 테스트.
+
+close()가 연결을 닫지 않고 반납해 재사용되는지, 커밋 안 된 쓰기는 반납 시 롤백되는지,
+PRAGMA가 연결 생성 시 적용되는지, connection()이 예외 시 롤백하는지, writer가 스레드 간 직렬화되고
+중첩 대여는 바깥 트랜잭션에 합류하는지, arun()/to_thread()가 executor에서 실행되는지, 여러 스레드에서
+갱신한 통계가 빠지지 않는지, 느린 쿼리가 집계되는지, booking·call_control·calls.db·caller_contacts
+계층이 풀을 쓰는지를 검증한다.
+"""
+
+import contextvars
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from src.common import sqlite_pool
+from src.common.sqlite_pool import SQLitePool
+
+
+@pytest.fixture
+def pool(tmp_path):
+    p = SQLitePool(tmp_path / "t.db", readers=2)
+    with p.connection() as conn:
+        conn.execute("CREATE TABLE t (k TEXT PRIMARY KEY, v INTEGER)")
+    yield p
+    p.close()
+
+
+def test_close_returns_connection_for_reuse(pool):
+    conn = pool.acquire()
+    conn.execute("INSERT INTO t VALUES ('a', 1)")
+    conn.commit()
+    conn.close()
+    conn.close()  # 중복 close는 무시
+    again = pool.acquire(row_factory=sqlite3.Row)
+    assert again is conn
+    assert again.execute("SELECT v FROM t WHERE k = 'a'").fetchone()["v"] == 1
+    again.close()
+    stats = pool.get_stats()
+    assert stats["opened"] == 1 and stats["reused"] >= 2 and stats["idle"] == 1
+
+
+def test_uncommitted_write_is_rolled_back_on_release(pool):
+    conn = pool.acquire()
+    conn.execute("INSERT INTO t VALUES ('lost', 1)")
+    conn.close()
+    with pool.connection() as reader:
+        assert reader.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_pragmas_are_applied_once_per_connection(pool):
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] < 0
+
+
+def test_connection_context_rolls_back_on_error(pool):
+    with pytest.raises(RuntimeError):
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO t VALUES ('x', 1)")
+            raise RuntimeError("abort")
+    with pool.connection() as conn:
+        conn.execute("INSERT INTO t VALUES ('z', 3)")
+    with pool.connection() as conn:
+        assert [r[0] for r in conn.execute("SELECT k FROM t")] == ["z"]
+
+
+def test_nested_write_joins_outer_transaction(pool):
+    with pytest.raises(RuntimeError):
+        with pool.write() as outer:
+            outer.execute("INSERT INTO t VALUES ('x', 1)")
+            with pool.write() as inner:
+                assert inner is outer
+                inner.execute("INSERT INTO t VALUES ('y', 2)")
+            raise RuntimeError("abort")
+    with pool.write() as conn:
+        conn.execute("INSERT INTO t VALUES ('z', 3)")
+    with pool.read() as conn:
+        assert [r[0] for r in conn.execute("SELECT k FROM t")] == ["z"]
+
+
+def test_writer_is_serialized_across_threads(pool):
+    order = []
+    first_in = threading.Event()
+
+    def slow_writer():
+        conn = pool.acquire_writer()
+        try:
+            first_in.set()
+            order.append("a-start")
+            time.sleep(0.1)
+            conn.execute("INSERT INTO t VALUES ('a', 1)")
+            conn.commit()
+            order.append("a-end")
+        finally:
+            conn.close()
+
+    t = threading.Thread(target=slow_writer)
+    t.start()
+    first_in.wait(1.0)
+    conn = pool.acquire_writer()  # 다른 스레드가 반납할 때까지 대기
+    order.append("b")
+    conn.close()
+    conn.close()  # 중복 close는 무시
+    t.join()
+    assert order == ["a-start", "a-end", "b"]
+    stats = pool.get_stats()
+    assert stats["writer_acquired"] == 2 and stats["has_writer"]
+
+
+def test_writer_close_rolls_back_uncommitted(pool):
+    conn = pool.acquire_writer()
+    conn.execute("INSERT INTO t VALUES ('lost', 1)")
+    conn.close()
+    with pool.read() as reader:
+        assert reader.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+async def test_arun_runs_off_the_event_loop(pool):
+    loop_thread = threading.get_ident()
+
+    def work(conn):
+        conn.execute("INSERT INTO t VALUES ('async', 7)")
+        return threading.get_ident()
+
+    worker_thread = await pool.arun(work, write=True)
+    assert worker_thread != loop_thread
+    assert await pool.arun(lambda c: c.execute("SELECT v FROM t WHERE k='async'").fetchone()[0]) == 7
+
+
+async def test_module_arun_and_to_thread_propagate_context(tmp_path):
+    var = contextvars.ContextVar("var", default="")
+    var.set("turn-1")
+    path = tmp_path / "m.db"
+    await sqlite_pool.arun(path, lambda c: c.execute("CREATE TABLE m (v TEXT)"), write=True)
+    await sqlite_pool.arun(path, lambda c: c.execute("INSERT INTO m VALUES (?)", (var.get(),)), write=True)
+    assert await sqlite_pool.arun(path, lambda c: c.execute("SELECT v FROM m").fetchone()[0]) == "turn-1"
+    assert await sqlite_pool.to_thread(var.get) == "turn-1"
+
+
+def test_stats_are_consistent_across_threads(pool):
+    before = pool.get_stats()
+
+    def work():
+        for _ in range(200):
+            conn = pool.acquire()
+            conn.execute("SELECT 1").fetchone()
+            conn.close()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = pool.get_stats()
+    assert stats["acquired"] - before["acquired"] == 1600
+    assert stats["queries"] - before["queries"] == 1600
+    assert stats["opened"] - stats["closed"] == stats["idle"]
+
+
+def test_slow_queries_are_counted(pool):
+    pool.slow_query_ms = 0.0
+    with pool.connection() as conn:
+        conn.execute("SELECT 1").fetchone()
+    assert pool.get_stats()["slow_queries"] >= 1
+
+
+def test_booking_layer_uses_pool(tmp_path, monkeypatch):
+    from src.booking import database as booking_db
+
+    monkeypatch.setattr(booking_db, "_DB_PATH", str(tmp_path / "booking.db"))
+    booking_db.init_db()
+    with booking_db.get_db() as conn:
+        first = conn
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    with booking_db.get_db() as conn:
+        assert conn is first
+        assert isinstance(conn.execute("SELECT 1 AS one").fetchone(), sqlite3.Row)
+    assert sqlite_pool.get_sqlite_pool(tmp_path / "booking.db").get_stats()["reused"] >= 1
+
+
+def test_data_layer_writes_go_through_the_writer(tmp_path, monkeypatch):
+    from src.booking import database as booking_db
+    from src.call_control import db as call_control_db
+    from src.common import caller_contact_db
+    from src.db import sqlite as calls_db
+
+    monkeypatch.setattr(booking_db, "_DB_PATH", str(tmp_path / "booking.db"))
+    monkeypatch.setenv("CALL_CONTROL_DB_PATH", str(tmp_path / "call_control.db"))
+    monkeypatch.setenv("SQLITE_DB_PATH", str(tmp_path / "calls.db"))
+    booking_db.init_db()
+    call_control_db.init_db()
+    calls_db.init_db()
+
+    assert caller_contact_db.insert_caller_contact_manual(
+        owner="1004", canonical_phone="01012345678", display_name="홍길동"
+    )
+    assert caller_contact_db.get_caller_contact("1004", "01012345678")["display_name"] == "홍길동"
+    call_control_db.create_rule({"id": "r1", "owner": "1004", "name": "r1", "action": "direct"})
+    calls_db.save_call_summary("1004", "01012345678", "call-1", "요약")
+
+    for name in ("booking.db", "call_control.db", "calls.db"):
+        stats = sqlite_pool.get_sqlite_pool(tmp_path / name).get_stats()
+        assert stats["writer_acquired"] >= 1 and stats["has_writer"], name
+    assert sqlite_pool.get_sqlite_pool(tmp_path / "booking.db").get_stats()["reused"] >= 1
@@ -0,0 +1,124 @@
+"""
+tests_new/unit/test_events 공통 설정.
+
+- event_store·webhook은 `src.ai.event_models`(AIEvent/EventType/SeverityLevel)를 import하는데, 이 트리에는
+  `src.ai` 패키지가 없다. 실제 모듈을 import할 수 없을 때만 테스트에 필요한 최소 정의를 sys.modules에 넣어
+  두 모듈을 수집·실행할 수 있게 한다 (실제 모듈이 있으면 그대로 쓴다).
+- receiver: webhook 전송 테스트용 로컬 aiohttp 수신 서버
+"""
+
+import asyncio
+import enum
+import importlib
+import socket
+import sys
+import types
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict
+
+import pytest
+from aiohttp import web
+
+
+def _install_event_models_stub():
+    try:
+        importlib.import_module("src.ai.event_models")
+        return
+    except ImportError:
+        pass
+
+    class EventType(str, enum.Enum):
+        PROFANITY_DETECTED = "profanity_detected"
+        ANGER_DETECTED = "anger_detected"
+        THREATENING_LANGUAGE = "threatening_language"
+        CALL_ENDED = "call_ended"
+
+    class SeverityLevel(str, enum.Enum):
+        LOW = "low"
+        MEDIUM = "medium"
+        HIGH = "high"
+        CRITICAL = "critical"
+
+    @dataclass
+    class AIEvent:
+        event_id: str
+        event_type: EventType
+        call_id: str
+        direction: str
+        timestamp: float
+        confidence: float
+        severity: SeverityLevel
+        details: Dict[str, Any] = field(default_factory=dict)
+        text: str = ""
+        created_at: datetime = field(default_factory=datetime.utcnow)
+
+        def to_dict(self) -> Dict[str, Any]:
+            data = asdict(self)
+            data["event_type"] = self.event_type.value
+            data["severity"] = self.severity.value
+            data["created_at"] = self.created_at.isoformat()
+            return data
+
+    models = types.ModuleType("src.ai.event_models")
+    models.AIEvent = AIEvent
+    models.EventType = EventType
+    models.SeverityLevel = SeverityLevel
+    package = sys.modules.get("src.ai")
+    if package is None:
+        package = types.ModuleType("src.ai")
+        package.__path__ = []
+        sys.modules["src.ai"] = package
+    package.event_models = models
+    sys.modules["src.ai.event_models"] = models
+
+
+_install_event_models_stub()
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class _Receiver:
+    def __init__(self):
+        self.port = _free_port()
+        self.bodies = []
+        self.requests = 0
+        self.fail_remaining = 0
+        self.delay = 0.0
+        self.runner = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.port}/hook"
+
+    async def handle(self, request):
+        self.requests += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail_remaining > 0:
+            self.fail_remaining -= 1
+            return web.Response(status=503)
+        self.bodies.append(await request.json())
+        return web.Response(status=204)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/hook", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, "127.0.0.1", self.port).start()
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+@pytest.fixture
+async def receiver():
+    r = _Receiver()
+    await r.start()
+    yield r
+    await r.stop()
@@ -0,0 +1,96 @@
+"""
+CDR 세그먼트 기록·압축·조회 단위 테스트.
+
+열린 핸들 재사용과 fsync 그룹 커밋, 크기 회전(.1.jsonl), 닫힌 세그먼트의 SQLite 압축(재압축 시 중복 없음),
+기간·내선·종료 사유 조회가 압축분과 현재 세그먼트를 합쳐 돌려주는지, pretty_json 세그먼트 읽기를 검증한다.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.events.cdr import CDR, CDRWriter, TerminationReason
+from src.events.cdr_store import CDRStore, iter_segment_records, sip_user
+
+
+def _cdr(i, caller="1001", callee="1002", reason=TerminationReason.NORMAL):
+    return CDR(
+        call_id=f"call-{i}",
+        caller=f"sip:{caller}@10.0.0.1",
+        callee=f"sip:{callee}@10.0.0.2",
+        start_time=datetime(2026, 1, 8, 12, i),
+        termination_reason=reason,
+        metadata={"note": "가" * 20},
+    )
+
+
+@pytest.fixture
+def writer(tmp_path):
+    w = CDRWriter(str(tmp_path), max_file_mb=600 / (1024 * 1024), fsync_every=2)
+    yield w
+    w.close()
+
+
+def test_handle_is_reused_and_fsync_is_grouped(tmp_path):
+    writer = CDRWriter(str(tmp_path), fsync_every=3, fsync_interval_sec=3600)
+    writer.write_cdr(_cdr(0))
+    handle = writer._handle
+    for i in range(1, 6):
+        writer.write_cdr(_cdr(i))
+    assert writer._handle is handle
+    assert writer.stats["fsyncs"] == 2
+    assert [r["call_id"] for r in iter_segment_records(writer.current_path)] == [f"call-{i}" for i in range(6)]
+    writer.close()
+
+
+def test_rotates_by_size_and_compacts_closed_segments(writer, tmp_path):
+    for i in range(5):
+        writer.write_cdr(_cdr(i))
+    segments = sorted(p.name for p in tmp_path.glob("cdr-*.jsonl"))
+    assert len(segments) >= 2 and writer.stats["segments_rotated"] >= 1
+    assert any(".1.jsonl" in name for name in segments)
+
+    added = writer.compact()
+    store = CDRStore(tmp_path / "cdr_store.db")
+    assert store.get_stats()["records"] == writer.stats["records_compacted"]
+    assert added + writer.stats["records_compacted"] >= 1
+    assert writer.compact() == 0  # 이미 압축된 세그먼트는 건너뜀
+
+    rows = writer.query()
+    assert [r["call_id"] for r in rows] == [f"call-{i}" for i in range(5)]  # 압축분 + 현재 세그먼트
+
+
+def test_query_filters(writer):
+    writer.write_cdr(_cdr(0, caller="1001", callee="2001"))
+    writer.write_cdr(_cdr(1, caller="3001", callee="1001", reason=TerminationReason.CANCEL))
+    writer.write_cdr(_cdr(2, caller="3001", callee="2001"))
+    writer.write_cdr(_cdr(3, caller="4001", callee="2001", reason=TerminationReason.CANCEL))
+
+    assert [r["call_id"] for r in writer.query(extension="1001")] == ["call-0", "call-1"]
+    assert [r["call_id"] for r in writer.query(termination_reason=TerminationReason.CANCEL)] == ["call-1", "call-3"]
+    assert [r["call_id"] for r in writer.query(caller="sip:3001@10.0.0.1")] == ["call-1", "call-2"]
+    window = writer.query(start=datetime(2026, 1, 8, 12, 1), end=datetime(2026, 1, 8, 12, 3))
+    assert [r["call_id"] for r in window] == ["call-1", "call-2"]
+    assert [r["call_id"] for r in writer.query(callee="2001", limit=2)] == ["call-0", "call-2"]
+
+
+def test_recompacting_changed_segment_replaces_rows(tmp_path):
+    store = CDRStore(tmp_path / "cdr_store.db")
+    path = tmp_path / "cdr-2026-01-08.jsonl"
+    path.write_text(_cdr(0).to_json() + "\n", encoding="utf-8")
+    assert store.compact_segment(path) == 1
+    path.write_text(_cdr(0).to_json() + "\n" + _cdr(1).to_json() + "\n", encoding="utf-8")
+    assert not store.is_compacted(path)
+    assert store.compact_segment(path) == 2
+    assert store.get_stats() == {"records": 2, "segments": 1}
+
+
+def test_pretty_json_segments_and_sip_user(tmp_path):
+    writer = CDRWriter(str(tmp_path), pretty_json=True, compact=False)
+    writer.write_cdr(_cdr(0))
+    writer.write_cdr(_cdr(1))
+    writer.close()
+    assert [r["call_id"] for r in writer.query(extension="1002")] == ["call-0", "call-1"]
+    assert not (tmp_path / "cdr_store.db").exists()
+    assert sip_user("<sip:1001@10.0.0.1;transport=udp>") == "1001"
+    assert sip_user("1001") == "1001"
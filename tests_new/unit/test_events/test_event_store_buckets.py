@@ -0,0 +1,92 @@
+"""
+EventStore 시간 버킷·보조 인덱스 단위 테스트.
+
+보존 기간이 지난 버킷 통째 만료, (created_at, 삽입 순) 커서 페이지, max_events 초과 시 가장 오래된
+버킷 축출, 통화별 삭제 후 다른 인덱스 정합성을 검증한다.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.ai.event_models import AIEvent, EventType, SeverityLevel
+from src.events.event_store import EventStore
+
+
+@pytest.fixture
+def event_store():
+    return EventStore(retention_hours=24)
+
+
+def _event(i, call_id="call-b", created_at=None, severity=SeverityLevel.MEDIUM):
+    event = AIEvent(
+        event_id=f"bucket-{i}",
+        event_type=EventType.PROFANITY_DETECTED,
+        call_id=call_id,
+        direction="caller",
+        timestamp=0.0,
+        confidence=0.8,
+        severity=severity,
+    )
+    if created_at is not None:
+        event.created_at = created_at
+    return event
+
+
+def test_expires_whole_buckets():
+    store = EventStore(retention_hours=1, bucket_seconds=600)
+    now = datetime.utcnow()
+    for i in range(3):
+        store.add_event(_event(i, created_at=now - timedelta(hours=3) + timedelta(seconds=i)))
+    store.add_event(_event(9, created_at=now))
+
+    assert store.cleanup_old_events() == 3
+    stats = store.get_stats()
+    assert stats["buckets_expired"] == 1 and stats["bucket_count"] == 1
+    assert [e.event_id for e in store.get_events_by_call("call-b")] == ["bucket-9"]
+    assert store.get_events_by_severity(SeverityLevel.MEDIUM)[0].event_id == "bucket-9"
+
+
+def test_cursor_pagination_in_time_order(event_store):
+    now = datetime.utcnow()
+    for i in reversed(range(5)):  # 과거 시각 이벤트가 나중에 들어와도 시간 순
+        event_store.add_event(_event(i, created_at=now - timedelta(minutes=10 - i)))
+
+    page, cursor = event_store.query_events(call_id="call-b", limit=2)
+    assert [e.event_id for e in page] == ["bucket-0", "bucket-1"]
+    page, cursor = event_store.query_events(call_id="call-b", limit=2, cursor=cursor)
+    assert [e.event_id for e in page] == ["bucket-2", "bucket-3"]
+    page, cursor = event_store.query_events(call_id="call-b", limit=2, cursor=cursor)
+    assert [e.event_id for e in page] == ["bucket-4"] and cursor is None
+
+
+def test_max_events_evicts_oldest_bucket():
+    store = EventStore(bucket_seconds=60, max_events=3)
+    now = datetime.utcnow()
+    store.add_event(_event(0, created_at=now - timedelta(minutes=5)))
+    store.add_event(_event(1, created_at=now - timedelta(minutes=5)))
+    store.add_event(_event(2, created_at=now))
+    store.add_event(_event(3, created_at=now))
+
+    stats = store.get_stats()
+    assert stats["events_evicted"] == 2 and stats["buckets_evicted"] == 1
+    assert store.get_event("bucket-0") is None and store.get_event_count() == 2
+
+
+def test_delete_by_call_keeps_other_indexes_consistent(event_store):
+    event_store.add_event(_event(0, call_id="call-x", severity=SeverityLevel.HIGH))
+    event_store.add_event(_event(1, call_id="call-y", severity=SeverityLevel.HIGH))
+    event_store.delete_events_by_call("call-x")
+
+    assert [e.event_id for e in event_store.get_events_by_severity(SeverityLevel.HIGH)] == ["bucket-1"]
+    assert [e.event_id for e in event_store.filter_events(event_type=EventType.PROFANITY_DETECTED)] == ["bucket-1"]
+
+
+def test_time_range_filter_reads_only_matching_buckets(event_store):
+    now = datetime.utcnow()
+    event_store.add_event(_event(0, created_at=now - timedelta(hours=2)))
+    event_store.add_event(_event(1, created_at=now - timedelta(minutes=30)))
+    event_store.add_event(_event(2, created_at=now))
+
+    events = event_store.filter_events(start_time=now - timedelta(hours=1), end_time=now - timedelta(minutes=1))
+    assert [e.event_id for e in events] == ["bucket-1"]
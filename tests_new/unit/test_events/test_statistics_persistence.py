@@ -0,0 +1,77 @@
+"""
+StatisticsCollector 저장·복원 단위 테스트.
+
+주기 저장 파일로 통화·이벤트·키워드·분 단위 시계열이 복원되는지, 진행 중 통화는 저장하지 않는지,
+STATISTICS_PERSIST=0이면 시작 시 복원하지 않는지를 검증한다.
+"""
+
+import pytest
+
+from src.ai.event_models import AIEvent, EventType, SeverityLevel
+from src.events import statistics as statistics_module
+from src.events.statistics import StatisticsCollector, get_statistics
+
+
+@pytest.fixture
+def statistics(tmp_path, monkeypatch):
+    """tmp_path에 저장하는 새 수집기 (싱글턴을 테스트 동안만 교체)"""
+    monkeypatch.setenv("STATISTICS_STATE_PATH", str(tmp_path / "statistics_state.json"))
+    monkeypatch.setattr(StatisticsCollector, "_instance", None)
+    return get_statistics()
+
+
+def _event(event_id="persist-event", keywords=("환불",)):
+    return AIEvent(
+        event_id=event_id,
+        event_type=EventType.ANGER_DETECTED,
+        call_id="persist-call",
+        direction="caller",
+        timestamp=0.0,
+        confidence=0.9,
+        severity=SeverityLevel.HIGH,
+        details={"keywords": list(keywords)},
+    )
+
+
+def test_save_and_load_state(statistics):
+    statistics.start_call("persist-call")
+    statistics.end_call("persist-call", 42.0)
+    statistics.start_call("live-call")
+    statistics.record_event(_event())
+    assert statistics.save_state()
+
+    statistics.reset_stats()
+    assert statistics.load_state()
+    assert statistics.get_event_counts()["anger"] == 1
+    assert statistics.get_top_keywords(1) == [{"keyword": "환불", "count": 1}]
+    assert statistics.total_calls_today == 2
+    assert statistics.get_average_call_duration() == 42.0
+    assert sum(p["count"] for p in statistics.get_minute_timeseries(5)) == 1
+    assert statistics.get_active_call_count() == 0  # 진행 중 통화는 저장하지 않음
+
+
+def test_new_collector_restores_saved_state(statistics, monkeypatch):
+    statistics.record_event(_event())
+    assert statistics.save_state()
+
+    monkeypatch.setattr(StatisticsCollector, "_instance", None)
+    assert get_statistics().get_event_counts()["anger"] == 1
+
+
+def test_persist_disabled_skips_restore(statistics, monkeypatch):
+    statistics.record_event(_event())
+    assert statistics.save_state()
+
+    monkeypatch.setenv("STATISTICS_PERSIST", "0")
+    monkeypatch.setattr(StatisticsCollector, "_instance", None)
+    restored = get_statistics()
+    assert restored.get_event_counts()["anger"] == 0
+    assert not statistics_module._persist_enabled()
+
+
+def test_keyword_tracking_is_bounded(statistics):
+    for i in range(statistics_module.KEYWORD_CAPACITY + 50):
+        statistics.record_event(_event(f"kw-{i}", keywords=(f"kw-{i}", "환불")))
+
+    assert len(statistics.keyword_counts) == statistics_module.KEYWORD_CAPACITY
+    assert statistics.get_top_keywords(1)[0]["keyword"] == "환불"
@@ -0,0 +1,65 @@
+"""
+대시보드 통계용 고정 크기 카운터 단위 테스트.
+
+RingCounter가 원형 범위를 넘은 버킷을 덮어쓰고 오래된 값을 무시하는지, 상태 저장·복원,
+SpaceSaving이 capacity개만 추적하면서 빈도 높은 키를 상위에 유지하는지를 검증한다.
+"""
+
+from src.events.stream_counters import RingCounter, SpaceSaving
+
+
+class TestRingCounter:
+    def test_series_and_wraparound(self):
+        ring = RingCounter(slot_seconds=60, slots=5)
+        for minute in range(8):
+            ring.add(minute * 60 + 1, n=minute + 1)
+        # 최근 5분(3~7)만 남고 0~2분 슬롯은 덮어써짐
+        assert ring.series(7 * 60, 5) == [(3, 4), (4, 5), (5, 6), (6, 7), (7, 8)]
+        assert ring.get(2) == 0
+        ring.add(0)  # 범위 밖 과거 값은 무시
+        assert ring.get(0) == 0 and ring.get(5) == 6
+        assert ring.total_since(6, 7 * 60) == 15
+        assert len(ring.series(7 * 60, 100)) == 5
+
+    def test_state_roundtrip(self):
+        ring = RingCounter(3600, 24)
+        ring.add(10 * 3600, 3)
+        restored = RingCounter(3600, 24)
+        restored.load_state(ring.to_state())
+        assert restored.get(10) == 3
+        other = RingCounter(60, 24)
+        other.load_state(ring.to_state())  # 슬롯 크기가 다르면 무시
+        assert other.get(10) == 0
+
+
+class TestSpaceSaving:
+    def test_bounded_and_keeps_heavy_hitters(self):
+        sketch = SpaceSaving(capacity=3)
+        for _ in range(50):
+            sketch.add("환불")
+        for _ in range(30):
+            sketch.add("주차")
+        for i in range(25):  # 노이즈 슬롯은 최솟값+1로 올라가지만 빈도 높은 키보다 낮다
+            sketch.add(f"noise-{i}")
+        assert len(sketch) == 3
+        top = sketch.top(2)
+        assert [k for k, _ in top] == ["환불", "주차"]
+        assert top[0][1] == 50 and sketch.error("환불") == 0
+
+    def test_replacement_inherits_min_count(self):
+        sketch = SpaceSaving(capacity=2)
+        sketch.add("a", 5)
+        sketch.add("b", 2)
+        sketch.add("c")
+        assert sketch.snapshot() == {"a": 5, "c": 3}
+        assert sketch.error("c") == 2
+
+    def test_state_roundtrip_trims_to_capacity(self):
+        sketch = SpaceSaving(capacity=5)
+        for i, n in enumerate([9, 7, 5, 3]):
+            sketch.add(f"k{i}", n)
+        restored = SpaceSaving(capacity=2)
+        restored.load_state(sketch.to_state())
+        assert restored.snapshot() == {"k0": 9, "k1": 7}
+        restored.add("k9")
+        assert "k1" not in restored.snapshot()
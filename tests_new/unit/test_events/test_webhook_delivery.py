@@ -0,0 +1,84 @@
+"""
+Webhook 전송 하위 시스템 단위 테스트 (로컬 aiohttp 서버 상대).
+
+emit()이 수신 지연과 무관하게 즉시 반환하는지, 목적지 세션 재사용, 배치 POST, 실패 후 백오프 재시도,
+서킷 브레이커 open/half-open, 종료 시 outbox에 남은 건을 재시작 후 이어 보내는지를 검증한다.
+"""
+
+import asyncio
+import time
+
+from src.events.webhook_delivery import CircuitBreaker, WebhookDispatcher
+
+
+async def test_emit_returns_immediately_and_reuses_session(receiver):
+    receiver.delay = 0.2
+    dispatcher = WebhookDispatcher(timeout=2.0)
+    started = time.perf_counter()
+    for i in range(5):
+        assert dispatcher.emit(receiver.url, {"event_id": f"e{i}"})
+    assert time.perf_counter() - started < 0.05
+    assert await dispatcher.flush(timeout=5.0)
+    session = dispatcher.session_for(receiver.url)
+    assert [b["event_id"] for b in receiver.bodies] == [f"e{i}" for i in range(5)]
+    assert dispatcher.get_stats()["sessions"] == 1
+    assert dispatcher.session_for(receiver.url) is session
+    await dispatcher.close()
+
+
+async def test_batches_events_per_post(receiver):
+    dispatcher = WebhookDispatcher(batch_size=4)
+    for i in range(10):
+        dispatcher.emit(receiver.url, {"event_id": i})
+    assert await dispatcher.flush(timeout=5.0)
+    assert [b["count"] for b in receiver.bodies] == [4, 4, 2]
+    assert [e["event_id"] for b in receiver.bodies for e in b["events"]] == list(range(10))
+    assert dispatcher.get_stats()["batches"] == 3
+    await dispatcher.close()
+
+
+async def test_failed_delivery_is_retried_with_backoff(receiver):
+    receiver.fail_remaining = 2
+    dispatcher = WebhookDispatcher(max_retries=3, backoff_factor=0.05, failure_threshold=10)
+    dispatcher.emit(receiver.url, {"event_id": "retry-me"})
+    assert await dispatcher.flush(timeout=5.0)
+    stats = dispatcher.get_stats()
+    assert receiver.bodies == [{"event_id": "retry-me"}]
+    assert stats["retries"] == 2 and stats["delivered"] == 1 and stats["failed"] == 0
+    await dispatcher.close()
+
+
+def test_circuit_breaker_opens_and_probes():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0)
+    breaker.record_failure(now=0.0)
+    assert breaker.allow(now=0.0)
+    breaker.record_failure(now=1.0)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow(now=5.0)
+    assert breaker.allow(now=11.5)  # half-open 탐침
+    assert not breaker.allow(now=11.6)
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow(now=12.0)
+
+
+async def test_outbox_survives_restart(receiver, tmp_path):
+    outbox = tmp_path / "webhook_outbox.db"
+    receiver.fail_remaining = 100
+    first = WebhookDispatcher(
+        max_retries=5, backoff_factor=30.0, outbox_path=outbox, failure_threshold=1, reset_timeout=60.0
+    )
+    first.emit(receiver.url, {"event_id": "durable"})
+    await asyncio.sleep(0.3)
+    stats = first.get_stats()
+    assert stats["urls"][receiver.url]["breaker"] == CircuitBreaker.OPEN
+    assert stats["outbox_rows"] == 1
+    await first.close(timeout=1.0)
+
+    receiver.fail_remaining = 0
+    second = WebhookDispatcher(outbox_path=outbox)
+    assert second.pending_count() == 1
+    second.emit(receiver.url, {"event_id": "fresh"})
+    assert await second.flush(timeout=5.0)
+    assert [b["event_id"] for b in receiver.bodies] == ["durable", "fresh"]
+    assert second.get_stats()["outbox_rows"] == 0
+    await second.close()
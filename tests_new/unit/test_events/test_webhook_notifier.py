@@ -0,0 +1,63 @@
+"""
+WebhookNotifier 단위 테스트 (로컬 aiohttp 서버 상대).
+
+emit_event()의 fire-and-forget 전송과 flush/close, send_event()가 공유 세션으로 재시도하는지,
+목적지 서킷 브레이커가 열려 있으면 POST 없이 실패를 돌려주는지를 검증한다.
+"""
+
+from src.ai.event_models import AIEvent, EventType, SeverityLevel
+from src.events.webhook import WebhookNotifier
+
+
+def _event(event_id="evt-1"):
+    return AIEvent(
+        event_id=event_id,
+        event_type=EventType.PROFANITY_DETECTED,
+        call_id="call-1",
+        direction="caller",
+        timestamp=1.5,
+        confidence=0.9,
+        severity=SeverityLevel.HIGH,
+        details={"text": "sample"},
+    )
+
+
+async def test_emit_event_is_fire_and_forget(receiver):
+    receiver.delay = 0.2
+    notifier = WebhookNotifier([receiver.url])
+
+    assert notifier.emit_event(_event()) is True
+    assert receiver.bodies == []
+
+    assert await notifier.flush(timeout=5.0) is True
+    assert [b["event_id"] for b in receiver.bodies] == ["evt-1"]
+    assert receiver.bodies[0]["severity"] == "high"
+    stats = notifier.get_stats()
+    assert stats["total_sent"] == 1 and stats["delivery"]["delivered"] == 1
+
+    await notifier.close()
+    assert notifier.emit_event(_event("evt-2")) is False
+
+
+async def test_send_event_retries_on_shared_session(receiver):
+    receiver.fail_remaining = 1
+    notifier = WebhookNotifier([receiver.url], max_retries=2, backoff_factor=0.01)
+
+    assert await notifier.send_event(_event()) is True
+    assert receiver.requests == 2
+    stats = notifier.get_stats()
+    assert stats["retries"] == 1 and stats["total_success"] == 1
+    assert stats["delivery"]["sessions"] == 1
+    await notifier.close()
+
+
+async def test_send_event_skips_post_while_breaker_open(receiver):
+    receiver.fail_remaining = 100
+    notifier = WebhookNotifier([receiver.url], max_retries=0, failure_threshold=1, reset_timeout=60.0)
+
+    assert await notifier.send_event(_event("evt-1")) is False
+    assert receiver.requests == 1
+    assert await notifier.send_event(_event("evt-2")) is False
+    assert receiver.requests == 1  # open 상태 — 요청을 보내지 않는다
+    assert notifier.get_stats()["total_failed"] == 2
+    await notifier.close()
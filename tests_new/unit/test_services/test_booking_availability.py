@@ -0,0 +1,164 @@
+"""
+예약 가용성 인덱스 단위 테스트.
+
+인덱스 응답이 DB 직접 조회(BOOKING_AVAILABILITY_INDEX=0)와 같은지, 반복 조회가 DB를 다시 읽지 않는지,
+예약 생성은 제자리 반영·취소는 무효화되는지, 동시 예약에서 정원 초과(이중 예약)가 없는지를 검증한다.
+"""
+
+import threading
+
+import pytest
+
+from src.booking import database as booking_db
+from src.booking.models import BookingCreate, BookingSlotCreate
+from src.services import booking_service as svc
+from src.services.booking_availability import get_booking_availability_index
+
+OWNER = "1004"
+
+
+@pytest.fixture(autouse=True)
+def booking_env(tmp_path, monkeypatch):
+    monkeypatch.setattr(booking_db, "_DB_PATH", str(tmp_path / "booking.db"))
+    monkeypatch.delenv("BOOKING_AVAILABILITY_INDEX", raising=False)
+    # 외부 연동 훅(캘린더·문자)은 이 테스트 범위 밖
+    monkeypatch.setattr("src.services.gcal_service.create_event", lambda owner, booking: None)
+    monkeypatch.setattr(
+        "src.services.booking_notify.notify_booking_created_sms", lambda owner, booking, call_id="": {}
+    )
+    monkeypatch.setattr("src.services.gcal_service.cancel_event", lambda owner, booking_id: None)
+    monkeypatch.setattr("src.services.booking_notify.notify_booking_lifecycle_sms", lambda *a, **k: None)
+    booking_db.init_db()
+    index = get_booking_availability_index()
+    index.clear()
+    yield index
+    index.clear()
+
+
+def _slot(day, hhmm, capacity=1, blocked=False):
+    return svc.create_slot(
+        OWNER, BookingSlotCreate(slot_date=day, slot_time=hhmm, capacity=capacity, is_blocked=blocked)
+    )
+
+
+def _book(day, hhmm, phone):
+    return svc.create_booking(OWNER, BookingCreate(slot_date=day, slot_time=hhmm, customer_phone=phone))
+
+
+def test_index_answers_match_direct_queries(monkeypatch):
+    _slot("2026-03-02", "10:00", capacity=2)
+    _slot("2026-03-02", "09:00", capacity=1)
+    _slot("2026-03-02", "11:00", blocked=True)
+    _slot("2026-03-04", "14:00", capacity=3)
+    _book("2026-03-02", "09:00", "010-1")
+
+    indexed = (
+        svc.get_available_slots_for_llm(OWNER, "2026-03-02"),
+        svc.check_multi_date_slots(OWNER, "2026-03-01", "2026-03-07", 2),
+        svc.find_next_available_slots(OWNER, "2026-03-01", limit=2),
+    )
+    monkeypatch.setenv("BOOKING_AVAILABILITY_INDEX", "0")
+    direct = (
+        svc.get_available_slots_for_llm(OWNER, "2026-03-02"),
+        svc.check_multi_date_slots(OWNER, "2026-03-01", "2026-03-07", 2),
+        svc.find_next_available_slots(OWNER, "2026-03-01", limit=2),
+    )
+    assert indexed[0] == direct[0]
+    assert [s["slot_time"] for s in indexed[0]] == ["10:00"]
+    assert indexed[1] == direct[1]
+    assert [(s["slot_date"], s["slot_time"]) for s in indexed[2]] == [
+        (s["slot_date"], s["slot_time"]) for s in direct[2]
+    ]
+
+
+def test_repeat_queries_do_not_reload(booking_env):
+    _slot("2026-03-02", "10:00", capacity=2)
+    svc.check_multi_date_slots(OWNER, "2026-03-01", "2026-03-07")
+    loads = booking_env.stats["loads"]
+    for _ in range(5):
+        svc.get_available_slots_for_llm(OWNER, "2026-03-02")
+        svc.check_multi_date_slots(OWNER, "2026-03-01", "2026-03-07")
+    assert booking_env.stats["loads"] == loads
+    svc.find_next_available_slots(OWNER, "2026-03-01")
+    svc.find_next_available_slots(OWNER, "2026-03-01")
+    assert booking_env.stats["answer_hits"] == 1
+
+
+def test_booking_updates_in_place_and_cancel_invalidates(booking_env):
+    _slot("2026-03-02", "10:00", capacity=2)
+    assert svc.get_available_slots_for_llm(OWNER, "2026-03-02")[0]["available"] == 2
+    loads = booking_env.stats["loads"]
+
+    booking = _book("2026-03-02", "10:00", "010-1")
+    assert svc.get_available_slots_for_llm(OWNER, "2026-03-02")[0]["available"] == 1
+    assert booking_env.stats["loads"] == loads
+
+    svc.cancel_booking(booking["booking_id"], owner=OWNER)
+    assert svc.get_available_slots_for_llm(OWNER, "2026-03-02")[0]["available"] == 2
+    assert booking_env.stats["loads"] == loads + 1
+
+
+def test_apply_is_monotonic(booking_env):
+    _slot("2026-03-02", "10:00", capacity=5)
+    slot = svc.get_available_slots_for_llm(OWNER, "2026-03-02")[0]
+    booking_env.apply_booking(OWNER, "2026-03-02", slot["slot_id"], 2)
+    booking_env.apply_booking(OWNER, "2026-03-02", slot["slot_id"], 1)  # 늦게 도착한 이전 값
+    assert svc.get_available_slots_for_llm(OWNER, "2026-03-02")[0]["available"] == 3
+
+
+def test_concurrent_bookings_never_exceed_capacity():
+    _slot("2026-03-02", "10:00", capacity=3)
+    svc.get_available_slots_for_llm(OWNER, "2026-03-02")
+    results, errors = [], []
+    barrier = threading.Barrier(12)
+
+    def worker(i):
+        barrier.wait()
+        try:
+            results.append(_book("2026-03-02", "10:00", f"010-{i:04d}"))
+        except ValueError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(12)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 3 and len(errors) == 9
+    assert all("정원" in e for e in errors)
+    slot = svc.list_slots(OWNER, slot_date="2026-03-02")[0]
+    assert slot["booked_count"] == 3
+    assert svc.get_available_slots_for_llm(OWNER, "2026-03-02") == []
+
+
+def test_long_range_is_answered_without_caching_every_day(booking_env):
+    _slot("2026-03-02", "10:00")
+    _slot("2031-07-01", "10:00")
+    summaries = svc.check_multi_date_slots(OWNER, "2026-01-01", "2099-12-31")
+    assert [s["slot_date"] for s in summaries] == ["2026-03-02", "2031-07-01"]
+    stats = booking_env.get_stats()
+    assert stats["uncached_loads"] == 1 and stats["days"] == 0
+    assert [s["slot_date"] for s in svc.find_next_available_slots(OWNER, "2026-03-03", days=100000)] == [
+        "2031-07-01"
+    ]
+    assert booking_env.get_stats()["days"] == 0
+
+
+def test_day_entries_are_pruned_past_the_cap(booking_env):
+    booking_env.max_entries = 40
+    booking_env.ttl_sec = 0.0
+    for month in range(1, 13):
+        svc.check_multi_date_slots(OWNER, f"2026-{month:02d}-01", f"2026-{month:02d}-28")
+    assert booking_env.get_stats()["days"] <= 40 + 28
+
+
+@pytest.mark.parametrize("bad", ["", "2026-3-2", "20260302", "2026-02-30", "tomorrow"])
+def test_malformed_dates_return_no_slots(monkeypatch, bad):
+    _slot("2026-03-02", "10:00")
+    for flag in ("1", "0"):
+        monkeypatch.setenv("BOOKING_AVAILABILITY_INDEX", flag)
+        assert svc.get_available_slots_for_llm(OWNER, bad) == []
+        assert svc.check_multi_date_slots(OWNER, bad, "2026-03-07") == []
+        assert svc.check_multi_date_slots(OWNER, "2026-03-01", bad) == []
+        assert svc.find_next_available_slots(OWNER, bad) == []